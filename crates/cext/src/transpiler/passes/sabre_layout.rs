@@ -19,7 +19,7 @@ use qiskit_circuit::converters::dag_to_circuit;
 use qiskit_circuit::dag_circuit::DAGCircuit;
 use qiskit_circuit::{PhysicalQubit, Qubit};
 use qiskit_transpiler::passes::sabre::heuristic;
-use qiskit_transpiler::passes::sabre::sabre_layout_and_routing;
+use qiskit_transpiler::passes::sabre::{TrialBudget, sabre_layout_and_routing};
 use qiskit_transpiler::target::Target;
 use qiskit_transpiler::transpile_layout::TranspileLayout;
 
@@ -139,6 +139,7 @@ pub unsafe extern "C" fn qk_transpiler_pass_standalone_sabre_layout(
         Some(options.seed),
         Vec::new(),
         false,
+        &TrialBudget::unlimited(),
     )
     .unwrap_or_else(|_| panic!("Sabre layout failed."));
     let out_circuit = dag_to_circuit(&result, false)
@@ -227,6 +227,7 @@ pub unsafe extern "C" fn qk_transpiler_pass_standalone_vf2_layout(
         max_trials,
         None,
         None,
+        None,
     ) {
         Ok(layout) => layout,
         Err(e) => panic!("{}", e),
@@ -16,6 +16,7 @@ use qiskit_circuit::circuit_data::CircuitData;
 use qiskit_transpiler::target::Target;
 
 use qiskit_transpiler::transpile;
+use qiskit_transpiler::transpile_batch;
 use qiskit_transpiler::transpile_layout::TranspileLayout;
 
 use crate::exit_codes::ExitCode;
@@ -60,6 +61,33 @@ impl Default for TranspileOptions {
     }
 }
 
+/// Extract the optimization level, approximation degree and seed from the C options struct.
+fn parse_options(options: &TranspileOptions) -> (u8, Option<f64>, Option<u64>) {
+    if !(0..=3u8).contains(&options.optimization_level) {
+        panic!(
+            "Invalid optimization level specified {}",
+            options.optimization_level
+        );
+    }
+
+    let seed = if options.seed < 0 {
+        None
+    } else {
+        Some(options.seed as u64)
+    };
+    let approximation_degree = if options.approximation_degree.is_nan() {
+        None
+    } else {
+        if !(0.0..=1.0).contains(&options.approximation_degree) {
+            panic!(
+                "Invalid value provided for approximation degree, only NAN or values between 0.0 and 1.0 inclusive are valid"
+            );
+        }
+        Some(options.approximation_degree)
+    };
+    (options.optimization_level, approximation_degree, seed)
+}
+
 /// @ingroup QkTranspiler
 ///
 /// Generate transpiler options defaults
@@ -131,28 +159,7 @@ pub unsafe extern "C" fn qk_transpile(
         unsafe { const_ptr_as_ref(options) }
     };
 
-    if !(0..=3u8).contains(&options.optimization_level) {
-        panic!(
-            "Invalid optimization level specified {}",
-            options.optimization_level
-        );
-    }
-
-    let seed = if options.seed < 0 {
-        None
-    } else {
-        Some(options.seed as u64)
-    };
-    let approximation_degree = if options.approximation_degree.is_nan() {
-        None
-    } else {
-        if !(0.0..=1.0).contains(&options.approximation_degree) {
-            panic!(
-                "Invalid value provided for approximation degree, only NAN or values between 0.0 and 1.0 inclusive are valid"
-            );
-        }
-        Some(options.approximation_degree)
-    };
+    let (optimization_level, approximation_degree, seed) = parse_options(options);
 
     if let Some(target_qubits) = target.num_qubits {
         if target_qubits < qc.num_qubits() as u32 {
@@ -174,7 +181,7 @@ pub unsafe extern "C" fn qk_transpile(
     match transpile(
         qc,
         target,
-        options.optimization_level.into(),
+        optimization_level.into(),
         approximation_degree,
         seed,
     ) {
@@ -206,3 +213,131 @@ pub unsafe extern "C" fn qk_transpile(
         }
     }
 }
+
+/// @ingroup QkTranspiler
+/// Transpile a batch of circuits for the same target in parallel.
+///
+/// This compiles each circuit in ``circuits`` independently, with the same options, exactly as
+/// ``qk_transpile`` would.  The circuits are compiled concurrently on the transpiler's thread pool,
+/// and all the threads share the one ``target`` instead of each working on a copy, so this is
+/// typically much faster than calling ``qk_transpile`` on each circuit in turn.  The same
+/// restrictions on the input circuits apply as for ``qk_transpile``.
+///
+/// The size of the thread pool can be tuned with the ``RAYON_NUM_THREADS`` environment variable, as
+/// for ``qk_transpile``.
+///
+/// @param circuits A pointer to an array of ``num_circuits`` pointers to the circuits to run the
+///   transpiler on.
+/// @param num_circuits The number of circuits in ``circuits``.
+/// @param target A pointer to the target to compile the circuits for.
+/// @param options A pointer to an options object that defines user options, which are used for
+///   every circuit. If this is a null pointer the default values will be used. See
+///   ``qk_transpile_default_options`` for more details on the default values.
+/// @param results A pointer to an array of ``num_circuits`` transpiler results. On a successful
+///   execution (return code 0) the output of the transpiler for ``circuits[i]`` will be written to
+///   ``results[i]``. The members of each result struct are owned by the caller and you are
+///   responsible for freeing them using the respective free functions. If any circuit fails to
+///   compile, nothing is written to ``results``.
+/// @param error A pointer to a pointer with an nul terminated string with an error description.
+///   If the transpiler fails on any circuit a pointer to the string with the error description,
+///   including the index of the failing circuit, will be written to this pointer. That pointer
+///   needs to be freed with ``qk_str_free``. This can be a null pointer in which case the error
+///   will not be written out.
+///
+/// @returns The return code for the transpiler, ``QkExitCode_Success`` means success and all
+///   other values indicate an error.
+///
+/// # Safety
+///
+/// Behavior is undefined if ``target`` is not a valid, non-null pointer to a ``QkTarget``, or if
+/// ``num_circuits`` is non-zero and either ``circuits`` is not a valid pointer to an array of
+/// ``num_circuits`` valid, non-null ``QkCircuit`` pointers, or ``results`` is not a valid pointer
+/// to an array of ``num_circuits`` ``QkTranspileResult`` structs.
+/// ``options`` must be a valid pointer a to a ``QkTranspileOptions`` or ``NULL``.
+/// ``error`` must be a valid pointer to a ``char`` pointer or ``NULL``.
+#[unsafe(no_mangle)]
+#[cfg(feature = "cbinding")]
+pub unsafe extern "C" fn qk_transpile_batch(
+    circuits: *const *const CircuitData,
+    num_circuits: usize,
+    target: *const Target,
+    options: *const TranspileOptions,
+    results: *mut TranspileResult,
+    error: *mut *mut c_char,
+) -> ExitCode {
+    // SAFETY: Per documentation, the pointer is non-null and aligned.
+    let target = unsafe { const_ptr_as_ref(target) };
+    let options = if options.is_null() {
+        &TranspileOptions::default()
+    } else {
+        // SAFETY: We checked the pointer is not null, then, per documentation, it is a valid
+        // and aligned pointer.
+        unsafe { const_ptr_as_ref(options) }
+    };
+    let (optimization_level, approximation_degree, seed) = parse_options(options);
+    if num_circuits == 0 {
+        return ExitCode::Success;
+    }
+
+    // SAFETY: Per documentation, `circuits` points to `num_circuits` valid circuit pointers.
+    let circuit_ptrs = unsafe { ::std::slice::from_raw_parts(circuits, num_circuits) };
+    let circuits: Vec<&CircuitData> = circuit_ptrs
+        .iter()
+        .map(|qc| unsafe { const_ptr_as_ref(*qc) })
+        .collect();
+
+    let write_error = |message: String| {
+        if !error.is_null() {
+            unsafe {
+                *error = CString::new(message).unwrap().into_raw();
+            }
+        }
+    };
+
+    if let Some(target_qubits) = target.num_qubits {
+        for (index, qc) in circuits.iter().enumerate() {
+            if target_qubits < qc.num_qubits() as u32 {
+                write_error(format!(
+                    "Insufficient qubits in target: {}, circuit {} uses {}",
+                    target_qubits,
+                    index,
+                    qc.num_qubits()
+                ));
+                return ExitCode::TranspilerError;
+            }
+        }
+    }
+
+    let batch_results = transpile_batch(
+        &circuits,
+        target,
+        optimization_level.into(),
+        approximation_degree,
+        seed,
+    );
+    let mut transpiled = Vec::with_capacity(num_circuits);
+    for (index, result) in batch_results.into_iter().enumerate() {
+        match result {
+            Ok(transpile_result) => transpiled.push(transpile_result),
+            Err(e) => {
+                // Any circuits that were already compiled are dropped here; the caller never sees
+                // them, so there's nothing for them to free.
+                write_error(format!(
+                    "Transpilation of circuit {} failed with this backtrace: {}",
+                    index,
+                    e.backtrace()
+                ));
+                return ExitCode::TranspilerError;
+            }
+        }
+    }
+    // SAFETY: Per documentation, `results` points to `num_circuits` result structs.
+    let results = unsafe { ::std::slice::from_raw_parts_mut(results, num_circuits) };
+    for (slot, (circuit, layout)) in results.iter_mut().zip(transpiled) {
+        *slot = TranspileResult {
+            circuit: Box::into_raw(Box::new(circuit)),
+            layout: Box::into_raw(Box::new(layout)),
+        };
+    }
+    ExitCode::Success
+}
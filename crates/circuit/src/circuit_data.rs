@@ -11,7 +11,7 @@
 // that they have been altered from the originals.
 
 use std::fmt::Debug;
-use std::hash::{Hash, RandomState};
+use std::hash::{DefaultHasher, Hash, Hasher, RandomState};
 #[cfg(feature = "cache_pygates")]
 use std::sync::OnceLock;
 
@@ -27,7 +27,7 @@ use crate::imports::{ANNOTATED_OPERATION, QUANTUM_CIRCUIT};
 use crate::interner::{Interned, InternedMap, Interner};
 use crate::object_registry::ObjectRegistry;
 use crate::operations::{Operation, OperationRef, Param, PythonOperation, StandardGate};
-use crate::packed_instruction::{PackedInstruction, PackedOperation};
+use crate::packed_instruction::{PackedInstruction, PackedOperation, hash_param};
 use crate::parameter::parameter_expression::ParameterExpression;
 use crate::parameter::symbol_expr::{Symbol, Value};
 use crate::parameter_table::{ParameterTable, ParameterTableError, ParameterUse, ParameterUuid};
@@ -1331,6 +1331,37 @@ impl CircuitData {
         ops_count
     }
 
+    /// Compute a hash of the structure of the circuit.
+    ///
+    /// The hash covers the number of qubits, clbits and variables, the global phase, and the
+    /// name, wires and parameters of every instruction in order.  It is much cheaper to compute
+    /// than a copy of the data or an equality comparison, and is suitable for detecting whether the
+    /// circuit has been modified.
+    ///
+    /// Returns:
+    ///     int | None: The hash, or ``None`` if some component of the circuit cannot be hashed
+    ///     (for example, a control-flow operation or another Python-space operation).
+    pub fn structural_hash(&self, py: Python) -> Option<u64> {
+        let mut state = DefaultHasher::new();
+        self.qubits.len().hash(&mut state);
+        self.clbits.len().hash(&mut state);
+        self.vars.len().hash(&mut state);
+        if !hash_param(py, &self.global_phase, &mut state) {
+            return None;
+        }
+        self.data
+            .iter()
+            .all(|inst| {
+                inst.hash_structure(
+                    py,
+                    self.qargs_interner.get(inst.qubits),
+                    self.cargs_interner.get(inst.clbits),
+                    &mut state,
+                )
+            })
+            .then(|| state.finish())
+    }
+
     // Marks this pyclass as NOT hashable.
     #[classattr]
     const __hash__: Option<Py<PyAny>> = None;
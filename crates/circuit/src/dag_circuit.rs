@@ -11,7 +11,7 @@
 // that they have been altered from the originals.
 
 use std::cmp::Ordering;
-use std::hash::Hash;
+use std::hash::{DefaultHasher, Hash, Hasher};
 use std::sync::Arc;
 
 use ahash::RandomState;
@@ -35,7 +35,7 @@ use crate::object_registry::ObjectRegistry;
 use crate::operations::{
     ArrayType, Operation, OperationRef, Param, PyInstruction, PythonOperation, StandardGate,
 };
-use crate::packed_instruction::{PackedInstruction, PackedOperation};
+use crate::packed_instruction::{PackedInstruction, PackedOperation, hash_param};
 use crate::parameter::parameter_expression::ParameterExpression;
 use crate::register_data::RegisterData;
 use crate::slice::PySequenceIndex;
@@ -242,6 +242,25 @@ pub struct DAGCircuit {
 
     stretches_capture: HashSet<Stretch>,
     stretches_declare: Vec<Stretch>,
+
+    /// Named positions in `change_log`, used to find the nodes that changed since.
+    checkpoints: HashMap<String, DAGCheckpoint>,
+    /// The nodes touched by each mutation of the graph, in order.  This is only recorded while
+    /// there is a checkpoint, and only back to the oldest one.
+    change_log: Vec<NodeIndex>,
+    /// The number of entries that have been dropped from the front of `change_log`.
+    change_log_start: usize,
+}
+
+/// A point in the history of a [DAGCircuit], set by [DAGCircuit::set_checkpoint].
+///
+/// The mutators of the graph log every node they add or modify, and the nodes on both sides of
+/// every edge they add or remove, so a node counts as changed if it was modified or replaced, or if
+/// a node next to it was added or removed.
+#[derive(Clone, Copy, Debug, Default)]
+struct DAGCheckpoint {
+    /// The absolute position in the change log when the checkpoint was set.
+    position: usize,
 }
 
 #[derive(Clone, Debug)]
@@ -554,7 +573,7 @@ impl DAGCircuit {
     ///
     /// To be removed with get_duration.
     #[getter("_duration")]
-    fn get_internal_duration(&self, py: Python) -> PyResult<Option<Py<PyAny>>> {
+    pub fn get_internal_duration(&self, py: Python) -> PyResult<Option<Py<PyAny>>> {
         Ok(self.duration.as_ref().map(|x| x.clone_ref(py)))
     }
 
@@ -610,7 +629,7 @@ impl DAGCircuit {
     ///
     /// To be removed with get_unit.
     #[getter("_unit")]
-    fn get_internal_unit(&self) -> PyResult<String> {
+    pub fn get_internal_unit(&self) -> PyResult<String> {
         Ok(self.unit.clone())
     }
 
@@ -894,6 +913,8 @@ impl DAGCircuit {
         let edges_lst = binding.downcast::<PyList>()?;
         let node_removed: bool = dict_state.get_item("nodes_removed")?.unwrap().extract()?;
         self.dag = StableDiGraph::default();
+        self.checkpoints.clear();
+        self.change_log.clear();
         if !node_removed {
             for item in nodes_lst.iter() {
                 let node_w = item.downcast::<PyTuple>().unwrap().get_item(1).unwrap();
@@ -1926,6 +1947,98 @@ impl DAGCircuit {
         weak_components
     }
 
+    /// Compute a hash of the structure of the circuit.
+    ///
+    /// The hash covers the number of qubits, clbits and variables, the global phase, and the
+    /// name, wires and parameters of every operation in topological order.  It is much cheaper to
+    /// compute than a copy of the DAG or an equality comparison, and is suitable for detecting
+    /// whether a DAG has been modified.  Different hashes imply that two DAGs are different, but
+    /// two DAGs that compare equal may have different hashes if they were built in a different
+    /// order.
+    ///
+    /// Returns:
+    ///     int | None: The hash, or ``None`` if some component of the circuit cannot be hashed
+    ///     (for example, a control-flow operation or another Python-space operation).
+    pub fn structural_hash(&self, py: Python) -> PyResult<Option<u64>> {
+        let mut state = DefaultHasher::new();
+        self.num_qubits().hash(&mut state);
+        self.num_clbits().hash(&mut state);
+        self.num_vars().hash(&mut state);
+        if !hash_param(py, &self.global_phase, &mut state) {
+            return Ok(None);
+        }
+        for node in self.topological_op_nodes()? {
+            let NodeType::Operation(inst) = &self.dag[node] else {
+                unreachable!("topological_op_nodes only yields operation nodes");
+            };
+            if !inst.hash_structure(
+                py,
+                self.qargs_interner.get(inst.qubits),
+                self.cargs_interner.get(inst.clbits),
+                &mut state,
+            ) {
+                return Ok(None);
+            }
+        }
+        Ok(Some(state.finish()))
+    }
+
+    /// Record the current point in the history of the DAG under a name, so that the nodes that
+    /// change afterwards can be found with :meth:`changed_nodes`.
+    ///
+    /// This is intended for passes that run repeatedly on the same DAG, such as those in an
+    /// optimization loop, so that later runs only need to process the regions that other passes
+    /// have modified.  Each pass should use its own name.  Copies of the DAG keep the checkpoints
+    /// of the original, but DAGs built by other means (including by pickling) have none.
+    ///
+    /// Args:
+    ///     name (str): The name of the checkpoint.  An existing checkpoint of the same name is
+    ///         replaced.
+    #[pyo3(name = "checkpoint")]
+    fn py_checkpoint(&mut self, name: String) {
+        self.set_checkpoint(name)
+    }
+
+    /// Get the operation nodes that changed since a checkpoint was recorded with
+    /// :meth:`checkpoint`.
+    ///
+    /// A node counts as changed if it was added, if its operation, parameters or wires were
+    /// modified, or if an edge to it was added or removed, such as when one of its neighbours on
+    /// any wire was added, removed or replaced.  The regions around removed nodes are therefore
+    /// represented by the nodes that surround them.  The DAG logs these changes as they are made,
+    /// so finding them takes time proportional to the number of changes, though putting a
+    /// non-empty result in topological order still walks the whole DAG.
+    ///
+    /// Args:
+    ///     name (str): The name of the checkpoint.
+    ///
+    /// Returns:
+    ///     list[DAGOpNode] | None: The changed nodes in topological order, or ``None`` if there is
+    ///     no checkpoint of that name, in which case every node should be treated as changed.
+    #[pyo3(name = "changed_nodes")]
+    fn py_changed_nodes(&self, py: Python, name: &str) -> PyResult<Option<Py<PyList>>> {
+        let Some(changed) = self.changed_since_checkpoint(name) else {
+            return Ok(None);
+        };
+        if changed.is_empty() {
+            return Ok(Some(PyList::empty(py).unbind()));
+        }
+        let nodes = self
+            .topological_op_nodes()?
+            .filter(|node| changed.contains(node))
+            .map(|node| self.get_node(py, node))
+            .collect::<PyResult<Vec<_>>>()?;
+        Ok(Some(PyList::new(py, nodes)?.unbind()))
+    }
+
+    /// Remove a checkpoint recorded with :meth:`checkpoint`, if it exists.
+    ///
+    /// Args:
+    ///     name (str): The name of the checkpoint.
+    fn discard_checkpoint(&mut self, name: &str) {
+        self.remove_checkpoint(name);
+    }
+
     fn __eq__(&self, py: Python, other: &DAGCircuit) -> PyResult<bool> {
         // Try to convert to float, but in case of unbound ParameterExpressions
         // a TypeError will be raise, fallback to normal equality in those
@@ -2808,6 +2921,7 @@ impl DAGCircuit {
         } else {
             HashSet::default()
         };
+        let mut contracted_edges = Vec::new();
         for contracted_var in node_vars.difference(&input_dag_var_set) {
             let pred = self
                 .dag
@@ -2831,11 +2945,11 @@ impl DAGCircuit {
                     }
                 })
                 .unwrap();
-            self.dag.add_edge(
+            contracted_edges.push((
                 pred.source(),
                 succ.target(),
                 Wire::Var(self.vars.find(contracted_var).unwrap()),
-            );
+            ));
         }
 
         for var in input_dag_var_set {
@@ -2846,6 +2960,9 @@ impl DAGCircuit {
         // references to variables owned by the DAG, which we'll need to mutate
         // when perform the substitution.
         drop(node_vars);
+        for (source, target, wire) in contracted_edges {
+            self.graph_add_edge(source, target, wire);
+        }
 
         // It doesn't make sense to try and propagate a condition from a control-flow op; a
         // replacement for the control-flow op should implement the operation completely.
@@ -3152,12 +3269,12 @@ impl DAGCircuit {
         for (wire, (node1_to_node2, _), (parent_to_node1, parent), (node2_to_child, child)) in
             relevant_edges
         {
-            self.dag.remove_edge(parent_to_node1);
-            self.dag.add_edge(parent, node2, wire);
-            self.dag.remove_edge(node1_to_node2);
-            self.dag.add_edge(node2, node1, wire);
-            self.dag.remove_edge(node2_to_child);
-            self.dag.add_edge(node1, child, wire);
+            self.graph_remove_edge(parent_to_node1);
+            self.graph_add_edge(parent, node2, wire);
+            self.graph_remove_edge(node1_to_node2);
+            self.graph_add_edge(node2, node1, wire);
+            self.graph_remove_edge(node2_to_child);
+            self.graph_add_edge(node1, child, wire);
         }
         Ok(())
     }
@@ -3615,7 +3732,7 @@ impl DAGCircuit {
             })
             .collect();
         for a in ancestors {
-            self.dag.remove_node(a);
+            self.graph_remove_node(a);
         }
     }
 
@@ -3628,7 +3745,7 @@ impl DAGCircuit {
             })
             .collect();
         for d in descendants {
-            self.dag.remove_node(d);
+            self.graph_remove_node(d);
         }
     }
 
@@ -3646,7 +3763,7 @@ impl DAGCircuit {
             .filter(|node_id| !ancestors.contains(node_id))
             .collect();
         for na in non_ancestors {
-            self.dag.remove_node(na);
+            self.graph_remove_node(na);
         }
     }
 
@@ -3664,7 +3781,7 @@ impl DAGCircuit {
             .filter(|node_id| !descendants.contains(node_id))
             .collect();
         for nd in non_descendants {
-            self.dag.remove_node(nd);
+            self.graph_remove_node(nd);
         }
     }
 
@@ -4554,6 +4671,9 @@ impl DAGCircuit {
             vars_declare: HashSet::new(),
             stretches_capture: HashSet::new(),
             stretches_declare: Vec::new(),
+            checkpoints: HashMap::new(),
+            change_log: Vec::new(),
+            change_log_start: 0,
         }
     }
 
@@ -4954,6 +5074,7 @@ impl DAGCircuit {
             })
             .collect();
 
+        self.mark_all_changed();
         // Update edges to use the new Qubits.
         for edge_weight in self.dag.edge_weights_mut() {
             if let Wire::Qubit(b) = edge_weight {
@@ -5087,6 +5208,7 @@ impl DAGCircuit {
             })
             .collect();
 
+        self.mark_all_changed();
         // Update edges to use the new Clbits.
         for edge_weight in self.dag.edge_weights_mut() {
             if let Wire::Clbit(c) = edge_weight {
@@ -5190,6 +5312,7 @@ impl DAGCircuit {
         }
 
         // From here on, everything should be infallible.
+        self.mark_all_changed();
         self.qubit_io_map = new_io_map;
         for (new, [in_, out]) in self.qubit_io_map.iter().enumerate() {
             let new = Qubit::new(new);
@@ -5429,7 +5552,7 @@ impl DAGCircuit {
         self.increment_op(instr.op.name());
 
         let qubits_id = instr.qubits;
-        let new_node = self.dag.add_node(NodeType::Operation(instr));
+        let new_node = self.graph_add_node(NodeType::Operation(instr));
         let terminus_index = match dir {
             Direction::Incoming => 0, // the "in" nodes
             Direction::Outgoing => 1, // the "out" nodes
@@ -5471,15 +5594,15 @@ impl DAGCircuit {
             for (op_node, old_edge, weight) in last_edges.into_iter() {
                 match dir {
                     Direction::Outgoing => {
-                        self.dag.add_edge(op_node, new_node, weight);
-                        self.dag.add_edge(new_node, terminus, weight);
+                        self.graph_add_edge(op_node, new_node, weight);
+                        self.graph_add_edge(new_node, terminus, weight);
                     }
                     Direction::Incoming => {
-                        self.dag.add_edge(terminus, new_node, weight);
-                        self.dag.add_edge(new_node, op_node, weight);
+                        self.graph_add_edge(terminus, new_node, weight);
+                        self.graph_add_edge(new_node, op_node, weight);
                     }
                 }
-                self.dag.remove_edge(old_edge);
+                self.graph_remove_edge(old_edge);
             }
         }
 
@@ -5809,8 +5932,8 @@ impl DAGCircuit {
                 if qubit.index() < self.qubit_io_map.len() {
                     return Err(DAGCircuitError::new_err("qubit wire already exists!"));
                 }
-                let in_node = self.dag.add_node(NodeType::QubitIn(qubit));
-                let out_node = self.dag.add_node(NodeType::QubitOut(qubit));
+                let in_node = self.graph_add_node(NodeType::QubitIn(qubit));
+                let out_node = self.graph_add_node(NodeType::QubitOut(qubit));
                 self.qubit_io_map.push([in_node, out_node]);
                 (in_node, out_node)
             }
@@ -5818,8 +5941,8 @@ impl DAGCircuit {
                 if clbit.index() < self.clbit_io_map.len() {
                     return Err(DAGCircuitError::new_err("classical wire already exists!"));
                 }
-                let in_node = self.dag.add_node(NodeType::ClbitIn(clbit));
-                let out_node = self.dag.add_node(NodeType::ClbitOut(clbit));
+                let in_node = self.graph_add_node(NodeType::ClbitIn(clbit));
+                let out_node = self.graph_add_node(NodeType::ClbitOut(clbit));
                 self.clbit_io_map.push([in_node, out_node]);
                 (in_node, out_node)
             }
@@ -5827,13 +5950,13 @@ impl DAGCircuit {
                 if var.index() < self.var_io_map.len() {
                     return Err(DAGCircuitError::new_err("var wire already exists!"));
                 }
-                let in_node = self.dag.add_node(NodeType::VarIn(var));
-                let out_node = self.dag.add_node(NodeType::VarOut(var));
+                let in_node = self.graph_add_node(NodeType::VarIn(var));
+                let out_node = self.graph_add_node(NodeType::VarOut(var));
                 self.var_io_map.push([in_node, out_node]);
                 (in_node, out_node)
             }
         };
-        self.dag.add_edge(in_node, out_node, wire);
+        self.graph_add_edge(in_node, out_node, wire);
         Ok((in_node, out_node))
     }
 
@@ -5872,8 +5995,8 @@ impl DAGCircuit {
             Wire::Clbit(clbit) => self.clbit_io_map[clbit.index()],
             Wire::Var(var) => self.var_io_map[var.index()],
         };
-        self.dag.remove_node(in_node);
-        self.dag.remove_node(out_node);
+        self.graph_remove_node(in_node);
+        self.graph_remove_node(out_node);
     }
 
     pub fn add_qubit_unchecked(&mut self, bit: ShareableQubit) -> PyResult<Qubit> {
@@ -5921,10 +6044,10 @@ impl DAGCircuit {
             }
         }
         for (source, target, weight) in edge_list {
-            self.dag.add_edge(source, target, weight);
+            self.graph_add_edge(source, target, weight);
         }
 
-        match self.dag.remove_node(index) {
+        match self.graph_remove_node(index) {
             Some(NodeType::Operation(packed)) => {
                 let op_name = packed.op.name();
                 self.decrement_op(op_name);
@@ -6112,6 +6235,104 @@ impl DAGCircuit {
         self.op_nodes(include_directives).map(|(index, _)| index)
     }
 
+    /// Record the current point in the history of the DAG under `name`, replacing any previous
+    /// checkpoint of the same name.
+    ///
+    /// This is constant time; see [Self::changed_since_checkpoint].
+    pub fn set_checkpoint(&mut self, name: String) {
+        let position = self.change_log_start + self.change_log.len();
+        self.checkpoints.insert(name, DAGCheckpoint { position });
+        self.trim_change_log();
+    }
+
+    /// Get the operation nodes that were added or modified, or had a neighbour on some wire
+    /// replaced, since the checkpoint `name` was set.
+    ///
+    /// Returns `None` if there is no such checkpoint.  This takes time proportional to the number
+    /// of changes made since the checkpoint, not to the size of the DAG.
+    pub fn changed_since_checkpoint(&self, name: &str) -> Option<HashSet<NodeIndex>> {
+        let checkpoint = self.checkpoints.get(name)?;
+        Some(
+            self.change_log[checkpoint.position - self.change_log_start..]
+                .iter()
+                .copied()
+                .filter(|node| matches!(self.dag.node_weight(*node), Some(NodeType::Operation(_))))
+                .collect(),
+        )
+    }
+
+    /// Remove the checkpoint `name`, if it exists.
+    pub fn remove_checkpoint(&mut self, name: &str) {
+        if self.checkpoints.remove(name).is_some() {
+            self.trim_change_log();
+        }
+    }
+
+    /// Drop the entries of the change log from before the oldest checkpoint.
+    fn trim_change_log(&mut self) {
+        let end = self.change_log_start + self.change_log.len();
+        let oldest = self
+            .checkpoints
+            .values()
+            .map(|checkpoint| checkpoint.position)
+            .min()
+            .unwrap_or(end);
+        self.change_log.drain(..oldest - self.change_log_start);
+        self.change_log_start = oldest;
+    }
+
+    /// Log that `node` was added or modified, if there are any checkpoints to log it for.
+    #[inline]
+    fn mark_changed(&mut self, node: NodeIndex) {
+        if !self.checkpoints.is_empty() {
+            self.change_log.push(node);
+        }
+    }
+
+    /// Log that `node` and all of its neighbours changed.
+    fn mark_changed_with_neighbours(&mut self, node: NodeIndex) {
+        if !self.checkpoints.is_empty() {
+            self.change_log.push(node);
+            self.change_log.extend(self.dag.neighbors_undirected(node));
+        }
+    }
+
+    /// Log that every node changed, for mutations that touch the whole graph.
+    fn mark_all_changed(&mut self) {
+        if !self.checkpoints.is_empty() {
+            self.change_log.extend(self.dag.node_indices());
+        }
+    }
+
+    /// Add a node to the graph, logging it as changed.
+    fn graph_add_node(&mut self, weight: NodeType) -> NodeIndex {
+        let node = self.dag.add_node(weight);
+        self.mark_changed(node);
+        node
+    }
+
+    /// Remove a node from the graph, logging its neighbours as changed.
+    fn graph_remove_node(&mut self, node: NodeIndex) -> Option<NodeType> {
+        self.mark_changed_with_neighbours(node);
+        self.dag.remove_node(node)
+    }
+
+    /// Add an edge to the graph, logging both of its endpoints as changed.
+    fn graph_add_edge(&mut self, source: NodeIndex, target: NodeIndex, wire: Wire) -> EdgeIndex {
+        self.mark_changed(source);
+        self.mark_changed(target);
+        self.dag.add_edge(source, target, wire)
+    }
+
+    /// Remove an edge from the graph, logging both of its endpoints as changed.
+    fn graph_remove_edge(&mut self, edge: EdgeIndex) -> Option<Wire> {
+        if let Some((source, target)) = self.dag.edge_endpoints(edge) {
+            self.mark_changed(source);
+            self.mark_changed(target);
+        }
+        self.dag.remove_edge(edge)
+    }
+
     /// Return an iterator of 2 qubit operations. Ignore directives like snapshot and barrier.
     pub fn two_qubit_ops(&self) -> impl Iterator<Item = (NodeIndex, &PackedInstruction)> + '_ {
         self.op_nodes(false)
@@ -6385,8 +6606,7 @@ impl DAGCircuit {
                         }
                     })
                     .unwrap();
-                self.dag
-                    .add_edge(pred.source(), succ.target(), Wire::Qubit(*self_wire));
+                self.graph_add_edge(pred.source(), succ.target(), Wire::Qubit(*self_wire));
             }
         }
         for (in_dag_wire, self_wire) in clbit_map.iter() {
@@ -6414,8 +6634,7 @@ impl DAGCircuit {
                         }
                     })
                     .unwrap();
-                self.dag
-                    .add_edge(pred.source(), succ.target(), Wire::Clbit(*self_wire));
+                self.graph_add_edge(pred.source(), succ.target(), Wire::Clbit(*self_wire));
             }
         }
 
@@ -6463,13 +6682,13 @@ impl DAGCircuit {
                 new_inst.clbits = self.cargs_interner.insert_owned(new_clbit_indices);
                 self.increment_op(new_inst.op.name());
             }
-            let new_index = self.dag.add_node(new_node);
+            let new_index = self.graph_add_node(new_node);
             out_map.insert(old_index, new_index);
         }
         // If no nodes are copied bail here since there is nothing left
         // to do.
         if out_map.is_empty() {
-            match self.dag.remove_node(node) {
+            match self.graph_remove_node(node) {
                 Some(NodeType::Operation(packed)) => {
                     let op_name = packed.op.name();
                     self.decrement_op(op_name);
@@ -6483,7 +6702,7 @@ impl DAGCircuit {
         for edge in other.dag.edge_references().filter(|edge| {
             out_map.contains_key(&edge.target()) && out_map.contains_key(&edge.source())
         }) {
-            self.dag.add_edge(
+            self.graph_add_edge(
                 out_map[&edge.source()],
                 out_map[&edge.target()],
                 match edge.weight() {
@@ -6536,7 +6755,7 @@ impl DAGCircuit {
                 },
                 None => continue,
             };
-            self.dag.add_edge(source, target_out, weight);
+            self.graph_add_edge(source, target_out, weight);
         }
         let edges: Vec<(NodeIndex, NodeIndex, Wire)> = self
             .dag
@@ -6576,13 +6795,13 @@ impl DAGCircuit {
                 },
                 None => continue,
             };
-            self.dag.add_edge(source_out, target, weight);
+            self.graph_add_edge(source_out, target, weight);
         }
         // Remove node
         if let NodeType::Operation(inst) = &self.dag[node] {
             self.decrement_op(inst.op.name().to_string().as_str());
         }
-        self.dag.remove_node(node);
+        self.graph_remove_node(node);
         Ok(out_map)
     }
 
@@ -6801,6 +7020,9 @@ impl DAGCircuit {
             vars_declare: HashSet::new(),
             stretches_capture: HashSet::new(),
             stretches_declare: Vec::new(),
+            checkpoints: HashMap::new(),
+            change_log: Vec::new(),
+            change_log_start: 0,
         }
     }
 
@@ -6836,16 +7058,16 @@ impl DAGCircuit {
         } else {
             panic!("This method only works if provided index is an op node");
         };
-        let new_index = self.dag.add_node(NodeType::Operation(inst));
+        let new_index = self.graph_add_node(NodeType::Operation(inst));
         let (parent_index, edge_index, weight) = self
             .dag
             .edges_directed(old_index, Incoming)
             .map(|edge| (edge.source(), edge.id(), *edge.weight()))
             .next()
             .unwrap();
-        self.dag.add_edge(parent_index, new_index, weight);
-        self.dag.add_edge(new_index, old_index, weight);
-        self.dag.remove_edge(edge_index);
+        self.graph_add_edge(parent_index, new_index, weight);
+        self.graph_add_edge(new_index, old_index, weight);
+        self.graph_remove_edge(edge_index);
     }
 
     /// Remove a sequence of 1 qubit nodes from the dag
@@ -6864,9 +7086,9 @@ impl DAGCircuit {
             .map(|edge| edge.target())
             .next()
             .unwrap();
-        self.dag.add_edge(parent_index, child_index, weight);
+        self.graph_add_edge(parent_index, child_index, weight);
         for node in sequence {
-            match self.dag.remove_node(*node) {
+            match self.graph_remove_node(*node) {
                 Some(NodeType::Operation(packed)) => {
                     let op_name = packed.op.name();
                     self.decrement_op(op_name);
@@ -6917,12 +7139,12 @@ impl DAGCircuit {
                 #[cfg(feature = "cache_pygates")]
                 py_op: OnceLock::new(),
             };
-            let new_index = self.dag.add_node(NodeType::Operation(inst));
-            self.dag.add_edge(source, new_index, weight);
-            self.dag.add_edge(new_index, target, weight);
+            let new_index = self.graph_add_node(NodeType::Operation(inst));
+            self.graph_add_edge(source, new_index, weight);
+            self.graph_add_edge(new_index, target, weight);
         }
 
-        match self.dag.remove_node(node) {
+        match self.graph_remove_node(node) {
             Some(NodeType::Operation(packed)) => {
                 let op_name = packed.op.name();
                 self.decrement_op(op_name);
@@ -7329,6 +7551,7 @@ impl DAGCircuit {
                     "Replacing the specified node block would introduce a cycle",
                 ),
             })?;
+        self.mark_changed_with_neighbours(new_node);
 
         self.increment_op(op_name.as_str());
         for name in block_op_names {
@@ -7658,6 +7881,7 @@ impl DAGCircuit {
         if let Some(weight) = self.dag.node_weight_mut(node_index) {
             *weight = new_weight;
         }
+        self.mark_changed(node_index);
 
         // Update self.op_names
         self.decrement_op(op_name.as_str());
@@ -7735,6 +7959,7 @@ impl DAGCircuit {
         if let Some(weight) = self.dag.node_weight_mut(node_index) {
             *weight = new_weight;
         }
+        self.mark_changed(node_index);
 
         // Update self.op_names
         self.decrement_op(op_name.as_str());
@@ -7930,6 +8155,7 @@ impl DAGCircuitBuilder {
                 .dag
                 .add_edge(var_last_node, new_node, Wire::Var(*var));
         }
+        self.dag.mark_changed_with_neighbours(new_node);
         Ok(new_node)
     }
 
@@ -10,7 +10,9 @@
 // copyright notice, and modified files need to carry a notice indicating
 // that they have been altered from the originals.
 
+use numpy::{AllowTypeChange, IntoPyArray, PyArray1, PyArrayLike1};
 use pyo3::IntoPyObjectExt;
+use pyo3::exceptions::{PyIndexError, PyValueError};
 use pyo3::prelude::*;
 use pyo3::types::PyList;
 
@@ -127,12 +129,21 @@ impl VirtualQubit {
 /// This class tracks the layout (or mapping between virtual qubits in the the
 /// circuit and physical qubits on the physical device) efficiently
 ///
+/// The layout is stored as two integer arrays, so single lookups are :math:`O(1)`, and the
+/// :meth:`apply`, :meth:`inverse` and :meth:`compose` methods work on whole arrays of qubit
+/// indices at once, without handling any Python objects per qubit.  For example, to map the
+/// measured qubits of many shots from their positions in a transpiled circuit back to the qubits
+/// of the input circuit::
+///
+///     final = transpiled.layout.final_nlayout()
+///     virtual_qubits = final.inverse().apply(physical_qubits)
+///
 /// Args:
 ///     qubit_indices (dict): A dictionary mapping the virtual qubit index in the circuit to the
 ///         physical qubit index on the coupling graph.
 ///     logical_qubits (int): The number of logical qubits in the layout
 ///     physical_qubits (int): The number of physical qubits in the layout
-#[pyclass(module = "qiskit._accelerate.nlayout")]
+#[pyclass(module = "qiskit._accelerate.nlayout", eq)]
 #[derive(Clone, Debug, Eq, PartialEq)]
 pub struct NLayout {
     virt_to_phys: Vec<PhysicalQubit>,
@@ -214,6 +225,191 @@ impl NLayout {
         self.clone()
     }
 
+    fn __len__(&self) -> usize {
+        self.virt_to_phys.len()
+    }
+
+    /// The number of physical qubits in the layout.
+    #[getter]
+    fn num_physical_qubits(&self) -> usize {
+        self.phys_to_virt.len()
+    }
+
+    /// Return the physical qubit of each virtual qubit, as a new array.
+    ///
+    /// Virtual qubits that are not in the layout are marked with the largest ``uint32``.
+    #[pyo3(text_signature = "(self, /)")]
+    fn virtual_to_physical_array<'py>(&self, py: Python<'py>) -> Bound<'py, PyArray1<u32>> {
+        self.virt_to_phys
+            .iter()
+            .map(|phys| phys.0)
+            .collect::<Vec<_>>()
+            .into_pyarray(py)
+    }
+
+    /// Return the virtual qubit of each physical qubit, as a new array.
+    ///
+    /// Physical qubits that are not in the layout are marked with the largest ``uint32``.
+    #[pyo3(text_signature = "(self, /)")]
+    fn physical_to_virtual_array<'py>(&self, py: Python<'py>) -> Bound<'py, PyArray1<u32>> {
+        self.phys_to_virt
+            .iter()
+            .map(|virt| virt.0)
+            .collect::<Vec<_>>()
+            .into_pyarray(py)
+    }
+
+    /// Map an array of virtual qubit indices to their physical qubits.
+    ///
+    /// Args:
+    ///     virtual_qubits: an integer array of virtual qubit indices, of any length.
+    ///
+    /// Returns:
+    ///     numpy.ndarray: the physical qubit of each virtual qubit.
+    ///
+    /// Raises:
+    ///     IndexError: if a virtual qubit is out of range.
+    ///     ValueError: if a virtual qubit is not in the layout.
+    #[pyo3(text_signature = "(self, virtual_qubits, /)")]
+    fn apply<'py>(
+        &self,
+        py: Python<'py>,
+        virtual_qubits: PyArrayLike1<'py, i64, AllowTypeChange>,
+    ) -> PyResult<Bound<'py, PyArray1<i64>>> {
+        let mapped = virtual_qubits
+            .as_array()
+            .iter()
+            .map(|&virt| {
+                let phys = usize::try_from(virt)
+                    .ok()
+                    .and_then(|index| self.virt_to_phys.get(index))
+                    .ok_or_else(|| {
+                        PyIndexError::new_err(format!(
+                            "virtual qubit {virt} is out of range for a layout of {} qubits",
+                            self.virt_to_phys.len()
+                        ))
+                    })?;
+                if *phys == PhysicalQubit(u32::MAX) {
+                    return Err(PyValueError::new_err(format!(
+                        "virtual qubit {virt} is not in the layout"
+                    )));
+                }
+                Ok(phys.0 as i64)
+            })
+            .collect::<PyResult<Vec<_>>>()?;
+        Ok(mapped.into_pyarray(py))
+    }
+
+    /// Return the inverse layout, which maps the physical qubits of this layout to its virtual
+    /// qubits.
+    #[pyo3(text_signature = "(self, /)")]
+    pub fn inverse(&self) -> NLayout {
+        NLayout {
+            virt_to_phys: self
+                .phys_to_virt
+                .iter()
+                .map(|virt| PhysicalQubit(virt.0))
+                .collect(),
+            phys_to_virt: self
+                .virt_to_phys
+                .iter()
+                .map(|phys| VirtualQubit(phys.0))
+                .collect(),
+        }
+    }
+
+    /// Compose this layout with another one, which is applied after it.
+    ///
+    /// The physical qubits of this layout are the virtual qubits of ``other``, so the result maps
+    /// each virtual qubit of this layout to the physical qubit of ``other`` that its physical qubit
+    /// is mapped to.
+    ///
+    /// Args:
+    ///     other (NLayout): the layout to apply second.  It must have as many virtual qubits as
+    ///         this layout has physical qubits.
+    ///
+    /// Returns:
+    ///     NLayout: the composed layout.
+    #[pyo3(text_signature = "(self, other, /)")]
+    pub fn compose(&self, other: &NLayout) -> PyResult<NLayout> {
+        if self.phys_to_virt.len() != other.virt_to_phys.len() {
+            return Err(PyValueError::new_err(format!(
+                "cannot compose a layout onto {} physical qubits with a layout of {} virtual qubits",
+                self.phys_to_virt.len(),
+                other.virt_to_phys.len()
+            )));
+        }
+        Ok(NLayout {
+            virt_to_phys: self
+                .virt_to_phys
+                .iter()
+                .map(|phys| {
+                    other
+                        .virt_to_phys
+                        .get(phys.index())
+                        .copied()
+                        .unwrap_or(PhysicalQubit(u32::MAX))
+                })
+                .collect(),
+            phys_to_virt: other
+                .phys_to_virt
+                .iter()
+                .map(|virt| {
+                    self.phys_to_virt
+                        .get(virt.index())
+                        .copied()
+                        .unwrap_or(VirtualQubit(u32::MAX))
+                })
+                .collect(),
+        })
+    }
+
+    /// Create a layout from an array of the physical qubit of each virtual qubit.
+    ///
+    /// Args:
+    ///     virtual_to_physical: an integer array whose ``i``-th entry is the physical qubit of
+    ///         virtual qubit ``i``.
+    ///     num_physical_qubits (int | None): the number of physical qubits.  Defaults to the number
+    ///         of virtual qubits.
+    ///
+    /// Raises:
+    ///     ValueError: if a physical qubit is out of range or repeated.
+    #[staticmethod]
+    #[pyo3(signature = (virtual_to_physical, num_physical_qubits=None))]
+    pub fn from_array(
+        virtual_to_physical: PyArrayLike1<'_, i64, AllowTypeChange>,
+        num_physical_qubits: Option<usize>,
+    ) -> PyResult<Self> {
+        let virtual_to_physical = virtual_to_physical.as_array();
+        let num_physical_qubits = num_physical_qubits.unwrap_or(virtual_to_physical.len());
+        let mut phys_to_virt = vec![VirtualQubit(u32::MAX); num_physical_qubits];
+        let virt_to_phys = virtual_to_physical
+            .iter()
+            .enumerate()
+            .map(|(virt, &phys)| {
+                let slot = usize::try_from(phys)
+                    .ok()
+                    .and_then(|index| phys_to_virt.get_mut(index))
+                    .ok_or_else(|| {
+                        PyValueError::new_err(format!(
+                            "physical qubit {phys} is out of range for {num_physical_qubits} qubits"
+                        ))
+                    })?;
+                if *slot != VirtualQubit(u32::MAX) {
+                    return Err(PyValueError::new_err(format!(
+                        "physical qubit {phys} is assigned more than once"
+                    )));
+                }
+                *slot = VirtualQubit(virt as u32);
+                Ok(PhysicalQubit(phys as u32))
+            })
+            .collect::<PyResult<Vec<_>>>()?;
+        Ok(NLayout {
+            virt_to_phys,
+            phys_to_virt,
+        })
+    }
+
     #[staticmethod]
     pub fn generate_trivial_layout(num_qubits: u32) -> Self {
         NLayout {
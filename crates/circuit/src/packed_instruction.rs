@@ -10,6 +10,7 @@
 // copyright notice, and modified files need to carry a notice indicating
 // that they have been altered from the originals.
 
+use std::hash::{Hash, Hasher};
 #[cfg(feature = "cache_pygates")]
 use std::sync::OnceLock;
 
@@ -24,7 +25,7 @@ use crate::circuit_data::CircuitData;
 use crate::imports::{BARRIER, DELAY, MEASURE, RESET, UNITARY_GATE, get_std_gate_class};
 use crate::interner::Interned;
 use crate::operations::{
-    Operation, OperationRef, Param, PyGate, PyInstruction, PyOperation, PythonOperation,
+    ArrayType, Operation, OperationRef, Param, PyGate, PyInstruction, PyOperation, PythonOperation,
     StandardGate, StandardInstruction, UnitaryGate,
 };
 use crate::{Clbit, Qubit};
@@ -676,6 +677,48 @@ impl PackedInstruction {
         self.label.as_ref().map(|label| label.as_str())
     }
 
+    /// Feed a structural description of this instruction into a hasher.
+    ///
+    /// The description is made up of the operation name, the given `qubits` and `clbits` (the
+    /// resolved qargs and cargs of the instruction in its containing circuit), the parameters and,
+    /// for unitary gates, the matrix.  The label is not included.
+    ///
+    /// Returns `false` if some part of the instruction cannot be hashed, in which case the state of
+    /// the hasher should be discarded.  This is always the case for Python-space operations, since
+    /// their name and parameters do not determine their action (two custom gates can share both),
+    /// and for Python-space parameters that are not hashable.
+    pub fn hash_structure<H: Hasher>(
+        &self,
+        py: Python,
+        qubits: &[Qubit],
+        clbits: &[Clbit],
+        state: &mut H,
+    ) -> bool {
+        self.op.name().hash(state);
+        qubits.hash(state);
+        clbits.hash(state);
+        match self.op.view() {
+            OperationRef::StandardGate(_) | OperationRef::StandardInstruction(_) => (),
+            OperationRef::Gate(_) | OperationRef::Instruction(_) | OperationRef::Operation(_) => {
+                return false;
+            }
+            OperationRef::Unitary(unitary) => {
+                let mut hash_element = |element: &Complex64| {
+                    element.re.to_bits().hash(state);
+                    element.im.to_bits().hash(state);
+                };
+                match &unitary.array {
+                    ArrayType::NDArray(array) => array.iter().for_each(&mut hash_element),
+                    ArrayType::OneQ(matrix) => matrix.iter().for_each(&mut hash_element),
+                    ArrayType::TwoQ(matrix) => matrix.iter().for_each(&mut hash_element),
+                }
+            }
+        }
+        self.params_view()
+            .iter()
+            .all(|param| hash_param(py, param, state))
+    }
+
     /// Build a reference to the Python-space operation object (the `Gate`, etc) packed into this
     /// instruction.  This may construct the reference if the `PackedInstruction` is a standard
     /// gate or instruction with no already stored operation.
@@ -784,3 +827,19 @@ impl PackedInstruction {
         Ok(())
     }
 }
+
+/// Feed a parameter into a hasher.
+///
+/// Floats are hashed by their exact bit pattern.  Returns `false` if the parameter is a Python
+/// object that is not hashable.
+pub fn hash_param<H: Hasher>(py: Python, param: &Param, state: &mut H) -> bool {
+    match param {
+        Param::Float(value) => value.to_bits().hash(state),
+        Param::ParameterExpression(expr) => expr.hash(state),
+        Param::Obj(ob) => match ob.bind(py).hash() {
+            Ok(value) => value.hash(state),
+            Err(_) => return false,
+        },
+    }
+    true
+}
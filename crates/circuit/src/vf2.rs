@@ -1241,6 +1241,12 @@ where
     NS: Semantics<N::NodeWeight, H::NodeWeight>,
     ES: Semantics<N::EdgeWeight, H::EdgeWeight, Score = NS::Score>,
 {
+    /// Whether the iteration was stopped because the call limit was exhausted, rather than because
+    /// the search space was.
+    pub fn call_limit_reached(&self) -> bool {
+        self.remaining_calls == Some(0)
+    }
+
     fn mapping(&self) -> IndexMap<NId, HId, ::ahash::RandomState> {
         self.needle
             .mapping
@@ -0,0 +1,217 @@
+// This code is part of Qiskit.
+//
+// (C) Copyright IBM 2025
+//
+// This code is licensed under the Apache License, Version 2.0. You may
+// obtain a copy of this license in the LICENSE.txt file in the root directory
+// of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+//
+// Any modifications or derivative works of this code must retain this
+// copyright notice, and modified files need to carry a notice indicating
+// that they have been altered from the originals.
+
+//! Lookup tables of optimal CX-cost syntheses for 2-qubit and 3-qubit Cliffords.
+//!
+//! A Clifford is determined by the symplectic part of its tableau and by the phases of its
+//! rows. The tables only hold syntheses of symplectic matrices, with all phases equal to zero:
+//! prepending a Pauli to such a synthesis flips the phases of the rows that anticommute with the
+//! Pauli, so the phases of any Clifford are corrected by a single layer of Pauli gates.
+//!
+//! The tables are further reduced by the qubit permutations: conjugating a Clifford by a
+//! permutation of its qubits permutes both the rows and the columns of its tableau, and relabeling
+//! the qubits of a synthesis of the conjugated Clifford gives a synthesis of the original one. So
+//! each symplectic matrix is looked up by the smallest key among its permutations.
+//!
+//! The table for 2-qubit Cliffords, whose symplectic group has 720 elements, is fully generated
+//! the first time it is used. The symplectic group for 3 qubits has 1451520 elements, so the
+//! entries of the table for 3-qubit Cliffords are instead generated the first time they are used.
+//! The entries are synthesized with the Bravyi-Maslov method, and are thus CX-optimal.
+
+use std::collections::VecDeque;
+use std::sync::{Arc, LazyLock, RwLock};
+
+use hashbrown::{HashMap, HashSet};
+use ndarray::{Array2, ArrayView2};
+use qiskit_circuit::Qubit;
+use qiskit_circuit::operations::{Operation, StandardGate};
+use qiskit_quantum_info::clifford::Clifford;
+use smallvec::smallvec;
+
+use crate::clifford::bm_synthesis::synth_clifford_bm_inner;
+use crate::clifford::utils::CliffordGatesVec;
+
+/// The permutations of the qubits of a 2-qubit Clifford.
+const PERMUTATIONS_2Q: [[usize; 3]; 2] = [[0, 1, 2], [1, 0, 2]];
+
+/// The permutations of the qubits of a 3-qubit Clifford.
+const PERMUTATIONS_3Q: [[usize; 3]; 6] = [
+    [0, 1, 2],
+    [0, 2, 1],
+    [1, 0, 2],
+    [1, 2, 0],
+    [2, 0, 1],
+    [2, 1, 0],
+];
+
+/// A gate of a tabulated synthesis, and the indices of the qubits it acts on.
+type TableGate = (StandardGate, [u8; 2]);
+
+static TABLE_2Q: LazyLock<CliffordTable> = LazyLock::new(CliffordTable::complete_2q);
+
+static TABLE_3Q: LazyLock<CliffordTable> = LazyLock::new(|| CliffordTable::new(3));
+
+/// A table of syntheses for the symplectic matrices on a fixed number of qubits, keyed by the
+/// bits of the matrices in row-major order.
+struct CliffordTable {
+    num_qubits: usize,
+    entries: RwLock<HashMap<u64, Arc<[TableGate]>>>,
+}
+
+impl CliffordTable {
+    fn new(num_qubits: usize) -> Self {
+        Self {
+            num_qubits,
+            entries: RwLock::new(HashMap::new()),
+        }
+    }
+
+    /// Creates the table for 2-qubit Cliffords, with the entries for all the symplectic matrices.
+    fn complete_2q() -> Self {
+        let table = Self::new(2);
+        // Enumerate the symplectic group by a breadth-first search over its generators.
+        let mut seen = HashSet::from([symplectic_key(Clifford::identity(2).tableau.view(), 2)]);
+        let mut queue = VecDeque::from([Clifford::identity(2)]);
+        while let Some(clifford) = queue.pop_front() {
+            table
+                .get(canonical_key(clifford.tableau.view(), 2).0)
+                .expect("The Bravyi-Maslov synthesis handles all 2-qubit Cliffords.");
+            for generator in 0..5 {
+                let mut next = clifford.clone();
+                match generator {
+                    0 | 1 => next.append_h(generator),
+                    2 | 3 => next.append_s(generator - 2),
+                    _ => next.append_cx(0, 1),
+                }
+                if seen.insert(symplectic_key(next.tableau.view(), 2)) {
+                    queue.push_back(next);
+                }
+            }
+        }
+        table
+    }
+
+    /// Returns the synthesis of the symplectic matrix with the given key, synthesizing it if
+    /// it is not in the table.
+    fn get(&self, key: u64) -> Result<Arc<[TableGate]>, String> {
+        if let Some(gates) = self.entries.read().unwrap().get(&key) {
+            return Ok(gates.clone());
+        }
+        let (_, gates) = synth_clifford_bm_inner(tableau_from_key(key, self.num_qubits).view())?;
+        let gates: Arc<[TableGate]> = gates
+            .into_iter()
+            .map(|(gate, _, qubits)| {
+                let mut indices = [0; 2];
+                for (index, qubit) in indices.iter_mut().zip(qubits) {
+                    *index = qubit.index() as u8;
+                }
+                (gate, indices)
+            })
+            .collect();
+        let mut entries = self.entries.write().unwrap();
+        Ok(entries.entry(key).or_insert(gates).clone())
+    }
+}
+
+/// Returns the key of the symplectic part of a tableau.
+fn symplectic_key(tableau: ArrayView2<bool>, num_qubits: usize) -> u64 {
+    permuted_key(tableau, num_qubits, &[0, 1, 2])
+}
+
+/// Returns the key of the symplectic part of a tableau, whose qubits are relabeled so that qubit
+/// `q` becomes qubit `permutation[q]`.
+fn permuted_key(tableau: ArrayView2<bool>, num_qubits: usize, permutation: &[usize; 3]) -> u64 {
+    let size = 2 * num_qubits;
+    let index = |i: usize| {
+        if i < num_qubits {
+            permutation[i]
+        } else {
+            num_qubits + permutation[i - num_qubits]
+        }
+    };
+    let mut key = 0;
+    for row in 0..size {
+        for col in 0..size {
+            if tableau[[row, col]] {
+                key |= 1u64 << (index(row) * size + index(col));
+            }
+        }
+    }
+    key
+}
+
+/// Returns the smallest key of the symplectic part of a tableau among its qubit permutations,
+/// and the permutation that achieves it.
+fn canonical_key(tableau: ArrayView2<bool>, num_qubits: usize) -> (u64, [usize; 3]) {
+    let permutations: &[[usize; 3]] = if num_qubits == 2 {
+        &PERMUTATIONS_2Q
+    } else {
+        &PERMUTATIONS_3Q
+    };
+    permutations
+        .iter()
+        .map(|permutation| (permuted_key(tableau, num_qubits, permutation), *permutation))
+        .min_by_key(|(key, _)| *key)
+        .unwrap()
+}
+
+/// Returns the tableau with the given symplectic key and all phases equal to zero.
+fn tableau_from_key(key: u64, num_qubits: usize) -> Array2<bool> {
+    let size = 2 * num_qubits;
+    Array2::from_shape_fn((size, size + 1), |(row, col)| {
+        col < size && key & (1u64 << (row * size + col)) != 0
+    })
+}
+
+/// Optimal CX-cost decomposition of a Clifford object (represented by ``tableau``)
+/// for Cliffords up to 3 qubits, using the lookup tables for 2-qubit and 3-qubit Cliffords.
+pub fn synth_clifford_lookup(
+    tableau: ArrayView2<bool>,
+) -> Result<(usize, CliffordGatesVec), String> {
+    let num_qubits = tableau.shape()[0] / 2;
+    let table = match num_qubits {
+        2 => &*TABLE_2Q,
+        3 => &*TABLE_3Q,
+        _ => return synth_clifford_bm_inner(tableau),
+    };
+
+    let (key, permutation) = canonical_key(tableau, num_qubits);
+    let table_gates = table.get(key)?;
+    let mut inverse = [0; 3];
+    for (qubit, image) in permutation.iter().enumerate() {
+        inverse[*image] = qubit;
+    }
+
+    let mut gates = CliffordGatesVec::with_capacity(num_qubits + table_gates.len());
+    // The tabulated synthesis has no phases. Prepending Z (resp. X) on a qubit flips the phase
+    // of its destabilizer (resp. stabilizer).
+    for qubit in 0..num_qubits {
+        let destab_phase = tableau[[qubit, 2 * num_qubits]];
+        let stab_phase = tableau[[qubit + num_qubits, 2 * num_qubits]];
+        let gate = match (destab_phase, stab_phase) {
+            (true, false) => StandardGate::Z,
+            (false, true) => StandardGate::X,
+            (true, true) => StandardGate::Y,
+            (false, false) => continue,
+        };
+        gates.push((gate, smallvec![], smallvec![Qubit::new(qubit)]));
+    }
+    for (gate, indices) in table_gates.iter() {
+        let qubits = indices[..gate.num_qubits() as usize]
+            .iter()
+            .map(|index| Qubit::new(inverse[*index as usize]))
+            .collect();
+        gates.push((*gate, smallvec![], qubits));
+    }
+
+    Ok((num_qubits, gates))
+}
@@ -12,12 +12,13 @@
 
 mod bm_synthesis;
 pub(crate) mod greedy_synthesis;
+mod lookup_table;
 mod random_clifford;
 pub(crate) mod utils;
 
 use crate::QiskitError;
-use crate::clifford::bm_synthesis::synth_clifford_bm_inner;
 use crate::clifford::greedy_synthesis::GreedyCliffordSynthesis;
+use crate::clifford::lookup_table::synth_clifford_lookup;
 use numpy::{IntoPyArray, PyArray2, PyReadonlyArray2};
 use pyo3::prelude::*;
 use qiskit_circuit::circuit_data::CircuitData;
@@ -71,12 +72,16 @@ fn random_clifford_tableau(
 ///
 /// This implementation follows the paper "Hadamard-free circuits expose the structure
 /// of the Clifford group" by S. Bravyi, D. Maslov (2020), `<https://arxiv.org/abs/2003.09412>`__.
+///
+/// The syntheses of 2-qubit and 3-qubit Cliffords are looked up in tables, which hold one
+/// synthesis for each symplectic matrix up to qubit permutations, and the phases are corrected
+/// by a layer of Pauli gates.
 #[pyfunction]
 #[pyo3(signature = (clifford))]
 fn synth_clifford_bm(clifford: PyReadonlyArray2<bool>) -> PyResult<CircuitData> {
     let tableau = clifford.as_array();
     let (num_qubits, clifford_gates) =
-        synth_clifford_bm_inner(tableau).map_err(QiskitError::new_err)?;
+        synth_clifford_lookup(tableau).map_err(QiskitError::new_err)?;
     CircuitData::from_standard_gates(num_qubits as u32, clifford_gates, Param::Float(0.0))
 }
 
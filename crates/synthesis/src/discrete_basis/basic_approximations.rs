@@ -28,6 +28,7 @@ use std::fmt::Debug;
 use thiserror::Error;
 
 use super::math;
+use super::table::ApproximationTable;
 
 #[derive(Error, Debug)]
 pub enum DiscreteBasisError {
@@ -428,12 +429,17 @@ impl BasicApproximations {
     ///
     /// This is for legacy compatibility with the old Python version of SK.
     pub fn load_from_sequences(sequences: &[GateSequence]) -> Self {
-        let mut points: RTree<BasicPoint> = RTree::new();
         let mut approximations: HashMap<usize, GateSequence> = HashMap::new();
         for (unique_index, sequence) in sequences.iter().enumerate() {
             approximations.insert(unique_index, sequence.clone());
-            points.insert(BasicPoint::from_sequence(sequence, unique_index));
         }
+        let points = RTree::bulk_load(
+            sequences
+                .iter()
+                .enumerate()
+                .map(|(index, sequence)| BasicPoint::from_sequence(sequence, index))
+                .collect(),
+        );
         Self {
             points,
             approximations,
@@ -483,11 +489,14 @@ impl BasicApproximations {
             .map(|(key, value)| (*key, GateSequence::from(value)))
             .collect::<HashMap<usize, GateSequence>>();
 
-        // build the RTree from the sequences
-        let mut points: RTree<BasicPoint> = RTree::new();
-        for (index, sequence) in approximations.iter() {
-            points.insert(BasicPoint::from_sequence(sequence, *index));
-        }
+        // build the RTree from the sequences; bulk loading is much faster than inserting the
+        // points one at a time, and gives a better balanced tree
+        let points = RTree::bulk_load(
+            approximations
+                .iter()
+                .map(|(index, sequence)| BasicPoint::from_sequence(sequence, *index))
+                .collect(),
+        );
 
         Ok(Self {
             points,
@@ -496,6 +505,41 @@ impl BasicApproximations {
     }
 }
 
+/// The basic approximations used by Solovay-Kitaev, either held in memory or borrowed from a
+/// memory-mapped table file (see [ApproximationTable]).
+pub enum ApproximationSet {
+    Tree(BasicApproximations),
+    Table(ApproximationTable),
+}
+
+impl ApproximationSet {
+    /// Query the closest sequence to an SO(3) matrix.
+    pub fn query(&self, matrix: &Matrix3<f64>) -> Option<GateSequence> {
+        match self {
+            Self::Tree(tree) => tree.query(matrix).cloned(),
+            Self::Table(table) => Some(table.sequence(table.nearest(matrix))),
+        }
+    }
+
+    /// Get all the sequences in the set.
+    pub fn sequences(&self) -> Vec<GateSequence> {
+        match self {
+            Self::Tree(tree) => tree.approximations.values().cloned().collect(),
+            Self::Table(table) => table.sequences(),
+        }
+    }
+
+    /// Save the basic approximations into a file, see [BasicApproximations::save].
+    pub fn save(&self, filename: &str) -> ::std::io::Result<()> {
+        match self {
+            Self::Tree(tree) => tree.save(filename),
+            Self::Table(table) => {
+                BasicApproximations::load_from_sequences(&table.sequences()).save(filename)
+            }
+        }
+    }
+}
+
 #[inline]
 fn matrix3_from_pyreadonly(array: &PyReadonlyArray2<f64>) -> Matrix3<f64> {
     Matrix3::from_fn(|i, j| *array.get((i, j)).unwrap())
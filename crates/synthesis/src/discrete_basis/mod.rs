@@ -13,6 +13,7 @@
 mod basic_approximations;
 mod math;
 mod solovay_kitaev;
+mod table;
 
 use pyo3::prelude::*;
 
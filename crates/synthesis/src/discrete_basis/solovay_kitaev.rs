@@ -11,7 +11,9 @@
 // that they have been altered from the originals.
 
 use nalgebra::{Matrix2, Matrix3};
-use numpy::{Complex64, PyReadonlyArray2};
+use std::path::PathBuf;
+
+use numpy::{Complex64, PyArray1, PyArray2, PyReadonlyArray2};
 use pyo3::exceptions::{PyRuntimeError, PyValueError};
 use pyo3::types::PyString;
 use pyo3::{prelude::*, types::PyList};
@@ -19,21 +21,24 @@ use qiskit_circuit::circuit_data::CircuitData;
 use qiskit_circuit::circuit_instruction::OperationFromPython;
 use qiskit_circuit::operations::{Operation, OperationRef, Param, StandardGate};
 
-use crate::discrete_basis::basic_approximations::{BasicApproximations, GateSequence};
+use crate::discrete_basis::basic_approximations::{
+    ApproximationSet, BasicApproximations, GateSequence,
+};
 
 use super::basic_approximations::DiscreteBasisError;
 use super::math::{self, group_commutator_decomposition};
+use super::table::{ApproximationTable, write_table};
 
 /// A stateful implementation of Solovay Kitaev.
 ///
 /// The code is based mainly on https://arxiv.org/pdf/quant-ph/0505030.
 ///
-/// This generates the basic approximation set once as R-tree and re-uses it for
-/// each queried decomposition.
+/// This generates the basic approximation set once as R-tree (or maps it from a table file) and
+/// re-uses it for each queried decomposition.
 #[pyclass]
 pub struct SolovayKitaevSynthesis {
     /// The set of basic approximations.
-    basic_approximations: BasicApproximations,
+    basic_approximations: ApproximationSet,
     /// Whether to perform runtime checks on the handled matrices/data.
     do_checks: bool,
 }
@@ -47,7 +52,8 @@ impl SolovayKitaevSynthesis {
         tol: Option<f64>,
         do_checks: bool,
     ) -> Result<Self, DiscreteBasisError> {
-        let basic_approximations = BasicApproximations::generate_from(basis_gates, depth, tol)?;
+        let basic_approximations =
+            ApproximationSet::Tree(BasicApproximations::generate_from(basis_gates, depth, tol)?);
         Ok(Self {
             basic_approximations,
             do_checks,
@@ -114,8 +120,7 @@ impl SolovayKitaevSynthesis {
             let basic_approximation = self
                 .basic_approximations
                 .query(matrix_so3)
-                .expect("No basic approximation in root found")
-                .clone();
+                .expect("No basic approximation in root found");
             return basic_approximation;
         }
 
@@ -143,7 +148,7 @@ impl SolovayKitaevSynthesis {
 
     /// Load basic approximation from a file to instantiate this class.
     fn from_basic_approximations(filename: &str, do_checks: bool) -> ::std::io::Result<Self> {
-        let basic_approximations = BasicApproximations::load(filename)?;
+        let basic_approximations = ApproximationSet::Tree(BasicApproximations::load(filename)?);
         Ok(Self {
             basic_approximations,
             do_checks,
@@ -252,12 +257,9 @@ impl SolovayKitaevSynthesis {
     ///
     /// Legacy compat.
     fn find_basic_approximation(&self, sequence: GateSequence) -> GateSequence {
-        let approximation = self
-            .basic_approximations
+        self.basic_approximations
             .query(&sequence.matrix_so3)
-            .expect("No basic approximation found");
-
-        approximation.clone()
+            .expect("No basic approximation found")
     }
 
     /// Query the basic approximation for a :class:`.Gate`.
@@ -340,7 +342,8 @@ impl SolovayKitaevSynthesis {
     /// Load from a list of [GateSequence]s.
     #[staticmethod]
     fn from_sequences(sequences: Vec<GateSequence>, do_checks: bool) -> Self {
-        let basic_approximations = BasicApproximations::load_from_sequences(&sequences);
+        let basic_approximations =
+            ApproximationSet::Tree(BasicApproximations::load_from_sequences(&sequences));
         Self {
             basic_approximations,
             do_checks,
@@ -351,11 +354,44 @@ impl SolovayKitaevSynthesis {
     ///
     /// Legacy compatibility.
     fn get_gate_sequences(&self) -> Vec<GateSequence> {
-        self.basic_approximations
-            .approximations
-            .values()
-            .cloned()
-            .collect()
+        self.basic_approximations.sequences()
+    }
+
+    /// Store the basic approximations as a table that can be memory-mapped.
+    ///
+    /// The file is written atomically, so processes can safely load it while it is replaced.
+    fn save_basic_approximation_table(&self, py: Python, filename: PathBuf) -> PyResult<()> {
+        let sequences = self.basic_approximations.sequences();
+        py.detach(|| write_table(&sequences, &filename))
+            .map_err(PyRuntimeError::new_err)
+    }
+
+    /// Load from the arrays of a basic-approximation table, which are used in place.
+    ///
+    /// Args:
+    ///     matrices: the ``(n, 9)`` column-major SO(3) matrices of the sequences.
+    ///     phases: the ``(n,)`` global phases of the sequences.
+    ///     partition: the ``(n + 1,)`` partition of ``gates`` into the sequences.
+    ///     splits: the ``(n,)`` splitting coordinates of the k-d tree.
+    ///     gates: the gates of all the sequences, as :class:`.StandardGate` values.
+    ///     do_checks: whether to perform runtime checks.
+    ///
+    /// All arrays must be read-only and C-contiguous, such as the ``numpy.memmap`` arrays of a
+    /// table file.  They are kept alive by the returned object.
+    #[staticmethod]
+    fn from_basic_approximation_table(
+        matrices: &Bound<PyArray2<f64>>,
+        phases: &Bound<PyArray1<f64>>,
+        partition: &Bound<PyArray1<u64>>,
+        splits: &Bound<PyArray1<u8>>,
+        gates: &Bound<PyArray1<u8>>,
+        do_checks: bool,
+    ) -> PyResult<Self> {
+        let table = ApproximationTable::from_arrays(matrices, phases, partition, splits, gates)?;
+        Ok(Self {
+            basic_approximations: ApproximationSet::Table(table),
+            do_checks,
+        })
     }
 }
 
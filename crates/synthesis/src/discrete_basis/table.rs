@@ -0,0 +1,305 @@
+// This code is part of Qiskit.
+//
+// (C) Copyright IBM 2025
+//
+// This code is licensed under the Apache License, Version 2.0. You may
+// obtain a copy of this license in the LICENSE.txt file in the root directory
+// of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+//
+// Any modifications or derivative works of this code must retain this
+// copyright notice, and modified files need to carry a notice indicating
+// that they have been altered from the originals.
+
+//! Basic-approximation tables that are written once and memory-mapped by every process.
+//!
+//! A table holds the gate sequences of a set of basic approximations together with a k-d tree over
+//! their SO(3) representations.  The sequences are stored in the order of an implicit, balanced k-d
+//! tree: the root of the range `lo..hi` is the element `lo + (hi - lo) / 2`, which splits the rest
+//! of the range on the coordinate stored for it.  The tree needs no pointers, so it is searched in
+//! place in the mapped file (by `numpy.memmap` on the Python side), and all the processes that map
+//! the same file share a single copy of it.
+//!
+//! The file format is little-endian throughout:
+//!
+//! * a 32-byte header: the 8 bytes `QKSKBA01`, then the number of sequences `n`, the total number
+//!   of gates `m`, and a reserved zero, each as a `u64`;
+//! * the SO(3) matrices, as `n * 9` column-major `f64` values;
+//! * the global phases, as `n` `f64` values;
+//! * the partition of the gates, as `n + 1` `u64` values;
+//! * the splitting coordinate of each tree node, as `n` `u8` values;
+//! * the gates, as `m` `u8` [StandardGate] values.
+
+use std::fs::File;
+use std::io::{BufWriter, Write};
+use std::path::Path;
+
+use nalgebra::Matrix3;
+use numpy::{Element, PyArray, PyArrayMethods, PyUntypedArrayMethods};
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use qiskit_circuit::operations::StandardGate;
+
+use super::basic_approximations::GateSequence;
+
+const MAGIC: &[u8; 8] = b"QKSKBA01";
+const DIMENSIONS: usize = 9;
+
+/// A read-only slice of the buffer of a Python object, such as a `numpy.memmap`.
+struct SharedSlice<T> {
+    // Keeps the buffer alive.
+    _owner: Py<PyAny>,
+    data: *const T,
+    len: usize,
+}
+
+// SAFETY: the buffer is read-only and lives as long as `owner`, which is `Send` and `Sync`.
+unsafe impl<T: Sync> Send for SharedSlice<T> {}
+unsafe impl<T: Sync> Sync for SharedSlice<T> {}
+
+impl<T: Element> SharedSlice<T> {
+    /// Borrow the buffer of a read-only, C-contiguous and aligned array.
+    fn from_array<D: ndarray::Dimension>(
+        array: &Bound<PyArray<T, D>>,
+        name: &str,
+    ) -> PyResult<Self> {
+        if array
+            .getattr("flags")?
+            .getattr("writeable")?
+            .extract::<bool>()?
+        {
+            return Err(PyValueError::new_err(format!(
+                "the {name} array must be read-only"
+            )));
+        }
+        if !array.is_c_contiguous() {
+            return Err(PyValueError::new_err(format!(
+                "the {name} array must be C-contiguous"
+            )));
+        }
+        let data = array.data() as *const T;
+        if !data.is_aligned() {
+            return Err(PyValueError::new_err(format!(
+                "the {name} array must be aligned"
+            )));
+        }
+        Ok(Self {
+            _owner: array.clone().into_any().unbind(),
+            data,
+            len: array.len(),
+        })
+    }
+
+    #[inline]
+    fn as_slice(&self) -> &[T] {
+        // SAFETY: we checked the layout and alignment of the buffer, which is not written to and
+        // is kept alive by the owner.
+        unsafe { std::slice::from_raw_parts(self.data, self.len) }
+    }
+}
+
+/// A set of basic approximations whose sequences and search tree are borrowed from a table file.
+pub struct ApproximationTable {
+    matrices: SharedSlice<f64>,
+    phases: SharedSlice<f64>,
+    partition: SharedSlice<u64>,
+    splits: SharedSlice<u8>,
+    gates: SharedSlice<u8>,
+}
+
+impl ApproximationTable {
+    /// Borrow the arrays of a table file, checking that they form a valid table.
+    pub fn from_arrays(
+        matrices: &Bound<PyArray<f64, ndarray::Ix2>>,
+        phases: &Bound<PyArray<f64, ndarray::Ix1>>,
+        partition: &Bound<PyArray<u64, ndarray::Ix1>>,
+        splits: &Bound<PyArray<u8, ndarray::Ix1>>,
+        gates: &Bound<PyArray<u8, ndarray::Ix1>>,
+    ) -> PyResult<Self> {
+        let num_sequences = phases.len();
+        if num_sequences == 0 {
+            return Err(PyValueError::new_err("the table contains no sequences"));
+        }
+        if matrices.shape() != [num_sequences, DIMENSIONS]
+            || partition.len() != num_sequences + 1
+            || splits.len() != num_sequences
+        {
+            return Err(PyValueError::new_err(
+                "the table arrays have inconsistent lengths",
+            ));
+        }
+        let out = Self {
+            matrices: SharedSlice::from_array(matrices, "matrix")?,
+            phases: SharedSlice::from_array(phases, "phase")?,
+            partition: SharedSlice::from_array(partition, "partition")?,
+            splits: SharedSlice::from_array(splits, "split")?,
+            gates: SharedSlice::from_array(gates, "gate")?,
+        };
+        let partition = out.partition.as_slice();
+        if partition[0] != 0
+            || partition.windows(2).any(|pair| pair[0] > pair[1])
+            || partition[num_sequences] != out.gates.len as u64
+        {
+            return Err(PyValueError::new_err("the gate partition is invalid"));
+        }
+        if out
+            .splits
+            .as_slice()
+            .iter()
+            .any(|&dim| dim as usize >= DIMENSIONS)
+        {
+            return Err(PyValueError::new_err(
+                "a splitting coordinate is out of range",
+            ));
+        }
+        if out
+            .gates
+            .as_slice()
+            .iter()
+            .any(|&gate| ::bytemuck::checked::try_cast::<u8, StandardGate>(gate).is_err())
+        {
+            return Err(PyValueError::new_err("the table contains an invalid gate"));
+        }
+        Ok(out)
+    }
+
+    /// The number of sequences in the table.
+    #[inline]
+    fn len(&self) -> usize {
+        self.phases.len
+    }
+
+    #[inline]
+    fn point(&self, index: usize) -> &[f64] {
+        &self.matrices.as_slice()[DIMENSIONS * index..DIMENSIONS * (index + 1)]
+    }
+
+    /// Get the sequence at the given index.
+    pub fn sequence(&self, index: usize) -> GateSequence {
+        let partition = self.partition.as_slice();
+        let gates = self.gates.as_slice()[partition[index] as usize..partition[index + 1] as usize]
+            .iter()
+            .map(|gate| ::bytemuck::checked::cast::<u8, StandardGate>(*gate))
+            .collect();
+        GateSequence {
+            gates,
+            matrix_so3: Matrix3::from_column_slice(self.point(index)),
+            phase: self.phases.as_slice()[index],
+        }
+    }
+
+    /// Get all the sequences in the table.
+    pub fn sequences(&self) -> Vec<GateSequence> {
+        (0..self.len()).map(|index| self.sequence(index)).collect()
+    }
+
+    /// Find the index of the sequence whose SO(3) representation is closest to ``matrix``.
+    pub fn nearest(&self, matrix: &Matrix3<f64>) -> usize {
+        let query: [f64; DIMENSIONS] = ::core::array::from_fn(|i| matrix[(i % 3, i / 3)]);
+        let mut best = (f64::INFINITY, 0);
+        self.search(0, self.len(), &query, &mut best);
+        best.1
+    }
+
+    fn search(&self, lo: usize, hi: usize, query: &[f64; DIMENSIONS], best: &mut (f64, usize)) {
+        if lo >= hi {
+            return;
+        }
+        let mid = lo + (hi - lo) / 2;
+        let point = self.point(mid);
+        let distance = point
+            .iter()
+            .zip(query)
+            .map(|(a, b)| (a - b) * (a - b))
+            .sum::<f64>();
+        if distance < best.0 {
+            *best = (distance, mid);
+        }
+        let dim = self.splits.as_slice()[mid] as usize;
+        let diff = query[dim] - point[dim];
+        let (near, far) = if diff < 0. {
+            ((lo, mid), (mid + 1, hi))
+        } else {
+            ((mid + 1, hi), (lo, mid))
+        };
+        self.search(near.0, near.1, query, best);
+        if diff * diff < best.0 {
+            self.search(far.0, far.1, query, best);
+        }
+    }
+}
+
+/// Order `order` as an implicit k-d tree over `points`, writing the splitting coordinate of each
+/// node into the matching position of `splits`.
+fn arrange(points: &[[f64; DIMENSIONS]], order: &mut [usize], splits: &mut [u8]) {
+    if order.is_empty() {
+        return;
+    }
+    // Split on the coordinate with the largest spread, which prunes the search best.
+    let spread = |dim: usize| {
+        let (min, max) = order
+            .iter()
+            .fold((f64::INFINITY, f64::NEG_INFINITY), |acc, &i| {
+                (acc.0.min(points[i][dim]), acc.1.max(points[i][dim]))
+            });
+        max - min
+    };
+    let dim = (0..DIMENSIONS)
+        .max_by(|&a, &b| spread(a).total_cmp(&spread(b)))
+        .unwrap();
+    let mid = order.len() / 2;
+    order.select_nth_unstable_by(mid, |&a, &b| points[a][dim].total_cmp(&points[b][dim]));
+    splits[mid] = dim as u8;
+    let (order_lo, order_hi) = order.split_at_mut(mid);
+    let (splits_lo, splits_hi) = splits.split_at_mut(mid);
+    arrange(points, order_lo, splits_lo);
+    arrange(points, &mut order_hi[1..], &mut splits_hi[1..]);
+}
+
+/// Write a table of the given sequences to a file.
+///
+/// The file is written to a temporary path beside the target, and then renamed into place, so a
+/// process never maps a partially written table.
+pub fn write_table(sequences: &[GateSequence], path: &Path) -> std::io::Result<()> {
+    let points = sequences
+        .iter()
+        .map(|sequence| ::core::array::from_fn(|i| sequence.matrix_so3[(i % 3, i / 3)]))
+        .collect::<Vec<[f64; DIMENSIONS]>>();
+    let mut order = (0..sequences.len()).collect::<Vec<_>>();
+    let mut splits = vec![0u8; sequences.len()];
+    arrange(&points, &mut order, &mut splits);
+    let num_gates = sequences
+        .iter()
+        .map(|sequence| sequence.gates.len())
+        .sum::<usize>();
+
+    let mut tmp_name = path.file_name().unwrap_or_default().to_owned();
+    tmp_name.push(format!(".{}.tmp", std::process::id()));
+    let tmp_path = path.with_file_name(tmp_name);
+    let mut file = BufWriter::new(File::create(&tmp_path)?);
+    file.write_all(MAGIC)?;
+    for value in [sequences.len() as u64, num_gates as u64, 0] {
+        file.write_all(&value.to_le_bytes())?;
+    }
+    for &index in &order {
+        for value in points[index] {
+            file.write_all(&value.to_le_bytes())?;
+        }
+    }
+    for &index in &order {
+        file.write_all(&sequences[index].phase.to_le_bytes())?;
+    }
+    let mut offset = 0u64;
+    file.write_all(&offset.to_le_bytes())?;
+    for &index in &order {
+        offset += sequences[index].gates.len() as u64;
+        file.write_all(&offset.to_le_bytes())?;
+    }
+    file.write_all(&splits)?;
+    for &index in &order {
+        for gate in &sequences[index].gates {
+            file.write_all(&[*gate as u8])?;
+        }
+    }
+    file.into_inner()?.sync_all()?;
+    std::fs::rename(&tmp_path, path)
+}
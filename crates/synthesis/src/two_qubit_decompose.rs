@@ -23,16 +23,21 @@ use num_complex::{Complex, Complex64, ComplexFloat};
 use num_traits::Zero;
 use smallvec::{SmallVec, smallvec};
 use std::f64::consts::{FRAC_1_SQRT_2, PI};
+use std::hash::{DefaultHasher, Hash, Hasher};
 use std::ops::Deref;
+use std::sync::{LazyLock, Mutex};
 
 use faer::Side::Lower;
 use faer::{Mat, MatRef, Scale, prelude::*};
 use faer_ext::{IntoFaer, IntoNdarray};
+use indexmap::{IndexMap, IndexSet};
 use ndarray::Zip;
 use ndarray::linalg::kron;
 use ndarray::prelude::*;
 use numpy::{IntoPyArray, ToPyArray};
-use numpy::{PyArray2, PyArrayLike2, PyReadonlyArray1, PyReadonlyArray2};
+use numpy::{
+    PyArray1, PyArray2, PyArrayLike2, PyReadonlyArray1, PyReadonlyArray2, PyReadonlyArray3,
+};
 
 use pyo3::IntoPyObjectExt;
 use pyo3::exceptions::PyValueError;
@@ -43,20 +48,22 @@ use pyo3::types::PyType;
 
 use crate::QiskitError;
 use crate::euler_one_qubit_decomposer::{
-    ANGLE_ZERO_EPSILON, EulerBasis, EulerBasisSet, OneQubitGateSequence, angles_from_unitary,
-    det_one_qubit, unitary_to_gate_sequence_inner,
+    ANGLE_ZERO_EPSILON, EulerBasis, EulerBasisSet, angles_from_unitary, det_one_qubit,
+    unitary_to_gate_sequence_inner,
 };
 use qiskit_quantum_info::convert_2q_block_matrix::change_basis;
 
 use rand::prelude::*;
 use rand_distr::StandardNormal;
 use rand_pcg::Pcg64Mcg;
+use rayon::prelude::*;
 
 use qiskit_circuit::bit::ShareableQubit;
 use qiskit_circuit::circuit_data::CircuitData;
 use qiskit_circuit::circuit_instruction::OperationFromPython;
 use qiskit_circuit::dag_circuit::DAGCircuit;
 use qiskit_circuit::gate_matrix::{CX_GATE, H_GATE, ONE_QUBIT_IDENTITY, S_GATE, SDG_GATE};
+use qiskit_circuit::getenv_use_multiple_threads;
 use qiskit_circuit::operations::{Operation, OperationRef, Param, StandardGate};
 use qiskit_circuit::packed_instruction::PackedOperation;
 use qiskit_circuit::util::{C_M_ONE, C_ONE, C_ZERO, GateArray1Q, GateArray2Q, IM, M_IM, c64};
@@ -1246,6 +1253,133 @@ impl TwoQubitWeylDecomposition {
 
 type TwoQubitSequenceVec = Vec<(PackedOperation, SmallVec<[f64; 3]>, SmallVec<[u8; 2]>)>;
 
+/// The default number of entries kept in the decomposition skeleton cache.
+const SKELETON_CACHE_DEFAULT_SIZE: usize = 4096;
+/// The grid that Weyl coordinates are snapped to when looking up a cached skeleton.  This is
+/// coarse enough to absorb the rounding noise of the Weyl decomposition, so that the same
+/// interaction dressed with different local gates shares an entry.  Two targets whose coordinates
+/// fall into the same cell get the same interior gates, which changes the synthesized unitary by
+/// at most an amount of this order.
+const SKELETON_WEYL_QUANTUM: f64 = 1e-13;
+
+/// The part of a [TwoQubitBasisDecomposer] decomposition that depends only on the Weyl coordinates
+/// of the target: the number of basis gates, and every basis-gate application together with the
+/// single-qubit layers between them.  Only the outermost single-qubit layers depend on the local
+/// parts of the target.
+#[derive(Clone, Debug)]
+struct DecompositionSkeleton {
+    num_basis: u8,
+    gates: TwoQubitSequenceVec,
+    global_phase: f64,
+}
+
+#[derive(Clone, Copy, Debug, Hash, PartialEq, Eq)]
+struct SkeletonKey {
+    decomposer: u64,
+    weyl: [i64; 3],
+    basis_fidelity: u64,
+    num_basis_uses: Option<u8>,
+}
+
+impl SkeletonKey {
+    fn new(
+        decomposer: &TwoQubitBasisDecomposer,
+        target: &TwoQubitWeylDecomposition,
+        basis_fidelity: f64,
+        num_basis_uses: Option<u8>,
+    ) -> Self {
+        let quantize = |x: f64| (x / SKELETON_WEYL_QUANTUM).round() as i64;
+        SkeletonKey {
+            decomposer: decomposer.fingerprint,
+            weyl: [quantize(target.a), quantize(target.b), quantize(target.c)],
+            basis_fidelity: basis_fidelity.to_bits(),
+            num_basis_uses,
+        }
+    }
+}
+
+/// A process-wide least-recently-used cache of [DecompositionSkeleton]s, shared by all
+/// [TwoQubitBasisDecomposer] instances.  Decomposers are frequently rebuilt (for example once per
+/// block by unitary synthesis), so the entries are keyed on a fingerprint of the decomposer's
+/// configuration rather than being stored on the decomposer itself.
+struct SkeletonCache {
+    /// The entries, from least to most recently used.
+    entries: IndexMap<SkeletonKey, DecompositionSkeleton, ::ahash::RandomState>,
+    max_size: usize,
+    hits: usize,
+    misses: usize,
+}
+
+impl SkeletonCache {
+    fn get(&mut self, key: &SkeletonKey) -> Option<DecompositionSkeleton> {
+        match self.entries.get_full(key) {
+            Some((index, _, _)) => {
+                self.hits += 1;
+                let last = self.entries.len() - 1;
+                self.entries.move_index(index, last);
+                Some(self.entries[last].clone())
+            }
+            None => {
+                self.misses += 1;
+                None
+            }
+        }
+    }
+
+    fn insert(&mut self, key: SkeletonKey, value: DecompositionSkeleton) {
+        if self.max_size == 0 {
+            return;
+        }
+        self.entries.shift_remove(&key);
+        self.entries.insert(key, value);
+        while self.entries.len() > self.max_size {
+            self.entries.shift_remove_index(0);
+        }
+    }
+}
+
+static SKELETON_CACHE: LazyLock<Mutex<SkeletonCache>> = LazyLock::new(|| {
+    Mutex::new(SkeletonCache {
+        entries: IndexMap::with_hasher(::ahash::RandomState::new()),
+        max_size: SKELETON_CACHE_DEFAULT_SIZE,
+        hits: 0,
+        misses: 0,
+    })
+});
+
+/// Return the statistics of the two-qubit decomposition skeleton cache as a tuple of
+/// ``(hits, misses, max_size, current_size)``.
+#[pyfunction]
+pub fn skeleton_cache_info() -> (usize, usize, usize, usize) {
+    let cache = SKELETON_CACHE.lock().unwrap();
+    (
+        cache.hits,
+        cache.misses,
+        cache.max_size,
+        cache.entries.len(),
+    )
+}
+
+/// Remove all entries from the two-qubit decomposition skeleton cache and reset its statistics.
+#[pyfunction]
+pub fn skeleton_cache_clear() {
+    let mut cache = SKELETON_CACHE.lock().unwrap();
+    cache.entries.clear();
+    cache.hits = 0;
+    cache.misses = 0;
+}
+
+/// Set the maximum number of entries in the two-qubit decomposition skeleton cache, evicting the
+/// least recently used entries if needed.  A size of zero disables the cache.
+#[pyfunction]
+pub fn skeleton_cache_set_size(max_size: usize) {
+    let mut cache = SKELETON_CACHE.lock().unwrap();
+    cache.max_size = max_size;
+    while cache.entries.len() > max_size {
+        cache.entries.shift_remove_index(0);
+    }
+}
+
 #[derive(Clone, Debug)]
 pub struct TwoQubitGateSequence {
     gates: TwoQubitSequenceVec,
@@ -1315,6 +1449,9 @@ pub struct TwoQubitBasisDecomposer {
     q1rb: Array2<Complex64>,
     q2l: Array2<Complex64>,
     q2r: Array2<Complex64>,
+    /// A hash of everything that determines the interior of a decomposition, used to key the
+    /// shared [SkeletonCache].
+    fingerprint: u64,
 }
 impl TwoQubitBasisDecomposer {
     /// Return the KAK gate name
@@ -1810,11 +1947,24 @@ impl TwoQubitBasisDecomposer {
         let q2l = k2ld.dot(&k12l);
         let q2r = k2rd.dot(&k12r);
 
+        let euler_basis = EulerBasis::__new__(euler_basis)?;
+        let mut hasher = DefaultHasher::new();
+        gate.name().hash(&mut hasher);
+        for param in gate_params.iter() {
+            param.to_bits().hash(&mut hasher);
+        }
+        for element in gate_matrix.iter() {
+            element.re.to_bits().hash(&mut hasher);
+            element.im.to_bits().hash(&mut hasher);
+        }
+        euler_basis.as_str().hash(&mut hasher);
+        let fingerprint = hasher.finish();
+
         Ok(TwoQubitBasisDecomposer {
             gate,
             gate_params,
             basis_fidelity,
-            euler_basis: EulerBasis::__new__(euler_basis)?,
+            euler_basis,
             pulse_optimize,
             basis_decomposer,
             super_controlled,
@@ -1837,6 +1987,7 @@ impl TwoQubitBasisDecomposer {
             q1rb,
             q2l,
             q2r,
+            fingerprint,
         })
     }
 
@@ -1854,16 +2005,22 @@ impl TwoQubitBasisDecomposer {
         };
         let target_decomposed =
             TwoQubitWeylDecomposition::new_inner(unitary, Some(DEFAULT_FIDELITY), None)?;
-        let traces = self.traces(&target_decomposed);
-        let best_nbasis = _num_basis_uses.unwrap_or_else(|| {
-            traces
-                .into_iter()
-                .enumerate()
-                .map(|(idx, trace)| (idx, trace.trace_to_fid() * basis_fidelity.powi(idx as i32)))
-                .min_by(|(_idx1, fid1), (_idx2, fid2)| fid2.partial_cmp(fid1).unwrap())
-                .unwrap()
-                .0 as u8
-        });
+        let key = SkeletonKey::new(self, &target_decomposed, basis_fidelity, _num_basis_uses);
+        let cached = SKELETON_CACHE.lock().unwrap().get(&key);
+        let best_nbasis = match &cached {
+            Some(skeleton) => skeleton.num_basis,
+            None => _num_basis_uses.unwrap_or_else(|| {
+                self.traces(&target_decomposed)
+                    .into_iter()
+                    .enumerate()
+                    .map(|(idx, trace)| {
+                        (idx, trace.trace_to_fid() * basis_fidelity.powi(idx as i32))
+                    })
+                    .min_by(|(_idx1, fid1), (_idx2, fid2)| fid2.partial_cmp(fid1).unwrap())
+                    .unwrap()
+                    .0 as u8
+            }),
+        };
         let decomposition = match best_nbasis {
             0 => decomp0_inner(&target_decomposed),
             1 => self.decomp1_inner(&target_decomposed),
@@ -1882,52 +2039,60 @@ impl TwoQubitBasisDecomposer {
         }
         let mut target_1q_basis_list = EulerBasisSet::new();
         target_1q_basis_list.add_basis(self.euler_basis);
-        let euler_decompositions: SmallVec<[Option<OneQubitGateSequence>; 8]> = decomposition
-            .iter()
-            .map(|decomp| {
-                unitary_to_gate_sequence_inner(
-                    decomp.view(),
-                    &target_1q_basis_list,
-                    0,
-                    None,
-                    true,
-                    None,
-                )
-            })
-            .collect();
-        let mut gates = Vec::with_capacity(TWO_QUBIT_SEQUENCE_DEFAULT_CAPACITY);
-        let mut global_phase = target_decomposed.global_phase;
-        global_phase -= best_nbasis as f64 * self.basis_decomposer.global_phase;
-        if best_nbasis == 2 {
-            global_phase += PI;
-        }
-        for i in 0..best_nbasis as usize {
-            if let Some(euler_decomp) = &euler_decompositions[2 * i] {
-                for gate in &euler_decomp.gates {
-                    gates.push((gate.0.into(), gate.1.clone(), smallvec![0]));
+        // Append the 1q gates for one matrix of the decomposition, returning their global phase.
+        let push_1q = |gates: &mut TwoQubitSequenceVec, index: usize, qubit: u8| -> f64 {
+            match unitary_to_gate_sequence_inner(
+                decomposition[index].view(),
+                &target_1q_basis_list,
+                0,
+                None,
+                true,
+                None,
+            ) {
+                Some(euler_decomp) => {
+                    for gate in euler_decomp.gates {
+                        gates.push((gate.0.into(), gate.1, smallvec![qubit]));
+                    }
+                    euler_decomp.global_phase
                 }
-                global_phase += euler_decomp.global_phase
+                None => 0.,
             }
-            if let Some(euler_decomp) = &euler_decompositions[2 * i + 1] {
-                for gate in &euler_decomp.gates {
-                    gates.push((gate.0.into(), gate.1.clone(), smallvec![1]));
+        };
+        // Everything between the outermost 1q layers depends only on the Weyl coordinates of the
+        // target, so it is shared with earlier targets that had the same coordinates.
+        let skeleton = match cached {
+            Some(skeleton) => skeleton,
+            None => {
+                let mut gates = Vec::with_capacity(TWO_QUBIT_SEQUENCE_DEFAULT_CAPACITY);
+                let mut global_phase = -(best_nbasis as f64) * self.basis_decomposer.global_phase;
+                if best_nbasis == 2 {
+                    global_phase += PI;
                 }
-                global_phase += euler_decomp.global_phase
-            }
-            gates.push((self.gate.clone(), self.gate_params.clone(), smallvec![0, 1]));
-        }
-        if let Some(euler_decomp) = &euler_decompositions[2 * best_nbasis as usize] {
-            for gate in &euler_decomp.gates {
-                gates.push((gate.0.into(), gate.1.clone(), smallvec![0]));
-            }
-            global_phase += euler_decomp.global_phase
-        }
-        if let Some(euler_decomp) = &euler_decompositions[2 * best_nbasis as usize + 1] {
-            for gate in &euler_decomp.gates {
-                gates.push((gate.0.into(), gate.1.clone(), smallvec![1]));
+                for i in 0..best_nbasis as usize {
+                    if i > 0 {
+                        global_phase += push_1q(&mut gates, 2 * i, 0);
+                        global_phase += push_1q(&mut gates, 2 * i + 1, 1);
+                    }
+                    gates.push((self.gate.clone(), self.gate_params.clone(), smallvec![0, 1]));
+                }
+                let skeleton = DecompositionSkeleton {
+                    num_basis: best_nbasis,
+                    gates,
+                    global_phase,
+                };
+                SKELETON_CACHE.lock().unwrap().insert(key, skeleton.clone());
+                skeleton
             }
-            global_phase += euler_decomp.global_phase
+        };
+        let mut gates = Vec::with_capacity(TWO_QUBIT_SEQUENCE_DEFAULT_CAPACITY);
+        let mut global_phase = target_decomposed.global_phase + skeleton.global_phase;
+        if best_nbasis > 0 {
+            global_phase += push_1q(&mut gates, 0, 0);
+            global_phase += push_1q(&mut gates, 1, 1);
         }
+        gates.extend(skeleton.gates);
+        global_phase += push_1q(&mut gates, 2 * best_nbasis as usize, 0);
+        global_phase += push_1q(&mut gates, 2 * best_nbasis as usize + 1, 1);
         Ok(TwoQubitGateSequence {
             gates,
             global_phase,
@@ -1942,91 +2107,138 @@ impl TwoQubitBasisDecomposer {
         approximate: bool,
         _num_basis_uses: Option<u8>,
     ) -> PyResult<TwoQubitGateSequence> {
-        let basis_fidelity = if !approximate {
-            1.0
-        } else {
-            basis_fidelity.unwrap_or(self.basis_fidelity)
-        };
-        let target_decomposed =
-            TwoQubitWeylDecomposition::new(unitary, Some(DEFAULT_FIDELITY), None)?;
-        let traces = self.traces(&target_decomposed);
-        let best_nbasis = traces
-            .into_iter()
-            .enumerate()
-            .map(|(idx, trace)| (idx, trace.trace_to_fid() * basis_fidelity.powi(idx as i32)))
-            .min_by(|(_idx1, fid1), (_idx2, fid2)| fid2.partial_cmp(fid1).unwrap())
-            .unwrap()
-            .0;
-        let best_nbasis = _num_basis_uses.unwrap_or(best_nbasis as u8);
-        let decomposition = match best_nbasis {
-            0 => decomp0_inner(&target_decomposed),
-            1 => self.decomp1_inner(&target_decomposed),
-            2 => self.decomp2_supercontrolled_inner(&target_decomposed),
-            3 => self.decomp3_supercontrolled_inner(&target_decomposed),
-            _ => unreachable!("Invalid basis to use"),
-        };
-        let pulse_optimize = self.pulse_optimize.unwrap_or(true);
-        let sequence = if pulse_optimize {
-            self.pulse_optimal_chooser(best_nbasis, &decomposition, &target_decomposed)?
-        } else {
-            None
-        };
-        if let Some(seq) = sequence {
-            return Ok(seq);
-        }
-        let mut target_1q_basis_list = EulerBasisSet::new();
-        target_1q_basis_list.add_basis(self.euler_basis);
-        let euler_decompositions: SmallVec<[Option<OneQubitGateSequence>; 8]> = decomposition
-            .iter()
-            .map(|decomp| {
-                unitary_to_gate_sequence_inner(
-                    decomp.view(),
-                    &target_1q_basis_list,
-                    0,
-                    None,
-                    true,
-                    None,
-                )
-            })
-            .collect();
-        let mut gates = Vec::with_capacity(TWO_QUBIT_SEQUENCE_DEFAULT_CAPACITY);
-        let mut global_phase = target_decomposed.global_phase;
-        global_phase -= best_nbasis as f64 * self.basis_decomposer.global_phase;
-        if best_nbasis == 2 {
-            global_phase += PI;
-        }
-        for i in 0..best_nbasis as usize {
-            if let Some(euler_decomp) = &euler_decompositions[2 * i] {
-                for gate in &euler_decomp.gates {
-                    gates.push((gate.0.into(), gate.1.clone(), smallvec![0]));
-                }
-                global_phase += euler_decomp.global_phase
-            }
-            if let Some(euler_decomp) = &euler_decompositions[2 * i + 1] {
-                for gate in &euler_decomp.gates {
-                    gates.push((gate.0.into(), gate.1.clone(), smallvec![1]));
-                }
-                global_phase += euler_decomp.global_phase
-            }
-            gates.push((self.gate.clone(), self.gate_params.clone(), smallvec![0, 1]));
-        }
-        if let Some(euler_decomp) = &euler_decompositions[2 * best_nbasis as usize] {
-            for gate in &euler_decomp.gates {
-                gates.push((gate.0.into(), gate.1.clone(), smallvec![0]));
+        self.call_inner(
+            unitary.as_array(),
+            basis_fidelity,
+            approximate,
+            _num_basis_uses,
+        )
+    }
+}
+
+/// The minimum number of unitaries in a batch before the work is spread over threads.
+const PARALLEL_BATCH_THRESHOLD: usize = 64;
+
+/// Check that `unitaries` is a stack of 4x4 matrices.
+fn check_batch_shape(unitaries: ArrayView3<Complex64>) -> PyResult<ArrayView3<Complex64>> {
+    match unitaries.shape() {
+        [_, 4, 4] => Ok(unitaries),
+        shape => Err(PyValueError::new_err(format!(
+            "expected an array of shape (N, 4, 4), not {shape:?}"
+        ))),
+    }
+}
+
+/// Apply `op` to every matrix in a stack of unitaries, using multiple threads if the batch is
+/// large enough and the user has not disabled them.
+fn map_batch<T, F>(unitaries: ArrayView3<Complex64>, parallel: bool, op: F) -> PyResult<Vec<T>>
+where
+    T: Send,
+    F: Fn(ArrayView2<Complex64>) -> PyResult<T> + Sync + Send,
+{
+    if parallel
+        && unitaries.len_of(Axis(0)) >= PARALLEL_BATCH_THRESHOLD
+        && getenv_use_multiple_threads()
+    {
+        unitaries
+            .axis_iter(Axis(0))
+            .into_par_iter()
+            .map(op)
+            .collect()
+    } else {
+        unitaries.axis_iter(Axis(0)).map(op).collect()
+    }
+}
+
+/// The flattened form of several [TwoQubitGateSequence]s: ``(names, gates, qubits, params,
+/// offsets, global_phases)``.
+type PackedSequences<'py> = (
+    Vec<String>,
+    Bound<'py, PyArray1<u8>>,
+    Bound<'py, PyArray2<i8>>,
+    Bound<'py, PyArray2<f64>>,
+    Bound<'py, PyArray1<u64>>,
+    Bound<'py, PyArray1<f64>>,
+);
+
+/// Flatten `sequences` into arrays.  The gates of sequence `i` are the rows
+/// `offsets[i]..offsets[i + 1]` of `gates` (an index into `names`), `qubits` (padded with `-1`)
+/// and `params` (padded with NaN).
+fn pack_sequences<'py>(
+    py: Python<'py>,
+    sequences: Vec<TwoQubitGateSequence>,
+) -> PyResult<PackedSequences<'py>> {
+    let num_gates = sequences.iter().map(|seq| seq.gates.len()).sum::<usize>();
+    let mut names = IndexSet::<String, ::ahash::RandomState>::default();
+    let mut gates = Vec::with_capacity(num_gates);
+    let mut qubits = Array2::<i8>::from_elem((num_gates, 2), -1);
+    let mut params = Array2::<f64>::from_elem((num_gates, 3), f64::NAN);
+    let mut offsets = Vec::with_capacity(sequences.len() + 1);
+    let mut global_phases = Vec::with_capacity(sequences.len());
+    let mut row = 0;
+    offsets.push(0);
+    for sequence in sequences {
+        for (gate, gate_params, gate_qubits) in sequence.gates {
+            let (index, _) = names.insert_full(gate.name().to_string());
+            gates.push(u8::try_from(index).map_err(|_| {
+                QiskitError::new_err("too many distinct gates in the batched decomposition")
+            })?);
+            for (i, qubit) in gate_qubits.into_iter().enumerate() {
+                qubits[[row, i]] = qubit as i8;
             }
-            global_phase += euler_decomp.global_phase
-        }
-        if let Some(euler_decomp) = &euler_decompositions[2 * best_nbasis as usize + 1] {
-            for gate in &euler_decomp.gates {
-                gates.push((gate.0.into(), gate.1.clone(), smallvec![1]));
+            for (i, param) in gate_params.into_iter().enumerate() {
+                params[[row, i]] = param;
             }
-            global_phase += euler_decomp.global_phase
+            row += 1;
         }
-        Ok(TwoQubitGateSequence {
-            gates,
-            global_phase,
-        })
+        offsets.push(row as u64);
+        global_phases.push(sequence.global_phase);
     }
+    Ok((
+        names.into_iter().collect(),
+        gates.into_pyarray(py),
+        qubits.into_pyarray(py),
+        params.into_pyarray(py),
+        offsets.into_pyarray(py),
+        global_phases.into_pyarray(py),
+    ))
+}
+
+/// Compute the Weyl decomposition of each of a stack of two-qubit unitaries, using multiple
+/// threads for large batches.
+///
+/// Args:
+///     unitaries (ndarray): A complex array of shape ``(N, 4, 4)``.
+///     fidelity (float): The fidelity used to specialize each decomposition, as in
+///         :class:`.TwoQubitWeylDecomposition`.
+///
+/// Returns:
+///     tuple: An ``(N, 3)`` array of the coordinates ``(a, b, c)`` and an ``(N,)`` array of the
+///     global phases.
+#[pyfunction]
+#[pyo3(signature = (unitaries, fidelity=DEFAULT_FIDELITY))]
+fn weyl_decomposition_batch<'py>(
+    py: Python<'py>,
+    unitaries: PyReadonlyArray3<Complex64>,
+    fidelity: Option<f64>,
+) -> PyResult<(Bound<'py, PyArray2<f64>>, Bound<'py, PyArray1<f64>>)> {
+    let unitaries = check_batch_shape(unitaries.as_array())?;
+    let decompositions = py.detach(|| {
+        map_batch(unitaries, true, |unitary| {
+            let decomposition = TwoQubitWeylDecomposition::new_inner(unitary, fidelity, None)?;
+            Ok((
+                [decomposition.a, decomposition.b, decomposition.c],
+                decomposition.global_phase,
+            ))
+        })
+    })?;
+    let mut coordinates = Array2::<f64>::zeros((decompositions.len(), 3));
+    let mut global_phases = Vec::with_capacity(decompositions.len());
+    for (mut row, (abc, global_phase)) in coordinates.outer_iter_mut().zip(decompositions) {
+        row.assign(&aview1(&abc));
+        global_phases.push(global_phase);
+    }
+    Ok((coordinates.into_pyarray(py), global_phases.into_pyarray(py)))
 }
 
 static K12R_ARR: GateArray1Q = [
@@ -2271,6 +2483,40 @@ impl TwoQubitBasisDecomposer {
         )
     }
 
+    /// Synthesizes a stack of two-qubit unitaries, using multiple threads for large batches.
+    ///
+    /// Args:
+    ///     unitaries (ndarray): A complex array of shape ``(N, 4, 4)``.
+    ///     basis_fidelity (float): The target fidelity of the synthesis. This is a floating point
+    ///         value between 1.0 and 0.0.
+    ///     approximate (bool): Whether to enable approximation. If set to false this is equivalent
+    ///         to setting basis_fidelity to 1.0.
+    ///
+    /// Returns:
+    ///     tuple: ``(names, gates, qubits, params, offsets, global_phases)``.  The gates of
+    ///     unitary ``i`` are the rows ``offsets[i]:offsets[i + 1]`` of ``gates`` (indices into
+    ///     ``names``), ``qubits`` (padded with ``-1``) and ``params`` (padded with NaN).
+    #[pyo3(signature = (unitaries, basis_fidelity=None, approximate=true))]
+    fn decompose_batch<'py>(
+        &self,
+        py: Python<'py>,
+        unitaries: PyReadonlyArray3<Complex64>,
+        basis_fidelity: Option<f64>,
+        approximate: bool,
+    ) -> PyResult<PackedSequences<'py>> {
+        let unitaries = check_batch_shape(unitaries.as_array())?;
+        let decompose = |unitary: ArrayView2<Complex64>| {
+            self.call_inner(unitary, basis_fidelity, approximate, None)
+        };
+        // A Python-space basis gate can only be copied into each sequence while holding the GIL.
+        let sequences = if matches!(self.gate.view(), OperationRef::Gate(_)) {
+            map_batch(unitaries, false, decompose)?
+        } else {
+            py.detach(|| map_batch(unitaries, true, decompose))?
+        };
+        pack_sequences(py, sequences)
+    }
+
     fn num_basis_gates(&self, unitary: PyReadonlyArray2<Complex64>) -> PyResult<usize> {
         _num_basis_gates(self.basis_decomposer.b, self.basis_fidelity, unitary)
     }
@@ -2976,6 +3222,10 @@ pub fn two_qubit_decompose(m: &Bound<PyModule>) -> PyResult<()> {
     m.add_wrapped(wrap_pyfunction!(py_trace_to_fid))?;
     m.add_wrapped(wrap_pyfunction!(py_ud))?;
     m.add_wrapped(wrap_pyfunction!(weyl_coordinates))?;
+    m.add_wrapped(wrap_pyfunction!(weyl_decomposition_batch))?;
+    m.add_wrapped(wrap_pyfunction!(skeleton_cache_info))?;
+    m.add_wrapped(wrap_pyfunction!(skeleton_cache_clear))?;
+    m.add_wrapped(wrap_pyfunction!(skeleton_cache_set_size))?;
     m.add_class::<TwoQubitWeylDecomposition>()?;
     m.add_class::<Specialization>()?;
     m.add_class::<TwoQubitBasisDecomposer>()?;
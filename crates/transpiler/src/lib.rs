@@ -22,7 +22,7 @@ pub mod transpile_layout;
 
 mod transpiler;
 
-pub use transpiler::transpile;
+pub use transpiler::{transpile, transpile_batch, transpiler_mod};
 
 mod gate_metrics;
 
@@ -0,0 +1,293 @@
+// This code is part of Qiskit.
+//
+// (C) Copyright IBM 2025
+//
+// This code is licensed under the Apache License, Version 2.0. You may
+// obtain a copy of this license in the LICENSE.txt file in the root directory
+// of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+//
+// Any modifications or derivative works of this code must retain this
+// copyright notice, and modified files need to carry a notice indicating
+// that they have been altered from the originals.
+
+use hashbrown::{HashMap, HashSet};
+use indexmap::IndexMap;
+use ndarray::Array2;
+use numpy::{PyArray2, ToPyArray};
+use pyo3::exceptions::{PyIndexError, PyKeyError, PyValueError};
+use pyo3::prelude::*;
+use pyo3::wrap_pyfunction;
+
+use crate::TranspilerError;
+
+type Edge = (u32, u32);
+
+/// The precomputed tables of a swap strategy: the permutation of the qubits after each number of
+/// swap layers, and the number of layers after which each pair of qubits is first adjacent.
+///
+/// This is the native backing of :class:`.SwapStrategy`.  The tables are calculated once, on
+/// construction, and the object pickles as its defining arguments.
+///
+/// Args:
+///     num_qubits (int): The number of qubits in the coupling map.
+///     edges (list[tuple[int, int]]): The edges of the coupling map.
+///     swap_layers (list[list[tuple[int, int]]]): The layers of swaps of the strategy.
+#[pyclass(module = "qiskit._accelerate.commuting_2q_router", frozen)]
+pub struct SwapStrategyTable {
+    num_qubits: u32,
+    edges: Vec<Edge>,
+    swap_layers: Vec<Vec<Edge>>,
+    /// The inverse of the composed permutation after each number of layers, from zero to all.
+    inverse_permutations: Vec<Vec<u32>>,
+    /// The number of layers until each pair of qubits is adjacent, or -1 if they never are.
+    distance: Array2<i64>,
+    /// The pairs of qubits that are adjacent after some number of layers, in both directions.
+    possible_edges: HashSet<Edge>,
+}
+
+impl SwapStrategyTable {
+    pub fn new(num_qubits: u32, edges: Vec<Edge>, swap_layers: Vec<Vec<Edge>>) -> PyResult<Self> {
+        let in_bounds = |(a, b): &Edge| *a < num_qubits && *b < num_qubits;
+        if let Some((a, b)) = edges
+            .iter()
+            .chain(swap_layers.iter().flatten())
+            .find(|edge| !in_bounds(edge))
+        {
+            return Err(PyValueError::new_err(format!(
+                "edge ({a}, {b}) is out of range for {num_qubits} qubits"
+            )));
+        }
+        let n = num_qubits as usize;
+        let mut inverse_permutations = Vec::with_capacity(swap_layers.len() + 1);
+        let mut permutation = (0..num_qubits).collect::<Vec<_>>();
+        let mut distance = Array2::from_elem((n, n), -1);
+        let mut possible_edges = HashSet::new();
+        for qubit in 0..n {
+            distance[[qubit, qubit]] = 0;
+        }
+        for layer in 0..=swap_layers.len() {
+            if layer > 0 {
+                for &(a, b) in swap_layers[layer - 1].iter() {
+                    permutation.swap(a as usize, b as usize);
+                }
+            }
+            for &(a, b) in edges.iter() {
+                let (a, b) = (permutation[a as usize], permutation[b as usize]);
+                // Layers are visited in order, so the first value set is the smallest.
+                if distance[[a as usize, b as usize]] == -1 {
+                    distance[[a as usize, b as usize]] = layer as i64;
+                    distance[[b as usize, a as usize]] = layer as i64;
+                }
+                possible_edges.insert((a, b));
+                possible_edges.insert((b, a));
+            }
+            inverse_permutations.push(permutation.clone());
+        }
+        Ok(Self {
+            num_qubits,
+            edges,
+            swap_layers,
+            inverse_permutations,
+            distance,
+            possible_edges,
+        })
+    }
+
+    /// The number of layers until two qubits are adjacent, if they ever are.
+    #[inline]
+    pub fn distance(&self, a: u32, b: u32) -> Option<usize> {
+        if a >= self.num_qubits || b >= self.num_qubits {
+            return None;
+        }
+        usize::try_from(self.distance[[a as usize, b as usize]]).ok()
+    }
+}
+
+#[pymethods]
+impl SwapStrategyTable {
+    #[new]
+    fn py_new(num_qubits: u32, edges: Vec<Edge>, swap_layers: Vec<Vec<Edge>>) -> PyResult<Self> {
+        Self::new(num_qubits, edges, swap_layers)
+    }
+
+    fn __getnewargs__(&self) -> (u32, Vec<Edge>, Vec<Vec<Edge>>) {
+        (
+            self.num_qubits,
+            self.edges.clone(),
+            self.swap_layers.clone(),
+        )
+    }
+
+    fn __len__(&self) -> usize {
+        self.swap_layers.len()
+    }
+
+    #[getter]
+    fn num_qubits(&self) -> u32 {
+        self.num_qubits
+    }
+
+    /// The distance matrix of the strategy, with -1 for pairs that are never adjacent.
+    fn distance_matrix<'py>(&self, py: Python<'py>) -> Bound<'py, PyArray2<i64>> {
+        self.distance.to_pyarray(py)
+    }
+
+    /// The inverse of the composition of the first ``idx`` swap layers.
+    fn inverse_composed_permutation(&self, idx: usize) -> PyResult<Vec<u32>> {
+        self.inverse_permutations
+            .get(idx)
+            .cloned()
+            .ok_or_else(|| PyIndexError::new_err(format!("swap layer {idx} is out of range")))
+    }
+
+    /// The pairs of qubits that the strategy makes adjacent, in both directions.
+    fn possible_edges(&self) -> HashSet<Edge> {
+        self.possible_edges.clone()
+    }
+}
+
+/// An item of a routed block: a gate of the block (by its index in the input), or a swap.
+type RoutedItem = (Option<usize>, u32, u32);
+
+/// Split the gates of one swap layer into sub-layers of gates that can be applied simultaneously.
+fn build_sub_layers(
+    layer: &IndexMap<Edge, usize, ::ahash::RandomState>,
+    edge_coloring: Option<&HashMap<Edge, usize>>,
+) -> PyResult<Vec<Vec<(Edge, usize)>>> {
+    if let Some(coloring) = edge_coloring {
+        let num_colors = coloring.values().max().map_or(0, |max| max + 1);
+        let mut sub_layers = vec![Vec::new(); num_colors];
+        for (edge, gate) in layer.iter() {
+            let color = coloring.get(edge).ok_or_else(|| {
+                PyKeyError::new_err(format!("edge {edge:?} is not in the edge coloring"))
+            })?;
+            sub_layers[*color].push((*edge, *gate));
+        }
+        return Ok(sub_layers);
+    }
+    // Without an edge coloring, greedily take the gates that don't overlap any already taken.
+    let mut sub_layers = Vec::new();
+    let mut remaining = layer
+        .iter()
+        .map(|(edge, gate)| (*edge, *gate))
+        .collect::<Vec<_>>();
+    let mut blocked = HashSet::new();
+    while !remaining.is_empty() {
+        blocked.clear();
+        let (sub_layer, rest) = remaining.into_iter().partition::<Vec<_>, _>(|((a, b), _)| {
+            if blocked.contains(a) || blocked.contains(b) {
+                false
+            } else {
+                blocked.insert(*a);
+                blocked.insert(*b);
+                true
+            }
+        });
+        sub_layers.push(sub_layer);
+        remaining = rest;
+    }
+    Ok(sub_layers)
+}
+
+/// Route a block of commuting two-qubit gates with a swap strategy.
+///
+/// The gates are given as the pairs of circuit qubits they act on, and ``layout`` is the position
+/// of each circuit qubit before the block.  Each gate is applied after the number of swap layers
+/// at which its qubits first become adjacent, and the gates that are applied at the same layer
+/// are split into sub-layers, either by the colors of their edges in ``edge_coloring`` or
+/// greedily.  Of several gates on the same pair of qubits, only the last is kept.
+///
+/// Returns:
+///     list[tuple[int | None, int, int]]: The routed block in order, as the index of a gate (or
+///     ``None`` for a swap) and the two qubits it acts on.
+#[pyfunction]
+#[pyo3(signature = (table, gates, layout, edge_coloring=None))]
+pub fn route_commuting_2q_block(
+    py: Python,
+    table: &SwapStrategyTable,
+    gates: Vec<Edge>,
+    layout: Vec<u32>,
+    edge_coloring: Option<HashMap<Edge, usize>>,
+) -> PyResult<Vec<RoutedItem>> {
+    let num_qubits = layout.len();
+    let mut physical_to_virtual = vec![u32::MAX; num_qubits];
+    for (virt, phys) in layout.iter().enumerate() {
+        match physical_to_virtual.get_mut(*phys as usize) {
+            Some(slot) if *slot == u32::MAX => *slot = virt as u32,
+            _ => return Err(PyValueError::new_err("the layout is not a permutation")),
+        }
+    }
+    let mut virtual_to_physical = layout;
+
+    py.detach(|| {
+        let mut layers: Vec<IndexMap<Edge, usize, ::ahash::RandomState>> = Vec::new();
+        for (index, &(a, b)) in gates.iter().enumerate() {
+            if a as usize >= num_qubits || b as usize >= num_qubits {
+                return Err(PyValueError::new_err(format!(
+                    "gate on qubits ({a}, {b}) is out of range"
+                )));
+            }
+            let distance = table
+                .distance(
+                    virtual_to_physical[a as usize],
+                    virtual_to_physical[b as usize],
+                )
+                .ok_or_else(|| {
+                    TranspilerError::new_err(format!(
+                        "The swap strategy cannot implement the edge ({a}, {b})."
+                    ))
+                })?;
+            if layers.len() <= distance {
+                layers.resize_with(distance + 1, IndexMap::default);
+            }
+            layers[distance].insert((a, b), index);
+        }
+
+        let mut out = Vec::with_capacity(gates.len());
+        let max_distance = layers.len().saturating_sub(1);
+        for (i, layer) in layers.iter().enumerate() {
+            // Place the gates at the current positions of their qubits, accounting for the swaps
+            // of the previous layers.
+            let mut current = IndexMap::<Edge, usize, ::ahash::RandomState>::default();
+            for (&(a, b), &gate) in layer.iter() {
+                current.insert(
+                    (
+                        physical_to_virtual[a as usize],
+                        physical_to_virtual[b as usize],
+                    ),
+                    gate,
+                );
+            }
+            for sub_layer in build_sub_layers(&current, edge_coloring.as_ref())? {
+                out.extend(
+                    sub_layer
+                        .into_iter()
+                        .map(|((a, b), gate)| (Some(gate), a, b)),
+                );
+            }
+            if i < max_distance {
+                let swaps = table.swap_layers.get(i).ok_or_else(|| {
+                    PyIndexError::new_err(format!("swap layer {i} is out of range"))
+                })?;
+                for &(a, b) in swaps.iter() {
+                    if a as usize >= num_qubits || b as usize >= num_qubits {
+                        return Err(PyValueError::new_err(format!(
+                            "swap on qubits ({a}, {b}) is out of range"
+                        )));
+                    }
+                    out.push((None, a, b));
+                    virtual_to_physical.swap(a as usize, b as usize);
+                    physical_to_virtual[virtual_to_physical[a as usize] as usize] = a;
+                    physical_to_virtual[virtual_to_physical[b as usize] as usize] = b;
+                }
+            }
+        }
+        Ok(out)
+    })
+}
+
+pub fn commuting_2q_router_mod(m: &Bound<PyModule>) -> PyResult<()> {
+    m.add_class::<SwapStrategyTable>()?;
+    m.add_wrapped(wrap_pyfunction!(route_commuting_2q_block))?;
+    Ok(())
+}
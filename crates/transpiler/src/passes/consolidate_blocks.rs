@@ -176,7 +176,7 @@ impl PhysQargsMap {
 
 #[allow(clippy::too_many_arguments)]
 #[pyfunction]
-#[pyo3(name = "consolidate_blocks", signature = (dag, decomposer, basis_gate_name, force_consolidate, target=None, basis_gates=None, blocks=None, runs=None, qubit_map=None))]
+#[pyo3(name = "consolidate_blocks", signature = (dag, decomposer, basis_gate_name, force_consolidate, target=None, basis_gates=None, blocks=None, runs=None, qubit_map=None, checkpoint=None))]
 fn py_run_consolidate_blocks(
     dag: &mut DAGCircuit,
     decomposer: DecomposerType,
@@ -187,6 +187,45 @@ fn py_run_consolidate_blocks(
     blocks: Option<Vec<Vec<usize>>>,
     runs: Option<Vec<Vec<usize>>>,
     qubit_map: Option<Vec<PhysicalQubit>>,
+    checkpoint: Option<String>,
+) -> PyResult<()> {
+    // Blocks that are entirely unchanged since the pass last saw this DAG (including their
+    // neighbours) were already considered for consolidation then.
+    let changed = checkpoint
+        .as_deref()
+        .and_then(|name| dag.changed_since_checkpoint(name));
+    consolidate_blocks(
+        dag,
+        decomposer,
+        basis_gate_name,
+        force_consolidate,
+        target,
+        basis_gates,
+        blocks,
+        runs,
+        qubit_map,
+        changed.as_ref(),
+    )?;
+    if let Some(name) = checkpoint {
+        dag.set_checkpoint(name);
+    }
+    Ok(())
+}
+
+/// Consolidate the blocks of `dag`.  If `changed` is given, blocks that are collected here (rather
+/// than passed in `blocks` or `runs`) are only considered if they contain one of its nodes.
+#[allow(clippy::too_many_arguments)]
+fn consolidate_blocks(
+    dag: &mut DAGCircuit,
+    decomposer: DecomposerType,
+    basis_gate_name: &str,
+    force_consolidate: bool,
+    target: Option<&Target>,
+    basis_gates: Option<HashSet<String>>,
+    blocks: Option<Vec<Vec<usize>>>,
+    runs: Option<Vec<Vec<usize>>>,
+    qubit_map: Option<Vec<PhysicalQubit>>,
+    changed: Option<&HashSet<NodeIndex>>,
 ) -> PyResult<()> {
     // The node indices that enter from `blocks` and `runs` come from Python space, and we can't
     // trust that they come from a correct analysis (or the block/run collection might have been
@@ -215,7 +254,13 @@ fn py_run_consolidate_blocks(
         // unexpected.
         None => match runs {
             Some(_) => vec![],
-            None => dag.collect_2q_runs().unwrap(),
+            None => {
+                let mut blocks = dag.collect_2q_runs().unwrap();
+                if let Some(changed) = changed {
+                    blocks.retain(|block| block.iter().any(|node| changed.contains(node)));
+                }
+                blocks
+            }
         },
     };
 
@@ -499,7 +544,7 @@ pub fn run_consolidate_blocks(
 ) -> PyResult<()> {
     let approximation_degree = approximation_degree.unwrap_or(1.0);
     let (decomposer, basis_gate) = get_decomposer_and_basis_gate(target, approximation_degree);
-    py_run_consolidate_blocks(
+    consolidate_blocks(
         dag,
         decomposer,
         basis_gate.name(),
@@ -510,6 +555,7 @@ pub fn run_consolidate_blocks(
         None,
         // TODO: this doesn't handle the possibility of control-flow operations yet.
         None,
+        None,
     )
 }
 
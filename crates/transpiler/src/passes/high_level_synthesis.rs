@@ -26,7 +26,7 @@ use qiskit_circuit::circuit_data::CircuitData;
 use qiskit_circuit::circuit_instruction::OperationFromPython;
 use qiskit_circuit::converters::QuantumCircuitData;
 use qiskit_circuit::converters::dag_to_circuit;
-use qiskit_circuit::dag_circuit::DAGCircuit;
+use qiskit_circuit::dag_circuit::{DAGCircuit, NodeType};
 use qiskit_circuit::gate_matrix::CX_GATE;
 use qiskit_circuit::imports::{HLS_SYNTHESIZE_OP_USING_PLUGINS, QS_DECOMPOSITION, QUANTUM_CIRCUIT};
 use qiskit_circuit::operations::Operation;
@@ -160,6 +160,17 @@ impl QubitTracker {
             self.state[q.index()] = other.state[q.index()]
         }
     }
+
+    /// Returns the state of a qubit: `'_'` if it is disabled, `'0'` if clean and `'*'` if dirty
+    fn state_char(&self, q: usize) -> char {
+        if !self.enabled[q] {
+            '_'
+        } else if self.state[q] {
+            '0'
+        } else {
+            '*'
+        }
+    }
 }
 
 #[pymethods]
@@ -226,6 +237,12 @@ impl QubitTracker {
         self.replace_state(other, qubits.into_iter())
     }
 
+    /// Returns the states of the given qubits, with one character per qubit: `'_'` for
+    /// disabled, `'0'` for clean and `'*'` for dirty qubits
+    fn states(&self, qubits: Vec<Qubit>) -> String {
+        qubits.iter().map(|q| self.state_char(q.index())).collect()
+    }
+
     fn num_qubits(&self) -> usize {
         self.num_qubits
     }
@@ -247,13 +264,7 @@ impl QubitTracker {
             out.push_str(&q.to_string());
             out.push(':');
             out.push(' ');
-            if !self.enabled[q] {
-                out.push('_');
-            } else if self.state[q] {
-                out.push('0');
-            } else {
-                out.push('*');
-            }
+            out.push(self.state_char(q));
             if q != self.num_qubits - 1 {
                 out.push(';');
                 out.push(' ');
@@ -326,11 +337,31 @@ pub struct HighLevelSynthesisData {
     // prioritize methods for Clifford+T basis set.
     #[pyo3(get)]
     optimize_clifford_t: bool,
+
+    // Optional, the cache of the circuits synthesized by the plugins, which lets identical
+    // high-level objects be synthesized only once.
+    // This is only accessed from the Python space.
+    #[pyo3(get)]
+    synthesis_cache: Option<Py<PyAny>>,
 }
 
 #[pymethods]
 impl HighLevelSynthesisData {
     #[new]
+    #[pyo3(signature = (
+        hls_config,
+        hls_plugin_manager,
+        hls_op_names,
+        coupling_map,
+        target,
+        equivalence_library,
+        device_insts,
+        use_physical_indices,
+        min_qubits,
+        unroll_definitions,
+        optimize_clifford_t,
+        synthesis_cache=None,
+    ))]
     #[allow(clippy::too_many_arguments)]
     fn __new__(
         hls_config: Py<PyAny>,
@@ -344,6 +375,7 @@ impl HighLevelSynthesisData {
         min_qubits: usize,
         unroll_definitions: bool,
         optimize_clifford_t: bool,
+        synthesis_cache: Option<Py<PyAny>>,
     ) -> Self {
         Self {
             hls_config,
@@ -357,6 +389,7 @@ impl HighLevelSynthesisData {
             min_qubits,
             unroll_definitions,
             optimize_clifford_t,
+            synthesis_cache,
         }
     }
 
@@ -373,13 +406,16 @@ impl HighLevelSynthesisData {
             self.min_qubits,
             self.unroll_definitions,
             self.optimize_clifford_t,
+            self.synthesis_cache
+                .as_ref()
+                .map(|cache| cache.clone_ref(py)),
         )
             .into_py_any(py)
     }
 
     fn __str__(&self) -> String {
         format!(
-            "HighLevelSynthesisData(hls_config: {:?}, hls_plugin_manager: {:?}, hls_op_names: {:?}, coupling_map: {:?}, target: {:?},  equivalence_library: {:?}, device_insts: {:?}, use_physical_indices: {:?}, min_qubits: {:?}, unroll_definitions: {:?}, optimize_clifford_t: {:?})",
+            "HighLevelSynthesisData(hls_config: {:?}, hls_plugin_manager: {:?}, hls_op_names: {:?}, coupling_map: {:?}, target: {:?},  equivalence_library: {:?}, device_insts: {:?}, use_physical_indices: {:?}, min_qubits: {:?}, unroll_definitions: {:?}, optimize_clifford_t: {:?}, synthesis_cache: {:?})",
             self.hls_config,
             self.hls_plugin_manager,
             self.hls_op_names,
@@ -391,6 +427,7 @@ impl HighLevelSynthesisData {
             self.min_qubits,
             self.unroll_definitions,
             self.optimize_clifford_t,
+            self.synthesis_cache,
         )
     }
 }
@@ -915,6 +952,27 @@ fn synthesize_operation(
     Ok(output_circuit_and_qubits)
 }
 
+/// Returns the Python object for an operation, as passed to the synthesis plugins.
+fn operation_to_py(
+    py: Python,
+    op: &OperationRef,
+    params: &[Param],
+    label: Option<&str>,
+) -> PyResult<Py<PyAny>> {
+    Ok(match op {
+        OperationRef::StandardGate(standard) => {
+            standard.create_py_op(py, Some(params), label)?.into_any()
+        }
+        OperationRef::StandardInstruction(instruction) => instruction
+            .create_py_op(py, Some(params), label)?
+            .into_any(),
+        OperationRef::Gate(gate) => gate.gate.clone_ref(py),
+        OperationRef::Instruction(instruction) => instruction.instruction.clone_ref(py),
+        OperationRef::Operation(operation) => operation.operation.clone_ref(py),
+        OperationRef::Unitary(unitary) => unitary.create_py_op(py, label)?.into_any(),
+    })
+}
+
 /// Attempts to synthesize an operation using available plugins.
 ///
 /// The input to this function is the operation to be synthesized and a list of global
@@ -938,18 +996,7 @@ fn synthesize_op_using_plugins(
 ) -> PyResult<Option<(CircuitData, Vec<Qubit>)>> {
     let mut output_circuit_and_qubits: Option<(CircuitData, Vec<Qubit>)> = None;
 
-    let op_py = match op {
-        OperationRef::StandardGate(standard) => {
-            standard.create_py_op(py, Some(params), label)?.into_any()
-        }
-        OperationRef::StandardInstruction(instruction) => instruction
-            .create_py_op(py, Some(params), label)?
-            .into_any(),
-        OperationRef::Gate(gate) => gate.gate.clone_ref(py),
-        OperationRef::Instruction(instruction) => instruction.instruction.clone_ref(py),
-        OperationRef::Operation(operation) => operation.operation.clone_ref(py),
-        OperationRef::Unitary(unitary) => unitary.create_py_op(py, label)?.into_any(),
-    };
+    let op_py = operation_to_py(py, op, params, label)?;
     let res = HLS_SYNTHESIZE_OP_USING_PLUGINS
         .get_bound(py)
         .call1((
@@ -1066,8 +1113,69 @@ pub fn run_high_level_synthesis(
     }
 }
 
+/// Collects the top-level operations of a DAG that will be passed to the synthesis plugins.
+///
+/// Each operation is returned together with its global qubits and the expected state of the
+/// qubit tracker when it is synthesized. The state is predicted by marking the qubits of every
+/// operation as dirty (and the qubits of resets as clean), which is what synthesizing a circuit
+/// does in the common case. This lets the Python space synthesize the distinct operations
+/// concurrently, and in advance of the (sequential) pass: when a prediction is wrong, the
+/// corresponding cache entry is simply not used.
+#[pyfunction]
+#[pyo3(signature = (dag, data, qubits_initially_zero))]
+fn collect_synthesis_candidates(
+    py: Python,
+    dag: &DAGCircuit,
+    data: &Bound<HighLevelSynthesisData>,
+    qubits_initially_zero: bool,
+) -> PyResult<Vec<(Py<PyAny>, Vec<usize>, QubitTracker)>> {
+    let mut candidates = Vec::new();
+    if all_instructions_supported(py, data, dag)? {
+        return Ok(candidates);
+    }
+
+    let mut tracker = QubitTracker::new(dag.num_qubits(), qubits_initially_zero);
+    for node in dag.topological_op_nodes()? {
+        let NodeType::Operation(inst) = &dag[node] else {
+            unreachable!("topological_op_nodes only yields operation nodes");
+        };
+        let qubits = dag.get_qargs(inst.qubits);
+        match inst.op.name() {
+            "id" | "delay" | "barrier" => continue,
+            "reset" => {
+                tracker.set_clean(qubits);
+                continue;
+            }
+            _ => (),
+        }
+        if !inst.op.control_flow()
+            && !definitely_skip_op(py, data, &inst.op, qubits)
+            && data
+                .borrow()
+                .hls_op_names
+                .iter()
+                .any(|s| s == inst.op.name())
+        {
+            let op_py = operation_to_py(
+                py,
+                &inst.op.view(),
+                inst.params_view(),
+                inst.label.as_ref().map(|x| x.as_str()),
+            )?;
+            candidates.push((
+                op_py,
+                qubits.iter().map(|q| q.index()).collect(),
+                tracker.clone(),
+            ));
+        }
+        tracker.set_dirty(qubits);
+    }
+    Ok(candidates)
+}
+
 pub fn high_level_synthesis_mod(m: &Bound<PyModule>) -> PyResult<()> {
     m.add_wrapped(wrap_pyfunction!(run_high_level_synthesis))?;
+    m.add_wrapped(wrap_pyfunction!(collect_synthesis_candidates))?;
     m.add_wrapped(wrap_pyfunction!(py_synthesize_operation))?;
 
     m.add_class::<QubitTracker>()?;
@@ -0,0 +1,390 @@
+// This code is part of Qiskit.
+//
+// (C) Copyright IBM 2025
+//
+// This code is licensed under the Apache License, Version 2.0. You may
+// obtain a copy of this license in the LICENSE.txt file in the root directory
+// of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+//
+// Any modifications or derivative works of this code must retain this
+// copyright notice, and modified files need to carry a notice indicating
+// that they have been altered from the originals.
+
+use pyo3::prelude::*;
+use pyo3::wrap_pyfunction;
+
+use rayon_cond::CondIterator;
+use smallvec::SmallVec;
+
+use qiskit_circuit::bit::ShareableQubit;
+use qiskit_circuit::dag_circuit::{DAGCircuit, NodeType};
+use qiskit_circuit::nlayout::NLayout;
+use qiskit_circuit::operations::{Operation, StandardGate};
+use qiskit_circuit::packed_instruction::PackedInstruction;
+use qiskit_circuit::{PhysicalQubit, Qubit, VarsMode, VirtualQubit, getenv_use_multiple_threads};
+use rustworkx_core::petgraph::prelude::*;
+
+use crate::TranspilerError;
+use crate::passes::sabre::route::{PyRoutingTarget, RoutingTarget};
+
+/// One operation of the input circuit, in topological order.
+struct Gate {
+    node: NodeIndex,
+    qubits: SmallVec<[VirtualQubit; 2]>,
+    /// Directives (such as barriers) are never blocked by the coupling constraints, and don't
+    /// contribute to the layout distance.
+    directive: bool,
+}
+
+/// An item in the routed output: either an operation from the input circuit (by its index in the
+/// list of gates), or an inserted swap.
+#[derive(Clone, Copy, Debug)]
+enum Mapped {
+    Gate(u32),
+    Swap([PhysicalQubit; 2]),
+}
+
+/// One possible step of the lookahead process.
+struct Step {
+    /// The layout after this step.
+    layout: NLayout,
+    /// The number of swaps that were introduced.
+    num_swaps: usize,
+    /// The gates (including introduced swaps) that were mapped, in order.
+    mapped: Vec<Mapped>,
+    /// The number of two-qubit items in `mapped`.
+    num_mapped_2q: usize,
+    /// The gates that could not be mapped yet.
+    remaining: Vec<u32>,
+}
+
+impl Step {
+    /// The number of two-qubit gates that were mapped, less three per introduced swap.
+    fn score(&self) -> isize {
+        self.num_mapped_2q as isize - 3 * self.num_swaps as isize
+    }
+}
+
+struct LookaheadSearch<'a> {
+    target: &'a RoutingTarget,
+    gates: Vec<Gate>,
+    /// The candidate swaps, as canonically ordered pairs of coupled physical qubits.
+    swaps: Vec<[PhysicalQubit; 2]>,
+    /// The maximum number of gates that contribute to the distance of a layout.
+    max_gates: usize,
+    search_width: usize,
+}
+
+impl LookaheadSearch<'_> {
+    #[inline]
+    fn distance(&self, a: PhysicalQubit, b: PhysicalQubit) -> f64 {
+        self.target.distance[[a.index(), b.index()]]
+    }
+
+    /// The sum of the distances between the qubits of the first `max_gates` two-qubit gates, with
+    /// the physical qubits mapped through `map_fn`.
+    fn layout_distance(
+        &self,
+        gates: &[u32],
+        layout: &NLayout,
+        map_fn: impl Fn(PhysicalQubit) -> PhysicalQubit,
+    ) -> f64 {
+        gates
+            .iter()
+            .take(self.max_gates)
+            .map(|gate| &self.gates[*gate as usize])
+            .filter(|gate| !gate.directive && gate.qubits.len() == 2)
+            .map(|gate| {
+                self.distance(
+                    map_fn(gate.qubits[0].to_phys(layout)),
+                    map_fn(gate.qubits[1].to_phys(layout)),
+                )
+            })
+            .sum()
+    }
+
+    /// Map all the gates that can be executed with the current layout, returning the mapped gates
+    /// and the remaining ones.
+    fn map_free_gates(&self, layout: &NLayout, gates: &[u32]) -> (Vec<u32>, Vec<u32>) {
+        let mut blocked = vec![false; layout.num_qubits()];
+        let mut mapped = Vec::new();
+        let mut remaining = Vec::new();
+        for &index in gates {
+            let gate = &self.gates[index as usize];
+            // Directives without any qubits can't be placed anywhere.
+            if gate.directive && gate.qubits.is_empty() {
+                continue;
+            }
+            let executable = !gate.qubits.iter().any(|q| blocked[q.index()])
+                && (gate.directive
+                    || gate.qubits.len() < 2
+                    || self.distance(
+                        gate.qubits[0].to_phys(layout),
+                        gate.qubits[1].to_phys(layout),
+                    ) == 1.);
+            if executable {
+                mapped.push(index);
+            } else {
+                for qubit in &gate.qubits {
+                    blocked[qubit.index()] = true;
+                }
+                remaining.push(index);
+            }
+        }
+        (mapped, remaining)
+    }
+
+    /// Search for the swaps that allow the application of the largest number of gates, exploring
+    /// `search_width` swaps at each level to a depth of `depth` swaps.
+    ///
+    /// Returns `None` if no swaps leading to an improvement were found.
+    fn search(
+        &self,
+        layout: &NLayout,
+        gates: &[u32],
+        depth: usize,
+        parallel: bool,
+    ) -> Option<Step> {
+        let (gates_mapped, gates_remaining) = self.map_free_gates(layout, gates);
+        if gates_remaining.is_empty() || depth == 0 {
+            let num_mapped_2q = gates_mapped
+                .iter()
+                .filter(|gate| self.gates[**gate as usize].qubits.len() == 2)
+                .count();
+            return Some(Step {
+                layout: layout.clone(),
+                num_swaps: 0,
+                mapped: gates_mapped.into_iter().map(Mapped::Gate).collect(),
+                num_mapped_2q,
+                remaining: gates_remaining,
+            });
+        }
+        if self.swaps.is_empty() {
+            return None;
+        }
+
+        // Rank the swaps by the distance of the resulting layout over the gates of this level.  The
+        // sort is stable, so ties keep the canonical order of the swaps.
+        let mut ranked = CondIterator::new(&self.swaps, parallel)
+            .map(|&[a, b]| {
+                let swapped = |q: PhysicalQubit| match q {
+                    q if q == a => b,
+                    q if q == b => a,
+                    q => q,
+                };
+                ([a, b], self.layout_distance(gates, layout, swapped))
+            })
+            .collect::<Vec<_>>();
+        ranked.sort_by(|left, right| left.1.total_cmp(&right.1));
+        let swapped_layout = |[a, b]: [PhysicalQubit; 2]| {
+            let mut layout = layout.clone();
+            layout.swap_physical(a, b);
+            layout
+        };
+
+        // We always explore at least the first `search_width + 1` swaps (or all of them), so these
+        // searches can run concurrently.  The results are then considered in rank order, exactly
+        // as if they had been run serially.
+        let first_break = self.search_width.min(ranked.len() - 1);
+        let mut eager = CondIterator::new(&ranked[..=first_break], parallel)
+            .map(|(swap, _)| {
+                let layout = swapped_layout(*swap);
+                let step = self.search(&layout, &gates_remaining, depth - 1, false);
+                (layout, step)
+            })
+            .collect::<Vec<_>>()
+            .into_iter();
+
+        let mut best: Option<([PhysicalQubit; 2], Step, isize)> = None;
+        for (rank, (swap, _)) in ranked.iter().enumerate() {
+            let (new_layout, next_step) = eager.next().unwrap_or_else(|| {
+                let layout = swapped_layout(*swap);
+                let step = self.search(&layout, &gates_remaining, depth - 1, false);
+                (layout, step)
+            });
+            let Some(next_step) = next_step else {
+                continue;
+            };
+            let next_score = next_step.score();
+            // `ranked` is already sorted by distance, so distance is the tie-breaker.
+            if best
+                .as_ref()
+                .is_none_or(|(_, _, score)| next_score > *score)
+            {
+                best = Some((*swap, next_step, next_score));
+            }
+            let (_, best_step, _) = best.as_ref().expect("just set");
+            // Once we've examined either `search_width` swaps or all available swaps, return the
+            // best-scoring swap provided it leads to an improvement in either the number of gates
+            // mapped, the number of gates left to be mapped, or the distance of the final layout.
+            if rank >= first_break
+                && (best_step.mapped.len() > depth
+                    || best_step.remaining.len() < gates_remaining.len()
+                    || self.layout_distance(&best_step.remaining, &best_step.layout, |q| q)
+                        < self.layout_distance(&gates_remaining, &new_layout, |q| q))
+            {
+                let (swap, best_step, _) = best.expect("just checked");
+                let num_mapped_2q = gates_mapped
+                    .iter()
+                    .filter(|gate| self.gates[**gate as usize].qubits.len() == 2)
+                    .count()
+                    + 1
+                    + best_step.num_mapped_2q;
+                let mut mapped =
+                    Vec::with_capacity(gates_mapped.len() + 1 + best_step.mapped.len());
+                mapped.extend(gates_mapped.into_iter().map(Mapped::Gate));
+                mapped.push(Mapped::Swap(swap));
+                mapped.extend(best_step.mapped);
+                return Some(Step {
+                    layout: best_step.layout,
+                    num_swaps: best_step.num_swaps + 1,
+                    mapped,
+                    num_mapped_2q,
+                    remaining: best_step.remaining,
+                });
+            }
+        }
+        None
+    }
+}
+
+/// Route a circuit with the lookahead swap mapper.
+///
+/// Args:
+///     dag (DAGCircuit): the physical circuit to route.  It must not have more qubits than the
+///         target.  If it has fewer, the routed circuit is padded with idle qubits up to the size
+///         of the target, so the swaps can use every physical qubit.
+///     target (RoutingTarget): the coupling constraints.
+///     search_depth (int): the number of swap layers to search before choosing a step.
+///     search_width (int): the number of swaps to explore at each layer.
+///     fake_run (bool): if ``True``, only calculate the final layout and don't build the routed
+///         circuit.
+///
+/// Returns:
+///     tuple[DAGCircuit | None, NLayout]: the routed circuit (or ``None`` in a fake run), and the
+///     layout of the virtual qubits at the end of the circuit.
+#[pyfunction]
+#[pyo3(signature = (dag, target, search_depth, search_width, fake_run=false))]
+pub fn lookahead_swap(
+    dag: &DAGCircuit,
+    target: &PyRoutingTarget,
+    search_depth: usize,
+    search_width: usize,
+    fake_run: bool,
+) -> PyResult<(Option<DAGCircuit>, NLayout)> {
+    let num_qubits = dag.num_qubits();
+    let Some(target) = target.0.as_ref() else {
+        // All-to-all coupling.
+        let layout = NLayout::generate_trivial_layout(num_qubits as u32);
+        return Ok(((!fake_run).then(|| dag.clone()), layout));
+    };
+    let num_physical = target.num_qubits();
+    if num_qubits > num_physical {
+        return Err(TranspilerError::new_err(format!(
+            "The circuit has {num_qubits} qubits, but the coupling map only has {num_physical}."
+        )));
+    }
+
+    let mut gates = Vec::with_capacity(dag.num_ops());
+    for node in dag.topological_op_nodes()? {
+        let NodeType::Operation(inst) = &dag[node] else {
+            unreachable!("topological_op_nodes only yields operations");
+        };
+        gates.push(Gate {
+            node,
+            qubits: dag
+                .get_qargs(inst.qubits)
+                .iter()
+                .map(|q| VirtualQubit::new(q.0))
+                .collect(),
+            directive: inst.op.directive(),
+        });
+    }
+    let mut swaps = target
+        .neighbors
+        .edge_references()
+        .map(|edge| {
+            let (a, b) = (edge.source(), edge.target());
+            if a < b { [a, b] } else { [b, a] }
+        })
+        .collect::<Vec<_>>();
+    swaps.sort_unstable();
+    swaps.dedup();
+    let search = LookaheadSearch {
+        target,
+        gates,
+        swaps,
+        max_gates: 50 + 10 * num_physical,
+        search_width,
+    };
+
+    let parallel = getenv_use_multiple_threads();
+    let mut layout = NLayout::generate_trivial_layout(num_physical as u32);
+    let mut remaining = (0..search.gates.len() as u32).collect::<Vec<_>>();
+    let mut order = Vec::with_capacity(search.gates.len());
+    while !remaining.is_empty() {
+        let step = search
+            .search(&layout, &remaining, search_depth, parallel)
+            .filter(|step| !step.mapped.is_empty())
+            .ok_or_else(|| {
+                TranspilerError::new_err(
+                    "Lookahead failed to find a swap which mapped gates or improved layout score.",
+                )
+            })?;
+        order.extend(step.mapped);
+        layout = step.layout;
+        remaining = step.remaining;
+    }
+    if fake_run {
+        return Ok((None, layout));
+    }
+
+    let num_swaps = order
+        .iter()
+        .filter(|item| matches!(item, Mapped::Swap(_)))
+        .count();
+    let mut out = dag.copy_empty_like_with_capacity(
+        dag.num_ops() + num_swaps,
+        dag.dag().edge_count() + 2 * num_swaps,
+        VarsMode::Alike,
+    )?;
+    for _ in num_qubits..num_physical {
+        out.add_qubit_unchecked(ShareableQubit::new_anonymous())?;
+    }
+    let mut out = out.into_builder();
+    let mut replay = NLayout::generate_trivial_layout(num_physical as u32);
+    let mut qargs = Vec::with_capacity(4);
+    for item in order {
+        match item {
+            Mapped::Gate(index) => {
+                let gate = &search.gates[index as usize];
+                let NodeType::Operation(inst) = &dag[gate.node] else {
+                    unreachable!("gates are built from operations");
+                };
+                qargs.clear();
+                qargs.extend(gate.qubits.iter().map(|q| Qubit(q.to_phys(&replay).0)));
+                let new_inst = PackedInstruction {
+                    qubits: out.insert_qargs(&qargs),
+                    ..inst.clone()
+                };
+                out.push_back(new_inst)?;
+            }
+            Mapped::Swap([a, b]) => {
+                replay.swap_physical(a, b);
+                let swap = PackedInstruction::from_standard_gate(
+                    StandardGate::Swap,
+                    None,
+                    out.insert_qargs(&[Qubit(a.0), Qubit(b.0)]),
+                );
+                out.push_back(swap)?;
+            }
+        }
+    }
+    debug_assert_eq!(replay, layout);
+    Ok((Some(out.build()), layout))
+}
+
+pub fn lookahead_swap_mod(m: &Bound<PyModule>) -> PyResult<()> {
+    m.add_wrapped(wrap_pyfunction!(lookahead_swap))?;
+    Ok(())
+}
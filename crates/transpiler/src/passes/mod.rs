@@ -29,6 +29,7 @@ mod basis_translator;
 mod check_map;
 mod commutation_analysis;
 mod commutation_cancellation;
+mod commuting_2q_router;
 mod consolidate_blocks;
 mod dense_layout;
 mod disjoint_layout;
@@ -40,11 +41,13 @@ mod high_level_synthesis;
 mod instruction_duration_check;
 mod inverse_cancellation;
 mod litinski_transformation;
+mod lookahead_swap;
 mod optimize_1q_gates_decomposition;
 mod remove_diagonal_gates_before_measure;
 mod remove_identity_equiv;
 pub mod sabre;
 mod split_2q_unitaries;
+mod token_swapper;
 mod unitary_synthesis;
 mod unroll_3q_or_more;
 mod vf2;
@@ -60,6 +63,9 @@ pub use basis_translator::{basis_translator_mod, run_basis_translator};
 pub use check_map::{check_map_mod, run_check_map};
 pub use commutation_analysis::{analyze_commutations, commutation_analysis_mod};
 pub use commutation_cancellation::{cancel_commutations, commutation_cancellation_mod};
+pub use commuting_2q_router::{
+    SwapStrategyTable, commuting_2q_router_mod, route_commuting_2q_block,
+};
 pub use consolidate_blocks::{DecomposerType, consolidate_blocks_mod, run_consolidate_blocks};
 pub use dense_layout::{best_subset, dense_layout_mod};
 pub use disjoint_layout::{combine_barriers, disjoint_utils_mod, distribute_components};
@@ -78,6 +84,7 @@ pub use instruction_duration_check::{
 };
 pub use inverse_cancellation::{inverse_cancellation_mod, run_inverse_cancellation_standard_gates};
 pub use litinski_transformation::{litinski_transformation_mod, run_litinski_transformation};
+pub use lookahead_swap::{lookahead_swap, lookahead_swap_mod};
 pub use optimize_1q_gates_decomposition::{
     optimize_1q_gates_decomposition_mod, run_optimize_1q_gates_decomposition,
 };
@@ -86,7 +93,11 @@ pub use remove_diagonal_gates_before_measure::{
 };
 pub use remove_identity_equiv::{remove_identity_equiv_mod, run_remove_identity_equiv};
 pub use split_2q_unitaries::{run_split_2q_unitaries, split_2q_unitaries_mod};
+pub use token_swapper::{TokenSwapper, TokenSwapperError, token_swap, token_swapper_mod};
 pub use unitary_synthesis::{run_unitary_synthesis, unitary_synthesis_mod};
 pub use unroll_3q_or_more::{run_unroll_3q_or_more, unroll_3q_or_more_mod};
-pub use vf2::{ErrorMap, error_map_mod, score_layout, vf2_layout_mod, vf2_layout_pass};
+pub use vf2::{
+    ErrorMap, csp_layout_mod, csp_layout_pass, error_map_mod, score_layout, vf2_layout_mod,
+    vf2_layout_pass,
+};
 pub use wrap_angles::{run_wrap_angles, wrap_angles_mod};
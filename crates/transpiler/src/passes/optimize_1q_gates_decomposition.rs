@@ -53,14 +53,58 @@ fn compute_error_from_target_one_qubit_sequence(
 }
 
 #[pyfunction]
-#[pyo3(name = "optimize_1q_gates_decomposition", signature = (dag, *, target=None, basis_gates=None, global_decomposers=None))]
+#[pyo3(
+    name = "optimize_1q_gates_decomposition",
+    signature = (dag, *, target=None, basis_gates=None, global_decomposers=None, checkpoint=None)
+)]
+pub fn py_run_optimize_1q_gates_decomposition(
+    dag: &mut DAGCircuit,
+    target: Option<&Target>,
+    basis_gates: Option<HashSet<String>>,
+    global_decomposers: Option<Vec<String>>,
+    checkpoint: Option<String>,
+) -> PyResult<()> {
+    // If the pass has seen this DAG before, runs that are entirely unchanged since then (including
+    // their neighbours) were already optimized, and would come out the same again.
+    let changed = checkpoint
+        .as_deref()
+        .and_then(|name| dag.changed_since_checkpoint(name));
+    optimize_1q_runs(
+        dag,
+        target,
+        basis_gates,
+        global_decomposers,
+        changed.as_ref(),
+    )?;
+    if let Some(name) = checkpoint {
+        dag.set_checkpoint(name);
+    }
+    Ok(())
+}
+
 pub fn run_optimize_1q_gates_decomposition(
     dag: &mut DAGCircuit,
     target: Option<&Target>,
     basis_gates: Option<HashSet<String>>,
     global_decomposers: Option<Vec<String>>,
 ) -> PyResult<()> {
-    let runs: Vec<Vec<NodeIndex>> = dag.collect_1q_runs().unwrap().collect();
+    optimize_1q_runs(dag, target, basis_gates, global_decomposers, None)
+}
+
+/// Resynthesize the single-qubit runs of `dag`.  If `changed` is given, only the runs that
+/// contain at least one of its nodes are considered.
+fn optimize_1q_runs(
+    dag: &mut DAGCircuit,
+    target: Option<&Target>,
+    basis_gates: Option<HashSet<String>>,
+    global_decomposers: Option<Vec<String>>,
+    changed: Option<&HashSet<NodeIndex>>,
+) -> PyResult<()> {
+    let runs: Vec<Vec<NodeIndex>> = dag
+        .collect_1q_runs()
+        .unwrap()
+        .filter(|run| changed.is_none_or(|changed| run.iter().any(|node| changed.contains(node))))
+        .collect();
     let dag_qubits = dag.num_qubits();
     let mut target_basis_per_qubit: Vec<EulerBasisSet> = vec![EulerBasisSet::new(); dag_qubits];
     let mut basis_gates_per_qubit: Vec<Option<HashSet<&str>>> = vec![None; dag_qubits];
@@ -257,6 +301,6 @@ pub fn matmul_1q_with_slice(operator: &mut [[Complex64; 2]; 2], other: &[[Comple
 }
 
 pub fn optimize_1q_gates_decomposition_mod(m: &Bound<PyModule>) -> PyResult<()> {
-    m.add_wrapped(wrap_pyfunction!(run_optimize_1q_gates_decomposition))?;
+    m.add_wrapped(wrap_pyfunction!(py_run_optimize_1q_gates_decomposition))?;
     Ok(())
 }
@@ -0,0 +1,94 @@
+// This code is part of Qiskit.
+//
+// (C) Copyright IBM 2025
+//
+// This code is licensed under the Apache License, Version 2.0. You may
+// obtain a copy of this license in the LICENSE.txt file in the root directory
+// of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+//
+// Any modifications or derivative works of this code must retain this
+// copyright notice, and modified files need to carry a notice indicating
+// that they have been altered from the originals.
+
+use std::sync::atomic::{AtomicUsize, Ordering};
+use std::time::{Duration, Instant};
+
+use pyo3::PyResult;
+use pyo3::exceptions::PyValueError;
+
+/// A wall-clock budget shared by all the trials of a Sabre layout or routing run.
+///
+/// Trials that have not started by the deadline are skipped, and the best of the completed trials
+/// is used.  The first trial at each level always runs to completion, so there is always a result,
+/// and the forwards-backwards refinement of a layout trial stops early once the deadline passes.
+/// Without a deadline, every trial runs and the output is the same as it would be without a budget.
+///
+/// The budget also counts the trials that were completed, since with a deadline that depends on
+/// the speed of the machine and the load on the thread pool.
+#[derive(Debug, Default)]
+pub struct TrialBudget {
+    deadline: Option<Instant>,
+    layout_trials: AtomicUsize,
+    routing_trials: AtomicUsize,
+}
+
+impl TrialBudget {
+    /// A budget with no deadline.
+    pub fn unlimited() -> Self {
+        Self::default()
+    }
+
+    /// A budget whose deadline is a given amount of time from now.
+    pub fn with_time_limit(limit: Duration) -> Self {
+        Self {
+            deadline: Some(Instant::now() + limit),
+            ..Self::default()
+        }
+    }
+
+    /// Create a budget from an optional number of seconds, as passed from Python.
+    pub fn from_seconds(seconds: Option<f64>) -> PyResult<Self> {
+        let Some(seconds) = seconds else {
+            return Ok(Self::unlimited());
+        };
+        Duration::try_from_secs_f64(seconds)
+            .map(Self::with_time_limit)
+            .map_err(|_| {
+                PyValueError::new_err(format!(
+                    "time limit must be a non-negative number of seconds, not {seconds}"
+                ))
+            })
+    }
+
+    /// Whether the deadline has passed.  This is always `false` for an unlimited budget.
+    #[inline]
+    pub fn expired(&self) -> bool {
+        self.deadline
+            .is_some_and(|deadline| Instant::now() >= deadline)
+    }
+
+    /// Whether the trial with a given index should be started.
+    #[inline]
+    pub(super) fn should_start(&self, index: usize) -> bool {
+        index == 0 || !self.expired()
+    }
+
+    pub(super) fn record_layout_trial(&self) {
+        self.layout_trials.fetch_add(1, Ordering::Relaxed);
+    }
+
+    pub(super) fn record_routing_trial(&self) {
+        self.routing_trials.fetch_add(1, Ordering::Relaxed);
+    }
+
+    /// The number of layout trials that have been completed with this budget.
+    pub fn layout_trials_completed(&self) -> usize {
+        self.layout_trials.load(Ordering::Relaxed)
+    }
+
+    /// The number of routing trials that have been completed with this budget, including those run
+    /// within layout trials.
+    pub fn routing_trials_completed(&self) -> usize {
+        self.routing_trials.load(Ordering::Relaxed)
+    }
+}
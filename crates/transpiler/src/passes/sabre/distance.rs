@@ -10,8 +10,13 @@
 // copyright notice, and modified files need to carry a notice indicating
 // that they have been altered from the originals.
 
+use std::fmt;
+use std::ops::Index;
+use std::sync::Arc;
+
 use fixedbitset::FixedBitSet;
-use ndarray::{Array2, ArrayViewMut1, Axis};
+use ndarray::{Array2, ArrayView2, ArrayViewMut1, Axis};
+use pyo3::prelude::*;
 use rayon_cond::CondIterator;
 use rustworkx_core::petgraph::visit::{IntoNeighbors, NodeCompactIndexable};
 
@@ -74,3 +79,107 @@ where
         .for_each(|(index, row)| bfs_traversal(index, row));
     out
 }
+
+/// A square matrix of distances between qubits.
+///
+/// The matrix is either owned, or borrowed from a read-only buffer that a Python object keeps
+/// alive, such as a memory-mapped routing table that is shared between processes (see
+/// [super::table]).
+#[derive(Clone, Debug)]
+pub enum DistanceMatrix {
+    Owned(Array2<f64>),
+    Shared(Arc<SharedDistance>),
+}
+
+impl DistanceMatrix {
+    #[inline]
+    pub fn view(&self) -> ArrayView2<'_, f64> {
+        match self {
+            Self::Owned(distance) => distance.view(),
+            Self::Shared(distance) => distance.view(),
+        }
+    }
+
+    pub fn to_owned(&self) -> Array2<f64> {
+        self.view().to_owned()
+    }
+}
+
+impl From<Array2<f64>> for DistanceMatrix {
+    fn from(distance: Array2<f64>) -> Self {
+        Self::Owned(distance)
+    }
+}
+
+impl Index<[usize; 2]> for DistanceMatrix {
+    type Output = f64;
+
+    #[inline]
+    fn index(&self, index: [usize; 2]) -> &f64 {
+        match self {
+            Self::Owned(distance) => &distance[index],
+            Self::Shared(distance) => distance.get(index),
+        }
+    }
+}
+
+/// A distance matrix in a buffer owned by a Python object.
+pub struct SharedDistance {
+    owner: Py<PyAny>,
+    data: *const f64,
+    num_qubits: usize,
+}
+
+// SAFETY: the buffer is read-only and lives as long as `owner`, which is `Send` and `Sync`.
+unsafe impl Send for SharedDistance {}
+unsafe impl Sync for SharedDistance {}
+
+impl SharedDistance {
+    /// Borrow a distance matrix from the buffer of a Python object.
+    ///
+    /// # Safety
+    ///
+    /// `data` must point to `num_qubits * num_qubits` aligned, row-major `f64` values that are
+    /// valid for as long as `owner` is alive, and that nothing writes to.
+    pub unsafe fn new(owner: Py<PyAny>, data: *const f64, num_qubits: usize) -> Self {
+        Self {
+            owner,
+            data,
+            num_qubits,
+        }
+    }
+
+    #[inline]
+    pub fn num_qubits(&self) -> usize {
+        self.num_qubits
+    }
+
+    /// The Python object that owns the buffer.
+    pub fn owner(&self) -> &Py<PyAny> {
+        &self.owner
+    }
+
+    #[inline]
+    pub fn view(&self) -> ArrayView2<'_, f64> {
+        // SAFETY: per the construction contract.
+        unsafe { ArrayView2::from_shape_ptr((self.num_qubits, self.num_qubits), self.data) }
+    }
+
+    #[inline]
+    fn get(&self, [row, col]: [usize; 2]) -> &f64 {
+        assert!(
+            row < self.num_qubits && col < self.num_qubits,
+            "index out of bounds"
+        );
+        // SAFETY: the index is in bounds, and the buffer is valid per the construction contract.
+        unsafe { &*self.data.add(row * self.num_qubits + col) }
+    }
+}
+
+impl fmt::Debug for SharedDistance {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        f.debug_struct("SharedDistance")
+            .field("num_qubits", &self.num_qubits)
+            .finish_non_exhaustive()
+    }
+}
@@ -18,7 +18,8 @@ use ndarray::aview2;
 use rand::prelude::*;
 use rand_pcg::Pcg64Mcg;
 use rayon_cond::CondIterator;
-use rustworkx_core::petgraph::graph::NodeIndex;
+use rustworkx_core::petgraph::Undirected;
+use rustworkx_core::petgraph::graph::{Graph, NodeIndex};
 
 use qiskit_circuit::dag_circuit::DAGCircuit;
 use qiskit_circuit::nlayout::NLayout;
@@ -32,13 +33,58 @@ use crate::passes::{
 };
 use crate::target::{Target, TargetCouplingError};
 
+use super::budget::TrialBudget;
 use super::dag::SabreDAG;
 use super::heuristic::Heuristic;
 use super::route::{RoutingProblem, RoutingResult, RoutingTarget, swap_map, swap_map_trial};
 
+/// Run Sabre layout and routing on a circuit.
+///
+/// Returns:
+///     A four-tuple of the routed :class:`.DAGCircuit`, the initial and final layouts, and the
+///     number of layout trials that were completed within the ``time_limit`` (in seconds), if any.
 #[allow(clippy::too_many_arguments)]
 #[pyfunction]
-#[pyo3(signature = (dag, target, heuristic, max_iterations, num_swap_trials, num_random_trials, seed=None, partial_layouts=vec![], skip_routing=false))]
+#[pyo3(name = "sabre_layout_and_routing", signature = (dag, target, heuristic, max_iterations, num_swap_trials, num_random_trials, seed=None, partial_layouts=vec![], skip_routing=false, time_limit=None))]
+pub fn py_sabre_layout_and_routing(
+    dag: &mut DAGCircuit,
+    target: &Target,
+    heuristic: &Heuristic,
+    max_iterations: usize,
+    num_swap_trials: usize,
+    num_random_trials: usize,
+    seed: Option<u64>,
+    partial_layouts: Vec<Vec<Option<PhysicalQubit>>>,
+    skip_routing: bool,
+    time_limit: Option<f64>,
+) -> PyResult<(DAGCircuit, NLayout, NLayout, usize)> {
+    let budget = TrialBudget::from_seconds(time_limit)?;
+    let (out, initial_layout, final_layout) = sabre_layout_and_routing(
+        dag,
+        target,
+        heuristic,
+        max_iterations,
+        num_swap_trials,
+        num_random_trials,
+        seed,
+        partial_layouts,
+        skip_routing,
+        &budget,
+    )?;
+    Ok((
+        out,
+        initial_layout,
+        final_layout,
+        budget.layout_trials_completed(),
+    ))
+}
+
+/// Run Sabre layout and routing on a circuit, returning the routed circuit and the initial and
+/// final layouts.
+///
+/// Layout and routing trials that have not started when the `budget` expires are skipped; use
+/// [TrialBudget::unlimited] to always run every trial.
+#[allow(clippy::too_many_arguments)]
 pub fn sabre_layout_and_routing(
     dag: &mut DAGCircuit,
     target: &Target,
@@ -49,6 +95,7 @@ pub fn sabre_layout_and_routing(
     seed: Option<u64>,
     partial_layouts: Vec<Vec<Option<PhysicalQubit>>>,
     skip_routing: bool,
+    budget: &TrialBudget,
 ) -> PyResult<(DAGCircuit, NLayout, NLayout)> {
     let Some(num_physical_qubits) = target.num_qubits else {
         return Err(TranspilerError::new_err(
@@ -81,7 +128,7 @@ pub fn sabre_layout_and_routing(
     let mut starting_layouts = (0..num_random_trials)
         .map(|_| Vec::new())
         .collect::<Vec<_>>();
-    let seeds = |count| {
+    let seeds = |count: usize| {
         match seed {
             Some(seed) => Pcg64Mcg::seed_from_u64(seed),
             None => Pcg64Mcg::from_os_rng(),
@@ -152,18 +199,20 @@ pub fn sabre_layout_and_routing(
                 allow_parallel && num_layout_trials > 1,
             )
             .enumerate()
-            .map(|(index, seed)| {
-                (
-                    index,
-                    layout_trial(
+            .filter_map(|(index, seed)| {
+                budget.should_start(index).then(|| {
+                    let result = layout_trial(
                         problem,
                         seed,
                         max_iterations,
                         num_swap_trials,
                         allow_parallel && num_swap_trials > 1,
                         &starting_layouts[index],
-                    ),
-                )
+                        budget,
+                    );
+                    budget.record_layout_trial();
+                    (index, result)
+                })
             })
             .min_by_key(|(index, result)| (result.swap_count(), *index))
             .expect("should have at least one layout trial");
@@ -193,87 +242,42 @@ pub fn sabre_layout_and_routing(
             // The DAG needs splitting across multiple chips.  We can build an initial layout
             // safely, but the final routing needs to be done altogether, with cross-chip
             // synchronisation points (e.g. barriers, classical communication, etc) fully in place.
+            // Each component is an independent layout problem, so they are laid out in parallel,
+            // and the results are merged in component order, which keeps the output deterministic.
             let mut full_layout = vec![PhysicalQubit::new(u32::MAX); dag.num_qubits()];
             // Mapping of the "proper" (full-target) physical qubits to the "fake" restricted
-            // physical qubit index used in the disjoint handling.  At the end of the loop, there
-            // will be duplicates in the list, and there may still be un-set entries, but that
-            // doesn't matter, because we only access physical qubits that come up.
+            // physical qubit index used in the disjoint handling.  The components are disjoint, so
+            // each physical qubit is set at most once, but the same restricted index appears once
+            // per component.  Un-set entries don't matter, because we only access physical qubits
+            // that come up, and check they belong to the component they are used in.
             let mut sub_from_full = vec![PhysicalQubit::new(u32::MAX); num_physical_qubits];
             for component in &components {
-                let sabre = SabreDAG::from_dag(&component.sub_dag)?;
-                let target =
-                    RoutingTarget::from_neighbors(Neighbors::from_coupling_subset_with_map(
-                        &coupling,
-                        &component.physical_qubits,
-                        |q| NodeIndex::new(q.index()),
-                    ));
-                let sub_problem = RoutingProblem {
-                    target: &target,
-                    sabre: &sabre,
-                    dag: &component.sub_dag,
-                    heuristic,
-                };
                 for (sub, full) in component.physical_qubits.iter().enumerate() {
                     sub_from_full[full.index()] = PhysicalQubit::new(sub as u32);
                 }
-                let mut starting_layouts = starting_layouts.clone();
-                for partial in partial_layouts.iter() {
-                    let assigned_physical = |v: &VirtualQubit| {
-                        partial
-                            .get(v.index())
-                            .copied()
-                            .flatten()
-                            .map(|p| {
-                                let sub = sub_from_full[p.index()];
-                                if component.physical_qubits[sub.index()] == p {
-                                    Ok(sub)
-                                } else {
-                                    // TODO: this handling sucks, but it's better than panicking
-                                    // later in Sabre routing when nothing makes any sense.
-                                    Err(PyValueError::new_err(format!(
-                                        "A custom starting layout assigned virtual qubit {} \
-                                        to physical qubit {}, which could not be satisfied on \
-                                        this disjoint QPU.  This might be a bug in Qiskit, or \
-                                        a bug in a custom transpiler pass that set the partial \
-                                        layout trials for SabreLayout.",
-                                        v.index(),
-                                        p.index(),
-                                    )))
-                                }
-                            })
-                            .transpose()
-                    };
-                    let mapped_partial = component
-                        .virtual_qubits
-                        .iter()
-                        .map(assigned_physical)
-                        .collect::<PyResult<Vec<_>>>()?;
-                    starting_layouts.push(mapped_partial);
-                }
-                add_heuristic_layouts(&mut starting_layouts, sub_problem, allow_parallel);
-                let num_layout_trials = starting_layouts.len();
-                let (_, result) = CondIterator::new(
-                    seeds(num_layout_trials),
-                    allow_parallel && num_layout_trials > 1,
+            }
+            let component_layouts = CondIterator::new(
+                components.as_slice(),
+                allow_parallel && components.len() > 1,
+            )
+            .map(|component| {
+                layout_component(
+                    component,
+                    &coupling,
+                    &sub_from_full,
+                    &starting_layouts,
+                    &partial_layouts,
+                    &seeds,
+                    heuristic,
+                    max_iterations,
+                    num_swap_trials,
+                    allow_parallel,
+                    budget,
                 )
-                .enumerate()
-                .map(|(index, seed)| {
-                    (
-                        index,
-                        layout_trial(
-                            sub_problem,
-                            seed,
-                            max_iterations,
-                            num_swap_trials,
-                            allow_parallel && num_layout_trials == 1,
-                            &starting_layouts[index],
-                        ),
-                    )
-                })
-                .min_by_key(|(index, result)| (result.swap_count(), *index))
-                .expect("should have at least one layout trial");
-                for ((_, sub_phys), virt) in result
-                    .initial_layout
+            })
+            .collect::<PyResult<Vec<_>>>()?;
+            for (component, initial_layout) in components.iter().zip(component_layouts) {
+                for ((_, sub_phys), virt) in initial_layout
                     .iter_virtual()
                     // This zip might be shorter than `initial_layout`, but we _want_ the
                     // side-effect of truncating to the non-ancillas.
@@ -325,6 +329,7 @@ pub fn sabre_layout_and_routing(
                     seed,
                     num_swap_trials,
                     Some(allow_parallel),
+                    budget,
                 );
                 Ok((
                     result.rebuild()?,
@@ -336,6 +341,95 @@ pub fn sabre_layout_and_routing(
     }
 }
 
+/// Choose the initial layout of one component of a disjoint layout problem, in terms of the
+/// restricted physical qubits of the component.
+#[allow(clippy::too_many_arguments)]
+fn layout_component(
+    component: &disjoint_layout::DisjointComponent,
+    coupling: &Graph<(), (), Undirected>,
+    sub_from_full: &[PhysicalQubit],
+    starting_layouts: &[Vec<Option<PhysicalQubit>>],
+    partial_layouts: &[Vec<Option<PhysicalQubit>>],
+    seeds: &(impl Fn(usize) -> Vec<u64> + Sync),
+    heuristic: &Heuristic,
+    max_iterations: usize,
+    num_swap_trials: usize,
+    allow_parallel: bool,
+    budget: &TrialBudget,
+) -> PyResult<NLayout> {
+    let sabre = SabreDAG::from_dag(&component.sub_dag)?;
+    let target = RoutingTarget::from_neighbors(Neighbors::from_coupling_subset_with_map(
+        coupling,
+        &component.physical_qubits,
+        |q| NodeIndex::new(q.index()),
+    ));
+    let sub_problem = RoutingProblem {
+        target: &target,
+        sabre: &sabre,
+        dag: &component.sub_dag,
+        heuristic,
+    };
+    let mut starting_layouts = starting_layouts.to_vec();
+    for partial in partial_layouts.iter() {
+        let assigned_physical = |v: &VirtualQubit| {
+            partial
+                .get(v.index())
+                .copied()
+                .flatten()
+                .map(|p| {
+                    let sub = sub_from_full[p.index()];
+                    if component.physical_qubits.get(sub.index()) == Some(&p) {
+                        Ok(sub)
+                    } else {
+                        // TODO: this handling sucks, but it's better than panicking
+                        // later in Sabre routing when nothing makes any sense.
+                        Err(PyValueError::new_err(format!(
+                            "A custom starting layout assigned virtual qubit {} \
+                            to physical qubit {}, which could not be satisfied on \
+                            this disjoint QPU.  This might be a bug in Qiskit, or \
+                            a bug in a custom transpiler pass that set the partial \
+                            layout trials for SabreLayout.",
+                            v.index(),
+                            p.index(),
+                        )))
+                    }
+                })
+                .transpose()
+        };
+        let mapped_partial = component
+            .virtual_qubits
+            .iter()
+            .map(assigned_physical)
+            .collect::<PyResult<Vec<_>>>()?;
+        starting_layouts.push(mapped_partial);
+    }
+    add_heuristic_layouts(&mut starting_layouts, sub_problem, allow_parallel);
+    let num_layout_trials = starting_layouts.len();
+    let (_, result) = CondIterator::new(
+        seeds(num_layout_trials),
+        allow_parallel && num_layout_trials > 1,
+    )
+    .enumerate()
+    .filter_map(|(index, seed)| {
+        budget.should_start(index).then(|| {
+            let result = layout_trial(
+                sub_problem,
+                seed,
+                max_iterations,
+                num_swap_trials,
+                allow_parallel && num_layout_trials == 1,
+                &starting_layouts[index],
+                budget,
+            );
+            budget.record_layout_trial();
+            (index, result)
+        })
+    })
+    .min_by_key(|(index, result)| (result.swap_count(), *index))
+    .expect("should have at least one layout trial");
+    Ok(result.initial_layout)
+}
+
 fn layout_trial<'a>(
     problem: RoutingProblem<'a>,
     seed: u64,
@@ -343,6 +437,7 @@ fn layout_trial<'a>(
     num_swap_trials: usize,
     run_swap_in_parallel: bool,
     starting_layout: &'_ [Option<PhysicalQubit>],
+    budget: &TrialBudget,
 ) -> RoutingResult<'a> {
     let num_physical_qubits: u32 = problem.target.neighbors.num_qubits().try_into().unwrap();
     let mut rng = Pcg64Mcg::seed_from_u64(seed);
@@ -382,9 +477,12 @@ fn layout_trial<'a>(
     // which means they don't actually affect any heuristics that affect our layout choice.
     let sabre_forwards = problem.sabre.only_interactions();
     let sabre_backwards = sabre_forwards.reverse_dag();
+    // If the budget runs out, we stop refining after the first forwards-backwards iteration.
     let initial_layout = (0..max_iterations)
         .flat_map(|_| [&sabre_forwards, &sabre_backwards])
-        .fold(initial_layout, |initial, sabre| {
+        .enumerate()
+        .take_while(|(pass, _)| *pass < 2 || !budget.expired())
+        .fold(initial_layout, |initial, (_, sabre)| {
             swap_map_trial(problem.with_sabre(sabre), &initial, routing_seed).final_layout
         });
     // Remap implicit ancillas to be assigned in numerical order.  This is pretty meaningless, but
@@ -405,6 +503,7 @@ fn layout_trial<'a>(
         Some(seed),
         num_swap_trials,
         Some(run_swap_in_parallel),
+        budget,
     )
 }
 
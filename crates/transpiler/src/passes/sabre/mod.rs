@@ -10,25 +10,33 @@
 // copyright notice, and modified files need to carry a notice indicating
 // that they have been altered from the originals.
 
+mod budget;
 mod dag;
 mod distance;
 pub mod heuristic;
 mod layer;
 mod layout;
 pub(crate) mod route;
+mod table;
 
 use pyo3::prelude::*;
 use pyo3::wrap_pyfunction;
 
+pub use budget::TrialBudget;
+pub(crate) use distance::distance_matrix;
 pub(crate) use heuristic::Heuristic;
 pub(crate) use heuristic::SetScaling;
 pub use layout::sabre_layout_and_routing;
 pub(crate) use route::sabre_routing;
 
 pub fn sabre(m: &Bound<PyModule>) -> PyResult<()> {
-    m.add_wrapped(wrap_pyfunction!(route::sabre_routing))?;
-    m.add_wrapped(wrap_pyfunction!(layout::sabre_layout_and_routing))?;
+    m.add_wrapped(wrap_pyfunction!(route::py_sabre_routing))?;
+    m.add_wrapped(wrap_pyfunction!(layout::py_sabre_layout_and_routing))?;
     m.add_class::<route::PyRoutingTarget>()?;
+    m.add_wrapped(wrap_pyfunction!(table::write_routing_table))?;
+    m.add_wrapped(wrap_pyfunction!(table::register_routing_table))?;
+    m.add_wrapped(wrap_pyfunction!(table::clear_routing_tables))?;
+    m.add_wrapped(wrap_pyfunction!(table::routing_table_distance))?;
     m.add_class::<heuristic::SetScaling>()?;
     m.add_class::<heuristic::Heuristic>()?;
     m.add_class::<heuristic::BasicHeuristic>()?;
@@ -18,12 +18,12 @@ use std::num::NonZero;
 use numpy::{PyArray2, ToPyArray};
 use pyo3::Python;
 use pyo3::exceptions::PyValueError;
+use pyo3::intern;
 use pyo3::prelude::*;
 use pyo3::types::PyDict;
 
 use hashbrown::HashSet;
 use indexmap::IndexMap;
-use ndarray::Array2;
 use rand::prelude::*;
 use rand_pcg::Pcg64Mcg;
 use rayon_cond::CondIterator;
@@ -31,10 +31,10 @@ use rustworkx_core::dictmap::*;
 use rustworkx_core::petgraph::prelude::*;
 use rustworkx_core::petgraph::visit::{EdgeCount, EdgeRef};
 use rustworkx_core::shortest_path::dijkstra;
-use rustworkx_core::token_swapper::token_swapper;
 use smallvec::{SmallVec, smallvec};
 
 use qiskit_circuit::circuit_instruction::OperationFromPython;
+use qiskit_circuit::converters::dag_to_circuit;
 use qiskit_circuit::dag_circuit::{DAGCircuit, DAGCircuitBuilder, NodeType, Wire};
 use qiskit_circuit::nlayout::NLayout;
 use qiskit_circuit::operations::{OperationRef, StandardGate};
@@ -43,15 +43,20 @@ use qiskit_circuit::{PhysicalQubit, Qubit, VirtualQubit, getenv_use_multiple_thr
 
 use crate::TranspilerError;
 use crate::neighbors::Neighbors;
+use crate::passes::token_swap;
 use crate::target::{Target, TargetCouplingError};
 
+use super::budget::TrialBudget;
 use super::dag::{InteractionKind, SabreDAG};
-use super::distance::distance_matrix;
+use super::distance::{DistanceMatrix, distance_matrix};
 use super::heuristic::{BasicHeuristic, DecayHeuristic, Heuristic, LookaheadHeuristic, SetScaling};
 use super::layer::{ExtendedSet, FrontLayer};
+use super::table;
 
 /// Number of trials for control flow block swap epilogues.
 const SWAP_EPILOGUE_TRIALS: usize = 4;
+/// Number of qubits from which the trials of control flow block swap epilogues run in parallel.
+const TOKEN_SWAPPER_PARALLEL_THRESHOLD: usize = 50;
 
 /// The number of control-flow blocks to take off the stack.
 ///
@@ -241,17 +246,38 @@ impl RoutingResult<'_> {
                             idle.push(qubit);
                         }
                     }
+                    // The blocks are converted to circuit data in Rust; Python is only needed to
+                    // wrap them in `QuantumCircuit` objects for the control-flow operation.
+                    let blocks = blocks
+                        .into_iter()
+                        .map(|mut dag| {
+                            dag.remove_qubits(idle.iter().copied())?;
+                            let data = dag_to_circuit(&dag, false)?;
+                            Ok((data, dag))
+                        })
+                        .collect::<PyResult<Vec<_>>>()?;
                     let new_inst = Python::attach(|py| -> PyResult<_> {
-                        // TODO: have to use Python-space `dag_to_circuit` because the Rust-space is
-                        // only half the conversion (since it doesn't handle vars or stretches).
-                        let dag_to_circuit = imports::DAG_TO_CIRCUIT.get_bound(py);
+                        let quantum_circuit = imports::QUANTUM_CIRCUIT.get_bound(py);
                         let blocks = blocks
                             .into_iter()
-                            .map(|mut dag| {
-                                dag.remove_qubits(idle.iter().copied())?;
-                                dag_to_circuit.call1((dag, false))
+                            .map(|(data, dag)| {
+                                // Match `dag_to_circuit`, which treats an empty name as unset.
+                                let name = dag.name.as_ref().filter(|name| !name.is_empty());
+                                let block = quantum_circuit.call_method1(
+                                    intern!(py, "_from_circuit_data"),
+                                    (data, false, name),
+                                )?;
+                                if let Some(metadata) = dag.metadata.as_ref() {
+                                    block.setattr(intern!(py, "metadata"), metadata)?;
+                                }
+                                block.setattr(
+                                    intern!(py, "_duration"),
+                                    dag.get_internal_duration(py)?,
+                                )?;
+                                block.setattr(intern!(py, "_unit"), dag.get_internal_unit()?)?;
+                                Ok(block)
                             })
-                            .collect::<Result<Vec<_>, _>>()?;
+                            .collect::<PyResult<Vec<_>>>()?;
 
                         let OperationRef::Instruction(py_inst) = inst.op.view() else {
                             panic!("control-flow nodes must be PyInstruction");
@@ -292,12 +318,20 @@ impl RoutingResult<'_> {
 #[derive(Clone, Debug)]
 pub struct RoutingTarget {
     pub neighbors: Neighbors,
-    pub distance: Array2<f64>,
+    pub distance: DistanceMatrix,
 }
 impl RoutingTarget {
+    /// Create a routing target from its neighbor table.
+    ///
+    /// If a shared routing table has been registered for the same coupling graph, its distance
+    /// matrix is used in place; otherwise, the distance matrix is calculated.
     pub fn from_neighbors(neighbors: Neighbors) -> Self {
+        let distance = match table::lookup(&neighbors) {
+            Some(shared) => DistanceMatrix::Shared(shared),
+            None => distance_matrix(&neighbors, usize::MAX, f64::NAN).into(),
+        };
         Self {
-            distance: distance_matrix(&neighbors, usize::MAX, f64::NAN),
+            distance,
             neighbors,
         }
     }
@@ -378,7 +412,9 @@ impl PyRoutingTarget {
     }
 
     fn distance_matrix<'py>(&self, py: Python<'py>) -> Option<Bound<'py, PyArray2<f64>>> {
-        self.0.as_ref().map(|target| target.distance.to_pyarray(py))
+        self.0
+            .as_ref()
+            .map(|target| target.distance.view().to_pyarray(py))
     }
 }
 
@@ -511,10 +547,28 @@ impl<'a> RoutingState<'a> {
                         let actual = VirtualQubit::new(outer.index() as u32).to_phys(&self.layout);
                         layout.swap_physical(dummy, actual);
                     }
-                    for (sabre, dag) in blocks.iter() {
-                        let block_result = self.route_control_flow_block(&layout, sabre, dag);
-                        self.control_flow.push(block_result);
-                    }
+                    // Sibling blocks are independent routing problems that all start and end in
+                    // the same layout, so they can be routed concurrently.  Each block uses the
+                    // same seed, so the result doesn't depend on the order they finish in.
+                    let problem = self.problem();
+                    let seed = self.seed;
+                    let block_results = CondIterator::new(
+                        &blocks[..],
+                        blocks.len() > 1 && getenv_use_multiple_threads(),
+                    )
+                    .map(|(sabre, dag)| {
+                        route_control_flow_block(
+                            RoutingProblem {
+                                sabre,
+                                dag,
+                                ..problem
+                            },
+                            &layout,
+                            seed,
+                        )
+                    })
+                    .collect::<Vec<_>>();
+                    self.control_flow.extend(block_results);
                     RoutedItemKind::ControlFlow((blocks.len() as u32).into())
                 }
             };
@@ -538,54 +592,6 @@ impl<'a> RoutingState<'a> {
         );
     }
 
-    /// Inner worker to route a control-flow block.  Since control-flow blocks are routed to
-    /// restore the layout at the end of themselves, and the recursive calls spawn their own
-    /// tracking states, this does not affect our own state.
-    fn route_control_flow_block(
-        &self,
-        layout: &'_ NLayout,
-        // The `'a` lifetime is related to `Self = RoutingState<'a>` by the `impl` block, i.e.
-        // `sabre` and `dag` are borrowed from the top-level "owning" `SabreDAG`.
-        sabre: &'a SabreDAG,
-        dag: &'a DAGCircuit,
-    ) -> RoutingResult<'a> {
-        let mut result = swap_map_trial(
-            RoutingProblem {
-                sabre,
-                dag,
-                ..self.problem()
-            },
-            layout,
-            self.seed,
-        );
-        // For now, we always append a swap circuit that gets the inner block back to the
-        // parent's layout.
-        result.final_swaps = token_swapper(
-            &self.target.neighbors,
-            // Map physical location in the final layout from the inner routing to the current
-            // location in the outer routing.
-            result
-                .final_layout
-                .iter_physical()
-                .map(|(p, v)| (p, v.to_phys(layout)))
-                .collect(),
-            Some(SWAP_EPILOGUE_TRIALS),
-            Some(self.seed),
-            None,
-        )
-        .unwrap()
-        .into_iter()
-        .map(|(l, r)| {
-            [
-                PhysicalQubit::new(l.index() as u32),
-                PhysicalQubit::new(r.index() as u32),
-            ]
-        })
-        .collect();
-        result.final_layout = layout.clone();
-        result
-    }
-
     /// Fill the given `extended_set` with the next nodes that would be reachable after the front
     /// layer (and themselves).  This uses `required_predecessors` as scratch space for efficiency,
     /// but returns it to the same state as the input on return.
@@ -772,13 +778,74 @@ impl<'a> RoutingState<'a> {
     }
 }
 
+/// Route a control-flow block, starting from the given layout.
+///
+/// Control-flow blocks are routed to restore the starting layout at the end of themselves, so the
+/// result does not affect the state of the routing of the enclosing circuit, and sibling blocks can
+/// be routed independently of each other.
+fn route_control_flow_block<'a>(
+    problem: RoutingProblem<'a>,
+    layout: &NLayout,
+    seed: u64,
+) -> RoutingResult<'a> {
+    let mut result = swap_map_trial(problem, layout, seed);
+    // For now, we always append a swap circuit that gets the inner block back to the
+    // parent's layout.
+    // Map physical location in the final layout from the inner routing to the current location
+    // in the outer routing.
+    let mapping = result
+        .final_layout
+        .iter_physical()
+        .map(|(p, v)| (p, v.to_phys(layout)))
+        .collect::<Vec<_>>();
+    result.final_swaps = token_swap(
+        &problem.target.neighbors,
+        problem.target.distance.view(),
+        &mapping,
+        SWAP_EPILOGUE_TRIALS,
+        seed,
+        TOKEN_SWAPPER_PARALLEL_THRESHOLD,
+    )
+    .expect("the coupling graph is connected and the layouts are permutations");
+    result.final_layout = layout.clone();
+    result
+}
+
 /// Run Sabre swap on a circuit
 ///
 /// Returns:
-///     A two-tuple of the newly routed :class:`.DAGCircuit`, and the layout that maps virtual
-///     qubits to their assigned physical qubits at the *end* of the circuit execution.
+///     A three-tuple of the newly routed :class:`.DAGCircuit`, the layout that maps virtual qubits
+///     to their assigned physical qubits at the *end* of the circuit execution, and the number of
+///     routing trials that were completed within the ``time_limit`` (in seconds), if any.
 #[pyfunction]
-#[pyo3(signature=(dag, target, heuristic, initial_layout, num_trials, seed=None, run_in_parallel=None))]
+#[pyo3(name = "sabre_routing", signature=(dag, target, heuristic, initial_layout, num_trials, seed=None, run_in_parallel=None, time_limit=None))]
+#[allow(clippy::too_many_arguments)]
+pub fn py_sabre_routing(
+    dag: &DAGCircuit,
+    target: &PyRoutingTarget,
+    heuristic: &Heuristic,
+    initial_layout: &NLayout,
+    num_trials: usize,
+    seed: Option<u64>,
+    run_in_parallel: Option<bool>,
+    time_limit: Option<f64>,
+) -> PyResult<(DAGCircuit, NLayout, usize)> {
+    let budget = TrialBudget::from_seconds(time_limit)?;
+    let (dag, final_layout) = sabre_routing(
+        dag,
+        target,
+        heuristic,
+        initial_layout,
+        num_trials,
+        seed,
+        run_in_parallel,
+        &budget,
+    )?;
+    Ok((dag, final_layout, budget.routing_trials_completed()))
+}
+
+/// Run Sabre swap on a circuit, returning the routed circuit and the final layout.
+#[allow(clippy::too_many_arguments)]
 pub fn sabre_routing(
     dag: &DAGCircuit,
     target: &PyRoutingTarget,
@@ -787,6 +854,7 @@ pub fn sabre_routing(
     num_trials: usize,
     seed: Option<u64>,
     run_in_parallel: Option<bool>,
+    budget: &TrialBudget,
 ) -> PyResult<(DAGCircuit, NLayout)> {
     let Some(target) = target.0.as_ref() else {
         // All-to-all coupling.
@@ -804,18 +872,22 @@ pub fn sabre_routing(
         seed,
         num_trials,
         run_in_parallel,
+        budget,
     );
     result.rebuild().map(|dag| (dag, result.final_layout))
 }
 
 /// Run (potentially in parallel) several trials of the Sabre routing algorithm on the given
 /// problem and return the one with fewest swaps.
+///
+/// Trials after the first are skipped if they have not started when the `budget` expires.
 pub fn swap_map<'a>(
     problem: RoutingProblem<'a>,
     initial_layout: &'_ NLayout,
     seed: Option<u64>,
     num_trials: usize,
     run_in_parallel: Option<bool>,
+    budget: &TrialBudget,
 ) -> RoutingResult<'a> {
     let seeds = match seed {
         Some(seed) => Pcg64Mcg::seed_from_u64(seed),
@@ -830,8 +902,14 @@ pub fn swap_map<'a>(
         num_trials > 1
             && run_in_parallel.unwrap_or_else(|| getenv_use_multiple_threads() && num_trials > 1),
     )
-    .map(|seed| swap_map_trial(problem, initial_layout, seed))
     .enumerate()
+    .filter_map(|(index, seed)| {
+        budget.should_start(index).then(|| {
+            let result = swap_map_trial(problem, initial_layout, seed);
+            budget.record_routing_trial();
+            (index, result)
+        })
+    })
     .min_by_key(|(index, result)| (result.swap_count(), *index))
     .map(|(_, result)| result)
     .expect("must have at least one trial")
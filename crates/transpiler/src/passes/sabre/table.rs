@@ -0,0 +1,224 @@
+// This code is part of Qiskit.
+//
+// (C) Copyright IBM 2025
+//
+// This code is licensed under the Apache License, Version 2.0. You may
+// obtain a copy of this license in the LICENSE.txt file in the root directory
+// of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+//
+// Any modifications or derivative works of this code must retain this
+// copyright notice, and modified files need to carry a notice indicating
+// that they have been altered from the originals.
+
+//! Routing tables that are calculated once and shared between transpiler runs and processes.
+//!
+//! A routing table is the neighbor table and the distance matrix of a coupling graph, written to a
+//! binary file.  The file is laid out so that its distance matrix can be memory-mapped read-only
+//! (by `numpy.memmap` on the Python side) and used in place.  A registered table is used by every
+//! [RoutingTarget](super::route::RoutingTarget) of the same coupling graph in the process, so the
+//! Sabre and lookahead routing and layout passes skip calculating the distance matrix, and all the
+//! processes that map the same file share a single copy of it.
+//!
+//! The file format is little-endian throughout:
+//!
+//! * a 32-byte header: the 8 bytes `QKRTBL01`, then the number of qubits `n`, the number of
+//!   neighbor entries `m`, and a reserved zero, each as a `u64`;
+//! * the distance matrix, as `n * n` row-major `f64` values, with NaN for unreachable pairs;
+//! * the partition of the neighbor table, as `n + 1` `u64` values;
+//! * the neighbor table, as `m` `u32` values.
+
+use std::fs::File;
+use std::io::{BufWriter, Write};
+use std::path::PathBuf;
+use std::sync::{Arc, PoisonError, RwLock};
+
+use numpy::{PyArray2, PyArrayMethods, PyReadonlyArray1, PyUntypedArrayMethods};
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use rustworkx_core::petgraph::prelude::*;
+
+use qiskit_circuit::PhysicalQubit;
+
+use crate::neighbors::Neighbors;
+
+use super::distance::{SharedDistance, distance_matrix};
+
+const MAGIC: &[u8; 8] = b"QKRTBL01";
+
+struct SharedTable {
+    neighbors: Neighbors,
+    distance: Arc<SharedDistance>,
+}
+
+/// The routing tables registered in this process.
+static TABLES: RwLock<Vec<SharedTable>> = RwLock::new(Vec::new());
+
+/// Get the distance matrix of a registered routing table with the given neighbors, if any.
+pub fn lookup(neighbors: &Neighbors) -> Option<Arc<SharedDistance>> {
+    TABLES
+        .read()
+        .unwrap_or_else(PoisonError::into_inner)
+        .iter()
+        .find(|table| table.neighbors == *neighbors)
+        .map(|table| table.distance.clone())
+}
+
+fn neighbors_from_edges(num_qubits: u32, edges: &[[PhysicalQubit; 2]]) -> PyResult<Neighbors> {
+    let mut coupling = Graph::<(), (), Undirected>::with_capacity(num_qubits as usize, edges.len());
+    for _ in 0..num_qubits {
+        coupling.add_node(());
+    }
+    for [a, b] in edges {
+        if a.0 >= num_qubits || b.0 >= num_qubits {
+            return Err(PyValueError::new_err(format!(
+                "edge ({}, {}) is out of range for {num_qubits} qubits",
+                a.0, b.0
+            )));
+        }
+        coupling.update_edge(NodeIndex::new(a.index()), NodeIndex::new(b.index()), ());
+    }
+    Ok(Neighbors::from_coupling(&coupling))
+}
+
+/// Calculate the routing table of a coupling graph and write it to a file.
+///
+/// The file is written to a temporary path beside the target, and then renamed into place, so a
+/// process never maps a partially written table.
+///
+/// Args:
+///     path: the file to write.
+///     num_qubits: the number of qubits in the coupling graph.
+///     edges: the edges of the coupling graph.  Their direction is ignored.
+#[pyfunction]
+pub fn write_routing_table(
+    py: Python,
+    path: PathBuf,
+    num_qubits: u32,
+    edges: Vec<[PhysicalQubit; 2]>,
+) -> PyResult<()> {
+    let neighbors = neighbors_from_edges(num_qubits, &edges)?;
+    py.detach(|| -> std::io::Result<()> {
+        let distance = distance_matrix(&neighbors, 0, f64::NAN);
+        let (neighbors, partition) = neighbors.take();
+        let mut tmp_name = path.file_name().unwrap_or_default().to_owned();
+        tmp_name.push(format!(".{}.tmp", std::process::id()));
+        let tmp_path = path.with_file_name(tmp_name);
+        let mut file = BufWriter::new(File::create(&tmp_path)?);
+        file.write_all(MAGIC)?;
+        for value in [num_qubits as u64, neighbors.len() as u64, 0] {
+            file.write_all(&value.to_le_bytes())?;
+        }
+        for value in distance.iter() {
+            file.write_all(&value.to_le_bytes())?;
+        }
+        for value in partition {
+            file.write_all(&(value as u64).to_le_bytes())?;
+        }
+        for value in neighbors {
+            file.write_all(&value.0.to_le_bytes())?;
+        }
+        file.into_inner()?.sync_all()?;
+        std::fs::rename(&tmp_path, &path)
+    })?;
+    Ok(())
+}
+
+/// Register a routing table, so that routing targets of the same coupling graph use its distance
+/// matrix in place.
+///
+/// Any table already registered for the same coupling graph is replaced.
+///
+/// Args:
+///     distance: the distance matrix.  This must be a read-only, C-contiguous array of
+///         ``float64``, such as a ``numpy.memmap`` of a routing table file.  It is kept alive while
+///         the table is registered.
+///     partition: the partition of the neighbor table.
+///     neighbors: the neighbor table.
+#[pyfunction]
+pub fn register_routing_table(
+    distance: &Bound<PyArray2<f64>>,
+    partition: PyReadonlyArray1<u64>,
+    neighbors: PyReadonlyArray1<u32>,
+) -> PyResult<()> {
+    let neighbors = Neighbors::from_parts(
+        neighbors
+            .as_array()
+            .iter()
+            .copied()
+            .map(PhysicalQubit)
+            .collect(),
+        partition
+            .as_array()
+            .iter()
+            .map(|value| *value as usize)
+            .collect(),
+    )
+    .map_err(|err| PyValueError::new_err(err.to_string()))?;
+    let num_qubits = neighbors.num_qubits();
+    if distance.shape() != [num_qubits, num_qubits] {
+        return Err(PyValueError::new_err(format!(
+            "distance matrix of shape {:?} does not match {num_qubits} qubits",
+            distance.shape()
+        )));
+    }
+    if distance
+        .getattr("flags")?
+        .getattr("writeable")?
+        .extract::<bool>()?
+    {
+        return Err(PyValueError::new_err(
+            "the distance matrix must be read-only",
+        ));
+    }
+    if !distance.is_c_contiguous() {
+        return Err(PyValueError::new_err(
+            "the distance matrix must be C-contiguous",
+        ));
+    }
+    let data = distance.data() as *const f64;
+    if !data.is_aligned() {
+        return Err(PyValueError::new_err("the distance matrix must be aligned"));
+    }
+    // SAFETY: we checked the shape, layout, alignment and that the array is not writeable, and we
+    // hold a reference to the array for as long as the pointer is used.
+    let shared =
+        unsafe { SharedDistance::new(distance.clone().into_any().unbind(), data, num_qubits) };
+    let mut tables = TABLES.write().unwrap_or_else(PoisonError::into_inner);
+    tables.retain(|table| table.neighbors != neighbors);
+    tables.push(SharedTable {
+        neighbors,
+        distance: Arc::new(shared),
+    });
+    Ok(())
+}
+
+/// Remove all the registered routing tables.
+#[pyfunction]
+pub fn clear_routing_tables() {
+    TABLES
+        .write()
+        .unwrap_or_else(PoisonError::into_inner)
+        .clear();
+}
+
+/// Get the distance matrix of the registered routing table of a coupling graph.
+///
+/// Returns:
+///     The read-only distance matrix that was registered, or ``None`` if there is no table for the
+///     coupling graph.
+#[pyfunction]
+pub fn routing_table_distance(
+    py: Python,
+    num_qubits: u32,
+    edges: Vec<[PhysicalQubit; 2]>,
+) -> PyResult<Option<Py<PyAny>>> {
+    if TABLES
+        .read()
+        .unwrap_or_else(PoisonError::into_inner)
+        .is_empty()
+    {
+        return Ok(None);
+    }
+    let neighbors = neighbors_from_edges(num_qubits, &edges)?;
+    Ok(lookup(&neighbors).map(|distance| distance.owner().clone_ref(py)))
+}
@@ -0,0 +1,457 @@
+// This code is part of Qiskit.
+//
+// (C) Copyright IBM 2025
+//
+// This code is licensed under the Apache License, Version 2.0. You may
+// obtain a copy of this license in the LICENSE.txt file in the root directory
+// of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+//
+// Any modifications or derivative works of this code must retain this
+// copyright notice, and modified files need to carry a notice indicating
+// that they have been altered from the originals.
+
+//! An approximate solver for the token-swapping problem.
+//!
+//! This is based on the paper "Approximation and Hardness for Token Swapping" by Miltzow et al.
+//! (2016), arXiv:1602.05150, generalized to partial mappings (graphs with nodes that hold no
+//! token).  Each node may hold a token that must be moved to its destination node by swapping the
+//! tokens of adjacent nodes.  The token of a node "wants" to move to any neighbor that is closer
+//! to its destination, and at each step, for a random node whose token is not home, the solver
+//! looks (in order of preference) for a cycle of wanted moves, which it resolves with one fewer
+//! swap than its length; a path of wanted moves ending at an empty node; or failing those, a
+//! wanted move into a node whose token is already home, which is the only kind of swap that
+//! moves a token away from its destination.
+
+use fixedbitset::FixedBitSet;
+use hashbrown::HashMap;
+use indexmap::IndexSet;
+use ndarray::{Array2, ArrayView2};
+use numpy::{PyArray2, ToPyArray};
+use pyo3::exceptions::PyValueError;
+use pyo3::import_exception;
+use pyo3::prelude::*;
+use rand::prelude::*;
+use rand_pcg::Pcg64Mcg;
+use rayon_cond::CondIterator;
+use rustworkx_core::petgraph::prelude::*;
+use smallvec::SmallVec;
+use thiserror::Error;
+
+use qiskit_circuit::{PhysicalQubit, getenv_use_multiple_threads};
+
+use crate::neighbors::Neighbors;
+use crate::passes::sabre::distance_matrix;
+
+/// The number of nodes in the coupling graph from which the trials for a single mapping are
+/// run in parallel.
+const PARALLEL_THRESHOLD: usize = 50;
+
+#[derive(Error, Debug, Clone, Copy, PartialEq, Eq)]
+pub enum TokenSwapperError {
+    #[error("qubit {0} is not in the coupling graph")]
+    OutOfBounds(u32),
+    #[error("more than one token has destination {0}")]
+    DuplicateDestination(u32),
+    #[error("there is no path from qubit {0} to qubit {1}")]
+    Disconnected(u32, u32),
+    #[error("too many iterations while approximating the token swaps")]
+    TooManyIterations,
+}
+
+// Raised for mappings that can't be implemented on a disconnected graph, for compatibility with
+// the `rustworkx` token swapper this solver replaces.
+import_exception!(rustworkx, InvalidMapping);
+
+impl From<TokenSwapperError> for PyErr {
+    fn from(err: TokenSwapperError) -> PyErr {
+        match err {
+            TokenSwapperError::Disconnected(..) => InvalidMapping::new_err(err.to_string()),
+            _ => PyValueError::new_err(err.to_string()),
+        }
+    }
+}
+
+/// The state of a single trial of the token-swapping algorithm.
+struct Trial<'a> {
+    neighbors: &'a Neighbors,
+    distance: ArrayView2<'a, f64>,
+    /// The destination of the token on each node, if there is one.
+    tokens: Vec<Option<PhysicalQubit>>,
+    /// The neighbors of each node that its token would move closer to its destination on.  These
+    /// are the edges of the directed graph of wanted moves.
+    moves: Vec<SmallVec<[PhysicalQubit; 4]>>,
+    /// The nodes whose tokens are not at their destinations.
+    todo: IndexSet<PhysicalQubit, ::ahash::RandomState>,
+}
+
+/// The swaps that a step of the algorithm makes, found by [Trial::search].
+enum Step {
+    /// Resolve a cycle of wanted moves, given as its nodes in order.
+    Cycle(Vec<PhysicalQubit>),
+    /// Move a token to an adjacent node, which is either empty or has a token that is home.
+    Swap([PhysicalQubit; 2]),
+}
+
+impl<'a> Trial<'a> {
+    fn new(
+        neighbors: &'a Neighbors,
+        distance: ArrayView2<'a, f64>,
+        tokens: Vec<Option<PhysicalQubit>>,
+    ) -> Self {
+        let mut out = Self {
+            neighbors,
+            distance,
+            moves: vec![SmallVec::new(); tokens.len()],
+            tokens,
+            todo: IndexSet::default(),
+        };
+        for node in 0..out.tokens.len() {
+            out.update(PhysicalQubit::new(node as u32));
+        }
+        out
+    }
+
+    /// Recalculate the wanted moves of the token on a node.
+    fn update(&mut self, node: PhysicalQubit) {
+        let moves = &mut self.moves[node.index()];
+        moves.clear();
+        match self.tokens[node.index()] {
+            Some(destination) if destination != node => {
+                let here = self.distance[[node.index(), destination.index()]];
+                moves.extend(self.neighbors[node].iter().copied().filter(|neighbor| {
+                    self.distance[[neighbor.index(), destination.index()]] < here
+                }));
+                self.todo.insert(node);
+            }
+            _ => {
+                self.todo.swap_remove(&node);
+            }
+        }
+    }
+
+    fn swap(&mut self, [left, right]: [PhysicalQubit; 2], swaps: &mut Vec<[PhysicalQubit; 2]>) {
+        self.tokens.swap(left.index(), right.index());
+        self.update(left);
+        self.update(right);
+        swaps.push([left, right]);
+    }
+
+    /// Find a cycle in the graph of wanted moves that is reachable from `source`.
+    fn find_cycle(&self, source: PhysicalQubit) -> Option<Vec<PhysicalQubit>> {
+        let num_nodes = self.tokens.len();
+        let mut finished = FixedBitSet::with_capacity(num_nodes);
+        let mut position = vec![usize::MAX; num_nodes];
+        let mut path = vec![source];
+        let mut next_child = vec![0];
+        position[source.index()] = 0;
+        while let Some(&node) = path.last() {
+            let child = next_child.last_mut().unwrap();
+            let Some(&successor) = self.moves[node.index()].get(*child) else {
+                finished.insert(node.index());
+                position[node.index()] = usize::MAX;
+                path.pop();
+                next_child.pop();
+                continue;
+            };
+            *child += 1;
+            if position[successor.index()] != usize::MAX {
+                return Some(path.split_off(position[successor.index()]));
+            }
+            if !finished.contains(successor.index()) {
+                position[successor.index()] = path.len();
+                path.push(successor);
+                next_child.push(0);
+            }
+        }
+        None
+    }
+
+    /// Choose the swaps for the token on `source`.
+    fn search(&self, source: PhysicalQubit) -> Option<Step> {
+        if let Some(cycle) = self.find_cycle(source) {
+            return Some(Step::Cycle(cycle));
+        }
+        // Without a cycle, search the wanted moves depth-first for an empty node.  The first
+        // move into a node whose token is home is the fallback; one is always reachable, since
+        // the graph of wanted moves is acyclic here, and a token that is not home always has a
+        // wanted move.
+        let mut seen = FixedBitSet::with_capacity(self.tokens.len());
+        let mut unhappy = None;
+        let mut stack = vec![source];
+        seen.insert(source.index());
+        while let Some(node) = stack.pop() {
+            for &successor in self.moves[node.index()].iter().rev() {
+                if seen.put(successor.index()) {
+                    continue;
+                }
+                match self.tokens[successor.index()] {
+                    None => return Some(Step::Swap([node, successor])),
+                    Some(destination) if destination == successor => {
+                        unhappy.get_or_insert([successor, node]);
+                    }
+                    Some(_) => stack.push(successor),
+                }
+            }
+        }
+        unhappy.map(Step::Swap)
+    }
+
+    fn run(mut self, rng: &mut Pcg64Mcg) -> Result<Vec<[PhysicalQubit; 2]>, TokenSwapperError> {
+        let num_nodes = self.tokens.len();
+        let max_steps = 4 * num_nodes * num_nodes;
+        let mut swaps = Vec::new();
+        while !self.todo.is_empty() {
+            if swaps.len() > max_steps {
+                return Err(TokenSwapperError::TooManyIterations);
+            }
+            let source = self.todo[rng.random_range(0..self.todo.len())];
+            match self.search(source) {
+                Some(Step::Cycle(cycle)) => {
+                    // Each token in the cycle wants to move one place forwards.  Swapping the
+                    // pairs from the back of the cycle forwards achieves that, except for the
+                    // pair that closes the cycle, which is swapped implicitly.
+                    let last = cycle.len() - 1;
+                    self.swap([cycle[last], cycle[0]], &mut swaps);
+                    for index in (1..last).rev() {
+                        self.swap([cycle[index], cycle[index + 1]], &mut swaps);
+                    }
+                }
+                Some(Step::Swap(swap)) => self.swap(swap, &mut swaps),
+                None => return Err(TokenSwapperError::TooManyIterations),
+            }
+        }
+        Ok(swaps)
+    }
+}
+
+/// Find an approximately minimal sequence of swaps that moves the token on each node in `mapping`
+/// to its destination.
+///
+/// The nodes that are not the source of any token are treated as empty, so this can route partial
+/// mappings.  `distance` must be the distance matrix of `neighbors`, with unreachable pairs marked
+/// as NaN.  The best of `trials` random trials is returned, and the trials are run on threads if
+/// the graph has at least `parallel_threshold` nodes.
+pub fn token_swap(
+    neighbors: &Neighbors,
+    distance: ArrayView2<f64>,
+    mapping: &[(PhysicalQubit, PhysicalQubit)],
+    trials: usize,
+    seed: u64,
+    parallel_threshold: usize,
+) -> Result<Vec<[PhysicalQubit; 2]>, TokenSwapperError> {
+    let num_nodes = neighbors.num_qubits();
+    let mut tokens = vec![None; num_nodes];
+    let mut destinations = FixedBitSet::with_capacity(num_nodes);
+    for &(source, destination) in mapping {
+        for qubit in [source, destination] {
+            if qubit.index() >= num_nodes {
+                return Err(TokenSwapperError::OutOfBounds(qubit.0));
+            }
+        }
+        if destinations.put(destination.index()) {
+            return Err(TokenSwapperError::DuplicateDestination(destination.0));
+        }
+        if distance[[source.index(), destination.index()]].is_nan() {
+            return Err(TokenSwapperError::Disconnected(source.0, destination.0));
+        }
+        tokens[source.index()] = Some(destination);
+    }
+    if mapping
+        .iter()
+        .all(|(source, destination)| source == destination)
+    {
+        return Ok(Vec::new());
+    }
+    let run_trial = |trial: usize| {
+        let mut rng = Pcg64Mcg::seed_from_u64(seed.wrapping_add(trial as u64));
+        Trial::new(neighbors, distance, tokens.clone()).run(&mut rng)
+    };
+    let parallel = num_nodes >= parallel_threshold && getenv_use_multiple_threads();
+    CondIterator::new(0..trials.max(1), parallel)
+        .map(run_trial)
+        .collect::<Result<Vec<_>, _>>()
+        .map(|results| {
+            results
+                .into_iter()
+                .min_by_key(|swaps| swaps.len())
+                .expect("there is always at least one trial")
+        })
+}
+
+fn to_pairs(swaps: Vec<[PhysicalQubit; 2]>) -> Vec<(u32, u32)> {
+    swaps.into_iter().map(|[a, b]| (a.0, b.0)).collect()
+}
+
+/// A native approximate solver for the token-swapping problem on a fixed coupling graph.
+///
+/// The distance matrix of the graph is calculated once, on construction, and reused by every call
+/// to :meth:`map` and :meth:`map_batch`.
+///
+/// Args:
+///     num_qubits (int): The number of nodes in the coupling graph.
+///     edges (list[tuple[int, int]]): The edges of the coupling graph.  Their direction is
+///         ignored.
+#[pyclass(module = "qiskit._accelerate.token_swapper", frozen)]
+pub struct TokenSwapper {
+    neighbors: Neighbors,
+    distance: Array2<f64>,
+}
+
+impl TokenSwapper {
+    pub fn from_neighbors(neighbors: Neighbors) -> Self {
+        Self {
+            distance: distance_matrix(&neighbors, PARALLEL_THRESHOLD, f64::NAN),
+            neighbors,
+        }
+    }
+
+    fn extract_mapping(
+        mapping: HashMap<PhysicalQubit, PhysicalQubit>,
+        num_qubits: usize,
+    ) -> Result<Vec<(PhysicalQubit, PhysicalQubit)>, TokenSwapperError> {
+        mapping
+            .into_iter()
+            .map(|(source, destination)| {
+                match [source, destination]
+                    .into_iter()
+                    .find(|qubit| qubit.index() >= num_qubits)
+                {
+                    Some(qubit) => Err(TokenSwapperError::OutOfBounds(qubit.0)),
+                    None => Ok((source, destination)),
+                }
+            })
+            .collect()
+    }
+}
+
+#[pymethods]
+impl TokenSwapper {
+    #[new]
+    fn py_new(num_qubits: u32, edges: Vec<(u32, u32)>) -> PyResult<Self> {
+        let mut graph = UnGraph::<(), ()>::with_capacity(num_qubits as usize, edges.len());
+        for _ in 0..num_qubits {
+            graph.add_node(());
+        }
+        for (left, right) in edges {
+            for qubit in [left, right] {
+                if qubit >= num_qubits {
+                    return Err(TokenSwapperError::OutOfBounds(qubit).into());
+                }
+            }
+            if left != right {
+                let [left, right] = [left, right].map(|qubit| NodeIndex::new(qubit as usize));
+                graph.update_edge(left, right, ());
+            }
+        }
+        Ok(Self::from_neighbors(Neighbors::from_coupling(&graph)))
+    }
+
+    /// The number of nodes in the coupling graph.
+    #[getter]
+    fn num_qubits(&self) -> usize {
+        self.neighbors.num_qubits()
+    }
+
+    /// The number of swaps on the shortest path between two nodes, or ``None`` if there is none.
+    fn distance(&self, left: PhysicalQubit, right: PhysicalQubit) -> PyResult<Option<usize>> {
+        let num_qubits = self.neighbors.num_qubits();
+        for qubit in [left, right] {
+            if qubit.index() >= num_qubits {
+                return Err(TokenSwapperError::OutOfBounds(qubit.0).into());
+            }
+        }
+        let distance = self.distance[[left.index(), right.index()]];
+        Ok((!distance.is_nan()).then_some(distance as usize))
+    }
+
+    /// The distance matrix of the coupling graph, with NaN for pairs of nodes with no path.
+    fn distance_matrix<'py>(&self, py: Python<'py>) -> Bound<'py, PyArray2<f64>> {
+        self.distance.to_pyarray(py)
+    }
+
+    /// Find the swaps that move the token on each key of ``mapping`` to its value.
+    ///
+    /// Args:
+    ///     mapping (dict[int, int]): The partial mapping of nodes to the destinations of their
+    ///         tokens.  Nodes that are not keys are empty.
+    ///     trials (int): The number of random trials; the one with the fewest swaps is returned.
+    ///     seed (int): The seed of the random trials.
+    ///     parallel_threshold (int): The number of nodes in the coupling graph from which the
+    ///         trials are run in parallel.
+    ///
+    /// Returns:
+    ///     list[tuple[int, int]]: The swaps, in order.
+    #[pyo3(signature = (mapping, trials=4, seed=None, parallel_threshold=PARALLEL_THRESHOLD))]
+    fn map(
+        &self,
+        py: Python,
+        mapping: HashMap<PhysicalQubit, PhysicalQubit>,
+        trials: usize,
+        seed: Option<u64>,
+        parallel_threshold: usize,
+    ) -> PyResult<Vec<(u32, u32)>> {
+        let seed = seed.unwrap_or_else(|| Pcg64Mcg::from_os_rng().next_u64());
+        let mapping = Self::extract_mapping(mapping, self.neighbors.num_qubits())?;
+        let swaps = py.detach(|| {
+            token_swap(
+                &self.neighbors,
+                self.distance.view(),
+                &mapping,
+                trials,
+                seed,
+                parallel_threshold,
+            )
+        })?;
+        Ok(to_pairs(swaps))
+    }
+
+    /// Find the swaps for each of many mappings on the same coupling graph.
+    ///
+    /// The mappings are routed in parallel.  The result for the mapping at index ``i`` is the same
+    /// as calling :meth:`map` on it with the seed ``seed + i``.
+    ///
+    /// Args:
+    ///     mappings (list[dict[int, int]]): The partial mappings.
+    ///     trials (int): The number of random trials for each mapping.
+    ///     seed (int): The seed of the random trials.
+    ///
+    /// Returns:
+    ///     list[list[tuple[int, int]]]: The swaps for each mapping, in order.
+    #[pyo3(signature = (mappings, trials=4, seed=None))]
+    fn map_batch(
+        &self,
+        py: Python,
+        mappings: Vec<HashMap<PhysicalQubit, PhysicalQubit>>,
+        trials: usize,
+        seed: Option<u64>,
+    ) -> PyResult<Vec<Vec<(u32, u32)>>> {
+        let seed = seed.unwrap_or_else(|| Pcg64Mcg::from_os_rng().next_u64());
+        let num_qubits = self.neighbors.num_qubits();
+        let mappings = mappings
+            .into_iter()
+            .map(|mapping| Self::extract_mapping(mapping, num_qubits))
+            .collect::<Result<Vec<_>, _>>()?;
+        let parallel = getenv_use_multiple_threads() && mappings.len() > 1;
+        let swaps = py.detach(|| {
+            CondIterator::new(mappings, parallel)
+                .enumerate()
+                .map(|(index, mapping)| {
+                    token_swap(
+                        &self.neighbors,
+                        self.distance.view(),
+                        &mapping,
+                        trials,
+                        seed.wrapping_add(index as u64),
+                        usize::MAX,
+                    )
+                })
+                .collect::<Result<Vec<_>, _>>()
+        })?;
+        Ok(swaps.into_iter().map(to_pairs).collect())
+    }
+}
+
+pub fn token_swapper_mod(m: &Bound<PyModule>) -> PyResult<()> {
+    m.add_class::<TokenSwapper>()?;
+    Ok(())
+}
@@ -0,0 +1,299 @@
+// This code is part of Qiskit.
+//
+// (C) Copyright IBM 2025
+//
+// This code is licensed under the Apache License, Version 2.0. You may
+// obtain a copy of this license in the LICENSE.txt file in the root directory
+// of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+//
+// Any modifications or derivative works of this code must retain this
+// copyright notice, and modified files need to carry a notice indicating
+// that they have been altered from the originals.
+
+use std::convert::Infallible;
+use std::error::Error;
+use std::fmt::{Display, Formatter};
+use std::time::{Duration, Instant};
+
+use hashbrown::{HashMap, HashSet};
+use rand::prelude::*;
+use rand_pcg::Pcg64Mcg;
+use rustworkx_core::petgraph::prelude::*;
+
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use pyo3::wrap_pyfunction;
+
+use qiskit_circuit::dag_circuit::DAGCircuit;
+use qiskit_circuit::packed_instruction::PackedInstruction;
+use qiskit_circuit::vf2;
+use qiskit_circuit::{PhysicalQubit, VirtualQubit};
+
+use super::error_map::ErrorMap;
+use super::vf2_layout::{VirtualInteractions, loosen_directionality, neg_log_fidelity};
+
+/// Why the constraint solver stopped.  The strings are the values of the
+/// ``CSPLayout_stop_reason`` property.
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+enum StopReason {
+    SolutionFound,
+    NonexistentSolution,
+    CallLimitReached,
+    TimeLimitReached,
+}
+
+impl StopReason {
+    fn as_str(&self) -> &'static str {
+        match self {
+            Self::SolutionFound => "solution found",
+            Self::NonexistentSolution => "nonexistent solution",
+            Self::CallLimitReached => "call limit reached",
+            Self::TimeLimitReached => "time limit reached",
+        }
+    }
+}
+
+/// The error used to abort the VF2 search from inside the node matcher once the deadline passes.
+#[derive(Debug)]
+struct TimeLimitReached;
+impl Display for TimeLimitReached {
+    fn fmt(&self, f: &mut Formatter<'_>) -> std::fmt::Result {
+        write!(f, "time limit reached")
+    }
+}
+impl Error for TimeLimitReached {}
+
+/// A virtual qubit in the interaction graph.
+#[derive(Clone, Copy, Debug)]
+struct Variable {
+    /// How many operations act on the qubit alone.
+    count: usize,
+    /// The physical qubit the virtual qubit is constrained to, if any.
+    fixed: Option<PhysicalQubit>,
+}
+
+/// A physical qubit in the coupling graph.
+#[derive(Clone, Copy, Debug)]
+struct Site {
+    qubit: PhysicalQubit,
+    /// The negative log fidelity of single-qubit operations on the qubit.
+    cost: f64,
+    /// Whether a fixed virtual qubit is constrained to this qubit, so no other may take it.
+    reserved: bool,
+}
+
+/// Find a layout that satisfies every two-qubit interaction of a circuit as a constraint
+/// satisfaction problem, using the VF2 subgraph-isomorphism search as the backtracking solver.
+///
+/// Each virtual qubit is a variable whose domain is the physical qubits, all the variables must
+/// take different values, and each pair of qubits that a two-qubit operation acts on must be
+/// mapped to an edge of the coupling graph (in the same direction, if ``strict_direction`` is
+/// set).  Operations on more than two qubits are not constraints, and are ignored.  Virtual qubits
+/// in ``fixed`` are constrained to the given physical qubit.
+///
+/// Without an error map the first solution is returned.  With one, the search continues for up to
+/// ``max_trials`` solutions (or without limit, if this is 0), and each partial assignment is
+/// pruned as soon as its error is no better than the best solution so far.  The search stops as
+/// soon as it has made ``call_limit`` extensions of the partial assignment, or ``time_limit``
+/// seconds have passed, whichever comes first.
+///
+/// Returns:
+///     The layout as a mapping of virtual to physical qubit indices, or ``None`` if none was
+///     found, and the reason the search stopped.
+#[allow(clippy::too_many_arguments)]
+#[pyfunction]
+#[pyo3(signature = (dag, num_physical_qubits, edges, strict_direction=false, fixed=None, call_limit=None, time_limit=None, max_trials=None, avg_error_map=None, shuffle_seed=None))]
+pub fn csp_layout_pass(
+    dag: &DAGCircuit,
+    num_physical_qubits: usize,
+    edges: Vec<[PhysicalQubit; 2]>,
+    strict_direction: bool,
+    fixed: Option<HashMap<VirtualQubit, PhysicalQubit>>,
+    call_limit: Option<usize>,
+    time_limit: Option<f64>,
+    max_trials: Option<usize>,
+    avg_error_map: Option<ErrorMap>,
+    shuffle_seed: Option<u64>,
+) -> PyResult<(Option<HashMap<VirtualQubit, PhysicalQubit>>, &'static str)> {
+    let deadline = time_limit
+        .map(|seconds| {
+            Duration::try_from_secs_f64(seconds).map_err(|_| {
+                PyValueError::new_err(format!(
+                    "time limit must be a non-negative number of seconds, not {seconds}"
+                ))
+            })
+        })
+        .transpose()?
+        .and_then(|limit| Instant::now().checked_add(limit));
+    let fixed = fixed.unwrap_or_default();
+    let mut reserved = HashSet::with_capacity(fixed.len());
+    for (virt, phys) in fixed.iter() {
+        if virt.index() >= dag.num_qubits() || phys.index() >= num_physical_qubits {
+            return Err(PyValueError::new_err(format!(
+                "fixed assignment {} -> {} is out of range",
+                virt.index(),
+                phys.index()
+            )));
+        }
+        if !reserved.insert(*phys) {
+            return Err(PyValueError::new_err(format!(
+                "more than one virtual qubit is fixed to physical qubit {}",
+                phys.index()
+            )));
+        }
+    }
+    if dag.num_qubits() > num_physical_qubits {
+        return Ok((None, StopReason::NonexistentSolution.as_str()));
+    }
+
+    let add_interaction = |count: &mut usize, _: &PackedInstruction, repeats: usize| {
+        *count += repeats;
+    };
+    let interactions =
+        VirtualInteractions::<usize>::from_dag_ignoring_multi_q(dag, add_interaction)?;
+    let variables = interactions.graph.map(
+        |index, count| Variable {
+            count: *count,
+            fixed: fixed.get(&interactions.nodes[index.index()]).copied(),
+        },
+        |_, count| *count,
+    );
+
+    let error = |qargs: [PhysicalQubit; 2]| -> f64 {
+        avg_error_map
+            .as_ref()
+            .and_then(|errors| errors.error_map.get(&qargs))
+            .copied()
+            .map(neg_log_fidelity)
+            .unwrap_or(0.0)
+    };
+    // The node order of the coupling graph sets the order that the domain is searched in, so the
+    // seed shuffles the physical qubits before the graph is built.
+    let mut domain = (0..num_physical_qubits as u32)
+        .map(PhysicalQubit::new)
+        .collect::<Vec<_>>();
+    if let Some(seed) = shuffle_seed {
+        domain.shuffle(&mut Pcg64Mcg::seed_from_u64(seed));
+    }
+    let mut node_of = vec![NodeIndex::end(); num_physical_qubits];
+    let mut coupling = Graph::<Site, f64>::with_capacity(num_physical_qubits, edges.len());
+    for qubit in domain.iter() {
+        node_of[qubit.index()] = coupling.add_node(Site {
+            qubit: *qubit,
+            cost: error([*qubit, *qubit]),
+            reserved: reserved.contains(qubit),
+        });
+    }
+    for [left, right] in edges {
+        if left.index() >= num_physical_qubits || right.index() >= num_physical_qubits {
+            return Err(PyValueError::new_err(format!(
+                "edge ({}, {}) is out of range",
+                left.index(),
+                right.index()
+            )));
+        }
+        coupling.update_edge(
+            node_of[left.index()],
+            node_of[right.index()],
+            error([left, right]),
+        );
+    }
+    if !strict_direction {
+        loosen_directionality(&mut coupling);
+    }
+
+    // The deadline is checked every time a candidate pair is considered, so the search stops
+    // within a single step of it passing.
+    let match_node = |var: &Variable, site: &Site| -> Result<Option<f64>, TimeLimitReached> {
+        if deadline.is_some_and(|deadline| Instant::now() >= deadline) {
+            return Err(TimeLimitReached);
+        }
+        let allowed = match var.fixed {
+            Some(qubit) => qubit == site.qubit,
+            None => !site.reserved,
+        };
+        Ok(allowed.then(|| var.count as f64 * site.cost))
+    };
+    let score_edge =
+        |count: &usize, cost: &f64| -> Result<f64, Infallible> { Ok(*count as f64 * *cost) };
+    let max_trials = match (&avg_error_map, max_trials) {
+        (None, _) => 1,
+        (Some(_), Some(max_trials)) => max_trials,
+        (Some(_), None) => 15 + variables.edge_count().max(coupling.edge_count()),
+    };
+    let search = vf2::Vf2::new(&variables, &coupling, vf2::Problem::Subgraph)
+        .with_semantics(match_node, vf2::Scorer(score_edge))
+        .with_call_limit(call_limit);
+    let search = if avg_error_map.is_some() {
+        search.with_restriction(vf2::Restriction::Decreasing(None))
+    } else {
+        search
+    };
+    let mut search = search.with_vf2pp_ordering().into_iter();
+    let mut best = None;
+    let mut timed_out = false;
+    let mut trials: usize = 0;
+    while max_trials == 0 || trials < max_trials {
+        match search.next() {
+            Some(Ok((mapping, _score))) => {
+                best = Some(mapping);
+                trials += 1;
+            }
+            Some(Err(vf2::IsIsomorphicError::NodeMatcher(TimeLimitReached))) => {
+                timed_out = true;
+                break;
+            }
+            Some(Err(vf2::IsIsomorphicError::EdgeMatcher(never))) => match never {},
+            None => break,
+        }
+    }
+    let Some(mapping) = best else {
+        let reason = if timed_out {
+            StopReason::TimeLimitReached
+        } else if search.call_limit_reached() {
+            StopReason::CallLimitReached
+        } else {
+            StopReason::NonexistentSolution
+        };
+        return Ok((None, reason.as_str()));
+    };
+
+    let mut layout = mapping
+        .iter()
+        .map(|(var, site)| (interactions.nodes[var.index()], coupling[*site].qubit))
+        .collect::<HashMap<_, _>>();
+    // The qubits without two-qubit interactions are unconstrained, except for being fixed.  The
+    // most used get first pick of the free physical qubits with the lowest error.
+    let used = layout
+        .values()
+        .chain(reserved.iter())
+        .copied()
+        .collect::<HashSet<_>>();
+    let mut free = coupling
+        .node_weights()
+        .filter(|site| !used.contains(&site.qubit))
+        .collect::<Vec<_>>();
+    free.sort_by(|a, b| a.cost.total_cmp(&b.cost));
+    let mut free = free.into_iter().map(|site| site.qubit);
+    let mut uncoupled = interactions.uncoupled.into_iter().collect::<Vec<_>>();
+    uncoupled.sort_by_key(|(_, count)| std::cmp::Reverse(*count));
+    for virt in uncoupled
+        .into_iter()
+        .map(|(virt, _)| virt)
+        .chain(interactions.idle)
+    {
+        let phys = match fixed.get(&virt) {
+            Some(phys) => *phys,
+            None => free
+                .next()
+                .expect("there are at least as many physical qubits as virtual"),
+        };
+        layout.insert(virt, phys);
+    }
+    Ok((Some(layout), StopReason::SolutionFound.as_str()))
+}
+
+pub fn csp_layout_mod(m: &Bound<PyModule>) -> PyResult<()> {
+    m.add_wrapped(wrap_pyfunction!(csp_layout_pass))?;
+    Ok(())
+}
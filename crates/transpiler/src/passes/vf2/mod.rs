@@ -10,8 +10,10 @@
 // copyright notice, and modified files need to carry a notice indicating
 // that they have been altered from the originals.
 
+mod csp_layout;
 mod error_map;
 mod vf2_layout;
 
+pub use csp_layout::{csp_layout_mod, csp_layout_pass};
 pub use error_map::{ErrorMap, error_map_mod};
 pub use vf2_layout::{score_layout, vf2_layout_mod, vf2_layout_pass};
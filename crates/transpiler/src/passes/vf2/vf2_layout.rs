@@ -11,6 +11,10 @@
 // that they have been altered from the originals.
 
 use std::convert::Infallible;
+use std::fs::{self, File, OpenOptions};
+use std::io::{ErrorKind, Read, Seek, SeekFrom, Write};
+use std::path::{Path, PathBuf};
+use std::sync::Mutex;
 use std::time::Instant;
 
 use hashbrown::HashMap;
@@ -20,8 +24,9 @@ use rand::prelude::*;
 use rand_pcg::Pcg64Mcg;
 use rayon::prelude::*;
 use rustworkx_core::petgraph::prelude::*;
+use sha2::{Digest, Sha256};
 
-use pyo3::exceptions::PyTypeError;
+use pyo3::exceptions::{PyTypeError, PyValueError};
 use pyo3::prelude::*;
 use pyo3::types::PyTuple;
 use pyo3::{create_exception, wrap_pyfunction};
@@ -144,24 +149,40 @@ fn build_average_error_map(target: &Target) -> Option<ErrorMap> {
 
 /// A full set of a virtual interaction graph, and any loose 1q qubits.
 #[derive(Default, Debug, Clone)]
-struct VirtualInteractions<T> {
+pub(super) struct VirtualInteractions<T> {
     /// The graph of actual interactions.  Nodes each correspond to 1q operations on a single
     /// virtual qubit (the mapping `nodes` stores _which_ qubits), and edges between virtual qubits
     /// correspond to 2q operations.  Edges are always directed, even for when `strict_direction` is
     /// unset; we handle the fuzzy directional matching by setting the edge weights of the coupling
     /// graph appropriately.
-    graph: Graph<T, T>,
+    pub(super) graph: Graph<T, T>,
     /// Map of node index to the qubit it represents.  We could store this on the nodes themselves,
     /// but then all the scorers would need different weight types between the nodes and the edges.
-    nodes: IndexSet<VirtualQubit>,
+    pub(super) nodes: IndexSet<VirtualQubit>,
     /// The qubits that have only single-qubit operations on them, mapped to the interaction summary
     /// associated with them.  We iterate through this at the end, so need a consistent order.
-    uncoupled: IndexMap<VirtualQubit, T>,
+    pub(super) uncoupled: IndexMap<VirtualQubit, T>,
     /// The qubits that have no operations on them at all.
-    idle: IndexSet<VirtualQubit>,
+    pub(super) idle: IndexSet<VirtualQubit>,
 }
 impl<T: Default> VirtualInteractions<T> {
-    fn from_dag<W>(dag: &DAGCircuit, weighter: W) -> PyResult<Self>
+    pub(super) fn from_dag<W>(dag: &DAGCircuit, weighter: W) -> PyResult<Self>
+    where
+        W: Fn(&mut T, &PackedInstruction, usize),
+    {
+        Self::from_dag_inner(dag, weighter, false)
+    }
+
+    /// Like [Self::from_dag], but operations on more than two qubits are left out of the
+    /// interactions, rather than raising [MultiQEncountered].
+    pub(super) fn from_dag_ignoring_multi_q<W>(dag: &DAGCircuit, weighter: W) -> PyResult<Self>
+    where
+        W: Fn(&mut T, &PackedInstruction, usize),
+    {
+        Self::from_dag_inner(dag, weighter, true)
+    }
+
+    fn from_dag_inner<W>(dag: &DAGCircuit, weighter: W, ignore_multi_q: bool) -> PyResult<Self>
     where
         W: Fn(&mut T, &PackedInstruction, usize),
     {
@@ -169,7 +190,7 @@ impl<T: Default> VirtualInteractions<T> {
             .map(|q| VirtualQubit(q as u32))
             .collect::<Vec<_>>();
         let mut out = Self::default();
-        out.add_interactions_from(dag, &id_qubit_map, 1, &weighter)?;
+        out.add_interactions_from(dag, &id_qubit_map, 1, &weighter, ignore_multi_q)?;
         out.idle.extend(
             (0..dag.num_qubits() as u32)
                 .map(VirtualQubit)
@@ -184,6 +205,7 @@ impl<T: Default> VirtualInteractions<T> {
         wire_map: &[VirtualQubit],
         repeats: usize,
         weighter: &W,
+        ignore_multi_q: bool,
     ) -> PyResult<()>
     where
         W: Fn(&mut T, &PackedInstruction, usize),
@@ -213,6 +235,7 @@ impl<T: Default> VirtualInteractions<T> {
                             &wire_map,
                             repeats,
                             weighter,
+                            ignore_multi_q,
                         )?;
                     }
                     Ok(())
@@ -251,6 +274,7 @@ impl<T: Default> VirtualInteractions<T> {
                         self.graph.add_edge(node0, node1, weight);
                     }
                 }
+                _ if ignore_multi_q => (),
                 _ => return Err(MultiQEncountered::new_err("")),
             }
         }
@@ -267,16 +291,19 @@ impl<T: Default> VirtualInteractions<T> {
     }
 }
 
+/// The negative log fidelity of an operation with a given error rate, which is additive over
+/// operations.  Unknown (NaN) errors are treated as perfect.
+pub(super) fn neg_log_fidelity(error: f64) -> f64 {
+    if error.is_nan() || error <= 0. {
+        0.0
+    } else if error >= 1. {
+        f64::INFINITY
+    } else {
+        -((-error).ln_1p())
+    }
+}
+
 fn build_coupling_map(target: &Target, errors: &ErrorMap) -> Option<Graph<f64, f64>> {
-    let neg_log_fidelity = |error: f64| {
-        if error.is_nan() || error <= 0. {
-            0.0
-        } else if error >= 1. {
-            f64::INFINITY
-        } else {
-            -((-error).ln_1p())
-        }
-    };
     let num_qubits = target.num_qubits.unwrap_or_default() as usize;
     if target.num_qargs() == 0 {
         return None;
@@ -307,7 +334,7 @@ fn build_coupling_map(target: &Target, errors: &ErrorMap) -> Option<Graph<f64, f
 }
 
 /// If an edge does not have a parallel but reversed counterpart, add one with the same weight.
-fn loosen_directionality<S, T: Clone>(graph: &mut Graph<S, T>) {
+pub(super) fn loosen_directionality<S, T: Clone>(graph: &mut Graph<S, T>) {
     graph
         .edge_references()
         .filter(|edge| graph.find_edge(edge.target(), edge.source()).is_none())
@@ -364,9 +391,452 @@ fn map_free_qubits(
     Some(partial_layout)
 }
 
+/// A cached result of [vf2_layout_pass], as pairs of virtual and physical qubit indices.
+type CachedLayout = Option<Vec<[u32; 2]>>;
+
+/// The first bytes of a cache file.
+const CACHE_MAGIC: &[u8; 8] = b"QKVF2LC\0";
+
+/// The version of the cache file format, which follows the magic bytes.  This covers the layout of
+/// the records and the derivation of the keys and checksums, and must be changed with either.  The
+/// crate version follows the generation of the file, so that layouts found by one release of the
+/// search are not reused by another.
+const CACHE_FORMAT_VERSION: u32 = 2;
+
+/// The largest valid payload of a record, which bounds what a corrupt length prefix can claim.
+const MAX_RECORD_PAYLOAD: usize = 20 + 8 * (1 << 24);
+
+/// A size-bounded cache of the results of VF2 layout searches.
+///
+/// The key of an entry is a hash of the canonical form of the circuit's interaction graph (the
+/// sorted lists of its weighted edges and its qubits), the coupling graph of the target with the
+/// error rates of its qubits and edges, and the arguments of the search that affect its result.
+/// A search whose key is found in the cache is skipped entirely.  When the cache is full, the
+/// least-recently used entry is dropped.
+///
+/// If a ``path`` is given, entries are also appended to that file and read back from it, so a
+/// cache can be shared between processes (including the workers of a parallel :func:`.transpile`
+/// call, which receive a copy of the cache object).  The file is compacted once it holds twice
+/// as many records as the cache can.  The file is a best-effort store; if it cannot be written
+/// after creation, or it was written by a different version of Qiskit, it is ignored.
+///
+/// Results of searches that were cut short by a time limit are not cached, since they depend on the
+/// speed of the machine, and a later search might find a better layout or succeed where this one
+/// failed.
+///
+/// Args:
+///     max_size (int): The maximum number of entries to keep.
+///     path (str | os.PathLike | None): A file to share the entries through.
+#[pyclass(module = "qiskit._accelerate.vf2_layout", name = "VF2LayoutCache")]
+pub struct Vf2LayoutCache {
+    max_size: usize,
+    path: Option<PathBuf>,
+    inner: Mutex<CacheInner>,
+}
+
+#[derive(Default)]
+struct CacheInner {
+    /// The entries, from least to most recently used.
+    entries: IndexMap<u128, CachedLayout, ::ahash::RandomState>,
+    /// The generation of the backing file that `offset` and `records` refer to.  Every rewrite of
+    /// the file starts a new generation.
+    generation: Option<u64>,
+    /// How far into the backing file has been read.
+    offset: u64,
+    /// The number of records in the backing file up to `offset`, including corrupt ones.
+    records: usize,
+    hits: usize,
+    misses: usize,
+}
+
+impl CacheInner {
+    fn insert(&mut self, key: u128, value: CachedLayout, max_size: usize) {
+        self.entries.shift_remove(&key);
+        self.entries.insert(key, value);
+        while self.entries.len() > max_size {
+            self.entries.shift_remove_index(0);
+        }
+    }
+}
+
+/// The header of a cache file: the magic bytes, the format version, the generation of the file and
+/// the crate version.
+fn cache_header(generation: u64) -> Vec<u8> {
+    let version = env!("CARGO_PKG_VERSION").as_bytes();
+    let mut header = Vec::with_capacity(CACHE_MAGIC.len() + 16 + version.len());
+    header.extend_from_slice(CACHE_MAGIC);
+    header.extend_from_slice(&CACHE_FORMAT_VERSION.to_le_bytes());
+    header.extend_from_slice(&generation.to_le_bytes());
+    header.extend_from_slice(&(version.len() as u32).to_le_bytes());
+    header.extend_from_slice(version);
+    header
+}
+
+/// Get the generation of a cache file from its header, if the header is of this format and crate
+/// version.
+fn header_generation(header: &[u8]) -> Option<u64> {
+    let expected = cache_header(0);
+    let generation_at = CACHE_MAGIC.len() + 4;
+    let version_at = generation_at + 8;
+    (header.len() == expected.len()
+        && header[..generation_at] == expected[..generation_at]
+        && header[version_at..] == expected[version_at..])
+        .then(|| u64::from_le_bytes(header[generation_at..version_at].try_into().unwrap()))
+}
+
+/// A random generation for a new or rewritten cache file.
+fn new_generation() -> u64 {
+    Pcg64Mcg::from_os_rng().next_u64()
+}
+
+fn checksum(payload: &[u8]) -> u64 {
+    u64::from_le_bytes(Sha256::digest(payload)[..8].try_into().unwrap())
+}
+
+/// Serialize one entry as a record of the cache file: the payload length, the payload (key and
+/// layout), and a checksum of the payload, so that torn or stale reads are detected.
+fn encode_record(key: u128, value: &CachedLayout) -> Vec<u8> {
+    let mut payload = Vec::with_capacity(20 + 8 * value.as_ref().map_or(0, Vec::len));
+    payload.extend_from_slice(&key.to_le_bytes());
+    match value {
+        Some(pairs) => {
+            payload.extend_from_slice(&(pairs.len() as u32).to_le_bytes());
+            for [virt, phys] in pairs {
+                payload.extend_from_slice(&virt.to_le_bytes());
+                payload.extend_from_slice(&phys.to_le_bytes());
+            }
+        }
+        None => payload.extend_from_slice(&u32::MAX.to_le_bytes()),
+    }
+    let mut record = Vec::with_capacity(payload.len() + 12);
+    record.extend_from_slice(&(payload.len() as u32).to_le_bytes());
+    record.extend_from_slice(&payload);
+    record.extend_from_slice(&checksum(&payload).to_le_bytes());
+    record
+}
+
+/// A record read from a cache file by [decode_record].
+enum Record {
+    /// A valid entry, and the length of its record.
+    Entry((u128, CachedLayout), usize),
+    /// A record of the given length whose payload is corrupt.
+    Corrupt(usize),
+    /// A record whose length prefix is invalid, so the records after it cannot be found.
+    Invalid,
+}
+
+/// Parse one record from the start of `bytes`.  Returns `None` if the record is incomplete.
+fn decode_record(bytes: &[u8]) -> Option<Record> {
+    let read_u32 = |at: usize| u32::from_le_bytes(bytes[at..at + 4].try_into().unwrap());
+    if bytes.len() < 4 {
+        return None;
+    }
+    let len = read_u32(0) as usize;
+    if !(20..=MAX_RECORD_PAYLOAD).contains(&len) {
+        return Some(Record::Invalid);
+    }
+    if bytes.len() < 12 + len {
+        return None;
+    }
+    let payload = &bytes[4..4 + len];
+    let stored = u64::from_le_bytes(bytes[4 + len..12 + len].try_into().unwrap());
+    if stored != checksum(payload) {
+        return Some(Record::Corrupt(12 + len));
+    }
+    let key = u128::from_le_bytes(payload[..16].try_into().unwrap());
+    let count = read_u32(4 + 16);
+    let value = if count == u32::MAX {
+        None
+    } else {
+        if len != 20 + 8 * count as usize {
+            return Some(Record::Corrupt(12 + len));
+        }
+        Some(
+            (0..count as usize)
+                .map(|i| [read_u32(24 + 8 * i), read_u32(28 + 8 * i)])
+                .collect(),
+        )
+    };
+    Some(Record::Entry((key, value), 12 + len))
+}
+
+impl Vf2LayoutCache {
+    /// Look up an entry, reading any new records from the backing file on a miss.
+    fn get(&self, key: u128) -> Option<CachedLayout> {
+        let mut inner = self.inner.lock().unwrap();
+        if inner.entries.get_index_of(&key).is_none() {
+            self.sync(&mut inner);
+        }
+        match inner.entries.get_index_of(&key) {
+            Some(index) => {
+                let last = inner.entries.len() - 1;
+                inner.entries.move_index(index, last);
+                inner.hits += 1;
+                Some(inner.entries[last].clone())
+            }
+            None => {
+                inner.misses += 1;
+                None
+            }
+        }
+    }
+
+    fn insert(&self, key: u128, value: CachedLayout) {
+        let mut inner = self.inner.lock().unwrap();
+        inner.insert(key, value.clone(), self.max_size);
+        let Some(path) = self.path.as_ref() else {
+            return;
+        };
+        let record = encode_record(key, &value);
+        let appended = OpenOptions::new()
+            .append(true)
+            .open(path)
+            .and_then(|mut file| {
+                // An empty file has not had its header written yet by the process that created it.
+                if file.metadata()?.len() == 0 {
+                    return Ok(None);
+                }
+                file.write_all(&record)?;
+                file.stream_position().map(Some)
+            });
+        let Ok(Some(end)) = appended else {
+            return;
+        };
+        // If no other process appended to the file since it was last read, the new record
+        // directly follows what has been read, and needn't be read back.  Otherwise, it is read
+        // and counted along with the other new records by the next sync.
+        if end == inner.offset + record.len() as u64 {
+            inner.offset = end;
+            inner.records += 1;
+        }
+        if inner.records > 2 * self.max_size {
+            // Take in the records of other processes first, so that the new file keeps them.
+            self.sync(&mut inner);
+            self.compact(&mut inner, path);
+        }
+    }
+
+    /// Read the records that other processes (or earlier instances) have added to the file since
+    /// it was last read.
+    fn sync(&self, inner: &mut CacheInner) {
+        let Some(path) = self.path.as_ref() else {
+            return;
+        };
+        let Ok(mut file) = File::open(path) else {
+            return;
+        };
+        let mut header = cache_header(0);
+        if file.read_exact(&mut header).is_err() {
+            return;
+        }
+        let Some(generation) = header_generation(&header) else {
+            return;
+        };
+        // A different generation means that the file was rewritten by another process, so it is
+        // read again from the start.
+        if inner.generation != Some(generation) {
+            inner.generation = Some(generation);
+            inner.offset = header.len() as u64;
+            inner.records = 0;
+        }
+        let mut bytes = Vec::new();
+        if file.seek(SeekFrom::Start(inner.offset)).is_err()
+            || file.read_to_end(&mut bytes).is_err()
+        {
+            return;
+        }
+        let mut at = 0;
+        while let Some(record) = decode_record(&bytes[at..]) {
+            match record {
+                Record::Entry((key, value), len) => {
+                    if !inner.entries.contains_key(&key) {
+                        inner.insert(key, value, self.max_size);
+                    }
+                    inner.records += 1;
+                    at += len;
+                }
+                // A corrupt record is skipped, but still counts towards the next compaction.
+                Record::Corrupt(len) => {
+                    inner.records += 1;
+                    at += len;
+                }
+                Record::Invalid => {
+                    // The rest of the file can't be read, so replace it with the entries so far.
+                    inner.offset += at as u64;
+                    self.compact(inner, path);
+                    return;
+                }
+            }
+        }
+        inner.offset += at as u64;
+    }
+
+    /// Rewrite the backing file with only the current entries, as a new generation.  The new file
+    /// is moved into place atomically, so concurrent readers see either the old or the new file.
+    fn compact(&self, inner: &mut CacheInner, path: &Path) {
+        let generation = new_generation();
+        let mut contents = cache_header(generation);
+        for (key, value) in inner.entries.iter() {
+            contents.extend(encode_record(*key, value));
+        }
+        let mut temporary = path.as_os_str().to_owned();
+        temporary.push(format!(".{}.tmp", std::process::id()));
+        if fs::write(&temporary, &contents).is_ok() && fs::rename(&temporary, path).is_ok() {
+            inner.generation = Some(generation);
+            inner.offset = contents.len() as u64;
+            inner.records = inner.entries.len();
+        } else {
+            let _ = fs::remove_file(&temporary);
+        }
+    }
+}
+
+#[pymethods]
+impl Vf2LayoutCache {
+    #[new]
+    #[pyo3(signature = (max_size=1024, path=None))]
+    fn new(max_size: usize, path: Option<PathBuf>) -> PyResult<Self> {
+        if max_size == 0 {
+            return Err(PyValueError::new_err("the cache size must be positive"));
+        }
+        if let Some(path) = path.as_ref() {
+            // Only the process that creates the file writes its header.
+            match OpenOptions::new().write(true).create_new(true).open(path) {
+                Ok(mut file) => file.write_all(&cache_header(new_generation()))?,
+                Err(err) if err.kind() == ErrorKind::AlreadyExists => (),
+                Err(err) => return Err(err.into()),
+            }
+        }
+        let out = Self {
+            max_size,
+            path,
+            inner: Mutex::new(CacheInner::default()),
+        };
+        out.sync(&mut out.inner.lock().unwrap());
+        Ok(out)
+    }
+
+    fn __getnewargs__(&self) -> (usize, Option<PathBuf>) {
+        (self.max_size, self.path.clone())
+    }
+
+    fn __len__(&self) -> usize {
+        self.inner.lock().unwrap().entries.len()
+    }
+
+    /// The maximum number of entries in the cache.
+    #[getter]
+    fn max_size(&self) -> usize {
+        self.max_size
+    }
+
+    /// The file the cache is shared through, if any.
+    #[getter]
+    fn path(&self) -> Option<PathBuf> {
+        self.path.clone()
+    }
+
+    /// The number of searches that were skipped because their result was in the cache.
+    #[getter]
+    fn hits(&self) -> usize {
+        self.inner.lock().unwrap().hits
+    }
+
+    /// The number of searches whose result was not in the cache.
+    #[getter]
+    fn misses(&self) -> usize {
+        self.inner.lock().unwrap().misses
+    }
+
+    /// Remove every entry from the cache, and empty its file.
+    fn clear(&self) -> PyResult<()> {
+        let mut inner = self.inner.lock().unwrap();
+        inner.entries.clear();
+        if let Some(path) = self.path.as_ref() {
+            let generation = new_generation();
+            let header = cache_header(generation);
+            fs::write(path, &header)?;
+            inner.generation = Some(generation);
+            inner.offset = header.len() as u64;
+            inner.records = 0;
+        }
+        Ok(())
+    }
+}
+
+/// Hash the canonical form of a VF2 layout problem to a cache key.
+///
+/// The interaction graph's node indices depend on the order the circuit visits its qubits, so it
+/// is described by sorted lists of its weighted edges and qubits, all in terms of the virtual
+/// qubits.  The node indices of the coupling graph are already the physical qubits.
+fn cache_key(
+    interactions: &VirtualInteractions<usize>,
+    coupling_graph: &Graph<f64, f64>,
+    arguments: [u64; 4],
+) -> u128 {
+    let virt = |index: NodeIndex| interactions.nodes[index.index()].0 as u64;
+    let mut words = Vec::new();
+    let push_sorted = |words: &mut Vec<u64>, mut items: Vec<[u64; 3]>| {
+        items.sort_unstable();
+        words.push(items.len() as u64);
+        words.extend(items.into_iter().flatten());
+    };
+    push_sorted(
+        &mut words,
+        interactions
+            .graph
+            .node_indices()
+            .map(|node| [virt(node), virt(node), interactions.graph[node] as u64])
+            .chain(interactions.graph.edge_references().map(|edge| {
+                [
+                    virt(edge.source()),
+                    virt(edge.target()),
+                    *edge.weight() as u64,
+                ]
+            }))
+            .collect(),
+    );
+    push_sorted(
+        &mut words,
+        interactions
+            .uncoupled
+            .iter()
+            .map(|(qubit, count)| [qubit.0 as u64, qubit.0 as u64, *count as u64])
+            .chain(
+                interactions
+                    .idle
+                    .iter()
+                    .map(|qubit| [qubit.0 as u64, u64::MAX, 0]),
+            )
+            .collect(),
+    );
+    words.push(coupling_graph.node_count() as u64);
+    words.extend(coupling_graph.node_weights().map(|weight| weight.to_bits()));
+    push_sorted(
+        &mut words,
+        coupling_graph
+            .edge_references()
+            .map(|edge| {
+                [
+                    edge.source().index() as u64,
+                    edge.target().index() as u64,
+                    edge.weight().to_bits(),
+                ]
+            })
+            .collect(),
+    );
+    words.extend(arguments);
+    // The keys are stored in cache files, so they must be stable across builds and platforms.
+    let mut hasher = Sha256::new();
+    for word in words {
+        hasher.update(word.to_le_bytes());
+    }
+    u128::from_le_bytes(hasher.finalize()[..16].try_into().unwrap())
+}
+
 #[allow(clippy::too_many_arguments)]
 #[pyfunction]
-#[pyo3(signature = (dag, target, strict_direction=false, call_limit=None, time_limit=None, max_trials=None, avg_error_map=None, shuffle_seed=None))]
+#[pyo3(signature = (dag, target, strict_direction=false, call_limit=None, time_limit=None, max_trials=None, avg_error_map=None, shuffle_seed=None, cache=None))]
 pub fn vf2_layout_pass(
     dag: &DAGCircuit,
     target: &Target,
@@ -376,6 +846,7 @@ pub fn vf2_layout_pass(
     max_trials: Option<isize>,
     avg_error_map: Option<ErrorMap>,
     shuffle_seed: Option<u64>,
+    cache: Option<&Vf2LayoutCache>,
 ) -> PyResult<Option<HashMap<VirtualQubit, PhysicalQubit>>> {
     let add_interaction = |count: &mut usize, _: &PackedInstruction, repeats: usize| {
         *count += repeats;
@@ -388,6 +859,39 @@ pub fn vf2_layout_pass(
     let Some(mut coupling_graph) = build_coupling_map(target, &avg_error_map) else {
         return Ok(None);
     };
+    let interactions = VirtualInteractions::from_dag(dag, add_interaction)?;
+    let cache_key = cache.map(|_| {
+        let arguments = [
+            strict_direction as u64,
+            call_limit.map_or(u64::MAX, |limit| limit as u64),
+            max_trials.map_or(u64::MAX, |limit| limit as u64),
+            shuffle_seed.map_or(u64::MAX, |seed| seed.wrapping_add(1)),
+        ];
+        cache_key(&interactions, &coupling_graph, arguments)
+    });
+    if let (Some(cache), Some(key)) = (cache, cache_key) {
+        if let Some(layout) = cache.get(key) {
+            return Ok(layout.map(|pairs| {
+                pairs
+                    .into_iter()
+                    .map(|[virt, phys]| (VirtualQubit(virt), PhysicalQubit(phys)))
+                    .collect()
+            }));
+        }
+    }
+    let store = |layout: &Option<HashMap<VirtualQubit, PhysicalQubit>>| {
+        if let (Some(cache), Some(key)) = (cache, cache_key) {
+            let pairs = layout.as_ref().map(|layout| {
+                let mut pairs = layout
+                    .iter()
+                    .map(|(virt, phys)| [virt.0, phys.0])
+                    .collect::<Vec<_>>();
+                pairs.sort_unstable();
+                pairs
+            });
+            cache.insert(key, pairs);
+        }
+    };
     let num_physical_qubits = coupling_graph.node_count();
     let mut coupling_qubits = (0..num_physical_qubits)
         .map(|k| PhysicalQubit::new(k as u32))
@@ -403,7 +907,6 @@ pub fn vf2_layout_pass(
             .collect::<Vec<_>>();
         coupling_graph = vf2::reorder_nodes(&coupling_graph, &order);
     }
-    let interactions = VirtualInteractions::from_dag(dag, add_interaction)?;
     let start_time = Instant::now();
     let mut times_up = false;
     let mut trials: usize = 0;
@@ -435,6 +938,9 @@ pub fn vf2_layout_pass(
             .map(|result| result.expect("error type is infallible"))
             .last()
     else {
+        if !times_up {
+            store(&None);
+        }
         return Ok(None);
     };
 
@@ -443,12 +949,11 @@ pub fn vf2_layout_pass(
         .iter()
         .map(|(k, v)| (interactions.nodes[k.index()], coupling_qubits[v.index()]))
         .collect();
-    Ok(map_free_qubits(
-        num_physical_qubits,
-        interactions,
-        mapping,
-        &avg_error_map,
-    ))
+    let layout = map_free_qubits(num_physical_qubits, interactions, mapping, &avg_error_map);
+    if !times_up {
+        store(&layout);
+    }
+    Ok(layout)
 }
 
 /// Score a given circuit with a layout applied
@@ -529,5 +1034,6 @@ pub fn vf2_layout_mod(m: &Bound<PyModule>) -> PyResult<()> {
     m.add_wrapped(wrap_pyfunction!(vf2_layout_pass))?;
     m.add("MultiQEncountered", m.py().get_type::<MultiQEncountered>())?;
     m.add_class::<EdgeList>()?;
+    m.add_class::<Vf2LayoutCache>()?;
     Ok(())
 }
@@ -13,7 +13,10 @@
 use hashbrown::HashSet;
 
 use anyhow::Result;
+use pyo3::prelude::*;
+use rayon::prelude::*;
 
+use crate::TranspilerError;
 use crate::commutation_checker::get_standard_commutation_checker;
 use crate::equivalence::EquivalenceLibrary;
 use crate::passes::sabre::route::PyRoutingTarget;
@@ -25,6 +28,7 @@ use qiskit_circuit::circuit_data::CircuitData;
 use qiskit_circuit::converters::dag_to_circuit;
 use qiskit_circuit::dag_circuit::DAGCircuit;
 use qiskit_circuit::nlayout::NLayout;
+use qiskit_circuit::operations::{Operation, OperationRef};
 use qiskit_circuit::{PhysicalQubit, Qubit, VirtualQubit};
 
 #[derive(Copy, Eq, PartialEq, Debug, Clone)]
@@ -162,6 +166,7 @@ pub fn transpile(
             Some(2500),
             None,
             None,
+            None,
         )? {
             apply_layout(
                 &mut dag,
@@ -180,6 +185,7 @@ pub fn transpile(
                 seed,
                 Vec::new(),
                 false,
+                &sabre::TrialBudget::unlimited(),
             )?;
             dag = result;
             transpile_layout =
@@ -195,6 +201,7 @@ pub fn transpile(
             Some(2500),
             None,
             None,
+            None,
         )? {
             apply_layout(
                 &mut dag,
@@ -213,6 +220,7 @@ pub fn transpile(
                 seed,
                 Vec::new(),
                 false,
+                &sabre::TrialBudget::unlimited(),
             )?;
             dag = result;
             transpile_layout =
@@ -227,6 +235,7 @@ pub fn transpile(
         Some(250_000),
         None,
         None,
+        None,
     )? {
         apply_layout(
             &mut dag,
@@ -245,6 +254,7 @@ pub fn transpile(
             seed,
             Vec::new(),
             false,
+            &sabre::TrialBudget::unlimited(),
         )?;
         dag = result;
         transpile_layout =
@@ -268,6 +278,7 @@ pub fn transpile(
                 5,
                 seed,
                 Some(true),
+                &sabre::TrialBudget::unlimited(),
             )?;
             dag = out_dag;
             let routing_permutation =
@@ -389,6 +400,124 @@ pub fn transpile(
     Ok((dag_to_circuit(&dag, false)?, transpile_layout))
 }
 
+/// Transpile a batch of circuits for the same target in parallel.
+///
+/// Each circuit is compiled independently with the same options as [transpile] would use, on the
+/// rayon thread pool.  All the threads share the one `target`, rather than each working on a copy.
+/// The results are in the same order as `circuits`.
+pub fn transpile_batch(
+    circuits: &[&CircuitData],
+    target: &Target,
+    optimization_level: OptimizationLevel,
+    approximation_degree: Option<f64>,
+    seed: Option<u64>,
+) -> Vec<Result<(CircuitData, TranspileLayout)>> {
+    circuits
+        .par_iter()
+        .map(|circuit| {
+            transpile(
+                circuit,
+                target,
+                optimization_level,
+                approximation_degree,
+                seed,
+            )
+        })
+        .collect()
+}
+
+/// Return the name of the first operation in `circuit` that [transpile] cannot handle, if any.
+fn find_unsupported_operation(circuit: &CircuitData) -> Option<String> {
+    if circuit.num_input_vars() > 0
+        || circuit.num_captured_vars() > 0
+        || circuit.num_declared_vars() > 0
+        || circuit.num_captured_stretches() > 0
+        || circuit.num_declared_stretches() > 0
+    {
+        return Some("classical variables".to_string());
+    }
+    circuit.data().iter().find_map(|inst| match inst.op.view() {
+        OperationRef::StandardGate(_)
+        | OperationRef::StandardInstruction(_)
+        | OperationRef::Unitary(_) => None,
+        _ => Some(format!("'{}'", inst.op.name())),
+    })
+}
+
+/// Transpile a list of circuits for a target with the native transpiler, on a pool of threads.
+///
+/// This releases the GIL while the circuits are being compiled.  The circuits can only contain
+/// standard gates, standard instructions and unitary gates.
+///
+/// Returns a list of tuples of the output circuit data and its Python-space ``TranspileLayout``.
+#[pyfunction]
+#[pyo3(
+    name = "transpile_batch",
+    signature = (circuits, target, optimization_level, approximation_degree=None, seed=None)
+)]
+pub fn py_transpile_batch(
+    py: Python,
+    circuits: Vec<PyRef<CircuitData>>,
+    target: PyRef<Target>,
+    optimization_level: u8,
+    approximation_degree: Option<f64>,
+    seed: Option<u64>,
+) -> PyResult<Vec<(CircuitData, Py<PyAny>)>> {
+    if optimization_level > 3 {
+        return Err(TranspilerError::new_err(format!(
+            "Invalid optimization level specified {optimization_level}"
+        )));
+    }
+    let Some(target_qubits) = target.num_qubits else {
+        return Err(TranspilerError::new_err(
+            "The native transpiler needs a target with a fixed number of qubits.",
+        ));
+    };
+    for (index, circuit) in circuits.iter().enumerate() {
+        if let Some(name) = find_unsupported_operation(circuit) {
+            return Err(TranspilerError::new_err(format!(
+                "Circuit {index} contains {name}, which the native transpiler does not support."
+            )));
+        }
+        if circuit.num_qubits() > target_qubits as usize {
+            return Err(TranspilerError::new_err(format!(
+                "Circuit {index} uses {} qubits, but the target only has {target_qubits}.",
+                circuit.num_qubits()
+            )));
+        }
+    }
+    let circuit_refs: Vec<&CircuitData> = circuits.iter().map(|circuit| &**circuit).collect();
+    let target_ref: &Target = &target;
+    let results = py.detach(|| {
+        transpile_batch(
+            &circuit_refs,
+            target_ref,
+            optimization_level.into(),
+            approximation_degree,
+            seed,
+        )
+    });
+    results
+        .into_iter()
+        .enumerate()
+        .map(|(index, result)| {
+            let (circuit, layout) = result.map_err(|err| match err.downcast::<PyErr>() {
+                Ok(err) => err,
+                Err(err) => {
+                    TranspilerError::new_err(format!("Failed to transpile circuit {index}: {err}"))
+                }
+            })?;
+            let py_layout = layout.to_py_native(py, circuit.qubits().objects())?;
+            Ok((circuit, py_layout.unbind()))
+        })
+        .collect()
+}
+
+pub fn transpiler_mod(m: &Bound<PyModule>) -> PyResult<()> {
+    m.add_wrapped(wrap_pyfunction!(py_transpile_batch))?;
+    Ok(())
+}
+
 struct MinPointState {
     best_depth: Option<usize>,
     best_size: Option<usize>,
@@ -691,4 +820,60 @@ mod tests {
             assert!(result.1.output_permutation().is_some());
         }
     }
+
+    #[test]
+    fn test_batch_matches_single() {
+        let target = build_universal_star_target();
+        let circuits = (2..=5)
+            .map(|num_qubits| {
+                CircuitData::from_packed_operations(
+                    num_qubits,
+                    0,
+                    ::std::iter::once(Ok((
+                        StandardGate::H.into(),
+                        smallvec![],
+                        vec![Qubit(0)],
+                        vec![],
+                    )))
+                    .chain((1..num_qubits).map(|i| {
+                        Ok((
+                            StandardGate::CX.into(),
+                            smallvec![],
+                            vec![Qubit(0), Qubit(i)],
+                            vec![],
+                        ))
+                    })),
+                    Param::Float(0.),
+                )
+                .unwrap()
+            })
+            .collect::<Vec<_>>();
+        let circuit_refs = circuits.iter().collect::<Vec<_>>();
+        for opt_level in 0..=3 {
+            let batch = transpile_batch(
+                &circuit_refs,
+                &target,
+                opt_level.into(),
+                Some(1.0),
+                Some(42),
+            );
+            assert_eq!(batch.len(), circuits.len());
+            for (circuit, batch_result) in circuits.iter().zip(batch) {
+                let batch_result = match batch_result {
+                    Ok(res) => res,
+                    Err(e) => panic!("Error: {}", e.backtrace()),
+                };
+                let single =
+                    transpile(circuit, &target, opt_level.into(), Some(1.0), Some(42)).unwrap();
+                assert_eq!(batch_result.0.data().len(), single.0.data().len());
+                for (batch_inst, single_inst) in batch_result.0.data().iter().zip(single.0.data()) {
+                    assert_eq!(batch_inst.op.name(), single_inst.op.name());
+                    assert_eq!(
+                        batch_result.0.get_qargs(batch_inst.qubits),
+                        single.0.get_qargs(single_inst.qubits)
+                    );
+                }
+            }
+        }
+    }
 }
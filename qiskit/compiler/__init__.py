@@ -21,7 +21,10 @@ Circuit Compilation Functions
 =======================================
 
 .. autofunction:: transpile
+.. autofunction:: atranspile
+.. autofunction:: transpile_batch
+.. autofunction:: transpile_ensemble
 
 """
 
-from .transpiler import transpile
+from .transpiler import transpile, atranspile, transpile_batch, transpile_ensemble
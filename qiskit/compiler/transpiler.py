@@ -13,13 +13,20 @@
 # pylint: disable=invalid-sequence-index
 
 """Circuit transpile function"""
+import asyncio
+import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from time import time
-from typing import List, Union, Dict, Callable, Any, Optional, TypeVar
+from typing import List, Union, Dict, Callable, Any, Optional, Sequence, TypeVar
+
+import numpy as np
 
 from qiskit import user_config
+from qiskit._accelerate.transpiler import transpile_batch as _transpile_batch
 from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.dagcircuit import DAGCircuit
+from qiskit.passmanager import PassManagerPool, PassProfiler
 from qiskit.providers.backend import Backend
 from qiskit.transpiler import Layout, CouplingMap, PropertySet
 from qiskit.transpiler.basepasses import BasePass
@@ -27,6 +34,9 @@ from qiskit.transpiler.exceptions import TranspilerError, CircuitTooWideForTarge
 from qiskit.transpiler.passes.synthesis.high_level_synthesis import HLSConfig
 from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
 from qiskit.transpiler.target import Target
+from qiskit.transpiler.cache import TranspileCache
+from qiskit.transpiler.ensemble import EnsemblePassManager, EnsembleResult
+from qiskit.transpiler.optimization_metric import OptimizationMetric
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +68,11 @@ def transpile(  # pylint: disable=too-many-return-statements
     ignore_backend_supplied_default_methods: bool = False,
     num_processes: Optional[int] = None,
     qubits_initially_zero: bool = True,
+    pool: Optional[PassManagerPool] = None,
+    cache: Optional[TranspileCache] = None,
+    stream: bool = False,
+    max_in_flight: Optional[int] = None,
+    profiler: Optional[PassProfiler] = None,
 ) -> _CircuitT:
     """Transpile one or more circuits, according to some desired transpilation targets.
 
@@ -232,19 +247,52 @@ def transpile(  # pylint: disable=too-many-return-statements
             environment variable. If set to ``None`` the system default or local user configuration
             will be used.
         qubits_initially_zero: Indicates whether the input circuit is zero-initialized.
+        pool: An optional :class:`.PassManagerPool` of long-lived worker processes to transpile
+            multiple circuits with, instead of starting new processes for this call.  Workers
+            retain the deserialized pass manager and :class:`.Target` between calls, so repeated
+            calls to :func:`transpile` with the same configuration avoid the process start-up and
+            deserialization costs.  If given, ``num_processes`` is ignored.
+        cache: An optional :class:`.TranspileCache` of previously transpiled circuits.  Each input
+            circuit is looked up in the cache by its structure and the full configuration of the
+            compilation (including the target and ``seed_transpiler``) before it is compiled, and
+            the outputs of compiled circuits are added to it.  The cache is bypassed if a
+            ``callback`` is given.
+        stream: If ``True``, ``circuits`` may be any iterable of circuits (including a generator),
+            and instead of a list, this function returns an iterator that yields tuples of
+            ``(index, transpiled_circuit, property_set)`` in the order the circuits finish
+            compiling.  See :meth:`.PassManager.run_iter` for details.  In this mode,
+            ``output_name`` can only be ``None`` or a list of names, and ``cache`` is not
+            supported.
+        max_in_flight: The maximum number of circuits that are compiled in parallel at once when
+            ``stream`` is ``True``.  If ``None``, twice the number of processes is used.  This has
+            no effect if ``stream`` is ``False``.
+        profiler: An optional :class:`.PassProfiler` that records the running time, memory usage
+            and circuit-size changes of every pass execution, for every circuit, including those
+            compiled in parallel worker processes.  A profiled run bypasses ``cache``, and is not
+            supported with ``stream``.
 
     Returns:
-        The transpiled circuit(s).
+        The transpiled circuit(s), or an iterator over them if ``stream`` is ``True``.
 
     Raises:
         TranspilerError: in case of bad inputs to transpiler (like conflicting parameters)
             or errors in passes
     """
-    arg_circuits_list = isinstance(circuits, list)
-    circuits = circuits if arg_circuits_list else [circuits]
+    if stream:
+        if isinstance(circuits, QuantumCircuit):
+            circuits = [circuits]
+        if isinstance(output_name, str):
+            raise TranspilerError("A streamed transpile needs a list of output names, not a str.")
+        if cache is not None:
+            raise TranspilerError("A transpile cache cannot be used with a streamed transpile.")
+        if profiler is not None:
+            raise TranspilerError("A profiler cannot be used with a streamed transpile.")
+    else:
+        arg_circuits_list = isinstance(circuits, list)
+        circuits = circuits if arg_circuits_list else [circuits]
 
-    if not circuits:
-        return []
+        if not circuits:
+            return []
 
     start_time = time()
 
@@ -259,9 +307,10 @@ def transpile(  # pylint: disable=too-many-return-statements
         if translation_method is None and hasattr(backend, "get_translation_stage_plugin"):
             translation_method = backend.get_translation_stage_plugin()
 
-    output_name = _parse_output_name(output_name, circuits)
     coupling_map = _parse_coupling_map(coupling_map)
-    _check_circuits_coupling_map(circuits, coupling_map, backend)
+    if not stream:
+        output_name = _parse_output_name(output_name, circuits)
+        _check_circuits_coupling_map(circuits, coupling_map, backend)
 
     # Edge cases require using the old model (loose constraints) instead of building a target,
     # but we don't populate the passmanager config with loose constraints unless it's one of
@@ -288,7 +337,27 @@ def transpile(  # pylint: disable=too-many-return-statements
         qubits_initially_zero=qubits_initially_zero,
     )
 
-    out_circuits = pm.run(circuits, callback=callback, num_processes=num_processes)
+    if stream:
+        return _transpile_stream(
+            pm,
+            circuits,
+            output_name=output_name,
+            coupling_map=coupling_map,
+            backend=backend,
+            callback=callback,
+            num_processes=num_processes,
+            pool=pool,
+            max_in_flight=max_in_flight,
+        )
+
+    out_circuits = pm.run(
+        circuits,
+        callback=callback,
+        num_processes=num_processes,
+        pool=pool,
+        cache=cache,
+        profiler=profiler,
+    )
 
     for name, circ in zip(output_name, out_circuits):
         circ.name = name
@@ -300,6 +369,270 @@ def transpile(  # pylint: disable=too-many-return-statements
         return out_circuits[0]
 
 
+async def atranspile(
+    circuits: _CircuitT,
+    backend: Optional[Backend] = None,
+    *,
+    max_concurrency: Optional[int] = None,
+    **kwargs,
+) -> _CircuitT:
+    """Transpile one or more circuits without blocking the running :mod:`asyncio` event loop.
+
+    This is the coroutine equivalent of :func:`transpile`, for use in :mod:`asyncio` services::
+
+        from qiskit.compiler import atranspile
+
+        async def handle(request):
+            isa_circuits = await atranspile(request.circuits, backend, max_concurrency=4)
+            ...
+
+    The pass manager is built and run on a helper thread, and multiple circuits are compiled in
+    parallel worker processes in the same way as for ``transpile(..., stream=True)``.  Each call
+    compiles at most ``max_concurrency`` of its circuits at any one time; the limit is per call,
+    and is not shared with other calls that are awaiting compilation at the same time.  To bound
+    the total work across many concurrent requests, share a :class:`.PassManagerPool` between them
+    with the ``pool`` argument, whose fixed number of worker processes caps how many circuits are
+    compiled at once, or guard the calls with an :class:`asyncio.Semaphore`.
+
+    If the awaiting task is cancelled, circuits that have not started compiling are not compiled.
+    Circuits that are already being compiled in a worker process are run to completion in the
+    background, and their outputs discarded.
+
+    Args:
+        circuits: Circuit(s) to transpile.
+        backend: The backend to compile for, as for :func:`transpile`.
+        max_concurrency: The maximum number of circuits from this call that are compiled in
+            parallel at once.  If ``None``, twice the number of processes is used.
+        kwargs: Any other arguments to :func:`transpile`, except for ``stream``, ``cache``,
+            ``max_in_flight`` and ``profiler``.
+
+    Returns:
+        The transpiled circuit(s), in the same form as :func:`transpile` would return them.
+
+    Raises:
+        TranspilerError: in case of bad inputs to the transpiler, or errors in passes.
+    """
+    for name in ("stream", "cache", "max_in_flight", "profiler"):
+        if name in kwargs:
+            raise TranspilerError(f"'{name}' is not a valid argument to atranspile.")
+    arg_circuits_list = isinstance(circuits, list)
+    circuit_list = circuits if arg_circuits_list else [circuits]
+    if not circuit_list:
+        return []
+    out_circuits = [None] * len(circuit_list)
+
+    loop = asyncio.get_running_loop()
+    # A single thread steps the stream, so closing it is always ordered after the last step.
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="qiskit-atranspile")
+    stream = None
+    try:
+        stream = await loop.run_in_executor(
+            executor,
+            functools.partial(
+                transpile,
+                circuit_list,
+                backend,
+                stream=True,
+                max_in_flight=max_concurrency,
+                **kwargs,
+            ),
+        )
+        while (item := await loop.run_in_executor(executor, next, stream, None)) is not None:
+            index, circuit, _ = item
+            out_circuits[index] = circuit
+    finally:
+        if stream is not None:
+            # Closing the stream cancels any circuits that haven't started compiling yet.
+            executor.submit(stream.close)
+        executor.shutdown(wait=False)
+    return out_circuits if arg_circuits_list else out_circuits[0]
+
+
+def transpile_batch(
+    circuits: _CircuitT,
+    target: Target,
+    *,
+    optimization_level: Optional[int] = None,
+    approximation_degree: Optional[float] = 1.0,
+    seed_transpiler: Optional[int] = None,
+) -> _CircuitT:
+    """Transpile one or more circuits for a target with the native compilation pipeline, in
+    parallel on threads.
+
+    This runs the same compilation pipeline that is exposed to C as ``qk_transpile``, in which every
+    stage is implemented natively.  The circuits are compiled concurrently on a pool of threads
+    while the Python global interpreter lock is released, and all the threads share the one
+    ``target``.  Unlike the parallel mode of :func:`transpile`, no worker processes are started and
+    neither the pass manager nor the target need to be serialized, and memory usage does not scale
+    with the number of workers.
+
+    The size of the thread pool can be tuned with the ``RAYON_NUM_THREADS`` environment variable.
+
+    The native pipeline supports fewer circuit features than :func:`transpile`.  The input circuits
+    can only contain standard gates (see :func:`.get_standard_gate_name_mapping`), standard
+    instructions such as :class:`.Measure` and :class:`.Barrier`, and :class:`.UnitaryGate`, and
+    cannot contain control flow or classical variables.  The target must have a fixed number of
+    qubits.  The outputs are not guaranteed to be identical to those of :func:`transpile`.
+
+    Args:
+        circuits: Circuit(s) to transpile.
+        target: The target to compile the circuits for.
+        optimization_level: The optimization level, in the same form as for :func:`transpile`.
+        approximation_degree: The heuristic approximation degree, in the same form as for
+            :func:`transpile`.
+        seed_transpiler: Sets the random seed for the stochastic parts of the transpiler.
+
+    Returns:
+        The transpiled circuit(s), each with its :attr:`~.QuantumCircuit.layout` set.
+
+    Raises:
+        TranspilerError: if a circuit contains unsupported operations, is wider than the target,
+            or fails to compile.
+    """
+    arg_circuits_list = isinstance(circuits, list)
+    circuits = circuits if arg_circuits_list else [circuits]
+    if not circuits:
+        return []
+    if optimization_level is None:
+        config = user_config.get_config()
+        optimization_level = config.get("transpile_optimization_level", 2)
+
+    start_time = time()
+    results = _transpile_batch(
+        [circuit._data for circuit in circuits],
+        target,
+        optimization_level,
+        approximation_degree,
+        seed_transpiler,
+    )
+    out_circuits = []
+    for circuit, (data, layout) in zip(circuits, results):
+        out_circuit = QuantumCircuit._from_circuit_data(data, name=circuit.name)
+        out_circuit.metadata = circuit.metadata
+        out_circuit._layout = layout
+        out_circuits.append(out_circuit)
+    _log_transpile_time(start_time, time())
+    if arg_circuits_list:
+        return out_circuits
+    return out_circuits[0]
+
+
+def transpile_ensemble(
+    circuits: Union[QuantumCircuit, List[QuantumCircuit]],
+    backend: Optional[Backend] = None,
+    *,
+    seeds: Union[int, Sequence[int]] = 8,
+    optimization_levels: Optional[Sequence[int]] = None,
+    metric: Union[
+        OptimizationMetric, Callable[[QuantumCircuit], Any]
+    ] = OptimizationMetric.COUNT_2Q,
+    seed_transpiler: Optional[int] = None,
+    num_processes: Optional[int] = None,
+    **kwargs,
+) -> Union[EnsembleResult, List[EnsembleResult]]:
+    """Transpile circuits with several seeds and optimization levels, and keep the best output of
+    each circuit.
+
+    This builds a preset pass manager for every combination of seed and optimization level, and
+    runs them as an :class:`.EnsemblePassManager`.  The ``init`` stage is run only once per circuit
+    for each optimization level, and the layout, routing, translation and optimization stages of
+    every combination are run in parallel worker processes from its output::
+
+        from qiskit.compiler import transpile_ensemble
+
+        result = transpile_ensemble(circuit, backend, seeds=16, optimization_levels=[2, 3])
+        isa_circuit = result.circuit
+        print(result.best.label, sorted(candidate.cost for candidate in result.candidates))
+
+    Args:
+        circuits: Circuit(s) to transpile.
+        backend: The backend to compile for, as for :func:`transpile`.
+        seeds: The values of ``seed_transpiler`` to try, or the number of seeds to try.  If a
+            number, the seeds are drawn from a random number generator seeded with
+            ``seed_transpiler``.
+        optimization_levels: The optimization levels to try.  If ``None``, only the default level
+            that :func:`transpile` would use is tried.
+        metric: How to score the outputs, as for :class:`.EnsemblePassManager`.  The output with
+            the lowest cost is selected.
+        seed_transpiler: The seed of the random number generator used to draw ``seeds``, if that
+            is a number.
+        num_processes: The maximum number of parallel processes to launch, as for
+            :func:`transpile`.
+        kwargs: Any other arguments to :func:`.generate_preset_pass_manager`, such as ``target``
+            or ``routing_method``.
+
+    Returns:
+        An :class:`.EnsembleResult` for each input circuit, in the same form as the input.  The
+        :attr:`~.EnsembleCandidate.label` of each candidate is a tuple of its optimization level and
+        seed.
+
+    Raises:
+        TranspilerError: if no seeds or optimization levels are given, or in case of bad inputs to
+            the transpiler or errors in passes.
+    """
+    if isinstance(seeds, int):
+        if seeds < 1:
+            raise TranspilerError(f"The number of seeds must be positive, not {seeds}.")
+        rng = np.random.default_rng(seed_transpiler)
+        seeds = [int(seed) for seed in rng.integers(0, 2**31, size=seeds)]
+    elif not seeds:
+        raise TranspilerError("At least one seed is needed.")
+    if optimization_levels is None:
+        config = user_config.get_config()
+        optimization_levels = [config.get("transpile_optimization_level", 2)]
+    elif not optimization_levels:
+        raise TranspilerError("At least one optimization level is needed.")
+    if "coupling_map" in kwargs:
+        kwargs["coupling_map"] = _parse_coupling_map(kwargs["coupling_map"])
+
+    labels = [(level, seed) for level in optimization_levels for seed in seeds]
+    pass_managers = [
+        generate_preset_pass_manager(level, backend, seed_transpiler=seed, **kwargs)
+        for level, seed in labels
+    ]
+    start_time = time()
+    results = EnsemblePassManager(pass_managers, labels=labels, metric=metric).run(
+        circuits, num_processes=num_processes
+    )
+    _log_transpile_time(start_time, time())
+    return results
+
+
+def _transpile_stream(
+    pm,
+    circuits,
+    *,
+    output_name,
+    coupling_map,
+    backend,
+    callback,
+    num_processes,
+    pool,
+    max_in_flight,
+):
+    def checked(circuits):
+        for circuit in circuits:
+            _check_circuits_coupling_map([circuit], coupling_map, backend)
+            yield circuit
+
+    for index, circuit, property_set in pm.run_iter(
+        checked(circuits),
+        callback=callback,
+        num_processes=num_processes,
+        pool=pool,
+        max_in_flight=max_in_flight,
+    ):
+        if output_name is not None:
+            try:
+                circuit.name = output_name[index]
+            except IndexError:
+                raise TranspilerError(
+                    "The length of output_name list must be equal to the number of transpiled"
+                    " circuits."
+                ) from None
+        yield index, circuit, property_set
+
+
 def _check_circuits_coupling_map(circuits, cmap, backend):
     # Check circuit width against number of qubits in coupling_map(s)
     max_qubits = None
@@ -241,6 +241,23 @@ Compilation state
    WorkflowStatus
    PassManagerState
 
+Execution
+---------
+
+.. autosummary::
+   :toctree: ../stubs/
+
+   PassManagerPool
+
+Profiling
+---------
+
+.. autosummary::
+   :toctree: ../stubs/
+
+   PassProfiler
+   PassRecord
+
 Exceptions
 ----------
 
@@ -256,3 +273,5 @@ from .flow_controllers import (
 from .base_tasks import GenericPass, BaseController
 from .compilation_status import PropertySet, WorkflowStatus, PassManagerState
 from .exceptions import PassManagerError
+from .pool import PassManagerPool
+from .profiler import PassProfiler, PassRecord
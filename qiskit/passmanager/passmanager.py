@@ -14,18 +14,27 @@
 from __future__ import annotations
 
 import logging
+import os
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Iterable
-from itertools import chain
-from typing import Any
+from collections.abc import Callable, Iterable, Iterator
+from itertools import chain, islice
+from typing import Any, TYPE_CHECKING
 
 import dill
 
-from qiskit.utils.parallel import parallel_map, should_run_in_parallel
+from qiskit.utils.parallel import (
+    parallel_map,
+    should_run_in_parallel,
+    _IN_PARALLEL_ALLOW_PARALLELISM,
+)
 from .base_tasks import Task, PassManagerIR
 from .exceptions import PassManagerError
 from .flow_controllers import FlowControllerLinear
 from .compilation_status import PropertySet, WorkflowStatus, PassManagerState
+from .profiler import PassProfiler
+
+if TYPE_CHECKING:
+    from .pool import PassManagerPool  # pylint: disable=cyclic-import
 
 logger = logging.getLogger(__name__)
 
@@ -169,6 +178,29 @@ class BasePassManager(ABC):
         """
         pass
 
+    def _profile_metrics(self, passmanager_ir: PassManagerIR) -> tuple[int | None, int | None]:
+        """Measure the size of a pass manager IR for a :class:`.PassProfiler`.
+
+        Subclasses can override this to report the metrics of their IR.
+
+        Args:
+            passmanager_ir: The IR to measure.
+
+        Returns:
+            The number of operations and the number of two-qubit operations in the IR, either of
+            which can be ``None`` if it is not meaningful.
+        """
+        return None, None
+
+    def _profile_stages(self) -> dict[int, str]:
+        """Get the stage each pass belongs to, for a :class:`.PassProfiler`.
+
+        Returns:
+            A mapping of the ``id`` of each pass to the name of its stage.  Passes that are not part
+            of any stage may be missing.
+        """
+        return {}
+
     def run(
         self,
         in_programs: Any | list[Any],
@@ -176,6 +208,8 @@ class BasePassManager(ABC):
         num_processes: int = None,
         *,
         property_set: dict[str, object] | None = None,
+        pool: PassManagerPool | None = None,
+        profiler: PassProfiler | None = None,
         **kwargs,
     ) -> Any:
         """Run all the passes on the specified ``in_programs``.
@@ -218,6 +252,14 @@ class BasePassManager(ABC):
                 another, in cases where you know the analysis is safe to share.  Beware that some
                 analysis will be specific to the input circuit and the particular :class:`.Target`,
                 so you should take a lot of care when using this argument.
+            pool: If given, a :class:`.PassManagerPool` whose long-lived worker processes are used
+                to run multiple input programs, instead of starting a new process pool for this
+                call.  When a pool is given, ``num_processes`` is ignored and the pool is used
+                regardless of the value of :func:`.should_run_in_parallel`, unless this call is
+                itself running inside a worker process.
+            profiler: If given, a :class:`.PassProfiler` that records the running time, memory and
+                program-size changes of every pass execution, for every program.  This works in
+                both the serial and parallel modes.
             kwargs: Arbitrary arguments passed to the compiler frontend and backend.
 
         Returns:
@@ -231,6 +273,21 @@ class BasePassManager(ABC):
             in_programs = [in_programs]
             is_list = False
 
+        if (
+            pool is not None
+            and len(in_programs) > 1
+            and os.getenv("QISKIT_IN_PARALLEL", _IN_PARALLEL_ALLOW_PARALLELISM)
+            == _IN_PARALLEL_ALLOW_PARALLELISM
+        ):
+            return pool.map(
+                self,
+                in_programs,
+                callback=callback,
+                initial_property_set=property_set,
+                profiler=profiler,
+                **kwargs,
+            )
+
         # If we're not going to run in parallel, we want to avoid spending time `dill` serializing
         # ourselves, since that can be quite expensive.
         if len(in_programs) == 1 or not should_run_in_parallel(num_processes):
@@ -240,9 +297,11 @@ class BasePassManager(ABC):
                     pass_manager=self,
                     callback=callback,
                     initial_property_set=property_set,
+                    profiler=profiler,
+                    program_index=index,
                     **kwargs,
                 )
-                for program in in_programs
+                for index, program in enumerate(in_programs)
             ]
             if len(in_programs) == 1 and not is_list:
                 return out[0]
@@ -252,16 +311,103 @@ class BasePassManager(ABC):
         # See https://github.com/Qiskit/qiskit-terra/pull/3290
         # Note that serialized object is deserialized as a different object.
         # Thus, we can reuse the same manager without state collision, without building it per thread.
-        return parallel_map(
+        out = parallel_map(
             _run_workflow_in_new_process,
             values=in_programs,
             task_kwargs={
                 "pass_manager_bin": dill.dumps(self),
                 "callback": dill.dumps(callback),
                 "initial_property_set": property_set,
+                "profiler_options": None if profiler is None else profiler._options(),
             },
             num_processes=num_processes,
         )
+        if profiler is None:
+            return out
+        return _merge_profiles(profiler, out)
+
+    def run_iter(
+        self,
+        in_programs: Iterable[Any],
+        callback: Callable = None,
+        num_processes: int = None,
+        *,
+        property_set: dict[str, object] | None = None,
+        max_in_flight: int | None = None,
+        pool: PassManagerPool | None = None,
+        **kwargs,
+    ) -> Iterator[tuple[int, Any, PropertySet]]:
+        """Lazily run all the passes on each of ``in_programs``, yielding the outputs as they are
+        completed.
+
+        Unlike :meth:`run`, this method accepts any iterable of input programs (including a
+        generator), and does not build a list of all the outputs before returning.  When running in
+        parallel, at most ``max_in_flight`` programs are being processed at any one time, and the
+        outputs are yielded in the order they complete, not necessarily the order of the inputs.
+        This allows the compilation of a large batch to be overlapped with whatever the consumer
+        does with the outputs, and bounds the peak memory usage.
+
+        Args:
+            in_programs: An iterable of input programs to transform via all the registered passes.
+            callback: A callback function that will be called after each pass execution, in the
+                same form as for :meth:`run`.
+            num_processes: The maximum number of parallel processes to launch if parallel
+                execution is enabled, as for :meth:`run`.
+            property_set: If given, the initial value to use as the :class:`.PropertySet` for the
+                pass manager pipeline, as for :meth:`run`.
+            max_in_flight: The maximum number of programs that are being processed in parallel at
+                once.  If ``None``, twice the number of processes is used.  This has no effect when
+                running serially.
+            pool: If given, a :class:`.PassManagerPool` whose worker processes are used to run the
+                programs.  See :meth:`run` for details.
+            kwargs: Arbitrary arguments passed to the compiler frontend and backend.
+
+        Yields:
+            Tuples of the index of the input program in ``in_programs``, the transformed program,
+            and the final :class:`.PropertySet` of its compilation.
+        """
+        # Imported here to avoid a cycle; the pool module depends on this one.
+        from .pool import PassManagerPool
+
+        in_programs = iter(in_programs)
+        # Look ahead so we don't start worker processes if there's only one program.
+        head = list(islice(in_programs, 2))
+        in_programs = chain(head, in_programs)
+        in_parallel_worker = (
+            os.getenv("QISKIT_IN_PARALLEL", _IN_PARALLEL_ALLOW_PARALLELISM)
+            != _IN_PARALLEL_ALLOW_PARALLELISM
+        )
+        if (
+            len(head) < 2
+            or in_parallel_worker
+            or (pool is None and not should_run_in_parallel(num_processes))
+        ):
+            for index, program in enumerate(in_programs):
+                out_program = _run_workflow(
+                    program=program,
+                    pass_manager=self,
+                    callback=callback,
+                    initial_property_set=property_set,
+                    **kwargs,
+                )
+                yield index, out_program, self.property_set
+            return
+
+        owned_pool = None
+        if pool is None:
+            pool = owned_pool = PassManagerPool(num_processes, max_cached_pass_managers=1)
+        try:
+            yield from pool.imap_unordered(
+                self,
+                in_programs,
+                callback=callback,
+                initial_property_set=property_set,
+                max_in_flight=max_in_flight,
+                **kwargs,
+            )
+        finally:
+            if owned_pool is not None:
+                owned_pool.shutdown(wait=False)
 
     def to_flow_controller(self) -> FlowControllerLinear:
         """Linearize this manager into a single :class:`.FlowControllerLinear`,
@@ -285,6 +431,8 @@ def _run_workflow(
     pass_manager: BasePassManager,
     *,
     initial_property_set: dict[str, object] | None = None,
+    profiler: PassProfiler | None = None,
+    program_index: int = 0,
     **kwargs,
 ) -> Any:
     """Run single program optimization with a pass manager.
@@ -292,6 +440,8 @@ def _run_workflow(
     Args:
         program: Arbitrary program to optimize.
         pass_manager: Pass manager with scheduled passes.
+        profiler: If given, the profiler to record the pass executions into.
+        program_index: The index of the program to record in the profiler.
         **kwargs: Keyword arguments for IR conversion.
 
     Returns:
@@ -308,13 +458,21 @@ def _run_workflow(
         input_program=program,
         **kwargs,
     )
-    passmanager_ir, final_state = flow_controller.execute(
-        passmanager_ir=passmanager_ir,
-        state=PassManagerState(
-            workflow_status=initial_status, property_set=pass_manager.property_set
-        ),
-        callback=kwargs.get("callback", None),
-    )
+    callback = kwargs.get("callback", None)
+    recorder = None
+    if profiler is not None:
+        callback = recorder = profiler._start_workflow(pass_manager, passmanager_ir, callback)
+    try:
+        passmanager_ir, final_state = flow_controller.execute(
+            passmanager_ir=passmanager_ir,
+            state=PassManagerState(
+                workflow_status=initial_status, property_set=pass_manager.property_set
+            ),
+            callback=callback,
+        )
+    finally:
+        if recorder is not None:
+            recorder.finish(program_index)
     # The `property_set` has historically been returned as a mutable attribute on `PassManager`
     # This makes us non-reentrant (though `PassManager` would be dependent on its internal tasks to
     # be re-entrant if that was required), but is consistent with previous interfaces.  We're still
@@ -338,19 +496,36 @@ def _run_workflow_in_new_process(
     *,
     initial_property_set: dict[str, object] | None,
     callback: bytes,
+    profiler_options: dict[str, Any] | None = None,
 ) -> Any:
     """Run single program optimization in new process.
 
     Args:
         program: Arbitrary program to optimize.
         pass_manager_bin: Binary of the pass manager with scheduled passes.
+        profiler_options: If given, profile the run with a new :class:`.PassProfiler` constructed
+            with these options.
 
     Returns:
-          Optimized program.
+          Optimized program, or a tuple of the optimized program and the profile records if
+          ``profiler_options`` is given.
     """
-    return _run_workflow(
+    profiler = None if profiler_options is None else PassProfiler(**profiler_options)
+    out_program = _run_workflow(
         program=program,
         pass_manager=dill.loads(pass_manager_bin),
         initial_property_set=initial_property_set,
         callback=dill.loads(callback),
+        profiler=profiler,
     )
+    if profiler is None:
+        return out_program
+    return out_program, profiler.records
+
+
+def _merge_profiles(profiler: PassProfiler, results: list[tuple[Any, list]]) -> list[Any]:
+    """Merge the records returned from profiled worker processes into ``profiler``, and return the
+    output programs."""
+    for index, (_, records) in enumerate(results):
+        profiler._merge(records, index)
+    return [out_program for out_program, _ in results]
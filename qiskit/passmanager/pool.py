@@ -0,0 +1,398 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""A long-lived pool of worker processes for running pass managers."""
+
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import functools
+import hashlib
+import itertools
+import os
+import shutil
+import tempfile
+import threading
+import weakref
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor
+from typing import Any
+
+import dill
+
+from qiskit.utils.parallel import default_num_processes, _IN_PARALLEL_FORBID_PARALLELISM
+from .compilation_status import PropertySet
+from .exceptions import PassManagerError
+from .passmanager import BasePassManager, _merge_profiles, _run_workflow
+from .profiler import PassProfiler
+
+
+class PassManagerPool:
+    """A persistent pool of worker processes that keeps pass managers loaded between runs.
+
+    By default, each parallel call to :meth:`.BasePassManager.run` starts a fresh set of worker
+    processes and sends each of them a :mod:`dill`-serialized copy of the pass manager, which every
+    worker must then deserialize (including any :class:`.Target` it holds) before doing any work.
+    For services that run many small batches, this start-up cost can dominate the actual
+    compilation time.
+
+    A :class:`PassManagerPool` keeps its worker processes alive between calls.  Each serialized pass
+    manager is written once to a private scratch directory, and workers deserialize it the first
+    time they see it and cache the result, so subsequent runs of the same pass manager (or of any
+    pass manager that serializes identically, such as the ones built by repeated calls to
+    :func:`.transpile` with the same arguments) skip both process start-up and deserialization.
+    The file is deleted again once every pass manager that serialized to it has been garbage
+    collected.
+
+    Pass a pool to :meth:`.BasePassManager.run` (or :func:`.transpile`) with the ``pool`` keyword
+    argument to use it.  The pool should be shut down when it is no longer needed, either by
+    calling :meth:`shutdown` or by using it as a context manager::
+
+        from qiskit.passmanager import PassManagerPool
+
+        with PassManagerPool(num_processes=8) as pool:
+            for batch in batches:
+                pass_manager.run(batch, pool=pool)
+
+    .. note::
+
+        The serialized form of a pass manager is cached by the pool the first time it is used.
+        If you modify a pass manager in place after running it through a pool (for example by
+        calling :meth:`~.BasePassManager.append`), you must call :meth:`invalidate` before running
+        it again, otherwise the workers will continue to use the previous schedule.
+    """
+
+    def __init__(self, num_processes: int | None = None, *, max_cached_pass_managers: int = 4):
+        """
+        Args:
+            num_processes: The number of worker processes to keep alive.  If ``None``, the return
+                value of :func:`.default_num_processes` is used.
+            max_cached_pass_managers: The maximum number of distinct deserialized pass managers
+                each worker keeps loaded at once.  The least-recently used one is evicted first.
+
+        Raises:
+            PassManagerError: if either of the numeric arguments is less than 1.
+        """
+        if num_processes is None:
+            num_processes = default_num_processes()
+        if num_processes < 1:
+            raise PassManagerError(f"a pool needs at least one process, not {num_processes}")
+        if max_cached_pass_managers < 1:
+            raise PassManagerError(
+                f"workers must cache at least one pass manager, not {max_cached_pass_managers}"
+            )
+        self._num_processes = num_processes
+        self._max_cached = max_cached_pass_managers
+        # Re-entrant, because the finalizers that release published files can run during garbage
+        # collection triggered while the lock is already held.
+        self._lock = threading.RLock()
+        self._executor = None
+        self._directory = None
+        # Map of pass manager -> (digest, path) of its serialized form on disk.
+        self._published = weakref.WeakKeyDictionary()
+        # Map of digest -> number of live pass managers that have been published with it.  Each
+        # publication holds one reference, which is released by a finalizer on the pass manager.
+        self._references = collections.Counter()
+        # Incremented on every call to `invalidate` so workers know to drop their caches.
+        self._epoch = 0
+
+    @property
+    def num_processes(self) -> int:
+        """The number of worker processes in this pool."""
+        return self._num_processes
+
+    def _ensure_started(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._directory = tempfile.mkdtemp(prefix="qiskit-pm-pool-")
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._num_processes,
+                initializer=_initialize_worker,
+                initargs=(self._max_cached,),
+            )
+        return self._executor
+
+    def _publish(self, pass_manager: BasePassManager) -> tuple[str, str]:
+        if (published := self._published.get(pass_manager)) is not None:
+            return published
+        pass_manager_bin = dill.dumps(pass_manager)
+        digest = hashlib.sha256(pass_manager_bin).hexdigest()
+        path = os.path.join(self._directory, f"{digest}.dill")
+        # Take the reference before checking for the file, so a finalizer that runs in between
+        # cannot delete it from under us.
+        self._references[digest] += 1
+        weakref.finalize(pass_manager, _release, self._lock, self._references, digest, path)
+        if not os.path.exists(path):
+            # Write-then-rename so a worker can never observe a partially written file.
+            with tempfile.NamedTemporaryFile(dir=self._directory, delete=False) as fptr:
+                fptr.write(pass_manager_bin)
+            os.replace(fptr.name, path)
+        self._published[pass_manager] = (digest, path)
+        return digest, path
+
+    def invalidate(self, pass_manager: BasePassManager | None = None) -> None:
+        """Drop cached copies of pass managers, so they are re-serialized on their next run.
+
+        This must be called after a pass manager that has already been run through this pool is
+        modified in place.  Workers discard all of their deserialized pass managers on the next
+        task they receive after this call.
+
+        Args:
+            pass_manager: The pass manager to forget.  If ``None``, all pass managers are forgotten.
+        """
+        with self._lock:
+            if pass_manager is None:
+                self._published.clear()
+            else:
+                self._published.pop(pass_manager, None)
+            self._epoch += 1
+
+    def map(
+        self,
+        pass_manager: BasePassManager,
+        programs: Iterable[Any],
+        *,
+        callback: Callable | None = None,
+        initial_property_set: dict[str, object] | None = None,
+        profiler: PassProfiler | None = None,
+        **kwargs,
+    ) -> list[Any]:
+        """Run ``pass_manager`` on each of ``programs`` in the worker processes.
+
+        This is the worker-pool equivalent of the parallel path of :meth:`.BasePassManager.run`,
+        which is the preferred entry point.
+
+        Args:
+            pass_manager: The pass manager to run.
+            programs: The input programs.
+            callback: The callback to pass to each workflow, in the form expected by
+                :class:`.BasePassManager`.  It is invoked within the worker processes.
+            initial_property_set: The initial property set of each workflow.
+            profiler: If given, a :class:`.PassProfiler` to merge the records of each worker into.
+            kwargs: Additional keyword arguments passed to the pass manager frontend and backend.
+
+        Returns:
+            The output programs, in the same order as the inputs.
+
+        Raises:
+            PassManagerError: if the pool has been shut down.
+        """
+        executor, task = self._prepare(
+            pass_manager,
+            callback,
+            initial_property_set,
+            kwargs,
+            with_property_set=False,
+            profiler_options=None if profiler is None else profiler._options(),
+        )
+        out = list(executor.map(task, programs))
+        if profiler is None:
+            return out
+        return _merge_profiles(profiler, out)
+
+    def imap_unordered(
+        self,
+        pass_manager: BasePassManager,
+        programs: Iterable[Any],
+        *,
+        callback: Callable | None = None,
+        initial_property_set: dict[str, object] | None = None,
+        max_in_flight: int | None = None,
+        **kwargs,
+    ) -> Iterator[tuple[int, Any, PropertySet]]:
+        """Lazily run ``pass_manager`` on each of ``programs`` in the worker processes, yielding the
+        results in the order they complete.
+
+        This is the worker-pool equivalent of the parallel path of
+        :meth:`.BasePassManager.run_iter`, which is the preferred entry point.
+
+        At most ``max_in_flight`` programs are submitted to the workers at any one time, and
+        ``programs`` is only consumed as space becomes available, so neither the inputs nor the
+        outputs need to be held in memory all at once.
+
+        Args:
+            pass_manager: The pass manager to run.
+            programs: The input programs.  This can be any iterable, including a generator.
+            callback: The callback to pass to each workflow, in the form expected by
+                :class:`.BasePassManager`.  It is invoked within the worker processes.
+            initial_property_set: The initial property set of each workflow.
+            max_in_flight: The maximum number of programs submitted to the workers at once.  If
+                ``None``, twice the number of processes in the pool is used.
+            kwargs: Additional keyword arguments passed to the pass manager frontend and backend.
+
+        Yields:
+            Tuples of the index of the input program in ``programs``, the output program, and the
+            final :class:`.PropertySet` of its workflow.
+
+        Raises:
+            PassManagerError: if the pool has been shut down, or ``max_in_flight`` is less than 1.
+        """
+        if max_in_flight is None:
+            max_in_flight = 2 * self._num_processes
+        if max_in_flight < 1:
+            raise PassManagerError(
+                f"must allow at least one program in flight, not {max_in_flight}"
+            )
+        executor, task = self._prepare(
+            pass_manager, callback, initial_property_set, kwargs, with_property_set=True
+        )
+        programs = enumerate(programs)
+        in_flight = {}
+        try:
+            while True:
+                for index, program in itertools.islice(programs, max_in_flight - len(in_flight)):
+                    in_flight[executor.submit(task, program)] = index
+                if not in_flight:
+                    return
+                done, _ = concurrent.futures.wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = in_flight.pop(future)
+                    out_program, property_set = future.result()
+                    yield index, out_program, property_set
+        finally:
+            # If the consumer stops early (or a task fails), don't leave work running.
+            for future in in_flight:
+                future.cancel()
+
+    def _prepare(
+        self,
+        pass_manager,
+        callback,
+        initial_property_set,
+        kwargs,
+        *,
+        with_property_set,
+        profiler_options=None,
+    ):
+        with self._lock:
+            if self._executor is None and self._directory is not None:
+                raise PassManagerError("cannot run tasks on a pool that has been shut down")
+            executor = self._ensure_started()
+            digest, path = self._publish(pass_manager)
+            epoch = self._epoch
+        task = functools.partial(
+            _run_in_worker,
+            epoch=epoch,
+            digest=digest,
+            path=path,
+            callback_bin=dill.dumps(callback),
+            initial_property_set=initial_property_set,
+            kwargs=kwargs,
+            with_property_set=with_property_set,
+            profiler_options=profiler_options,
+        )
+        return executor, task
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes and remove the pool's scratch files.
+
+        The pool cannot be used after this method has been called.
+
+        Args:
+            wait: Whether to block until all pending work has finished.
+        """
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait)
+                self._executor = None
+            if self._directory is not None:
+                shutil.rmtree(self._directory, ignore_errors=True)
+            else:
+                # Mark as shut down, even if it was never started.
+                self._directory = ""
+            self._published.clear()
+            self._references.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    def __repr__(self):
+        return f"{type(self).__name__}(num_processes={self._num_processes})"
+
+
+def _release(lock, references, digest, path):
+    # This runs as a finalizer, so it must not hold a reference to the pool itself.  Any task that
+    # still needs the file is running on behalf of a live pass manager, which holds a reference.
+    with lock:
+        if references[digest] > 1:
+            references[digest] -= 1
+            return
+        del references[digest]
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            # The pool has already been shut down.
+            pass
+
+
+# Worker-process state.  These are only populated inside the pool's worker processes.
+_WORKER_PASS_MANAGERS = collections.OrderedDict()
+_WORKER_MAX_CACHED = 1
+_WORKER_EPOCH = 0
+
+
+def _initialize_worker(max_cached: int) -> None:
+    global _WORKER_MAX_CACHED  # pylint: disable=global-statement
+
+    # This isn't a user-set variable; we set this so that the workers don't try to launch their
+    # own parallel pools.
+    os.environ["QISKIT_IN_PARALLEL"] = _IN_PARALLEL_FORBID_PARALLELISM
+    _WORKER_MAX_CACHED = max_cached
+
+
+def _load_pass_manager(epoch: int, digest: str, path: str) -> BasePassManager:
+    global _WORKER_EPOCH  # pylint: disable=global-statement
+
+    if epoch != _WORKER_EPOCH:
+        _WORKER_PASS_MANAGERS.clear()
+        _WORKER_EPOCH = epoch
+    if (pass_manager := _WORKER_PASS_MANAGERS.get(digest)) is not None:
+        _WORKER_PASS_MANAGERS.move_to_end(digest)
+        return pass_manager
+    with open(path, "rb") as fptr:
+        pass_manager = dill.load(fptr)
+    _WORKER_PASS_MANAGERS[digest] = pass_manager
+    while len(_WORKER_PASS_MANAGERS) > _WORKER_MAX_CACHED:
+        _WORKER_PASS_MANAGERS.popitem(last=False)
+    return pass_manager
+
+
+def _run_in_worker(
+    program: Any,
+    *,
+    epoch: int,
+    digest: str,
+    path: str,
+    callback_bin: bytes,
+    initial_property_set: dict[str, object] | None,
+    kwargs: dict[str, Any],
+    with_property_set: bool,
+    profiler_options: dict[str, Any] | None,
+) -> Any:
+    pass_manager = _load_pass_manager(epoch, digest, path)
+    profiler = None if profiler_options is None else PassProfiler(**profiler_options)
+    out_program = _run_workflow(
+        program=program,
+        pass_manager=pass_manager,
+        callback=dill.loads(callback_bin),
+        initial_property_set=initial_property_set,
+        profiler=profiler,
+        **kwargs,
+    )
+    if with_property_set:
+        return out_program, pass_manager.property_set
+    if profiler is not None:
+        return out_program, profiler.records
+    return out_program
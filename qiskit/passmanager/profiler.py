@@ -0,0 +1,327 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Per-pass profiling of pass manager runs."""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import operator
+import os
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+from .base_tasks import BaseController, GenericPass, Task
+from .exceptions import PassManagerError
+
+
+@dataclasses.dataclass(frozen=True)
+class PassRecord:
+    """The measurements of a single execution of a pass, as recorded by a :class:`PassProfiler`."""
+
+    program_index: int
+    """The index of the input program in the call to :meth:`.BasePassManager.run`."""
+    name: str
+    """The name of the pass."""
+    stage: str | None
+    """The name of the stage of a :class:`.StagedPassManager` that the pass belongs to, if any."""
+    count: int
+    """The index of this pass execution within the compilation of its program."""
+    start: float
+    """The wall-clock time at which the pass started, in seconds since the epoch."""
+    duration: float
+    """The wall-clock time the pass took to run, in seconds."""
+    memory_delta: int | None
+    """The change in memory allocated on the Python heap over the pass, in bytes, or ``None`` if
+    memory was not tracked."""
+    size_before: int | None
+    """The number of operations in the program before the pass, if the pass manager reports it."""
+    size_after: int | None
+    """The number of operations in the program after the pass, if the pass manager reports it."""
+    num_2q_before: int | None
+    """The number of two-qubit operations in the program before the pass, if the pass manager
+    reports it."""
+    num_2q_after: int | None
+    """The number of two-qubit operations in the program after the pass, if the pass manager
+    reports it."""
+    process_id: int
+    """The identifier of the process that ran the pass."""
+
+
+class PassProfiler:
+    """A recorder of the time, memory and program-size changes of each pass execution in a pass
+    manager run.
+
+    Pass a profiler as the ``profiler`` argument of :meth:`.BasePassManager.run` (or
+    :func:`.transpile`) to record one :class:`PassRecord` per pass execution, including each
+    iteration of passes inside loops such as :class:`.DoWhileController`.  When multiple programs are
+    compiled in parallel, the records of each worker process are sent back and merged, so the
+    profiler always sees every program::
+
+        from qiskit import transpile
+        from qiskit.passmanager import PassProfiler
+
+        profiler = PassProfiler()
+        transpile(circuits, backend, profiler=profiler)
+        print(profiler.table(by="stage"))
+        profiler.write_chrome_trace("transpile.json")
+
+    The same profiler can be used for several runs, in which case its records accumulate.
+
+    Memory deltas are measured with :mod:`tracemalloc`, which is started for the duration of each
+    run if it is not already tracing.  This only covers memory allocated through the Python
+    allocator, and slows down Python-heavy passes noticeably; pass ``track_memory=False`` if only
+    timings are needed.
+    """
+
+    def __init__(self, *, track_memory: bool = True):
+        """
+        Args:
+            track_memory: Whether to measure the change in allocated memory over each pass.
+        """
+        self._track_memory = track_memory
+        self._lock = threading.Lock()
+        self._records = []
+
+    @property
+    def track_memory(self) -> bool:
+        """Whether this profiler measures the change in allocated memory over each pass."""
+        return self._track_memory
+
+    @property
+    def records(self) -> list[PassRecord]:
+        """All the records of pass executions, in the order they were received."""
+        return list(self._records)
+
+    def clear(self) -> None:
+        """Discard all records."""
+        with self._lock:
+            self._records.clear()
+
+    def summary(self, by: str = "pass") -> list[dict[str, Any]]:
+        """Aggregate the records into totals per pass name or per stage.
+
+        Args:
+            by: Either ``"pass"`` to group records by the name of the pass, or ``"stage"`` to group
+                them by the stage they ran in.  Records with no stage are grouped under ``None``.
+
+        Returns:
+            One dictionary per group, in the order each group was first seen, with the keys
+            ``"name"``, ``"calls"``, ``"time"`` (total seconds), ``"memory_delta"`` (total bytes,
+            or ``None``), ``"size_delta"`` and ``"num_2q_delta"`` (the total change in the number
+            of operations and two-qubit operations, or ``None``).
+
+        Raises:
+            PassManagerError: if ``by`` is not a known grouping.
+        """
+        if by == "pass":
+            group_of = operator.attrgetter("name")
+        elif by == "stage":
+            group_of = operator.attrgetter("stage")
+        else:
+            raise PassManagerError(f"unknown profile grouping '{by}'; use 'pass' or 'stage'")
+        groups = {}
+        for record in self.records:
+            group = groups.setdefault(
+                group_of(record),
+                {
+                    "name": group_of(record),
+                    "calls": 0,
+                    "time": 0.0,
+                    "memory_delta": None,
+                    "size_delta": None,
+                    "num_2q_delta": None,
+                },
+            )
+            group["calls"] += 1
+            group["time"] += record.duration
+            group["memory_delta"] = _add_optional(group["memory_delta"], record.memory_delta)
+            group["size_delta"] = _add_optional(
+                group["size_delta"], _difference(record.size_after, record.size_before)
+            )
+            group["num_2q_delta"] = _add_optional(
+                group["num_2q_delta"], _difference(record.num_2q_after, record.num_2q_before)
+            )
+        return list(groups.values())
+
+    def table(self, by: str = "pass") -> str:
+        """Format :meth:`summary` as a human-readable table, sorted by decreasing total time.
+
+        Args:
+            by: The grouping to use, as for :meth:`summary`.
+
+        Returns:
+            The table, as a multi-line string.
+        """
+        header = (by, "calls", "time (ms)", "memory (KiB)", "size change", "2q change")
+        rows = [
+            (
+                str(group["name"]),
+                str(group["calls"]),
+                f"{group['time'] * 1000:.3f}",
+                "-" if group["memory_delta"] is None else f"{group['memory_delta'] / 1024:.1f}",
+                "-" if group["size_delta"] is None else f"{group['size_delta']:+d}",
+                "-" if group["num_2q_delta"] is None else f"{group['num_2q_delta']:+d}",
+            )
+            for group in sorted(self.summary(by), key=lambda group: group["time"], reverse=True)
+        ]
+        widths = [max(len(row[i]) for row in (header, *rows)) for i in range(len(header))]
+        lines = [
+            "  ".join(
+                cell.ljust(width) if i == 0 else cell.rjust(width)
+                for i, (cell, width) in enumerate(zip(row, widths))
+            )
+            for row in (header, *rows)
+        ]
+        lines.insert(1, "  ".join("-" * width for width in widths))
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """Convert the records to the Chrome trace-event format.
+
+        Each pass execution becomes a complete event, with one track per process and program, which
+        can be loaded into ``chrome://tracing`` or `Perfetto <https://ui.perfetto.dev>`__.
+
+        Returns:
+            A JSON-serializable dictionary.
+        """
+        events = []
+        for record in self.records:
+            events.append(
+                {
+                    "name": record.name,
+                    "cat": record.stage or "pass",
+                    "ph": "X",
+                    "ts": record.start * 1e6,
+                    "dur": record.duration * 1e6,
+                    "pid": record.process_id,
+                    "tid": record.program_index,
+                    "args": {
+                        "count": record.count,
+                        "memory_delta": record.memory_delta,
+                        "size_before": record.size_before,
+                        "size_after": record.size_after,
+                        "num_2q_before": record.num_2q_before,
+                        "num_2q_after": record.num_2q_after,
+                    },
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, file: str | os.PathLike) -> None:
+        """Write the records to a file in the Chrome trace-event format.
+
+        Args:
+            file: The path to write the JSON trace to.
+        """
+        with open(file, "w", encoding="utf-8") as fptr:
+            json.dump(self.chrome_trace(), fptr)
+
+    def _options(self) -> dict[str, Any]:
+        return {"track_memory": self._track_memory}
+
+    def _merge(self, records: Iterable[PassRecord], program_index: int) -> None:
+        records = [dataclasses.replace(record, program_index=program_index) for record in records]
+        with self._lock:
+            self._records.extend(records)
+
+    def _start_workflow(self, pass_manager, passmanager_ir, callback: Callable | None):
+        return _WorkflowRecorder(self, pass_manager, passmanager_ir, callback)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(records={len(self._records)})"
+
+
+class _WorkflowRecorder:
+    """The pass-manager callback that records the executions of a single workflow."""
+
+    def __init__(self, profiler, pass_manager, passmanager_ir, callback):
+        self._profiler = profiler
+        self._pass_manager = pass_manager
+        self._callback = callback
+        self._stages = pass_manager._profile_stages()
+        self._records = []
+        self._started_tracing = profiler.track_memory and not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+        self._size, self._num_2q = pass_manager._profile_metrics(passmanager_ir)
+        self._memory = self._current_memory()
+
+    def _current_memory(self):
+        if not self._profiler.track_memory:
+            return None
+        return tracemalloc.get_traced_memory()[0]
+
+    def __call__(self, *, task, passmanager_ir, property_set, running_time, count):
+        memory = self._current_memory()
+        size, num_2q = self._pass_manager._profile_metrics(passmanager_ir)
+        self._records.append(
+            PassRecord(
+                program_index=0,
+                name=task.name(),
+                stage=self._stages.get(id(task)),
+                count=count,
+                start=time.time() - running_time,
+                duration=running_time,
+                memory_delta=None if memory is None else memory - self._memory,
+                size_before=self._size,
+                size_after=size,
+                num_2q_before=self._num_2q,
+                num_2q_after=num_2q,
+                process_id=os.getpid(),
+            )
+        )
+        self._size, self._num_2q = size, num_2q
+        if self._callback is not None:
+            self._callback(
+                task=task,
+                passmanager_ir=passmanager_ir,
+                property_set=property_set,
+                running_time=running_time,
+                count=count,
+            )
+        # Measure the baseline for the next pass last, so our own bookkeeping isn't counted.
+        self._memory = self._current_memory()
+
+    def finish(self, program_index: int) -> None:
+        """Stop measuring, and send the records to the profiler."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        self._profiler._merge(self._records, program_index)
+
+
+def _iter_passes(tasks: Iterable[Task]) -> Iterator[GenericPass]:
+    """Iterate over every pass in a collection of tasks, including those nested inside flow
+    controllers and those required by other passes."""
+    for task in tasks:
+        if isinstance(task, BaseController):
+            yield from _iter_passes(getattr(task, "tasks", ()))
+        elif isinstance(task, GenericPass):
+            yield from _iter_passes(task.requires)
+            yield task
+
+
+def _add_optional(total, value):
+    if value is None:
+        return total
+    return value if total is None else total + value
+
+
+def _difference(after, before):
+    if after is None or before is None:
+        return None
+    return after - before
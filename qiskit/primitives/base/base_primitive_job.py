@@ -13,8 +13,10 @@
 Primitive job abstract base class
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, Union
+from collections.abc import Generator
+from typing import Any, Generic, TypeVar, Union
 
 from ..containers import PrimitiveResult
 from .base_result_v1 import _BasePrimitiveResultV1
@@ -24,7 +26,15 @@ StatusT = TypeVar("StatusT")
 
 
 class BasePrimitiveJob(ABC, Generic[ResultT, StatusT]):
-    """Primitive job abstract base class."""
+    """Primitive job abstract base class.
+
+    Jobs are awaitable, so that :mod:`asyncio` code can wait for the result of a job without
+    blocking the event loop::
+
+        result = await sampler.run(pubs)
+
+    If the awaiting task is cancelled, the job is cancelled with :meth:`cancel`.
+    """
 
     def __init__(self, job_id: str, **kwargs) -> None:
         """Initializes the primitive job.
@@ -76,3 +86,18 @@ class BasePrimitiveJob(ABC, Generic[ResultT, StatusT]):
     def cancel(self):
         """Attempt to cancel the job."""
         raise NotImplementedError("Subclass of BasePrimitiveJob must implement `cancel` method.")
+
+    def __await__(self) -> Generator[Any, None, ResultT]:
+        return self._result_async().__await__()
+
+    async def _result_async(self) -> ResultT:
+        """Wait for the result of the job without blocking the event loop.
+
+        The default implementation waits for :meth:`result` in a helper thread.  Subclasses that
+        can wait for completion natively should override this.
+        """
+        try:
+            return await asyncio.to_thread(self.result)
+        except asyncio.CancelledError:
+            self.cancel()
+            raise
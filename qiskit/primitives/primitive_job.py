@@ -13,6 +13,7 @@
 Job for the reference implementations of Primitives V1 and V2.
 """
 
+import asyncio
 import uuid
 from concurrent.futures import ThreadPoolExecutor
 
@@ -65,6 +66,13 @@ class PrimitiveJob(BasePrimitiveJob[ResultT, JobStatus]):
             self._result = self._future.result()
         return self._result
 
+    async def _result_async(self) -> ResultT:
+        if self._result is None:
+            self._check_submitted()
+            # Cancelling the wrapping future also cancels the job's own future.
+            await asyncio.wrap_future(self._future)
+        return self.result()
+
     def status(self) -> JobStatus:
         if self._status is None:
             self._check_submitted()
@@ -120,6 +120,7 @@ Two-Qubit Synthesis
    XXDecomposer
    TwoQubitWeylDecomposition
    TwoQubitControlledUDecomposer
+   TwoQubitSequenceBatch
 
 .. autofunction:: two_qubit_cnot_decompose
 
@@ -225,6 +226,7 @@ from .two_qubit.two_qubit_decompose import (
     two_qubit_cnot_decompose,
     TwoQubitWeylDecomposition,
     TwoQubitControlledUDecomposer,
+    TwoQubitSequenceBatch,
 )
 from .multi_controlled import (
     synth_mcmt_vchain,
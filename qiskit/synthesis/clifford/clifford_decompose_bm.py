@@ -26,6 +26,13 @@ def synth_clifford_bm(clifford: Clifford) -> QuantumCircuit:
     """Optimal CX-cost decomposition of a :class:`.Clifford` operator on 2 qubits
     or 3 qubits into a :class:`.QuantumCircuit` based on the Bravyi-Maslov method [1].
 
+    The syntheses are looked up in tables, so that Cliffords that recur, for example after
+    :class:`.CollectCliffords`, are only synthesized once.  The tables hold one synthesis for each
+    symplectic matrix up to permutations of the qubits, and the phases of the Clifford are set by
+    a layer of Pauli gates at the start of the circuit.  The table for 2-qubit Cliffords is
+    generated in full the first time it is used, and the entries of the table for 3-qubit
+    Cliffords the first time each is needed.
+
     Args:
         clifford: A Clifford operator.
 
@@ -14,6 +14,8 @@
 
 from __future__ import annotations
 
+import os
+import struct
 import typing
 import warnings
 import numpy as np
@@ -29,6 +31,9 @@ from qiskit._accelerate.synthesis.discrete_basis import (
 if typing.TYPE_CHECKING:
     from qiskit.dagcircuit import DAGCircuit
 
+_TABLE_MAGIC = b"QKSKBA01"
+_TABLE_HEADER = struct.Struct("<8sQQQ")
+
 
 class SolovayKitaevDecomposition:
     """The Solovay Kitaev discrete decomposition algorithm.
@@ -51,7 +56,8 @@ class SolovayKitaevDecomposition:
                 of discrete gates. At each iteration this algorithm, the remaining error is
                 approximated with the closest sequence of gates in this set.
                 If a ``str``, this specifies a filename from which to load the
-                approximation. If a ``dict``, then this contains
+                approximation; files written by :meth:`save_basic_approximation_table` are
+                memory-mapped rather than read. If a ``dict``, then this contains
                 ``{gates: effective_SO3_matrix}`` pairs,
                 e.g. ``{"h t": np.array([[0, 0.7071, -0.7071], [0, -0.7071, -0.7071], [-1, 0, 0]]}``.
                 If a list, this contains the same information as the dict, but already converted to
@@ -79,9 +85,12 @@ class SolovayKitaevDecomposition:
         else:
             # Fast Rust path to load the file
             if isinstance(basic_approximations, str) and basic_approximations[~3:] != ".npy":
-                self._sk = RustSolovayKitaevSynthesis.from_basic_approximations(
-                    basic_approximations, True
-                )
+                if _is_table(basic_approximations):
+                    self._sk = _load_table(basic_approximations, True)
+                else:
+                    self._sk = RustSolovayKitaevSynthesis.from_basic_approximations(
+                        basic_approximations, True
+                    )
             else:
                 sequences = self.load_basic_approximations(basic_approximations)
                 self._sk = RustSolovayKitaevSynthesis.from_sequences(sequences, True)
@@ -192,6 +201,27 @@ class SolovayKitaevDecomposition:
             )
         self._sk.save_basic_approximations(filename)
 
+    def save_basic_approximation_table(self, filename: str | os.PathLike):
+        """Save the basic approximations into a table file that can be memory-mapped.
+
+        Loading a table with the class initializer does not read or rebuild the approximations:
+        the file is memory-mapped read-only and searched in place, through a k-d tree over the
+        SO(3) matrices that is stored in the file.  Loading is therefore immediate, and all the
+        processes that load the same table, such as the workers of a parallel
+        :func:`.transpile`, share one copy of it in memory::
+
+            sk = SolovayKitaevDecomposition(basis_gates=["h", "t", "tdg"], depth=16)
+            sk.save_basic_approximation_table("h_t_tdg_16.table")
+
+            new_sk = SolovayKitaevDecomposition("h_t_tdg_16.table")
+
+        The file is written atomically, so processes can safely load it while it is replaced.
+
+        Args:
+            filename: The filename to store the table in.
+        """
+        self._sk.save_basic_approximation_table(filename)
+
     def run(
         self,
         gate_matrix: np.ndarray | Gate,
@@ -263,6 +293,45 @@ class SolovayKitaevDecomposition:
         return self._sk.find_basic_approximation(sequence)
 
 
+def _is_table(filename: str) -> bool:
+    with open(filename, "rb") as file:
+        return file.read(len(_TABLE_MAGIC)) == _TABLE_MAGIC
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    # The table is little-endian, so big-endian hosts need a native copy.
+    if not array.dtype.isnative:
+        array = array.astype(array.dtype.newbyteorder("="))
+    array.flags.writeable = False
+    return array
+
+
+def _load_table(filename: str, check_input: bool) -> RustSolovayKitaevSynthesis:
+    with open(filename, "rb") as file:
+        header = file.read(_TABLE_HEADER.size)
+    if len(header) != _TABLE_HEADER.size:
+        raise ValueError(f"'{filename}' is too short to be a basic-approximation table")
+    _, num_sequences, num_gates, _ = _TABLE_HEADER.unpack(header)
+
+    def memmap(dtype, offset, shape):
+        return _read_only(np.memmap(filename, dtype=dtype, mode="r", offset=offset, shape=shape))
+
+    offset = _TABLE_HEADER.size
+    matrices = memmap("<f8", offset, (num_sequences, 9))
+    offset += 8 * 9 * num_sequences
+    phases = memmap("<f8", offset, (num_sequences,))
+    offset += 8 * num_sequences
+    partition = memmap("<u8", offset, (num_sequences + 1,))
+    offset += 8 * (num_sequences + 1)
+    splits = memmap("u1", offset, (num_sequences,))
+    offset += num_sequences
+    # A zero-length memory map is an error, so a table of empty sequences is made directly.
+    gates = memmap("u1", offset, (num_gates,)) if num_gates else _read_only(np.zeros(0, np.uint8))
+    return RustSolovayKitaevSynthesis.from_basic_approximation_table(
+        matrices, phases, partition, splits, gates, check_input
+    )
+
+
 def normalize_gates(gates: list[Gate | str]) -> list[Gate]:
     """Normalize a list[Gate | str] into list[Gate]."""
     name_to_gate = get_standard_gate_name_mapping()
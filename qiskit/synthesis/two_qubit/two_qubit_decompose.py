@@ -27,7 +27,7 @@ from __future__ import annotations
 import io
 import base64
 import warnings
-from typing import Optional, Type, TYPE_CHECKING
+from typing import NamedTuple, Optional, Type, TYPE_CHECKING
 
 import logging
 
@@ -102,6 +102,13 @@ def decompose_two_qubit_product_gate(special_unitary_matrix: np.ndarray):
     return (L, R, phase)
 
 
+def _as_unitary_batch(unitaries) -> np.ndarray:
+    unitaries = np.asarray(unitaries, dtype=complex)
+    if unitaries.ndim != 3 or unitaries.shape[1:] != (4, 4):
+        raise ValueError(f"expected an array of shape (N, 4, 4), not {unitaries.shape}")
+    return unitaries
+
+
 class TwoQubitWeylDecomposition:
     r"""Two-qubit Weyl decomposition.
 
@@ -191,6 +198,29 @@ class TwoQubitWeylDecomposition:
                     self.calculated_fidelity - actual_fidelity,
                 )
 
+    @staticmethod
+    def batch_coordinates(
+        unitaries: np.ndarray, fidelity: float | None = 1.0 - 1.0e-9
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Compute the Weyl coordinates of a stack of two-qubit unitaries.
+
+        The decompositions are computed in parallel, without creating a
+        :class:`.TwoQubitWeylDecomposition` for each unitary.
+
+        Args:
+            unitaries: a complex array of shape ``(N, 4, 4)``.
+            fidelity: the fidelity used to specialize each decomposition, as in the constructor.
+
+        Returns:
+            An ``(N, 3)`` array whose rows are the coordinates ``(a, b, c)`` of each unitary, and
+            an ``(N,)`` array of the global phases of the decompositions.
+
+        Raises:
+            ValueError: if ``unitaries`` does not have shape ``(N, 4, 4)``.
+        """
+        unitaries = _as_unitary_batch(unitaries)
+        return two_qubit_decompose.weyl_decomposition_batch(unitaries, fidelity=fidelity)
+
     @deprecate_func(since="1.1.0", removal_timeline="in the 2.0.0 release")
     def specialize(self):
         """Make changes to the decomposition to comply with any specializations.
@@ -317,10 +347,81 @@ class TwoQubitControlledUDecomposer:
         return QuantumCircuit._from_circuit_data(circ_data, legacy_qubits=True)
 
 
+class TwoQubitSequenceBatch:
+    """The packed result of :meth:`.TwoQubitBasisDecomposer.decompose_batch`.
+
+    The gates of every decomposition are stored in flat arrays.  The gates of unitary ``i`` are
+    the rows ``offsets[i]:offsets[i + 1]`` of ``gates``, ``qubits`` and ``params``.  Indexing the
+    batch builds the :class:`.QuantumCircuit` of a single decomposition.
+
+    Attributes:
+        names (list[str]): the names of the gates used in the decompositions.
+        gates (np.ndarray): the gate of each row, as an index into ``names``.
+        qubits (np.ndarray): an array of shape ``(M, 2)`` of the qubits of each gate, padded with
+            ``-1`` for single-qubit gates.
+        params (np.ndarray): an array of shape ``(M, 3)`` of the parameters of each gate, padded
+            with NaN.
+        offsets (np.ndarray): an array of shape ``(N + 1,)`` of the first row of each
+            decomposition.
+        global_phases (np.ndarray): an array of shape ``(N,)`` of the global phase of each
+            decomposition.
+    """
+
+    def __init__(self, basis_gate, names, gates, qubits, params, offsets, global_phases):
+        self._basis_gate = basis_gate
+        self.names = names
+        self.gates = gates
+        self.qubits = qubits
+        self.params = params
+        self.offsets = offsets
+        self.global_phases = global_phases
+
+    def __len__(self):
+        return len(self.global_phases)
+
+    def __getitem__(self, index) -> QuantumCircuit:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"index {index} out of range for {len(self)} decompositions")
+        circuit = QuantumCircuit(2, global_phase=float(self.global_phases[index]))
+        for row in range(self.offsets[index], self.offsets[index + 1]):
+            name = self.names[self.gates[row]]
+            if name == self._basis_gate.name:
+                gate = self._basis_gate
+            else:
+                params = self.params[row]
+                gate = GATE_NAME_MAP[name](*(float(x) for x in params[~np.isnan(params)]))
+            qubits = [circuit.qubits[q] for q in self.qubits[row] if q >= 0]
+            circuit._append(gate, qubits, ())
+        return circuit
+
+
+class DecompositionCacheInfo(NamedTuple):
+    """Statistics of the cache shared by all :class:`.TwoQubitBasisDecomposer` instances."""
+
+    hits: int
+    """The number of decompositions that reused a cached skeleton."""
+    misses: int
+    """The number of decompositions that built a new skeleton."""
+    max_size: int
+    """The maximum number of skeletons kept in the cache."""
+    current_size: int
+    """The number of skeletons currently in the cache."""
+
+
 class TwoQubitBasisDecomposer:
     """A class for decomposing 2-qubit unitaries into minimal number of uses of a 2-qubit
     basis gate.
 
+    The interior of a decomposition, which is the number of basis gates together with every
+    application of the basis gate and the single-qubit gates between them, depends only on the
+    Weyl-chamber coordinates of the target.  These are kept in a bounded least-recently-used cache
+    that is shared by all instances with the same ``gate`` and ``euler_basis``, keyed on the
+    coordinates, the basis fidelity and ``_num_basis_uses``.  When a repeated block is synthesized
+    only its outermost single-qubit layers are recomputed.  The cache is managed with
+    :meth:`cache_info`, :meth:`cache_clear` and :meth:`set_cache_size`.
+
     Args:
         gate: Two-qubit gate to be used in the KAK decomposition.
         basis_fidelity: Fidelity to be assumed for applications of KAK Gate. Defaults to ``1.0``.
@@ -337,6 +438,32 @@ class TwoQubitBasisDecomposer:
     .. automethod:: __call__
     """
 
+    @staticmethod
+    def cache_info() -> DecompositionCacheInfo:
+        """Return the statistics of the decomposition cache shared by all instances."""
+        return DecompositionCacheInfo(*two_qubit_decompose.skeleton_cache_info())
+
+    @staticmethod
+    def cache_clear():
+        """Remove every entry from the shared decomposition cache and reset its statistics."""
+        two_qubit_decompose.skeleton_cache_clear()
+
+    @staticmethod
+    def set_cache_size(max_size: int):
+        """Set the maximum number of entries in the shared decomposition cache.
+
+        The least recently used entries are evicted if the cache is larger than the new size.
+
+        Args:
+            max_size: the new maximum size.  A size of ``0`` disables the cache.
+
+        Raises:
+            ValueError: if ``max_size`` is negative.
+        """
+        if max_size < 0:
+            raise ValueError(f"cache size must be non-negative, not {max_size}")
+        two_qubit_decompose.skeleton_cache_set_size(max_size)
+
     def __init__(
         self,
         gate: Gate,
@@ -469,6 +596,35 @@ class TwoQubitBasisDecomposer:
             )
             return QuantumCircuit._from_circuit_data(circ_data, legacy_qubits=True)
 
+    def decompose_batch(
+        self,
+        unitaries: np.ndarray,
+        basis_fidelity: float | None = None,
+        approximate: bool = True,
+    ) -> TwoQubitSequenceBatch:
+        r"""Decompose a stack of two-qubit unitaries.
+
+        This is equivalent to calling this decomposer on each unitary in turn, but the
+        decompositions are computed in parallel and returned in a packed form, without creating
+        a circuit for each of them.
+
+        Args:
+            unitaries: a complex array of shape ``(N, 4, 4)``.
+            basis_fidelity: Fidelity to be assumed for applications of KAK Gate.
+                If given, overrides ``basis_fidelity`` given at init.
+            approximate: Approximates if basis fidelities are less than 1.0.
+
+        Returns:
+            The packed decompositions.
+
+        Raises:
+            ValueError: if ``unitaries`` does not have shape ``(N, 4, 4)``.
+            QiskitError: if ``pulse_optimize`` is True but we don't know how to do it.
+        """
+        unitaries = _as_unitary_batch(unitaries)
+        packed = self._inner_decomposer.decompose_batch(unitaries, basis_fidelity, approximate)
+        return TwoQubitSequenceBatch(self.gate, *packed)
+
     def traces(self, target):
         r"""
         Give the expected traces :math:`\Big\vert\text{Tr}(U \cdot U_\text{target}^{\dag})\Big\vert`
@@ -503,6 +659,10 @@ class _LazyTwoQubitCXDecomposer(TwoQubitBasisDecomposer):
         self._load()
         return self._inner.traces(target)
 
+    def decompose_batch(self, *args, **kwargs):
+        self._load()
+        return self._inner.decompose_batch(*args, **kwargs)
+
     def decomp1(self, target):
         self._load()
         return self._inner.decomp1(target)
@@ -1476,6 +1476,25 @@ Pass Manager Definition
    PassManager
    PassManagerConfig
    generate_preset_pass_manager
+   TranspileCache
+
+Ensembles of Pass Managers
+--------------------------
+
+.. autosummary::
+   :toctree: ../stubs/
+
+   EnsemblePassManager
+   EnsembleResult
+   EnsembleCandidate
+
+Binding Transpiled Parametric Circuits
+--------------------------------------
+
+.. autosummary::
+   :toctree: ../stubs/
+
+   CompiledParametricCircuit
 
 Layout and Topology
 -------------------
@@ -1486,6 +1505,8 @@ Layout and Topology
    Layout
    CouplingMap
    TranspileLayout
+   NLayout
+   RoutingTable
 
 Scheduling
 ----------
@@ -1547,10 +1568,14 @@ from .exceptions import (
 )
 from .basepasses import AnalysisPass, TransformationPass
 from .coupling import CouplingMap
-from .layout import Layout, TranspileLayout
+from .layout import Layout, TranspileLayout, NLayout
 from .instruction_durations import InstructionDurations
 from .preset_passmanagers import generate_preset_pass_manager
 from .target import Target
 from .target import InstructionProperties
 from .target import QubitProperties
+from .routing_table import RoutingTable
 from .optimization_metric import OptimizationMetric
+from .cache import TranspileCache
+from .ensemble import EnsemblePassManager, EnsembleResult, EnsembleCandidate
+from .parametric_circuit import CompiledParametricCircuit
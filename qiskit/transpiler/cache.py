@@ -0,0 +1,293 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Content-addressed cache of transpiled circuits."""
+
+from __future__ import annotations
+
+import collections
+import hashlib
+import io
+import logging
+import os
+import tempfile
+import threading
+import weakref
+
+import dill
+
+from qiskit.circuit import QuantumCircuit
+from qiskit.passmanager import BasePassManager
+from qiskit.passmanager.compilation_status import PropertySet
+from qiskit.version import __version__
+from .exceptions import TranspilerError
+
+logger = logging.getLogger(__name__)
+
+
+class TranspileCache:
+    """A content-addressed cache of transpiled circuits.
+
+    Each entry is keyed on a hash of the serialized structure of the input circuit (including any
+    bound parameter values, but not the values that unbound parameters might later take) and of the
+    complete configuration of the pass manager that compiled it.  The pass-manager configuration
+    includes the :class:`.Target`, the options and seeds given to each pass, and the version of
+    Qiskit, so a cached result is only returned if recompiling the same circuit with the same pass
+    manager would have been done with identical inputs.
+
+    Entries are held in an in-memory least-recently-used store, which is bounded by the total number
+    of instructions in the cached output circuits.  If a ``directory`` is given, entries are also
+    written there in :ref:`QPY format <qpy>`, and in-memory misses are looked up on disk, so that
+    the cache can persist across processes and sessions.
+
+    Use a cache by passing it as the ``cache`` argument to :meth:`.PassManager.run` or
+    :func:`.transpile`::
+
+        from qiskit import transpile
+        from qiskit.transpiler import TranspileCache
+
+        cache = TranspileCache(directory="~/.cache/qiskit-transpile")
+        isa_circuit = transpile(circuit, backend, seed_transpiler=2025, cache=cache)
+
+    .. note::
+
+        If the pass manager is not seeded (for example, ``seed_transpiler`` is not set in a call to
+        :func:`.transpile`), a cache hit will return the one valid output that was previously
+        computed, rather than a new randomized compilation.
+
+    Runs that use a ``callback`` or an initial ``property_set`` bypass the cache, since neither
+    can be reproduced from a cached output.  On a cache hit, the :attr:`.PassManager.property_set`
+    only contains the layout information that can be recovered from the output circuit's
+    :class:`.TranspileLayout`.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1_000_000,
+        directory: str | os.PathLike | None = None,
+    ):
+        """
+        Args:
+            max_size: The maximum total number of instructions across all the output circuits held
+                in memory.  The least-recently used entries are evicted first when this is
+                exceeded.  This does not limit the size of the on-disk store.
+            directory: If given, a directory in which to persist the cache in QPY format.  It is
+                created if it does not exist.
+
+        Raises:
+            TranspilerError: if ``max_size`` is negative.
+        """
+        if max_size < 0:
+            raise TranspilerError(f"cache size must be non-negative, not {max_size}")
+        self._max_size = max_size
+        self._directory = None
+        if directory is not None:
+            self._directory = os.path.abspath(os.path.expanduser(os.fspath(directory)))
+            os.makedirs(self._directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+        self._size = 0
+        self.hits = 0
+        """The number of successful lookups made in the cache."""
+        self.misses = 0
+        """The number of lookups made in the cache that found no entry."""
+
+    @property
+    def max_size(self) -> int:
+        """The maximum total number of instructions held in memory."""
+        return self._max_size
+
+    @property
+    def directory(self) -> str | None:
+        """The directory of the on-disk store, if any."""
+        return self._directory
+
+    def __len__(self):
+        return len(self._entries)
+
+    def key(self, pass_manager_fingerprint: str, circuit: QuantumCircuit) -> str | None:
+        """Calculate the cache key of a given input circuit.
+
+        Args:
+            pass_manager_fingerprint: The fingerprint of the pass manager that will be run, as
+                returned by :func:`pass_manager_fingerprint`.
+            circuit: The input circuit.
+
+        Returns:
+            The cache key, or ``None`` if the circuit cannot be serialized and so cannot be cached.
+        """
+        from qiskit import qpy
+
+        buffer = io.BytesIO()
+        try:
+            qpy.dump(circuit, buffer)
+        except Exception:  # pylint: disable=broad-except
+            # Anything QPY can't represent is simply not cacheable; this isn't an error.
+            logger.debug("Circuit '%s' is not serializable to QPY; not caching.", circuit.name)
+            return None
+        hasher = hashlib.sha256(pass_manager_fingerprint.encode("ascii"))
+        hasher.update(buffer.getbuffer())
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> QuantumCircuit | None:
+        """Look up a cached output circuit.
+
+        Args:
+            key: The cache key, as returned by :meth:`key`.
+
+        Returns:
+            A copy of the cached output circuit, or ``None`` if there is no entry for the key.
+        """
+        with self._lock:
+            if (circuit := self._entries.get(key)) is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return circuit.copy()
+        if (circuit := self._load(key)) is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+            self._insert(key, circuit)
+        return circuit.copy()
+
+    def put(self, key: str, circuit: QuantumCircuit) -> None:
+        """Add an output circuit to the cache.
+
+        Args:
+            key: The cache key of the input circuit, as returned by :meth:`key`.
+            circuit: The output circuit.  A copy is stored, so the caller may continue to modify
+                the given object.
+        """
+        circuit = circuit.copy()
+        with self._lock:
+            self._insert(key, circuit)
+        self._store(key, circuit)
+
+    def clear(self) -> None:
+        """Remove all in-memory entries.  The on-disk store, if any, is not modified."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _insert(self, key, circuit):
+        if (previous := self._entries.pop(key, None)) is not None:
+            self._size -= _entry_size(previous)
+        self._entries[key] = circuit
+        self._size += _entry_size(circuit)
+        while self._size > self._max_size and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= _entry_size(evicted)
+
+    def _path(self, key):
+        return os.path.join(self._directory, f"{key}.qpy")
+
+    def _load(self, key):
+        if self._directory is None:
+            return None
+        from qiskit import qpy
+
+        try:
+            with open(self._path(key), "rb") as fptr:
+                (circuit,) = qpy.load(fptr)
+        except FileNotFoundError:
+            return None
+        except Exception:  # pylint: disable=broad-except
+            # A corrupt or incompatible file is just a cache miss; it'll be overwritten.
+            logger.warning("Failed to load cached circuit from '%s'.", self._path(key))
+            return None
+        return circuit
+
+    def _store(self, key, circuit):
+        if self._directory is None:
+            return
+        from qiskit import qpy
+
+        # Write-then-rename so concurrent readers never see a partial file.
+        with tempfile.NamedTemporaryFile(dir=self._directory, delete=False) as fptr:
+            try:
+                qpy.dump(circuit, fptr)
+            except Exception:  # pylint: disable=broad-except
+                logger.warning("Failed to write cached circuit for key '%s'.", key)
+                written = False
+            else:
+                written = True
+        if written:
+            os.replace(fptr.name, self._path(key))
+        else:
+            os.remove(fptr.name)
+
+
+def _entry_size(circuit):
+    return len(circuit.data) + 1
+
+
+class _FingerprintPickler(dill.Pickler):
+    """A pickler that ignores run-time state attached to passes, and canonicalizes the order of
+    sets so the output does not depend on the process's hash seed."""
+
+    def persistent_id(self, obj):
+        # Passes keep a reference to the property set of their most recent run, but that's not
+        # part of their configuration.
+        if isinstance(obj, PropertySet):
+            return "PropertySet"
+        return None
+
+    def reducer_override(self, obj):
+        if type(obj) in (set, frozenset):
+            try:
+                return type(obj), (sorted(obj),)
+            except TypeError:
+                pass
+        return NotImplemented
+
+
+# Map of pass manager -> (tasks, fingerprint).  Passes can cache derived data on themselves while
+# running (for example, error maps built from the target), so the serialized form of a pass manager
+# that has been run differs from that of a fresh one.  We fingerprint each pass manager the first
+# time we see it, and keep that until its schedule changes.
+_FINGERPRINTS = weakref.WeakKeyDictionary()
+
+
+def pass_manager_fingerprint(pass_manager: BasePassManager) -> str | None:
+    """Calculate a fingerprint of the complete configuration of a pass manager.
+
+    Two pass managers with the same fingerprint, run on the same version of Qiskit, will produce the
+    same output for the same input.  The converse is not necessarily true.
+
+    The fingerprint of a given pass manager object is memoized until its schedule of tasks changes.
+    Modifying the options of a pass that is already scheduled in a pass manager is not detected.
+
+    Args:
+        pass_manager: The pass manager to fingerprint.
+
+    Returns:
+        A hexadecimal string, or ``None`` if the pass manager cannot be serialized.
+    """
+    tasks = tuple(pass_manager.to_flow_controller().tasks)
+    if (memo := _FINGERPRINTS.get(pass_manager)) is not None:
+        memo_tasks, fingerprint = memo
+        if len(memo_tasks) == len(tasks) and all(a is b for a, b in zip(memo_tasks, tasks)):
+            return fingerprint
+    buffer = io.BytesIO()
+    try:
+        _FingerprintPickler(buffer).dump(pass_manager)
+    except Exception:  # pylint: disable=broad-except
+        logger.debug("Pass manager is not serializable; not caching.")
+        fingerprint = None
+    else:
+        hasher = hashlib.sha256(__version__.encode("ascii"))
+        hasher.update(buffer.getbuffer())
+        fingerprint = hasher.hexdigest()
+    _FINGERPRINTS[pass_manager] = (tasks, fingerprint)
+    return fingerprint
@@ -22,9 +22,11 @@ onto a device with this coupling.
 import math
 from typing import List
 
+import numpy as np
 import rustworkx as rx
 from rustworkx.visualization import graphviz_draw
 
+from qiskit._accelerate.sabre import routing_table_distance
 from qiskit.transpiler.exceptions import CouplingError
 
 
@@ -169,11 +171,27 @@ class CouplingMap:
         but can be called if you're accessing the distance matrix outside of
         those or want to pre-generate it.
         """
+        if self._dist_matrix is None:
+            self._dist_matrix = self._routing_table_distance_matrix()
         if self._dist_matrix is None:
             self._dist_matrix = rx.digraph_distance_matrix(
                 self.graph, as_undirected=True, null_value=math.inf
             )
 
+    def _routing_table_distance_matrix(self):
+        """The distance matrix of a loaded :class:`.RoutingTable` of this coupling map, if any.
+
+        A table is only used if the coupling graph is connected, since the tables mark unconnected
+        pairs with NaN rather than ``inf``.
+        """
+        try:
+            distance = routing_table_distance(self.size(), self.get_edges())
+        except ValueError:
+            return None
+        if distance is None or np.isnan(distance).any():
+            return None
+        return distance
+
     def distance(self, physical_qubit1, physical_qubit2):
         """Returns the undirected distance between physical_qubit1 and physical_qubit2.
 
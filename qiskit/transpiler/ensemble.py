@@ -0,0 +1,285 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Best-of-many compilation with an ensemble of pass managers."""
+
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import dill
+
+from qiskit.circuit import QuantumCircuit
+from qiskit.converters import dag_to_circuit
+from qiskit.passmanager.base_tasks import PassManagerState
+from qiskit.passmanager.compilation_status import PropertySet, WorkflowStatus
+from qiskit.utils.parallel import parallel_map, should_run_in_parallel
+from .cache import pass_manager_fingerprint
+from .exceptions import TranspilerError
+from .optimization_metric import OptimizationMetric
+from .passmanager import PassManager, StagedPassManager
+
+
+@dataclasses.dataclass(frozen=True)
+class EnsembleCandidate:
+    """The metrics of the output of one member of an :class:`EnsemblePassManager`."""
+
+    label: Any
+    """The label of the pass manager that produced this candidate."""
+    cost: Any
+    """The cost of the output circuit, according to the metric of the ensemble.  Lower is better."""
+    num_2q: int
+    """The number of multi-qubit gates in the output circuit."""
+    depth: int
+    """The depth of the output circuit."""
+    size: int
+    """The total number of instructions in the output circuit."""
+
+
+@dataclasses.dataclass(frozen=True)
+class EnsembleResult:
+    """The result of compiling one circuit with an :class:`EnsemblePassManager`."""
+
+    circuit: QuantumCircuit
+    """The output circuit with the lowest cost."""
+    best: EnsembleCandidate
+    """The metrics of :attr:`circuit`."""
+    candidates: tuple[EnsembleCandidate, ...]
+    """The metrics of every member's output, including the best, in the order of the members of
+    the ensemble."""
+
+
+class EnsemblePassManager:
+    """Compile circuits with several pass managers, and keep the best output of each circuit.
+
+    Stochastic stages of the preset pass managers, such as :class:`.SabreLayout` and
+    :class:`.SabreSwap`, can give noticeably different results with different seeds.  An ensemble
+    runs every one of its member pass managers on each circuit, scores the outputs with a metric,
+    and returns the output with the lowest cost, along with the scores of all the others::
+
+        from qiskit.transpiler import EnsemblePassManager, generate_preset_pass_manager
+
+        ensemble = EnsemblePassManager(
+            [generate_preset_pass_manager(3, backend, seed_transpiler=seed) for seed in range(8)],
+            labels=range(8),
+        )
+        result = ensemble.run(circuit)
+        print(result.best.label, [candidate.cost for candidate in result.candidates])
+
+    When the members are :class:`.StagedPassManager` instances, the stages before ``split_stage``
+    (the ``init`` stage of the preset pass managers, by default) are only run once per circuit for
+    all the members whose stages up to that point are configured identically, and the remaining
+    stages of each member start from the shared output.  Configurations are compared in the same way
+    as the keys of a :class:`.TranspileCache`, so stages are only shared between members whose early
+    stages do not depend on their seed.
+
+    Both the shared stages and the member runs are distributed over worker processes with
+    :func:`.parallel_map`, so all the members and circuits are compiled in parallel at once.
+    """
+
+    def __init__(
+        self,
+        pass_managers: Sequence[PassManager],
+        *,
+        labels: Sequence[Any] | None = None,
+        metric: OptimizationMetric | Callable[[QuantumCircuit], Any] = OptimizationMetric.COUNT_2Q,
+        split_stage: str | None = "layout",
+    ):
+        """
+        Args:
+            pass_managers: The members of the ensemble.
+            labels: A label for each member, to identify it in the results.  Defaults to the index
+                of each member.
+            metric: How to score the output circuits.  :data:`.OptimizationMetric.COUNT_2Q` counts
+                the multi-qubit gates, and :data:`.OptimizationMetric.COUNT_T` counts the ``t`` and
+                ``tdg`` gates.  Alternatively, a callable that takes an output circuit and returns
+                an orderable cost.  In every case the lowest cost wins, and ties go to the member
+                that comes first.
+            split_stage: The first stage of each :class:`.StagedPassManager` member that is run
+                separately for every member.  If ``None``, or a member does not have this stage,
+                no stages of that member are shared.
+
+        Raises:
+            TranspilerError: if there are no members, or the number of labels does not match the
+                number of members.
+        """
+        if not pass_managers:
+            raise TranspilerError("An ensemble needs at least one pass manager.")
+        labels = list(range(len(pass_managers))) if labels is None else list(labels)
+        if len(labels) != len(pass_managers):
+            raise TranspilerError(
+                f"Got {len(labels)} labels for an ensemble of {len(pass_managers)} pass managers."
+            )
+        self._pass_managers = list(pass_managers)
+        self._labels = labels
+        self.metric = metric
+        self.split_stage = split_stage
+
+    @property
+    def pass_managers(self) -> list[PassManager]:
+        """The members of the ensemble."""
+        return list(self._pass_managers)
+
+    @property
+    def labels(self) -> list[Any]:
+        """The labels of the members of the ensemble."""
+        return list(self._labels)
+
+    def run(
+        self,
+        circuits: QuantumCircuit | list[QuantumCircuit],
+        num_processes: int | None = None,
+    ) -> EnsembleResult | list[EnsembleResult]:
+        """Compile circuits with every member of the ensemble, and select the best output of each.
+
+        Args:
+            circuits: The circuit or circuits to compile.
+            num_processes: The maximum number of parallel processes to launch, as for
+                :meth:`.PassManager.run`.
+
+        Returns:
+            An :class:`EnsembleResult` for each input circuit, in the same form as the input.
+        """
+        arg_circuits_list = isinstance(circuits, list)
+        circuits = circuits if arg_circuits_list else [circuits]
+        if not circuits:
+            return []
+
+        # Group the members by the configuration of their shared stages.
+        groups = {}
+        remainders = []
+        for index, pass_manager in enumerate(self._pass_managers):
+            shared, remainder = _split_stages(pass_manager, self.split_stage)
+            remainders.append(remainder)
+            if shared is None:
+                continue
+            key = pass_manager_fingerprint(shared)
+            groups.setdefault(index if key is None else key, (shared, []))[1].append(index)
+
+        shared_jobs = [(shared, circuit) for shared, _ in groups.values() for circuit in circuits]
+        shared_outputs = _map(_run_shared_stages, shared_jobs, num_processes)
+        starts = {}
+        for group_index, (_, members) in enumerate(groups.values()):
+            for circuit_index in range(len(circuits)):
+                start = shared_outputs[group_index * len(circuits) + circuit_index]
+                for member in members:
+                    starts[member, circuit_index] = start
+
+        member_jobs = [
+            (remainder, *starts.get((member, circuit_index), (circuit, None)))
+            for circuit_index, circuit in enumerate(circuits)
+            for member, remainder in enumerate(remainders)
+        ]
+        outputs = _map(_run_remaining_stages, member_jobs, num_processes)
+
+        results = []
+        num_members = len(self._pass_managers)
+        for circuit_index in range(len(circuits)):
+            circuit_outputs = outputs[
+                circuit_index * num_members : (circuit_index + 1) * num_members
+            ]
+            candidates = tuple(
+                EnsembleCandidate(
+                    label=label,
+                    cost=_cost(self.metric, output),
+                    num_2q=output.num_nonlocal_gates(),
+                    depth=output.depth(),
+                    size=output.size(),
+                )
+                for label, output in zip(self._labels, circuit_outputs)
+            )
+            best = min(range(num_members), key=lambda member: candidates[member].cost)
+            results.append(
+                EnsembleResult(
+                    circuit=circuit_outputs[best],
+                    best=candidates[best],
+                    candidates=candidates,
+                )
+            )
+        if arg_circuits_list:
+            return results
+        return results[0]
+
+
+def _split_stages(pass_manager, split_stage):
+    """Split a pass manager into the stages before ``split_stage`` and the rest, returning ``None``
+    for the first part if there is nothing to share."""
+    if (
+        split_stage is None
+        or not isinstance(pass_manager, StagedPassManager)
+        or split_stage not in pass_manager.stages
+    ):
+        return None, pass_manager
+    split = pass_manager.stages.index(split_stage)
+    if split == 0:
+        return None, pass_manager
+
+    def substages(stages):
+        return StagedPassManager(
+            stages,
+            **{
+                name: getattr(pass_manager, name)
+                for stage in stages
+                for name in (f"pre_{stage}", stage, f"post_{stage}")
+            },
+        )
+
+    return substages(pass_manager.stages[:split]), substages(pass_manager.stages[split:])
+
+
+def _run_shared_stages(pass_manager, circuit):
+    # This doesn't go through `PassManager.run`, since its conversion back to a circuit would
+    # canonicalize a `virtual_permutation_layout` into an initial layout, and the later stages
+    # would then skip layout selection.
+    pass_manager.property_set = PropertySet()
+    dag = pass_manager._passmanager_frontend(input_program=circuit)
+    dag, state = pass_manager.to_flow_controller().execute(
+        passmanager_ir=dag,
+        state=PassManagerState(
+            workflow_status=WorkflowStatus(), property_set=pass_manager.property_set
+        ),
+    )
+    return dag_to_circuit(dag, copy_operations=False), dict(state.property_set)
+
+
+def _run_remaining_stages(pass_manager, circuit, property_set):
+    return pass_manager.run(circuit, property_set=property_set)
+
+
+def _map(task, jobs, num_processes):
+    """Call ``task(pass_manager, *args)`` for each ``(pass_manager, *args)`` in ``jobs``, in
+    parallel if possible.  Each pass manager is only serialized once, however many jobs use it."""
+    if len(jobs) < 2 or not should_run_in_parallel(num_processes):
+        return [task(*job) for job in jobs]
+    serialized = {}
+    values = []
+    for pass_manager, *args in jobs:
+        if (pass_manager_bin := serialized.get(id(pass_manager))) is None:
+            pass_manager_bin = serialized[id(pass_manager)] = dill.dumps(pass_manager)
+        values.append((pass_manager_bin, *args))
+    return parallel_map(_run_in_new_process, values, (task,), num_processes=num_processes)
+
+
+def _run_in_new_process(job, task):
+    pass_manager_bin, *args = job
+    return task(dill.loads(pass_manager_bin), *args)
+
+
+def _cost(metric, circuit):
+    if metric is OptimizationMetric.COUNT_2Q:
+        return circuit.num_nonlocal_gates()
+    if metric is OptimizationMetric.COUNT_T:
+        ops = circuit.count_ops()
+        return ops.get("t", 0) + ops.get("tdg", 0)
+    return metric(circuit)
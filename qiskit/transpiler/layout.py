@@ -23,6 +23,7 @@ from typing import List, TYPE_CHECKING
 from dataclasses import dataclass
 
 from qiskit import circuit
+from qiskit._accelerate.nlayout import NLayout
 from qiskit.circuit import Qubit, QuantumRegister
 from qiskit.transpiler.exceptions import LayoutError
 from qiskit.converters import isinstanceint
@@ -696,6 +697,60 @@ class TranspileLayout:
             qubit_indices.append(qubit_idx)
         return qubit_indices
 
+    def initial_nlayout(self, filter_ancillas: bool = False) -> NLayout:
+        """Return the initial layout as an array-backed :class:`.NLayout`.
+
+        The virtual qubits of the returned layout are the positions of the qubits in the input
+        circuit, and its physical qubits are the positions in the output circuit, as in
+        :meth:`initial_index_layout`.  Unlike the list, the :class:`.NLayout` can map whole arrays
+        of qubit indices at once with :meth:`.NLayout.apply`.
+
+        Args:
+            filter_ancillas: If set to ``True`` any ancilla qubits added
+                to the transpiler will not be included in the output.
+
+        Returns:
+            The initial layout.
+        """
+        return NLayout.from_array(
+            self.initial_index_layout(filter_ancillas=filter_ancillas), len(self.initial_layout)
+        )
+
+    def routing_nlayout(self) -> NLayout:
+        """Return the permutation caused by routing as an array-backed :class:`.NLayout`.
+
+        This is the same permutation as :meth:`routing_permutation`.
+
+        Returns:
+            The routing permutation.
+        """
+        return NLayout.from_array(self.routing_permutation())
+
+    def final_nlayout(self, filter_ancillas: bool = True) -> NLayout:
+        """Return the final layout as an array-backed :class:`.NLayout`.
+
+        The virtual qubits of the returned layout are the positions of the qubits in the input
+        circuit, and its physical qubits are their final positions in the output circuit, as in
+        :meth:`final_index_layout`.  For example, to find the input-circuit qubits that were
+        measured at an array of output positions::
+
+            input_qubits = transpiled.layout.final_nlayout().inverse().apply(output_positions)
+
+        Args:
+            filter_ancillas: If set to ``False`` any ancillas allocated in the output circuit will be
+                included in the layout.
+
+        Returns:
+            The final layout.
+        """
+        if self._output_qubit_list is None:
+            num_physical_qubits = len(self.initial_layout)
+        else:
+            num_physical_qubits = len(self._output_qubit_list)
+        return NLayout.from_array(
+            self.final_index_layout(filter_ancillas=filter_ancillas), num_physical_qubits
+        )
+
     def final_virtual_layout(self, filter_ancillas: bool = True) -> Layout:
         """Generate the final layout as a :class:`.Layout` object.
 
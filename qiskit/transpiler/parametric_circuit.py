@@ -0,0 +1,335 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""A transpiled parametric circuit that can be bound to many parameter values at once."""
+
+from __future__ import annotations
+
+import math
+import operator
+import typing
+from collections.abc import Iterable
+
+import numpy as np
+
+from qiskit.circuit import (
+    ControlFlowOp,
+    Parameter,
+    ParameterExpression,
+    ParameterVector,
+    QuantumCircuit,
+)
+from qiskit.circuit.parameterexpression import OpCode
+from .exceptions import TranspilerError
+from .passes.optimization.optimize_1q_decomposition import Optimize1qGatesDecomposition
+from .passes.optimization.remove_identity_equiv import RemoveIdentityEquivalent
+from .passmanager import PassManager
+from .target import Target
+
+if typing.TYPE_CHECKING:
+    from qiskit.primitives.containers.bindings_array import BindingsArrayLike
+
+
+class CompiledParametricCircuit:
+    """A transpiled parametric circuit, prepared to be bound to many sets of parameter values.
+
+    When the transpiler compiles a parametric circuit, the parameters of the output circuit's gates
+    are generally expressions of the input parameters; for example, single-qubit gate fusion can
+    turn ``rz(θ)`` followed by ``rz(π/2)`` into ``rz(θ + π/2)``.  Binding such a circuit with
+    :meth:`.QuantumCircuit.assign_parameters` evaluates every expression symbolically, once per
+    binding.
+
+    This class analyses a transpiled circuit once, and records each parameterized gate argument
+    (and the global phase, if it is parameterized) as a numbered *slot* holding the expression for
+    its value.  For a whole :class:`.BindingsArray` of input values, the values of all the slots
+    are then calculated in one vectorized pass with :meth:`parameter_values`, and :meth:`bind`
+    uses them to emit the bound physical circuits::
+
+        from qiskit.transpiler import CompiledParametricCircuit
+
+        compiled = CompiledParametricCircuit.from_transpile(ansatz, backend, optimization_level=3)
+        values = compiled.parameter_values(bindings)  # shape: bindings.shape + (num_slots,)
+        isa_circuits = compiled.bind(bindings, optimize=True)
+
+    Identical expressions share a single slot.
+    """
+
+    def __init__(
+        self,
+        circuit: QuantumCircuit,
+        target: Target | None = None,
+        parameters: Iterable[Parameter] | None = None,
+    ):
+        """
+        Args:
+            circuit: The transpiled circuit.
+            target: The target the circuit was compiled for.  This is only needed to ``optimize``
+                the bound circuits in :meth:`bind`.
+            parameters: The input parameters that bindings are given for, in order.  This defaults
+                to the parameters of ``circuit``, but should be set to those of the circuit before
+                transpilation if the transpiler might have removed some of them.
+
+        Raises:
+            TranspilerError: if the circuit contains parameterized control flow.
+        """
+        self._circuit = circuit
+        self._target = target
+        self._parameters = tuple(circuit.parameters if parameters is None else parameters)
+        missing = set(circuit.parameters).difference(self._parameters)
+        if missing:
+            raise TranspilerError(
+                f"The circuit has parameters that are not inputs: {sorted(p.name for p in missing)}"
+            )
+
+        self._expressions = []
+        slot_of = {}
+
+        def slot(expression):
+            if (index := slot_of.get(expression)) is None:
+                index = slot_of[expression] = len(self._expressions)
+                self._expressions.append(expression)
+            return index
+
+        instructions = []
+        for instruction in circuit.data:
+            operation = instruction.operation
+            if isinstance(operation, ControlFlowOp):
+                if any(block.parameters for block in operation.blocks):
+                    raise TranspilerError(
+                        f"Parameterized control flow ('{operation.name}') is not supported."
+                    )
+                instructions.append((instruction, None))
+            elif any(_is_parametric(param) for param in operation.params):
+                slot_params = [
+                    slot(param) if _is_parametric(param) else None for param in operation.params
+                ]
+                instructions.append((instruction, slot_params))
+            else:
+                instructions.append((instruction, None))
+        global_phase_slot = (
+            slot(circuit.global_phase) if _is_parametric(circuit.global_phase) else None
+        )
+
+        # The slots are represented in the template by the elements of a single vector, so that
+        # binding them is a plain positional assignment.
+        slots = ParameterVector("_slot", len(self._expressions))
+        template = circuit.copy_empty_like()
+        template._layout = circuit._layout
+        for instruction, slot_params in instructions:
+            if slot_params is None:
+                template._append(instruction)
+                continue
+            operation = instruction.operation.copy()
+            operation.params = [
+                param if index is None else slots[index]
+                for param, index in zip(operation.params, slot_params)
+            ]
+            template._append(instruction.replace(operation=operation))
+        if global_phase_slot is not None:
+            template.global_phase = slots[global_phase_slot]
+        self._template = template
+
+    @classmethod
+    def from_transpile(
+        cls, circuit: QuantumCircuit, backend=None, **kwargs
+    ) -> CompiledParametricCircuit:
+        """Transpile a parametric circuit, and prepare the output for binding.
+
+        Args:
+            circuit: The circuit to transpile.
+            backend: The backend to compile for, as for :func:`.transpile`.
+            kwargs: Any other arguments to :func:`.transpile`.
+
+        Returns:
+            The compiled circuit, which accepts bindings for all the parameters of the input.
+        """
+        from qiskit.compiler import transpile
+
+        target = kwargs.get("target")
+        if target is None and backend is not None:
+            target = backend.target
+        return cls(
+            transpile(circuit, backend, **kwargs), target=target, parameters=circuit.parameters
+        )
+
+    @property
+    def circuit(self) -> QuantumCircuit:
+        """The transpiled circuit."""
+        return self._circuit
+
+    @property
+    def parameters(self) -> tuple[Parameter, ...]:
+        """The input parameters, in the order that array values are taken in."""
+        return self._parameters
+
+    @property
+    def num_slots(self) -> int:
+        """The number of distinct parameterized values in the circuit."""
+        return len(self._expressions)
+
+    @property
+    def slot_expressions(self) -> list[ParameterExpression]:
+        """The expression for the value of each slot, in terms of the input parameters."""
+        return list(self._expressions)
+
+    def parameter_values(self, bindings: BindingsArrayLike | np.ndarray) -> np.ndarray:
+        """Calculate the value of every slot for each set of input parameter values.
+
+        Args:
+            bindings: The input parameter values.  Either a :class:`.BindingsArray` (or anything
+                that can be coerced to one), or an array whose last axis is indexed in the same
+                order as :attr:`parameters`.
+
+        Returns:
+            An array of shape ``bindings.shape + (num_slots,)``.
+
+        Raises:
+            TranspilerError: if values are missing for some input parameters, or a slot's value is
+                not real.
+        """
+        inputs, shape = self._input_values(bindings)
+        values = np.empty(shape + (self.num_slots,), dtype=float)
+        for index, expression in enumerate(self._expressions):
+            value = _evaluate(expression, inputs)
+            if np.iscomplexobj(value):
+                value = np.real_if_close(value)
+                if np.iscomplexobj(value):
+                    raise TranspilerError(f"Expression '{expression}' has a complex value.")
+            values[..., index] = value
+        return values
+
+    def bind(
+        self, bindings: BindingsArrayLike | np.ndarray, *, optimize: bool = False
+    ) -> np.ndarray:
+        """Bind the circuit to each set of input parameter values.
+
+        Args:
+            bindings: The input parameter values, in any form accepted by :meth:`parameter_values`.
+            optimize: Whether to resynthesize single-qubit runs and remove gates that became
+                identities with the bound values, as the transpiler could have done if the values
+                had been known in advance.  This needs the :class:`.Target` to have been given.
+
+        Returns:
+            An object array of bound circuits, of the same shape as ``bindings``.
+
+        Raises:
+            TranspilerError: if ``optimize`` is set and there is no target.
+        """
+        if optimize and self._target is None:
+            raise TranspilerError("A target is needed to optimize the bound circuits.")
+        values = self.parameter_values(bindings)
+        flat_values = values.reshape(math.prod(values.shape[:-1]), self.num_slots)
+        circuits = [self._template.assign_parameters(row) for row in flat_values]
+        if optimize:
+            pass_manager = PassManager(
+                [
+                    Optimize1qGatesDecomposition(target=self._target),
+                    RemoveIdentityEquivalent(target=self._target),
+                ]
+            )
+            circuits = pass_manager.run(circuits)
+            for circuit in circuits:
+                circuit._layout = self._template.layout
+        out = np.empty(len(circuits), dtype=object)
+        out[:] = circuits
+        return out.reshape(values.shape[:-1])
+
+    def _input_values(self, bindings):
+        if isinstance(bindings, np.ndarray):
+            if bindings.shape[-1:] != (len(self._parameters),):
+                raise TranspilerError(
+                    f"Expected the last axis of the values to have length {len(self._parameters)},"
+                    f" but the array has shape {bindings.shape}."
+                )
+            return dict(zip(self._parameters, np.moveaxis(bindings, -1, 0))), bindings.shape[:-1]
+        from qiskit.primitives.containers.bindings_array import BindingsArray
+
+        bindings = BindingsArray.coerce(bindings)
+        columns = {}
+        for names, array in bindings.data.items():
+            for name, column in zip(names, np.moveaxis(array, -1, 0)):
+                columns[name] = column
+        missing = [param.name for param in self._parameters if param.name not in columns]
+        if missing:
+            raise TranspilerError(f"No values were given for the parameters {missing}.")
+        return {param: columns[param.name] for param in self._parameters}, bindings.shape
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}(name={self._circuit.name!r}, "
+            f"num_parameters={len(self._parameters)}, num_slots={self.num_slots})"
+        )
+
+
+def _is_parametric(value):
+    return isinstance(value, ParameterExpression) and bool(value.parameters)
+
+
+_BINARY = {
+    int(OpCode.ADD): operator.add,
+    int(OpCode.SUB): operator.sub,
+    int(OpCode.MUL): operator.mul,
+    int(OpCode.DIV): operator.truediv,
+    int(OpCode.POW): operator.pow,
+    int(OpCode.RSUB): lambda lhs, rhs: rhs - lhs,
+    int(OpCode.RDIV): lambda lhs, rhs: rhs / lhs,
+    int(OpCode.RPOW): lambda lhs, rhs: rhs**lhs,
+}
+
+_UNARY = {
+    int(OpCode.SIN): np.sin,
+    int(OpCode.COS): np.cos,
+    int(OpCode.TAN): np.tan,
+    int(OpCode.ASIN): np.arcsin,
+    int(OpCode.ACOS): np.arccos,
+    int(OpCode.ATAN): np.arctan,
+    int(OpCode.EXP): np.exp,
+    int(OpCode.LOG): np.log,
+    int(OpCode.SIGN): np.sign,
+    int(OpCode.CONJ): np.conj,
+    int(OpCode.ABS): np.abs,
+}
+
+
+def _evaluate(expression, inputs):
+    """Evaluate a parameter expression over arrays of values of its parameters."""
+    if not expression.parameters:
+        return expression.numeric()
+    if expression.is_symbol():
+        return inputs[next(iter(expression.parameters))]
+    # Replay the expression's operations on the arrays, in the same way as `sympify` does.
+    stack = []
+    for instruction in expression._qpy_replay:
+        for operand in (instruction.lhs, instruction.rhs):
+            if operand is not None:
+                if isinstance(operand, ParameterExpression):
+                    operand = _evaluate(operand, inputs)
+                stack.append(operand)
+        if (function := _BINARY.get(int(instruction.op))) is not None:
+            rhs = stack.pop()
+            lhs = stack.pop()
+            stack.append(function(lhs, rhs))
+        elif (function := _UNARY.get(int(instruction.op))) is not None:
+            stack.append(function(stack.pop()))
+        else:
+            return _evaluate_pointwise(expression, inputs)
+    return stack.pop()
+
+
+def _evaluate_pointwise(expression, inputs):
+    parameters = list(expression.parameters)
+    arrays = np.broadcast_arrays(*(inputs[parameter] for parameter in parameters))
+    out = np.empty(arrays[0].shape, dtype=complex)
+    for index in np.ndindex(out.shape):
+        bound = expression.bind({p: array[index] for p, array in zip(parameters, arrays)})
+        out[index] = complex(bound.numeric())
+    return out
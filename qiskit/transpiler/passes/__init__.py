@@ -29,6 +29,7 @@ Layout Selection (Placement)
    SabreLayout
    CSPLayout
    VF2Layout
+   VF2LayoutCache
    ApplyLayout
    Layout2qDistance
    EnlargeWithAncilla
@@ -197,6 +198,7 @@ from .layout import DenseLayout
 from .layout import SabreLayout
 from .layout import CSPLayout
 from .layout import VF2Layout
+from .layout import VF2LayoutCache
 from .layout import VF2PostLayout
 from .layout import ApplyLayout
 from .layout import Layout2qDistance
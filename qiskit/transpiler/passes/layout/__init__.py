@@ -17,7 +17,7 @@ from .trivial_layout import TrivialLayout
 from .dense_layout import DenseLayout
 from .sabre_layout import SabreLayout
 from .csp_layout import CSPLayout
-from .vf2_layout import VF2Layout
+from .vf2_layout import VF2Layout, VF2LayoutCache
 from .vf2_post_layout import VF2PostLayout
 from .apply_layout import ApplyLayout
 from .layout_2q_distance import Layout2qDistance
@@ -20,11 +20,11 @@ import random
 from qiskit.transpiler.layout import Layout
 from qiskit.transpiler.basepasses import AnalysisPass
 from qiskit.transpiler.exceptions import TranspilerError
-from qiskit.utils import optionals as _optionals
+from qiskit.transpiler.passes.layout import vf2_utils
 from qiskit.transpiler.target import Target
+from qiskit._accelerate.csp_layout import csp_layout_pass
 
 
-@_optionals.HAS_CONSTRAINT.require_in_instance
 class CSPLayout(AnalysisPass):
     """If possible, chooses a Layout as a CSP, using backtracking."""
 
@@ -35,9 +35,17 @@ class CSPLayout(AnalysisPass):
         seed=None,
         call_limit=1000,
         time_limit=10,
+        *,
+        initial_layout=None,
+        max_trials=None,
     ):
         """If possible, chooses a Layout as a CSP, using backtracking.
 
+        Each virtual qubit is a variable whose domain is the physical qubits, and each pair of
+        qubits that a two-qubit operation acts on is constrained to be mapped to an edge of the
+        coupling map.  Operations on more than two qubits are ignored.  The problem is solved natively by a backtracking search that uses the same
+        machinery as :class:`.VF2Layout`.
+
         If not possible, does not set the layout property. In all the cases,
         the property `CSPLayout_stop_reason` will be added with one of the
         following values:
@@ -47,16 +55,26 @@ class CSPLayout(AnalysisPass):
         * call limit reached: If no perfect layout was found and the call limit was reached.
         * time limit reached: If no perfect layout was found and the time limit was reached.
 
+        If ``coupling_map`` is a :class:`.Target`, or there is an :class:`.ErrorMap` in the
+        ``vf2_avg_error_map`` field of the property set, the search does not stop at the first
+        solution.  It continues looking for layouts with a lower average error, pruning every
+        partial assignment whose error is already no better than the best layout so far, until
+        ``max_trials`` layouts have been found or a limit is reached.
+
         Args:
             coupling_map (Union[CouplingMap, Target]): Directed graph representing a coupling map.
             strict_direction (bool): If True, considers the direction of the coupling map.
                                      Default is False.
-            seed (int): Sets the seed of the PRNG.
-            call_limit (int): Amount of times that
-                ``constraint.RecursiveBacktrackingSolver.recursiveBacktracking`` will be called.
-                None means no call limit. Default: 1000.
-            time_limit (int): Amount of seconds that the pass will try to find a solution.
+            seed (int): Sets the seed of the PRNG that orders the search over physical qubits.
+            call_limit (int): Amount of times that the partial assignment of virtual qubits can
+                be extended.  None means no call limit. Default: 1000.
+            time_limit (float): Amount of seconds that the pass will try to find a solution.
                 None means no time limit. Default: 10 seconds.
+            initial_layout (Layout): A partial layout of qubits that are pre-assigned.  Virtual
+                qubits in this layout can only be mapped to their given physical qubit.
+            max_trials (int): The maximum number of layouts to find when searching for a layout
+                with lower error.  0 means no limit, and None (the default) chooses a limit
+                based on the sizes of the interaction graph and the coupling map.
         """
         super().__init__()
         if isinstance(coupling_map, Target):
@@ -70,6 +88,8 @@ class CSPLayout(AnalysisPass):
         self.call_limit = call_limit
         self.time_limit = time_limit
         self.seed = seed
+        self.initial_layout = initial_layout
+        self.max_trials = max_trials
 
     def run(self, dag):
         """run the layout method"""
@@ -78,54 +98,37 @@ class CSPLayout(AnalysisPass):
                 "Coupling Map is disjoint, this pass can't be used with a disconnected coupling "
                 "map."
             )
-        qubits = dag.qubits
-        cxs = set()
-
-        from constraint import Problem, AllDifferentConstraint, RecursiveBacktrackingSolver
-        from qiskit.transpiler.passes.layout._csp_custom_solver import CustomSolver
-
-        for gate in dag.two_qubit_ops():
-            cxs.add((qubits.index(gate.qargs[0]), qubits.index(gate.qargs[1])))
-        edges = set(self.coupling_map.get_edges())
-
-        if self.time_limit is None and self.call_limit is None:
-            solver = RecursiveBacktrackingSolver()
-        else:
-            solver = CustomSolver(call_limit=self.call_limit, time_limit=self.time_limit)
-
-        variables = list(range(len(qubits)))
-        variable_domains = list(self.coupling_map.physical_qubits)
-        random.Random(self.seed).shuffle(variable_domains)
-
-        problem = Problem(solver)
-        problem.addVariables(variables, variable_domains)
-        problem.addConstraint(AllDifferentConstraint())  # each wire is map to a single qubit
-
-        if self.strict_direction:
-
-            def constraint(control, target):
-                return (control, target) in edges
-
-        else:
-
-            def constraint(control, target):
-                return (control, target) in edges or (target, control) in edges
-
-        for pair in cxs:
-            problem.addConstraint(constraint, [pair[0], pair[1]])
-
-        solution = problem.getSolution()
-
-        if solution is None:
-            stop_reason = "nonexistent solution"
-            if isinstance(solver, CustomSolver):
-                if solver.time_current is not None and solver.time_current >= self.time_limit:
-                    stop_reason = "time limit reached"
-                elif solver.call_current is not None and solver.call_current >= self.call_limit:
-                    stop_reason = "call limit reached"
+        fixed = None
+        if self.initial_layout is not None:
+            fixed = {
+                dag.find_bit(virtual).index: physical
+                for virtual, physical in self.initial_layout.get_virtual_bits().items()
+                if virtual in dag.qubits
+            }
+        error_map = self.property_set["vf2_avg_error_map"]
+        if error_map is None and self.target is not None:
+            error_map = vf2_utils.build_average_error_map(self.target, None)
+        if self.seed is None or self.seed < 0:
+            # The solver takes a `u64` seed; `random` turns anything else into one.
+            seed = random.Random(self.seed).randrange(1 << 64)
         else:
-            stop_reason = "solution found"
-            self.property_set["layout"] = Layout({v: qubits[k] for k, v in solution.items()})
+            seed = self.seed
+        solution, stop_reason = csp_layout_pass(
+            dag,
+            self.coupling_map.size(),
+            self.coupling_map.get_edges(),
+            strict_direction=self.strict_direction,
+            fixed=fixed,
+            call_limit=self.call_limit,
+            time_limit=self.time_limit,
+            max_trials=self.max_trials,
+            avg_error_map=error_map,
+            shuffle_seed=seed,
+        )
+
+        if solution is not None:
+            qubits = dag.qubits
+            self.property_set["layout"] = Layout({qubits[k]: v for k, v in solution.items()})
             for reg in dag.qregs.values():
                 self.property_set["layout"].add_register(reg)
 
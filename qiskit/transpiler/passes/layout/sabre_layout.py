@@ -90,6 +90,10 @@ class SabreLayout(TransformationPass):
     ``final_layout`` (:class:`.Layout`)
         A permutation of how swaps have been applied to the input qubits at the end of the circuit.
 
+    ``sabre_layout_trials_completed`` (``int``)
+        The number of layout trials that were run to completion.  This is less than the number
+        requested if the ``time_limit`` ran out.
+
     **References:**
 
     [1] Henry Zou and Matthew Treinish and Kevin Hartman and Alexander Ivrii and Jake Lishman.
@@ -109,6 +113,7 @@ class SabreLayout(TransformationPass):
         swap_trials=None,
         layout_trials=None,
         skip_routing=False,
+        time_limit=None,
     ):
         """SabreLayout initializer.
 
@@ -147,6 +152,13 @@ class SabreLayout(TransformationPass):
                 will be set in the property set. This is a tradeoff to run custom
                 routing with multiple layout trials, as using this option will cause
                 SabreLayout to run the routing stage internally but not use that result.
+            time_limit (float): A wall-clock budget for the layout and routing trials, in seconds.
+                Trials that have not started when the time runs out are skipped, and the best of
+                the completed trials is used; the first trial always runs to completion, so the
+                pass may overrun the budget by the time of one trial.  The number of completed
+                trials depends on the speed of the machine, so the output is only reproducible for
+                a fixed ``seed`` if this is ``None`` (the default).  This has no effect if
+                ``routing_pass`` is set.
 
         Raises:
             TranspilerError: If both ``routing_pass`` and ``swap_trials`` or
@@ -178,6 +190,7 @@ class SabreLayout(TransformationPass):
         self.swap_trials = default_num_processes() if swap_trials is None else swap_trials
         self.layout_trials = default_num_processes() if layout_trials is None else layout_trials
         self.skip_routing = skip_routing
+        self.time_limit = time_limit
 
     @property
     def coupling_map(self):  # pylint: disable=missing-function-docstring
@@ -271,7 +284,7 @@ class SabreLayout(TransformationPass):
         )
         sabre_start = time.perf_counter()
         # If `skip_routing`, then `out_dag` and `final` are meaningless but well-typed.
-        out_dag, initial, final = sabre_layout_and_routing(
+        out_dag, initial, final, trials_completed = sabre_layout_and_routing(
             dag,
             self.target,
             heuristic,
@@ -281,12 +294,14 @@ class SabreLayout(TransformationPass):
             seed=self.seed,
             partial_layouts=starting_layouts,
             skip_routing=self.skip_routing,
+            time_limit=self.time_limit,
         )
         sabre_stop = time.perf_counter()
         logger.debug(
             "Sabre layout algorithm execution for all components complete in: %s sec.",
             sabre_stop - sabre_start,
         )
+        self.property_set["sabre_layout_trials_completed"] = trials_completed
 
         if self.skip_routing:
             virtuals = list(dag.qubits)
@@ -20,7 +20,7 @@ from qiskit.transpiler.layout import Layout
 from qiskit.transpiler.basepasses import AnalysisPass
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.transpiler.passes.layout import vf2_utils
-from qiskit._accelerate.vf2_layout import vf2_layout_pass, MultiQEncountered
+from qiskit._accelerate.vf2_layout import vf2_layout_pass, MultiQEncountered, VF2LayoutCache
 
 
 class VF2LayoutStopReason(Enum):
@@ -77,6 +77,7 @@ class VF2Layout(AnalysisPass):
         time_limit=None,
         max_trials=None,
         target=None,
+        cache=None,
     ):
         """Initialize a ``VF2Layout`` pass instance
 
@@ -99,6 +100,12 @@ class VF2Layout(AnalysisPass):
                 of ``target`` models an ideal backend without any constraints then the value of
                 ``coupling_map``
                 will be used.
+            cache (VF2LayoutCache): A cache of search results, which can be shared between pass
+                instances, and between processes if it is backed by a file.  If the circuit's
+                interaction graph, the connectivity and error rates of the target, and the
+                arguments that affect the search all match a previous search, the result of
+                that search is reused without searching again.  If ``seed`` is ``None``, the
+                coupling graph is not shuffled when there is a cache.
 
         Raises:
             TypeError: At runtime, if neither ``coupling_map`` or ``target`` are provided.
@@ -111,6 +118,7 @@ class VF2Layout(AnalysisPass):
         self.call_limit = call_limit
         self.time_limit = time_limit
         self.max_trials = max_trials
+        self.cache = cache
         self.avg_error_map = None
 
     def run(self, dag):
@@ -131,8 +139,9 @@ class VF2Layout(AnalysisPass):
             else:
                 target = self.target
         self.avg_error_map = self.property_set["vf2_avg_error_map"]
-        if self.seed == -1:
-            # Happy path of no shuffling.
+        if self.seed == -1 or (self.seed is None and self.cache is not None):
+            # Happy path of no shuffling.  A cache only helps if equal problems have equal keys,
+            # so an unset seed doesn't draw a fresh shuffle each run when there is one.
             seed = None
         elif self.seed is None or self.seed < -1:
             # `seed is None` is OS entropy, `seed < -1` is a bad value (most pRNGs we're
@@ -151,6 +160,7 @@ class VF2Layout(AnalysisPass):
                 max_trials=self.max_trials,
                 avg_error_map=self.avg_error_map,
                 shuffle_seed=seed,
+                cache=self.cache,
             )
         except MultiQEncountered:
             self.property_set["VF2Layout_stop_reason"] = VF2LayoutStopReason.MORE_THAN_2Q
@@ -13,6 +13,8 @@
 """Replace each block of consecutive gates by a single Unitary node."""
 from __future__ import annotations
 
+import uuid
+
 from qiskit.synthesis.two_qubit import TwoQubitBasisDecomposer, TwoQubitControlledUDecomposer
 from qiskit.circuit.library.standard_gates import (
     CXGate,
@@ -75,6 +77,8 @@ class ConsolidateBlocks(TransformationPass):
         basis_gates=None,
         approximation_degree=1.0,
         target=None,
+        *,
+        track_changes=False,
     ):
         """ConsolidateBlocks initializer.
 
@@ -88,8 +92,13 @@ class ConsolidateBlocks(TransformationPass):
             basis_gates (List(str)): Basis gates from which to choose a KAK gate.
             approximation_degree (float): a float between :math:`[0.0, 1.0]`. Lower approximates more.
             target (Target): The target object for the compilation target backend.
+            track_changes (bool): If ``True``, record a checkpoint in the DAG after each run, and
+                on later runs of this pass instance over the same DAG only consider the blocks
+                that contain nodes added or modified since.  This has no effect when the blocks
+                are given by a previous pass.
         """
         super().__init__()
+        self._checkpoint = f"{type(self).__name__}-{uuid.uuid4().hex}" if track_changes else None
         self.basis_gates = None
         self.basis_gate_name = None
         # Bypass target if it doesn't contain any basis gates (i.e. it's a _FakeTarget), as this
@@ -152,6 +161,7 @@ class ConsolidateBlocks(TransformationPass):
             blocks=blocks,
             runs=runs,
             qubit_map=self._qubit_map,
+            checkpoint=self._checkpoint,
         )
         dag = self._handle_control_flow_ops(dag)
 
@@ -14,6 +14,7 @@
 
 import logging
 import math
+import uuid
 
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.transpiler.passes.utils import control_flow
@@ -69,7 +70,7 @@ class Optimize1qGatesDecomposition(TransformationPass):
      Error is computed as a multiplication of the errors of individual gates on that qubit.
     """
 
-    def __init__(self, basis=None, target=None):
+    def __init__(self, basis=None, target=None, *, track_changes=False):
         """Optimize1qGatesDecomposition initializer.
 
         Args:
@@ -78,8 +79,13 @@ class Optimize1qGatesDecomposition(TransformationPass):
                 and the Euler basis. Ignored if ``target`` is also specified.
             target (Optional[Target]): The :class:`~.Target` object corresponding to the compilation
                 target. When specified, any argument specified for ``basis_gates`` is ignored.
+            track_changes (bool): If ``True``, record a checkpoint in the DAG after each run, and
+                on later runs of this pass instance over the same DAG only resynthesize the runs
+                that contain nodes added or modified since.  This is intended for passes inside an
+                optimization loop, where most of the circuit is unchanged between iterations.
         """
         super().__init__()
+        self._checkpoint = f"{type(self).__name__}-{uuid.uuid4().hex}" if track_changes else None
 
         if basis and len(basis) > 0:
             self._basis_gates = set(basis)
@@ -213,6 +219,7 @@ class Optimize1qGatesDecomposition(TransformationPass):
             target=self._target,
             global_decomposers=self._global_decomposers,
             basis_gates=self._basis_gates,
+            checkpoint=self._checkpoint,
         )
         return dag
 
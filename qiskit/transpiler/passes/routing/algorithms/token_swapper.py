@@ -28,11 +28,13 @@
 
 from __future__ import annotations
 import logging
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 
 import numpy as np
 import rustworkx as rx
 
+from qiskit._accelerate.token_swapper import TokenSwapper
+
 from .types import Swap, Permutation
 from .util import PermutationCircuit, permutation_circuit
 
@@ -43,7 +45,8 @@ logger = logging.getLogger(__name__)
 class ApproximateTokenSwapper:
     """A class for computing approximate solutions to the Token Swapping problem.
 
-    Internally caches the graph and associated datastructures for re-use.
+    Internally caches the graph and associated datastructures for re-use.  The search itself is
+    native, and :meth:`map_batch` routes many mappings on the same graph in parallel.
     """
 
     def __init__(self, graph: rx.PyGraph, seed: int | np.random.Generator | None = None) -> None:
@@ -54,15 +57,22 @@ class ApproximateTokenSwapper:
             seed: Seed to use for random trials.
         """
         self.graph = graph
-        self.shortest_paths = rx.graph_distance_matrix(graph)
+        num_qubits = max(graph.node_indices(), default=-1) + 1
+        self._swapper = TokenSwapper(num_qubits, list(graph.edge_list()))
         if isinstance(seed, np.random.Generator):
             self.seed = seed
         else:
             self.seed = np.random.default_rng(seed)
 
+    @property
+    def shortest_paths(self) -> np.ndarray:
+        """The distance matrix of `graph`, with 0 for pairs of nodes that are not connected."""
+        return np.nan_to_num(self._swapper.distance_matrix(), nan=0.0)
+
     def distance(self, vertex0: int, vertex1: int) -> int:
         """Compute the distance between two nodes in `graph`."""
-        return self.shortest_paths[vertex0, vertex1]
+        distance = self._swapper.distance(vertex0, vertex1)
+        return 0 if distance is None else distance
 
     def permutation_circuit(self, permutation: Permutation, trials: int = 4) -> PermutationCircuit:
         """Perform an approximately optimal Token Swapping algorithm to implement the permutation.
@@ -98,8 +108,28 @@ class ApproximateTokenSwapper:
 
         Returns:
           The swaps to implement the mapping
+
+        Raises:
+          rustworkx.InvalidMapping: if some token has no path to its destination.
+        """
+        # The native solver takes an integer seed, so draw one from the generator.
+        seed = int(self.seed.integers(1, 10000))
+        return self._swapper.map(dict(mapping), trials, seed, parallel_threshold)
+
+    def map_batch(
+        self, mappings: Sequence[Mapping[int, int]], trials: int = 4
+    ) -> list[list[Swap[int]]]:
+        """Find the swaps that implement each of several mappings on `graph`.
+
+        This is equivalent to calling :meth:`map` on each mapping, except that the mappings are
+        routed in parallel and share a single draw from the random number generator.
+
+        Args:
+          mappings: The partial mappings to implement in swaps.
+          trials: The number of trials to try to perform each mapping. Minimize over the trials.
+
+        Returns:
+          The swaps to implement each mapping, in order.
         """
-        # Since integer seed is used in rustworkx, take random integer from np.random.randint
-        # and use that for the seed.
-        seed = self.seed.integers(1, 10000)
-        return rx.graph_token_swapper(self.graph, mapping, trials, seed, parallel_threshold)
+        seed = int(self.seed.integers(1, 10000))
+        return self._swapper.map_batch([dict(mapping) for mapping in mappings], trials, seed)
@@ -12,9 +12,9 @@
 
 """A swap strategy pass for blocks of commuting gates."""
 from __future__ import annotations
-from collections import defaultdict
 
-from qiskit.circuit import Gate, QuantumCircuit, Qubit
+from qiskit.circuit import QuantumCircuit, Qubit
+from qiskit.circuit.library import SwapGate
 from qiskit.converters import circuit_to_dag
 from qiskit.dagcircuit import DAGCircuit, DAGOpNode
 from qiskit.transpiler.basepasses import TransformationPass
@@ -24,6 +24,7 @@ from qiskit.transpiler.passes.routing.commuting_2q_gate_routing.swap_strategy im
 from qiskit.transpiler.passes.routing.commuting_2q_gate_routing.commuting_2q_block import (
     Commuting2qBlock,
 )
+from qiskit._accelerate.commuting_2q_router import route_commuting_2q_block
 
 
 class Commuting2qGateRouter(TransformationPass):
@@ -222,91 +223,15 @@ class Commuting2qGateRouter(TransformationPass):
         # Re-initialize the node accumulator
         return new_dag.copy_empty_like()
 
-    def _position_in_cmap(self, dag: DAGCircuit, j: int, k: int, layout: Layout) -> tuple[int, ...]:
-        """A helper function to track the movement of virtual qubits through the swaps.
-
-        Args:
-            j: The index of decision variable j (i.e. virtual qubit).
-            k: The index of decision variable k (i.e. virtual qubit).
-            layout: The current layout that takes into account previous swap gates.
-
-        Returns:
-            The position in the coupling map of the virtual qubits j and k as a tuple.
-        """
-        bit0 = dag.find_bit(layout.get_physical_bits()[j]).index
-        bit1 = dag.find_bit(layout.get_physical_bits()[k]).index
-
-        return bit0, bit1
-
-    def _build_sub_layers(
-        self, current_layer: dict[tuple[int, int], Gate]
-    ) -> list[dict[tuple[int, int], Gate]]:
-        """A helper method to build-up sets of gates to simultaneously apply.
-
-        This is done with an edge coloring if the ``edge_coloring`` init argument was given or with
-        a greedy algorithm if not. With an edge coloring all gates on edges with the same color
-        will be applied simultaneously. These sublayers are applied in the order of their color,
-        which is an int, in increasing color order.
-
-        Args:
-            current_layer: All gates in the current layer can be applied given the qubit ordering
-                of the current layout. However, not all gates in the current layer can be applied
-                simultaneously. This function creates sub-layers by building up sub-layers
-                of gates. All gates in a sub-layer can simultaneously be applied given the coupling
-                map and current qubit configuration.
-
-        Returns:
-             A list of gate dicts that can be applied. The gates a position 0 are applied first.
-             A gate dict has the qubit tuple as key and the gate to apply as value.
-        """
-        if self._edge_coloring is not None:
-            return self._edge_coloring_build_sub_layers(current_layer)
-        else:
-            return self._greedy_build_sub_layers(current_layer)
-
-    def _edge_coloring_build_sub_layers(
-        self, current_layer: dict[tuple[int, int], Gate]
-    ) -> list[dict[tuple[int, int], Gate]]:
-        """The edge coloring method of building sub-layers of commuting gates."""
-        sub_layers: list[dict[tuple[int, int], Gate]] = [
-            {} for _ in set(self._edge_coloring.values())
-        ]
-        for edge, gate in current_layer.items():
-            color = self._edge_coloring[edge]
-            sub_layers[color][edge] = gate
-
-        return sub_layers
-
-    @staticmethod
-    def _greedy_build_sub_layers(
-        current_layer: dict[tuple[int, int], Gate],
-    ) -> list[dict[tuple[int, int], Gate]]:
-        """The greedy method of building sub-layers of commuting gates."""
-        sub_layers = []
-        while len(current_layer) > 0:
-            current_sub_layer, remaining_gates = {}, {}
-            blocked_vertices: set[tuple] = set()
-
-            for edge, evo_gate in current_layer.items():
-                if blocked_vertices.isdisjoint(edge):
-                    current_sub_layer[edge] = evo_gate
-
-                    # A vertex becomes blocked once a gate is applied to it.
-                    blocked_vertices = blocked_vertices.union(edge)
-                else:
-                    remaining_gates[edge] = evo_gate
-
-            current_layer = remaining_gates
-            sub_layers.append(current_sub_layer)
-
-        return sub_layers
-
     def swap_decompose(
         self, dag: DAGCircuit, node: DAGOpNode, current_layout: Layout, swap_strategy: SwapStrategy
     ) -> DAGCircuit:
         """Take an instance of :class:`.Commuting2qBlock` and map it to the coupling map.
 
-        The mapping is done with the swap strategy.
+        The mapping is done with the swap strategy.  The whole block is routed natively in one
+        call: each gate is placed after the number of swap layers at which its qubits become
+        adjacent, and the gates of each layer are grouped into sub-layers of simultaneous gates,
+        either by the ``edge_coloring`` or greedily.
 
         Args:
             dag: The dag which contains the :class:`.Commuting2qBlock` we route.
@@ -319,60 +244,27 @@ class Commuting2qGateRouter(TransformationPass):
             A dag that is compatible with the coupling map where swap gates have been added
             to map the gates in the :class:`.Commuting2qBlock` to the hardware.
         """
-        trivial_layout = Layout.generate_trivial_layout(*dag.qregs.values())
-        gate_layers = self._make_op_layers(dag, node.op, current_layout, swap_strategy)
-
-        # Iterate over and apply gate layers
-        max_distance = max(gate_layers.keys())
+        sub_nodes = list(node.op.node_block)
+        gates = [
+            (dag.find_bit(sub_node.qargs[0]).index, dag.find_bit(sub_node.qargs[1]).index)
+            for sub_node in sub_nodes
+        ]
+        virtual_bits = current_layout.get_virtual_bits()
+        layout = [virtual_bits[qubit] for qubit in dag.qubits]
+        tables = swap_strategy._tables  # pylint: disable=protected-access
+        routed = route_commuting_2q_block(tables, gates, layout, self._edge_coloring)
 
         circuit_with_swap = QuantumCircuit(len(dag.qubits))
-
-        for i in range(max_distance + 1):
-            # Get current layer and replace the problem indices j,k by the corresponding
-            # positions in the coupling map. The current layer corresponds
-            # to all the gates that can be applied at the ith swap layer.
-            current_layer = {}
-            for (j, k), local_gate in gate_layers.get(i, {}).items():
-                current_layer[self._position_in_cmap(dag, j, k, current_layout)] = local_gate
-
-            # Not all gates that are applied at the ith swap layer can be applied at the same
-            # time. We therefore greedily build sub-layers.
-            sub_layers = self._build_sub_layers(current_layer)
-
-            # Apply sub-layers
-            for sublayer in sub_layers:
-                for edge, local_gate in sublayer.items():
-                    circuit_with_swap.append(local_gate, edge)
-
-            # Apply SWAP gates
-            if i < max_distance:
-                for swap in swap_strategy.swap_layer(i):
-                    (j, k) = [trivial_layout.get_physical_bits()[vertex] for vertex in swap]
-
-                    circuit_with_swap.swap(j, k)
-                    current_layout.swap(j, k)
+        qubits = circuit_with_swap.qubits
+        for index, j, k in routed:
+            if index is None:
+                circuit_with_swap._append(SwapGate(), (qubits[j], qubits[k]), ())
+                current_layout.swap(dag.qubits[j], dag.qubits[k])
+            else:
+                circuit_with_swap._append(sub_nodes[index].op, (qubits[j], qubits[k]), ())
 
         return circuit_to_dag(circuit_with_swap)
 
-    def _make_op_layers(
-        self, dag: DAGCircuit, op: Commuting2qBlock, layout: Layout, swap_strategy: SwapStrategy
-    ) -> dict[int, dict[tuple, Gate]]:
-        """Creates layers of two-qubit gates based on the distance in the swap strategy."""
-
-        gate_layers: dict[int, dict[tuple, Gate]] = defaultdict(dict)
-
-        for node in op.node_block:
-            edge = (dag.find_bit(node.qargs[0]).index, dag.find_bit(node.qargs[1]).index)
-
-            bit0 = layout.get_virtual_bits()[dag.qubits[edge[0]]]
-            bit1 = layout.get_virtual_bits()[dag.qubits[edge[1]]]
-
-            distance = swap_strategy.distance_matrix[bit0, bit1]
-
-            gate_layers[distance][edge] = node.op
-
-        return gate_layers
-
     def _check_edges(self, dag: DAGCircuit, node: DAGOpNode, swap_strategy: SwapStrategy):
         """Check if the swap strategy can create the required connectivity.
 
@@ -14,10 +14,22 @@
 from __future__ import annotations
 from typing import Any
 import copy
+import functools
 import numpy as np
 
 from qiskit.exceptions import QiskitError
 from qiskit.transpiler.coupling import CouplingMap
+from qiskit._accelerate.commuting_2q_router import SwapStrategyTable
+
+
+@functools.lru_cache(maxsize=128)
+def _swap_strategy_table(
+    num_vertices: int,
+    edges: tuple[tuple[int, int], ...],
+    swap_layers: tuple[tuple[tuple[int, int], ...], ...],
+) -> SwapStrategyTable:
+    """Build the native tables of a swap strategy, reusing them for identical strategies."""
+    return SwapStrategyTable(num_vertices, list(edges), [list(layer) for layer in swap_layers])
 
 
 class SwapStrategy:
@@ -66,10 +78,10 @@ class SwapStrategy:
         self._coupling_map = coupling_map
         self._num_vertices = coupling_map.size()
         self._swap_layers = swap_layers
+        self._table: SwapStrategyTable | None = None
         self._distance_matrix: np.ndarray | None = None
         self._possible_edges: set[tuple[int, int]] | None = None
         self._missing_couplings: set[tuple[int, int]] | None = None
-        self._inverse_composed_permutation = {0: list(range(self._num_vertices))}
 
         edge_set = set(self._coupling_map.get_edges())
 
@@ -127,6 +139,21 @@ class SwapStrategy:
 
         return cls(coupling_map=CouplingMap(couplings), swap_layers=tuple(swap_layers))
 
+    @property
+    def _tables(self) -> SwapStrategyTable:
+        """The native tables of the strategy.
+
+        The tables of strategies with the same coupling map and swap layers, such as the line
+        strategies made by :meth:`from_line`, are computed once and shared.
+        """
+        if self._table is None:
+            self._table = _swap_strategy_table(
+                self._num_vertices,
+                tuple(tuple(edge) for edge in self._coupling_map.get_edges()),
+                tuple(tuple(tuple(swap) for swap in layer) for layer in self._swap_layers),
+            )
+        return self._table
+
     def __len__(self) -> int:
         """Return the length of the strategy as the number of layers.
 
@@ -173,19 +200,7 @@ class SwapStrategy:
             obtain a connection between physical qubits i and j.
         """
         if self._distance_matrix is None:
-            self._distance_matrix = np.full((self._num_vertices, self._num_vertices), -1, dtype=int)
-
-            for i in range(self._num_vertices):
-                self._distance_matrix[i, i] = 0
-
-            for i in range(len(self._swap_layers) + 1):
-                for j, k in self.swapped_coupling_map(i).get_edges():
-
-                    # This if ensures that the smallest distance is used.
-                    if self._distance_matrix[j, k] == -1:
-                        self._distance_matrix[j, k] = i
-                        self._distance_matrix[k, j] = i
-
+            self._distance_matrix = self._tables.distance_matrix()
             self._distance_matrix.setflags(write=False)
 
         return self._distance_matrix
@@ -202,23 +217,13 @@ class SwapStrategy:
         Returns:
             A list of edges representing the new qubit connections.
         """
-        connections = []
-        for i in range(self._num_vertices):
-            for j in range(i):
-                if self.distance_matrix[i, j] == idx:
-                    connections.append({i, j})
-        return connections
+        # The lower triangle, in row-major order, is every pair (i, j) with j < i.
+        rows, cols = np.nonzero(np.tril(self.distance_matrix == idx, k=-1))
+        return [{int(i), int(j)} for i, j in zip(rows, cols)]
 
     def _build_edges(self) -> set[tuple[int, int]]:
         """Build the possible edges that the swap strategy accommodates."""
-
-        possible_edges = set()
-        for swap_layer_idx in range(len(self) + 1):
-            for edge in self.swapped_coupling_map(swap_layer_idx).get_edges():
-                possible_edges.add(edge)
-                possible_edges.add(edge[::-1])
-
-        return possible_edges
+        return self._tables.possible_edges()
 
     @property
     def possible_edges(self) -> set[tuple[int, int]]:
@@ -297,10 +302,4 @@ class SwapStrategy:
         Returns:
             The inversed permutation as a list of integer values.
         """
-        # Only compute the inverse permutation if it has not been computed before
-        if idx not in self._inverse_composed_permutation:
-            self._inverse_composed_permutation[idx] = self.apply_swap_layer(
-                self.inverse_composed_permutation(idx - 1), idx - 1
-            )
-
-        return self._inverse_composed_permutation[idx]
+        return self._tables.inverse_composed_permutation(idx)
@@ -71,7 +71,15 @@ class SabreSwap(TransformationPass):
     `arXiv:1809.02573 <https://arxiv.org/pdf/1809.02573.pdf>`_
     """
 
-    def __init__(self, coupling_map, heuristic="basic", seed=None, fake_run=False, trials=None):
+    def __init__(
+        self,
+        coupling_map,
+        heuristic="basic",
+        seed=None,
+        fake_run=False,
+        trials=None,
+        time_limit=None,
+    ):
         r"""SabreSwap initializer.
 
         Args:
@@ -87,6 +95,12 @@ class SabreSwap(TransformationPass):
                 CPUs on the local system. For reproducible results it is recommended
                 that you set this explicitly, as the output will be deterministic for
                 a fixed number of trials.
+            time_limit (float): A wall-clock budget for the trials, in seconds.  Trials that have
+                not started when the time runs out are skipped, and the best of the completed
+                trials is used; the first trial always runs to completion.  The number of
+                completed trials is written to the ``sabre_swap_trials_completed`` field of the
+                property set.  The output is only reproducible for a fixed ``seed`` if this is
+                ``None`` (the default).
 
         Raises:
             TranspilerError: If the specified heuristic is not valid.
@@ -157,6 +171,7 @@ class SabreSwap(TransformationPass):
         self.seed = seed
         self.trials = default_num_processes() if trials is None else trials
         self.fake_run = fake_run
+        self.time_limit = time_limit
 
     @functools.cached_property
     def dist_matrix(self):  # pylint: disable=missing-function-docstring
@@ -232,11 +247,18 @@ class SabreSwap(TransformationPass):
 
         initial_layout = NLayout.generate_trivial_layout(num_dag_qubits)
         sabre_start = time.perf_counter()
-        dag, final_layout = sabre_routing(
-            dag, self._routing_target, heuristic, initial_layout, self.trials, self.seed
+        dag, final_layout, trials_completed = sabre_routing(
+            dag,
+            self._routing_target,
+            heuristic,
+            initial_layout,
+            self.trials,
+            self.seed,
+            time_limit=self.time_limit,
         )
         sabre_stop = time.perf_counter()
         LOG.debug("Sabre swap algorithm execution complete in: %s", sabre_stop - sabre_start)
+        self.property_set["sabre_swap_trials_completed"] = trials_completed
         permutation = [
             final_layout.virtual_to_physical(initial_layout.physical_to_virtual(i))
             for i in range(num_dag_qubits)
@@ -16,8 +16,14 @@ High-level-synthesis transpiler pass.
 
 from __future__ import annotations
 
+import collections
+import hashlib
+import logging
+import pickle
+import threading
 import typing
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -34,6 +40,7 @@ from qiskit.transpiler.exceptions import TranspilerError
 from qiskit._accelerate.high_level_synthesis import (
     QubitTracker,
     HighLevelSynthesisData,
+    collect_synthesis_candidates,
     run_on_dag,
 )
 
@@ -42,6 +49,8 @@ from .plugin import HighLevelSynthesisPluginManager
 if typing.TYPE_CHECKING:
     from qiskit.dagcircuit import DAGOpNode
 
+logger = logging.getLogger(__name__)
+
 
 class HLSConfig:
     """The high-level-synthesis config allows to specify a list of "methods" used by
@@ -187,6 +196,14 @@ class HighLevelSynthesis(TransformationPass):
         state after the synthesized block, while dirty auxiliary qubits are re-used only
         as dirty qubits.
 
+    The circuits returned by the synthesis plugins are cached, so that identical higher-level
+    objects are only synthesized once, both within a circuit and across the circuits that the
+    pass runs on.  Two objects are identical if they have the same content and the same
+    auxiliary qubits are available to them (and, when ``use_qubit_indices`` is ``True``, if they
+    act on the same qubits).  When ``num_threads`` is larger than one, the distinct objects are
+    also synthesized concurrently before the pass runs.  Synthesis plugins are assumed not to
+    depend on anything but their arguments, which holds for all the plugins in Qiskit.
+
     """
 
     def __init__(
@@ -200,6 +217,8 @@ class HighLevelSynthesis(TransformationPass):
         min_qubits: int = 0,
         qubits_initially_zero: bool = True,
         optimization_metric: OptimizationMetric = OptimizationMetric.COUNT_2Q,
+        cache_size: int = 1024,
+        num_threads: int = 1,
     ):
         r"""
         HighLevelSynthesis initializer.
@@ -225,9 +244,24 @@ class HighLevelSynthesis(TransformationPass):
                 (i.e. in the zero state) to synthesize an operation.
             optimization_metric:  Specifies the optimization criterion used by the default synthesis
                 methods for high-level-objects (when available).
+            cache_size: The maximum number of circuits synthesized by the plugins that are kept,
+                so that identical high-level-objects are only synthesized once. The
+                least-recently used circuits are evicted first. If ``0``, nothing is cached.
+            num_threads: The number of threads used to synthesize the distinct high-level-objects
+                of a circuit concurrently. This has no effect if ``cache_size`` is ``0``. Since
+                the synthesis plugins are Python code, this is mostly useful with plugins that
+                release the GIL, or with a free-threaded build of Python.
+
+        Raises:
+            TranspilerError: if ``cache_size`` is negative or ``num_threads`` is not positive.
         """
         super().__init__()
 
+        if cache_size < 0:
+            raise TranspilerError(f"cache_size must be non-negative, not {cache_size}")
+        if num_threads < 1:
+            raise TranspilerError(f"num_threads must be positive, not {num_threads}")
+
         # When the config file is not provided, we will use the "default" method
         # to synthesize Operations (when available).
         hls_config = hls_config or HLSConfig(True)
@@ -252,6 +286,7 @@ class HighLevelSynthesis(TransformationPass):
             device_insts = set()
 
         self.qubits_initially_zero = qubits_initially_zero
+        self.num_threads = num_threads
 
         self.data = HighLevelSynthesisData(
             hls_config=hls_config,
@@ -265,6 +300,7 @@ class HighLevelSynthesis(TransformationPass):
             min_qubits=min_qubits,
             unroll_definitions=unroll_definitions,
             optimize_clifford_t=optimization_metric == OptimizationMetric.COUNT_T,
+            synthesis_cache=_SynthesisCache(cache_size) if cache_size > 0 else None,
         )
 
     def run(self, dag: DAGCircuit) -> DAGCircuit:
@@ -280,9 +316,120 @@ class HighLevelSynthesis(TransformationPass):
             TranspilerError: when the transpiler is unable to synthesize the given DAG
             (for instance, when the specified synthesis method is not available).
         """
+        if self.num_threads > 1 and self.data.synthesis_cache is not None:
+            self._synthesize_concurrently(dag)
         res = run_on_dag(dag, self.data, self.qubits_initially_zero)
         return res if res is not None else dag
 
+    def _synthesize_concurrently(self, dag: DAGCircuit):
+        """Synthesize the distinct high-level-objects of ``dag`` concurrently into the cache.
+
+        The state of the auxiliary qubits available to each object is predicted in Rust. When the
+        prediction is wrong, the object is synthesized again by the (sequential) pass.
+        """
+        data = self.data
+        cache = data.synthesis_cache
+        tasks = {}
+        for operation, input_qubits, tracker in collect_synthesis_candidates(
+            dag, data, self.qubits_initially_zero
+        ):
+            if not (hls_methods := _methods_to_try(data, operation.name)):
+                continue
+            num_clean_ancillas = tracker.num_clean(input_qubits)
+            num_dirty_ancillas = tracker.num_dirty(input_qubits)
+            key = cache.key(
+                operation, input_qubits, data, tracker, num_clean_ancillas, num_dirty_ancillas
+            )
+            if key is not None and key not in tasks and key not in cache:
+                tasks[key] = (
+                    operation,
+                    input_qubits,
+                    tracker,
+                    hls_methods,
+                    num_clean_ancillas,
+                    num_dirty_ancillas,
+                )
+        if len(tasks) < 2:
+            return
+
+        def synthesize(key):
+            operation, input_qubits, tracker, hls_methods, num_clean, num_dirty = tasks[key]
+            try:
+                decomposition = _run_plugins(
+                    operation, input_qubits, data, tracker, hls_methods, num_clean, num_dirty
+                )
+            except Exception:  # pylint: disable=broad-except
+                # The pass synthesizes the object again, and reports the error if it is real.
+                logger.debug("Concurrent synthesis of '%s' failed.", operation.name, exc_info=True)
+                return
+            cache.put(key, decomposition)
+
+        with ThreadPoolExecutor(max_workers=min(self.num_threads, len(tasks))) as executor:
+            list(executor.map(synthesize, tasks))
+
+
+class _SynthesisCache:
+    """A thread-safe, least-recently-used cache of the circuits synthesized by the plugins.
+
+    Entries are keyed on a hash of the pickled operation, together with every argument that the
+    pass passes to the plugins and that can differ between operations.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+
+    def __reduce__(self):
+        # The entries are specific to a process, and the lock cannot be pickled.
+        return (_SynthesisCache, (self.max_size,))
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    @staticmethod
+    def key(operation, input_qubits, data, tracker, num_clean_ancillas, num_dirty_ancillas):
+        """Calculate the key of a synthesis, or ``None`` if the operation cannot be cached."""
+        try:
+            payload = pickle.dumps(operation, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:  # pylint: disable=broad-except
+            # Anything that can't be pickled is simply not cached; this isn't an error.
+            logger.debug("Operation '%s' cannot be pickled; not caching.", operation.name)
+            return None
+        return (
+            hashlib.sha256(payload).digest(),
+            # The plugin for annotated operations depends on the state of the qubits themselves.
+            tracker.states(input_qubits),
+            num_clean_ancillas,
+            num_dirty_ancillas,
+            tuple(input_qubits) if data.use_physical_indices else None,
+        )
+
+    def get(self, key):
+        """Return a 1-tuple of the synthesized circuit (which may be ``None``), or ``None`` if
+        the synthesis is not cached."""
+        with self._lock:
+            if (decomposition := self._entries.get(key, self)) is self:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return (decomposition,)
+
+    def put(self, key, decomposition):
+        """Cache a synthesized circuit, evicting the least-recently used entries if needed."""
+        with self._lock:
+            self._entries[key] = decomposition
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
 
 def _methods_to_try(data: HighLevelSynthesisData, name: str):
     """Get a sequence of methods to try for a given op name."""
@@ -328,10 +475,69 @@ def _synthesize_op_using_plugins(
     if len(hls_methods) == 0:
         return None
 
-    hls_plugin_manager = data.hls_plugin_manager
     num_clean_ancillas = tracker.num_clean(input_qubits)
     num_dirty_ancillas = tracker.num_dirty(input_qubits)
 
+    cache = data.synthesis_cache
+    key = None
+    if cache is not None:
+        key = cache.key(
+            operation, input_qubits, data, tracker, num_clean_ancillas, num_dirty_ancillas
+        )
+    if key is not None and (cached := cache.get(key)) is not None:
+        (best_decomposition,) = cached
+    else:
+        best_decomposition = _run_plugins(
+            operation,
+            input_qubits,
+            data,
+            tracker,
+            hls_methods,
+            num_clean_ancillas,
+            num_dirty_ancillas,
+        )
+        if key is not None:
+            cache.put(key, best_decomposition)
+
+    # A synthesis method may have potentially used available ancilla qubits.
+    # The following greedily grabs global qubits available. In the additional
+    # refactoring mentioned in _run_plugins, we want each plugin to actually return
+    # the global qubits used, especially when the synthesis is done on the physical
+    # circuit, and the choice of which ancilla qubits to use really matters.
+    output_qubits = input_qubits
+    if best_decomposition is not None:
+        if best_decomposition.num_qubits > len(input_qubits):
+            global_aux_qubits = tracker.borrow(
+                best_decomposition.num_qubits - len(input_qubits), input_qubits
+            )
+            output_qubits = output_qubits + global_aux_qubits
+
+        # This checks (in particular) that there is indeed a sufficient number
+        # of ancilla qubits to borrow from the tracker.
+        if best_decomposition.num_qubits != len(output_qubits):
+            raise TranspilerError(
+                "HighLevelSynthesis: the result from 'synthesize_op_using_plugin' is incorrect."
+            )
+
+    if best_decomposition is None:
+        return None
+
+    return (best_decomposition, output_qubits)
+
+
+def _run_plugins(
+    operation: Operation,
+    input_qubits: tuple[int],
+    data: HighLevelSynthesisData,
+    tracker: QubitTracker,
+    hls_methods: list,
+    num_clean_ancillas: int,
+    num_dirty_ancillas: int,
+) -> QuantumCircuit | None:
+    """Run the synthesis methods ``hls_methods`` on an operation, and return the best circuit
+    found, or ``None`` if no method is applicable."""
+    hls_plugin_manager = data.hls_plugin_manager
+
     best_decomposition = None
     best_score = np.inf
 
@@ -346,6 +552,9 @@ def _synthesize_op_using_plugins(
         #   "pmh".
         if isinstance(method, tuple):
             plugin_specifier, plugin_args = method
+            # The arguments are copied, as they are extended below and may be shared by
+            # concurrent syntheses.
+            plugin_args = dict(plugin_args)
         else:
             plugin_specifier = method
             plugin_args = {}
@@ -413,27 +622,4 @@ def _synthesize_op_using_plugins(
                 best_decomposition = decomposition
                 best_score = current_score
 
-    # A synthesis method may have potentially used available ancilla qubits.
-    # The following greedily grabs global qubits available. In the additional
-    # refactoring mentioned previously, we want each plugin to actually return
-    # the global qubits used, especially when the synthesis is done on the physical
-    # circuit, and the choice of which ancilla qubits to use really matters.
-    output_qubits = input_qubits
-    if best_decomposition is not None:
-        if best_decomposition.num_qubits > len(input_qubits):
-            global_aux_qubits = tracker.borrow(
-                best_decomposition.num_qubits - len(input_qubits), input_qubits
-            )
-            output_qubits = output_qubits + global_aux_qubits
-
-        # This checks (in particular) that there is indeed a sufficient number
-        # of ancilla qubits to borrow from the tracker.
-        if best_decomposition.num_qubits != len(output_qubits):
-            raise TranspilerError(
-                "HighLevelSynthesis: the result from 'synthesize_op_using_plugin' is incorrect."
-            )
-
-    if best_decomposition is None:
-        return None
-
-    return (best_decomposition, output_qubits)
+    return best_decomposition
@@ -27,6 +27,16 @@ class DAGFixedPoint(AnalysisPass):
 
     def run(self, dag):
         """Run the DAGFixedPoint pass on `dag`."""
+        if (current_hash := dag.structural_hash()) is not None:
+            # Fast path: compare structural hashes rather than keeping a full copy of the DAG.
+            previous_hash = self.property_set["_dag_fixed_point_previous_hash"]
+            self.property_set["dag_fixed_point"] = previous_hash == current_hash
+            self.property_set["_dag_fixed_point_previous_hash"] = current_hash
+            self.property_set["_dag_fixed_point_previous_dag"] = None
+            return
+
+        # Some component of the DAG (such as a control-flow block) can't be hashed, so fall back to
+        # a full comparison.
         if self.property_set["_dag_fixed_point_previous_dag"] is None:
             self.property_set["dag_fixed_point"] = False
         else:
@@ -34,3 +44,4 @@ class DAGFixedPoint(AnalysisPass):
             self.property_set["dag_fixed_point"] = fixed_point_reached
 
         self.property_set["_dag_fixed_point_previous_dag"] = deepcopy(dag)
+        self.property_set["_dag_fixed_point_previous_hash"] = None
@@ -15,6 +15,7 @@ from __future__ import annotations
 
 import inspect
 import io
+import itertools
 import re
 from collections.abc import Iterator, Iterable, Callable
 from functools import wraps
@@ -27,7 +28,11 @@ from qiskit.passmanager.passmanager import BasePassManager
 from qiskit.passmanager.base_tasks import Task
 from qiskit.passmanager.flow_controllers import FlowControllerLinear
 from qiskit.passmanager.exceptions import PassManagerError
+from qiskit.passmanager.pool import PassManagerPool
+from qiskit.passmanager.profiler import PassProfiler, _iter_passes
+from qiskit.passmanager.compilation_status import PropertySet
 from .basepasses import BasePass
+from .cache import TranspileCache, pass_manager_fingerprint
 from .exceptions import TranspilerError
 from .layout import TranspileLayout
 
@@ -96,6 +101,9 @@ class PassManager(BasePassManager):
 
         return out_program
 
+    def _profile_metrics(self, passmanager_ir: DAGCircuit) -> tuple[int, int]:
+        return passmanager_ir.size(), len(passmanager_ir.two_qubit_ops())
+
     def append(  # pylint:disable=arguments-renamed
         self,
         passes: Task | list[Task],
@@ -132,6 +140,9 @@ class PassManager(BasePassManager):
         num_processes: int = None,
         *,
         property_set: dict[str, object] | None = None,
+        pool: PassManagerPool | None = None,
+        cache: TranspileCache | None = None,
+        profiler: PassProfiler | None = None,
     ) -> _CircuitsT:
         """Run all the passes on the specified ``circuits``.
 
@@ -187,10 +198,25 @@ class PassManager(BasePassManager):
                 another, in cases where you know the analysis is safe to share.  Beware that some
                 analysis will be specific to the input circuit and the particular :class:`.Target`,
                 so you should take a lot of care when using this argument.
+            pool: If given, a :class:`.PassManagerPool` whose long-lived worker processes are used
+                to run multiple circuits, instead of starting a new process pool for this call.
+                See :meth:`.BasePassManager.run` for details.
+            cache: If given, a :class:`.TranspileCache` in which to look up the output for each
+                input circuit before compiling it, and to store the outputs of circuits that were
+                compiled.  The cache is bypassed if any of ``callback``, ``property_set`` or
+                ``profiler`` is given.
+            profiler: If given, a :class:`.PassProfiler` that records the running time, memory
+                usage and circuit-size changes of every pass execution, for every circuit,
+                including when running in parallel.
 
         Returns:
             The transformed circuit(s).
         """
+        if cache is not None and callback is None and property_set is None and profiler is None:
+            return self._run_cached(
+                circuits, cache, output_name=output_name, num_processes=num_processes, pool=pool
+            )
+
         if callback is not None:
             callback = _legacy_style_callback(callback)
 
@@ -200,8 +226,95 @@ class PassManager(BasePassManager):
             output_name=output_name,
             num_processes=num_processes,
             property_set=property_set,
+            pool=pool,
+            profiler=profiler,
+        )
+
+    def run_iter(  # pylint:disable=arguments-renamed
+        self,
+        circuits: Iterable[QuantumCircuit],
+        output_name: str | None = None,
+        callback: Callable = None,
+        num_processes: int = None,
+        *,
+        property_set: dict[str, object] | None = None,
+        max_in_flight: int | None = None,
+        pool: PassManagerPool | None = None,
+    ) -> Iterator[tuple[int, QuantumCircuit, PropertySet]]:
+        """Lazily run all the passes on each of ``circuits``, yielding the outputs as they are
+        completed.
+
+        This accepts any iterable of circuits, including a generator, and yields the transpiled
+        circuits in the order they complete, rather than building the complete list of outputs
+        before returning.  When running in parallel, at most ``max_in_flight`` circuits are being
+        compiled at once, so the compilation of a large batch can be overlapped with serialization
+        or submission of the outputs, with bounded memory usage::
+
+            for index, isa_circuit, property_set in pass_manager.run_iter(circuit_generator()):
+                submit(index, isa_circuit)
+
+        Args:
+            circuits: The circuits to transform via all the registered passes.
+            output_name: The output circuit name. If ``None``, it will be set to the same as the
+                input circuit name.
+            callback: A callback function that will be called after each pass execution, in the
+                same form as for :meth:`run`.
+            num_processes: The maximum number of parallel processes to launch if parallel
+                execution is enabled, as for :meth:`run`.
+            property_set: If given, the initial value to use as the :class:`.PropertySet` for the
+                pass manager pipeline, as for :meth:`run`.
+            max_in_flight: The maximum number of circuits that are being compiled in parallel at
+                once.  If ``None``, twice the number of processes is used.
+            pool: If given, a :class:`.PassManagerPool` whose worker processes are used to run the
+                circuits.
+
+        Yields:
+            Tuples of the index of the input circuit in ``circuits``, the transformed circuit, and
+            the final :class:`.PropertySet` of its compilation.
+        """
+        if callback is not None:
+            callback = _legacy_style_callback(callback)
+
+        return super().run_iter(
+            circuits,
+            callback=callback,
+            num_processes=num_processes,
+            property_set=property_set,
+            max_in_flight=max_in_flight,
+            pool=pool,
+            output_name=output_name,
         )
 
+    def _run_cached(self, circuits, cache, *, output_name, num_processes, pool):
+        is_list = isinstance(circuits, list)
+        circuit_list = circuits if is_list else [circuits]
+        if (fingerprint := pass_manager_fingerprint(self)) is None:
+            keys = [None] * len(circuit_list)
+        else:
+            keys = [cache.key(fingerprint, circuit) for circuit in circuit_list]
+        out = [None if key is None else cache.get(key) for key in keys]
+        hits = [i for i, circuit in enumerate(out) if circuit is not None]
+        for i in hits:
+            out[i].name = circuit_list[i].name if output_name is None else output_name
+        if misses := [i for i, circuit in enumerate(out) if circuit is None]:
+            compiled = super().run(
+                [circuit_list[i] for i in misses],
+                output_name=output_name,
+                num_processes=num_processes,
+                pool=pool,
+            )
+            for i, circuit in zip(misses, compiled):
+                if keys[i] is not None:
+                    cache.put(keys[i], circuit)
+                out[i] = circuit
+        if hits and hits[-1] == len(out) - 1:
+            # The last circuit never went through the pipeline, so reconstruct what we can of the
+            # property set it would have left behind.
+            self.property_set = PropertySet()
+            if (layout := out[-1].layout) is not None:
+                layout.write_into_property_set(self.property_set)
+        return out if is_list else out[0]
+
     def draw(self, filename=None, style=None, raw=False):
         """Draw the pass manager.
 
@@ -410,14 +523,57 @@ class StagedPassManager(PassManager):
         num_processes: int = None,
         *,
         property_set: dict[str, object] | None = None,
+        pool: PassManagerPool | None = None,
+        cache: TranspileCache | None = None,
+        profiler: PassProfiler | None = None,
     ) -> _CircuitsT:
         self._update_passmanager()
-        return super().run(circuits, output_name, callback, num_processes=num_processes)
+        return super().run(
+            circuits,
+            output_name,
+            callback,
+            num_processes=num_processes,
+            property_set=property_set,
+            pool=pool,
+            cache=cache,
+            profiler=profiler,
+        )
+
+    def run_iter(
+        self,
+        circuits: Iterable[QuantumCircuit],
+        output_name: str | None = None,
+        callback: Callable | None = None,
+        num_processes: int = None,
+        *,
+        property_set: dict[str, object] | None = None,
+        max_in_flight: int | None = None,
+        pool: PassManagerPool | None = None,
+    ) -> Iterator[tuple[int, QuantumCircuit, PropertySet]]:
+        self._update_passmanager()
+        return super().run_iter(
+            circuits,
+            output_name,
+            callback,
+            num_processes=num_processes,
+            property_set=property_set,
+            max_in_flight=max_in_flight,
+            pool=pool,
+        )
 
     def to_flow_controller(self) -> FlowControllerLinear:
         self._update_passmanager()
         return super().to_flow_controller()
 
+    def _profile_stages(self) -> dict[int, str]:
+        stages = {}
+        for stage in self.expanded_stages:
+            if (pm := getattr(self, stage, None)) is not None:
+                # ``_tasks`` holds one list of tasks per call to ``append``.
+                for task in _iter_passes(itertools.chain.from_iterable(pm._tasks)):
+                    stages.setdefault(id(task), stage)
+        return stages
+
     def draw(self, filename=None, style=None, raw=False):
         """Draw the staged pass manager."""
         from qiskit.visualization import staged_pass_manager_drawer
@@ -508,7 +508,9 @@ class OptimizationPassManager(PassManagerStagePlugin):
 
                 _opt = [
                     Optimize1qGatesDecomposition(
-                        basis=pass_manager_config.basis_gates, target=pass_manager_config.target
+                        basis=pass_manager_config.basis_gates,
+                        target=pass_manager_config.target,
+                        track_changes=True,
                     ),
                     InverseCancellation(),
                     ContractIdleWiresInControlFlow(),
@@ -525,7 +527,9 @@ class OptimizationPassManager(PassManagerStagePlugin):
                         target=pass_manager_config.target,
                     ),
                     Optimize1qGatesDecomposition(
-                        basis=pass_manager_config.basis_gates, target=pass_manager_config.target
+                        basis=pass_manager_config.basis_gates,
+                        target=pass_manager_config.target,
+                        track_changes=True,
                     ),
                     CommutativeCancellation(target=pass_manager_config.target),
                     ContractIdleWiresInControlFlow(),
@@ -543,6 +547,7 @@ class OptimizationPassManager(PassManagerStagePlugin):
                         basis_gates=pass_manager_config.basis_gates,
                         target=pass_manager_config.target,
                         approximation_degree=pass_manager_config.approximation_degree,
+                        track_changes=True,
                     ),
                     UnitarySynthesis(
                         pass_manager_config.basis_gates,
@@ -557,7 +562,9 @@ class OptimizationPassManager(PassManagerStagePlugin):
                         target=pass_manager_config.target,
                     ),
                     Optimize1qGatesDecomposition(
-                        basis=pass_manager_config.basis_gates, target=pass_manager_config.target
+                        basis=pass_manager_config.basis_gates,
+                        target=pass_manager_config.target,
+                        track_changes=True,
                     ),
                     CommutativeCancellation(target=pass_manager_config.target),
                     ContractIdleWiresInControlFlow(),
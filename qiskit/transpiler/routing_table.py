@@ -0,0 +1,158 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Persisted, memory-mapped distance and neighbor tables of coupling graphs."""
+
+from __future__ import annotations
+
+import os
+import struct
+import sys
+
+import numpy as np
+
+from qiskit._accelerate import sabre
+from .coupling import CouplingMap
+from .exceptions import TranspilerError
+from .target import Target
+
+_MAGIC = b"QKRTBL01"
+_HEADER = struct.Struct("<8sQQQ")
+
+
+class RoutingTable:
+    """The distance matrix and neighbor table of a coupling graph, shared through a file.
+
+    The distance matrix of a large coupling graph takes :math:`O(n^2)` memory and noticeable time to
+    calculate, and without a routing table every transpilation, and every worker process of a
+    parallel transpilation, calculates and holds its own copy.  A routing table is calculated once
+    and written to a compact binary file with :meth:`build`.  Loading the file memory-maps it
+    read-only, so all the processes that load the same file share one copy of it in memory, and
+    registers it with the transpiler: while a table is loaded, the routing and layout passes that
+    need the distance matrix of its coupling graph (such as :class:`.SabreLayout`,
+    :class:`.SabreSwap` and :class:`.LookaheadSwap`), and :attr:`.CouplingMap.distance_matrix`,
+    use the mapped table in place instead of calculating it.
+
+    For example, build the table once::
+
+        from qiskit.transpiler import RoutingTable
+
+        RoutingTable.build(backend.target, "heavy_hex_1121.routing")
+
+    and load it in each process that transpiles for the backend::
+
+        table = RoutingTable("heavy_hex_1121.routing")
+
+    The table stays registered until :meth:`clear` is called, even if the :class:`RoutingTable`
+    object is garbage collected.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        """
+        Args:
+            path: the routing table file to load, as written by :meth:`build`.
+
+        Raises:
+            TranspilerError: if the file is not a valid routing table.
+        """
+        self._path = os.fspath(path)
+        with open(self._path, "rb") as file:
+            header = file.read(_HEADER.size)
+            file_size = os.fstat(file.fileno()).st_size
+        if len(header) != _HEADER.size:
+            raise TranspilerError(f"'{self._path}' is too short to be a routing table")
+        magic, num_qubits, num_neighbors, _ = _HEADER.unpack(header)
+        if magic != _MAGIC:
+            raise TranspilerError(f"'{self._path}' is not a routing table")
+        expected_size = (
+            _HEADER.size + 8 * num_qubits * num_qubits + 8 * (num_qubits + 1) + 4 * num_neighbors
+        )
+        if file_size != expected_size:
+            raise TranspilerError(
+                f"'{self._path}' is not a valid routing table: its size is {file_size} bytes, but"
+                f" its header describes a table of {expected_size} bytes"
+            )
+        if sys.byteorder != "little":
+            # The tables are stored little-endian, and the transpiler can only use them in place
+            # if that is the native byte order.
+            raise TranspilerError("routing tables can only be loaded on little-endian platforms")
+        offset = _HEADER.size
+        self._distance = np.memmap(
+            self._path, dtype="<f8", mode="r", offset=offset, shape=(num_qubits, num_qubits)
+        )
+        offset += 8 * num_qubits * num_qubits
+        self._partition = np.memmap(
+            self._path, dtype="<u8", mode="r", offset=offset, shape=(num_qubits + 1,)
+        )
+        offset += 8 * (num_qubits + 1)
+        # A zero-length memory map is an error, so the neighbor table of a graph with no edges is
+        # made directly.
+        if num_neighbors:
+            neighbors = np.memmap(
+                self._path, dtype="<u4", mode="r", offset=offset, shape=(num_neighbors,)
+            )
+        else:
+            neighbors = np.zeros((0,), dtype=np.uint32)
+        try:
+            sabre.register_routing_table(self._distance, self._partition, neighbors)
+        except (TypeError, ValueError) as err:
+            raise TranspilerError(f"'{self._path}' is not a valid routing table: {err}") from err
+
+    @classmethod
+    def build(cls, coupling: Target | CouplingMap, path: str | os.PathLike) -> RoutingTable:
+        """Calculate the routing table of a coupling graph, write it to a file and load it.
+
+        The file is written atomically, so processes can safely load it while it is replaced.
+
+        Args:
+            coupling: the target or coupling map whose (undirected) connectivity to tabulate.
+            path: the file to write.
+
+        Returns:
+            The loaded table.
+
+        Raises:
+            TranspilerError: if the target has all-to-all connectivity.
+        """
+        if isinstance(coupling, Target):
+            coupling_map = coupling.build_coupling_map()
+            if coupling_map is None:
+                raise TranspilerError("a target with all-to-all connectivity has no routing table")
+            num_qubits = coupling.num_qubits
+        else:
+            coupling_map = coupling
+            num_qubits = coupling.size()
+        sabre.write_routing_table(path, num_qubits, list(coupling_map.get_edges()))
+        return cls(path)
+
+    @staticmethod
+    def clear():
+        """Stop using all the loaded routing tables.
+
+        Routing targets and coupling maps that were already created with a table keep it mapped.
+        """
+        sabre.clear_routing_tables()
+
+    @property
+    def path(self) -> str:
+        """The path of the table file."""
+        return self._path
+
+    @property
+    def num_qubits(self) -> int:
+        """The number of qubits in the coupling graph."""
+        return self._distance.shape[0]
+
+    @property
+    def distance_matrix(self) -> np.ndarray:
+        """The read-only, memory-mapped distance matrix, with NaN for unconnected pairs."""
+        return self._distance
@@ -52,7 +52,8 @@ External Python Libraries
 .. py:data:: HAS_CONSTRAINT
 
     `python-constraint <https://github.com/python-constraint/python-constraint>`__ is a
-    constraint satisfaction problem solver, used in the :class:`~.CSPLayout` transpiler pass.
+    constraint satisfaction problem solver.  It was previously used in the :class:`~.CSPLayout`
+    transpiler pass, which now has a native solver.
 
 .. py:data:: HAS_CPLEX
 
@@ -14,7 +14,10 @@
 # pylint: disable=attribute-defined-outside-init,unsubscriptable-object
 # pylint: disable=unused-wildcard-import,wildcard-import,undefined-variable
 
-from qiskit.transpiler import CouplingMap
+import numpy as np
+
+from qiskit.circuit import QuantumCircuit
+from qiskit.transpiler import CouplingMap, Layout
 from qiskit.transpiler.passes import *
 from qiskit.converters import circuit_to_dag
 
@@ -231,3 +234,68 @@ class RoutedPassBenchmarks:
 
     def time_check_map(self, _, __):
         CheckMap(self.coupling_map).run(self.routed_dag)
+
+
+class ControlFlowRoutingBenchmarks:
+    """Routing of dynamic circuits with many mid-circuit measurements and control-flow blocks."""
+
+    params = ([3, 5], [50, 200])
+
+    param_names = ["heavy_hex_distance", "n_blocks"]
+    timeout = 300
+
+    def setup(self, heavy_hex_distance, n_blocks):
+        rng = np.random.default_rng(42)
+        self.coupling_map = CouplingMap.from_heavy_hex(heavy_hex_distance)
+        n_qubits = self.coupling_map.size()
+        circuit = QuantumCircuit(n_qubits, n_qubits)
+
+        def random_pairs(count):
+            for _ in range(count):
+                yield rng.choice(n_qubits, size=2, replace=False).tolist()
+
+        def block(num_qubits, num_gates):
+            body = QuantumCircuit(num_qubits)
+            for a, b in random_pairs(num_gates):
+                body.cx(a, b)
+            return body
+
+        for i in range(n_blocks):
+            for a, b in random_pairs(4):
+                circuit.cx(a, b)
+            qubit = int(rng.integers(n_qubits))
+            circuit.measure(qubit, qubit)
+            clbit = circuit.clbits[qubit]
+            if i % 3 == 0:
+                circuit.if_else(
+                    (clbit, True),
+                    block(n_qubits, 6),
+                    block(n_qubits, 6),
+                    circuit.qubits,
+                    [],
+                )
+            elif i % 3 == 1:
+                circuit.switch(
+                    clbit,
+                    [(False, block(n_qubits, 6)), (True, block(n_qubits, 6))],
+                    circuit.qubits,
+                    [],
+                )
+            else:
+                circuit.for_loop(range(2), None, block(n_qubits, 6), circuit.qubits, [])
+        fresh_dag = circuit_to_dag(circuit)
+        self.layout = Layout.generate_trivial_layout(*circuit.qregs)
+        full_ancilla_pass = FullAncillaAllocation(self.coupling_map)
+        full_ancilla_pass.property_set["layout"] = self.layout
+        full_ancilla_dag = full_ancilla_pass.run(fresh_dag)
+        enlarge_pass = EnlargeWithAncilla()
+        enlarge_pass.property_set["layout"] = self.layout
+        enlarge_dag = enlarge_pass.run(full_ancilla_dag)
+        apply_pass = ApplyLayout()
+        apply_pass.property_set["layout"] = self.layout
+        self.dag = apply_pass.run(enlarge_dag)
+
+    def time_sabre_swap(self, _, __):
+        swap = SabreSwap(self.coupling_map, seed=42)
+        swap.property_set["layout"] = self.layout
+        swap.run(self.dag)
@@ -188,3 +188,33 @@ class MultiQBlockPassBenchmarks:
 
     def time_collect_multiq_block(self, _, __, max_block_size):
         CollectMultiQBlocks(max_block_size).run(self.dag)
+
+
+class DAGCheckpointBenchmarks:
+    params = ([5, 14, 20], [1024])
+
+    param_names = ["n_qubits", "depth"]
+    timeout = 300
+
+    def setup(self, n_qubits, depth):
+        seed = 42
+        self.circuit = random_circuit(
+            n_qubits, depth, measure=True, conditional=True, reset=True, seed=seed
+        )
+        self.dag = circuit_to_dag(self.circuit)
+        self.optimize_1q = Optimize1qGatesDecomposition(
+            basis=["rz", "sx", "cx"], track_changes=True
+        )
+        self.dag = self.optimize_1q.run(self.dag)
+        self.dag.checkpoint("benchmark")
+        self.node = self.dag.op_nodes()[-1]
+
+    def time_checkpoint(self, _, __):
+        self.dag.checkpoint("benchmark")
+
+    def time_changed_nodes_after_local_change(self, _, __):
+        self.dag.substitute_node(self.node, self.node.op)
+        self.dag.changed_nodes("benchmark")
+
+    def time_optimize_1q_rerun_with_tracking(self, _, __):
+        self.optimize_1q.run(self.dag)
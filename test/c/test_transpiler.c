@@ -248,11 +248,80 @@ cleanup:
     return result;
 }
 
+static int test_transpile_batch(void) {
+    const uint32_t n = 10;
+    const size_t num_circuits = 4;
+    QkTarget *target = qk_target_new(n);
+    qk_target_add_instruction(target, qk_target_entry_new(QkGate_SX));
+    qk_target_add_instruction(target, qk_target_entry_new(QkGate_X));
+    qk_target_add_instruction(target, qk_target_entry_new(QkGate_RZ));
+
+    QkCircuit *circuits[4];
+    for (size_t c = 0; c < num_circuits; c++) {
+        uint32_t num_qubits = (uint32_t)c + 1;
+        circuits[c] = qk_circuit_new(num_qubits, 0);
+        for (uint32_t i = 0; i < num_qubits; i++) {
+            qk_circuit_gate(circuits[c], QkGate_H, (uint32_t[1]){i}, NULL);
+        }
+    }
+
+    QkTranspileResult results[4];
+    memset(results, 0, sizeof(results));
+    char *error = NULL;
+    int result = Ok;
+    QkExitCode exit =
+        qk_transpile_batch((const QkCircuit *const *)circuits, num_circuits, target, NULL, results,
+                           &error);
+    if (exit != QkExitCode_Success) {
+        printf("Batch transpilation failed %s\n", error);
+        qk_str_free(error);
+        result = RuntimeError;
+        goto cleanup;
+    }
+
+    // H gets translated to RZ-SX-RZ on each qubit
+    for (size_t c = 0; c < num_circuits; c++) {
+        size_t num_inst = qk_circuit_num_instructions(results[c].circuit);
+        if (num_inst != 3 * (c + 1)) {
+            printf("Circuit %zu: expected %zu instructions, but got %zu\n", c, 3 * (c + 1),
+                   num_inst);
+            result = EqualityError;
+        }
+    }
+
+    // A circuit that doesn't fit in the target fails the whole batch, and writes no results.
+    QkCircuit *too_wide = qk_circuit_new(n + 1, 0);
+    const QkCircuit *bad_batch[2] = {circuits[0], too_wide};
+    QkTranspileResult bad_results[2] = {{NULL, NULL}, {NULL, NULL}};
+    exit = qk_transpile_batch(bad_batch, 2, target, NULL, bad_results, &error);
+    qk_circuit_free(too_wide);
+    if (exit != QkExitCode_TranspilerError) {
+        printf("Expected a transpiler error for a circuit wider than the target\n");
+        result = EqualityError;
+    } else {
+        qk_str_free(error);
+        if (bad_results[0].circuit != NULL || bad_results[1].circuit != NULL) {
+            printf("Expected no results to be written on failure\n");
+            result = EqualityError;
+        }
+    }
+
+cleanup:
+    for (size_t c = 0; c < num_circuits; c++) {
+        qk_circuit_free(circuits[c]);
+        qk_circuit_free(results[c].circuit);
+        qk_transpile_layout_free(results[c].layout);
+    }
+    qk_target_free(target);
+    return result;
+}
+
 int test_transpiler(void) {
     int num_failed = 0;
     num_failed += RUN_TEST(test_transpile_bv);
     num_failed += RUN_TEST(test_transpile_idle_qubits);
     num_failed += RUN_TEST(test_transpile_options_null);
+    num_failed += RUN_TEST(test_transpile_batch);
 
     fflush(stderr);
     fprintf(stderr, "=== Number of failed subtests: %i\n", num_failed);
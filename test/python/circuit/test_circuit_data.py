@@ -168,6 +168,21 @@ class TestQuantumCircuitData(QiskitTestCase):
         with self.subTest("global_phase is equal"):
             self.assertEqual(data.global_phase, data_copy.global_phase)
 
+    def test_structural_hash(self):
+        """Test that the structural hash tracks the instruction data."""
+        qr = QuantumRegister(2)
+        data = CircuitData(
+            qubits=qr,
+            data=[
+                CircuitInstruction(RXGate(0.5), [qr[0]], []),
+                CircuitInstruction(CXGate(), [qr[0], qr[1]], []),
+            ],
+        )
+        reference = data.structural_hash()
+        self.assertEqual(data.copy().structural_hash(), reference)
+        data.append(CircuitInstruction(XGate(), [qr[1]], []))
+        self.assertNotEqual(data.structural_hash(), reference)
+
     def test_pickle_roundtrip(self):
         """Test pickle roundtrip coverage"""
         qr = QuantumRegister(1)
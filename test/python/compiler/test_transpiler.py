@@ -12,6 +12,7 @@
 
 """Tests basic functionality of the transpile function"""
 
+import asyncio
 import copy
 import io
 import itertools
@@ -19,6 +20,7 @@ import math
 import os
 import sys
 import random
+import threading
 from logging import StreamHandler, getLogger
 from unittest.mock import patch
 import numpy as np
@@ -80,7 +82,7 @@ from qiskit.circuit.library import (
     XXPlusYYGate,
     RZZGate,
 )
-from qiskit.compiler import transpile
+from qiskit.compiler import atranspile, transpile, transpile_batch
 from qiskit.converters import circuit_to_dag
 from qiskit.dagcircuit import DAGOpNode, DAGOutNode, DAGCircuit
 from qiskit.exceptions import QiskitError
@@ -3201,6 +3203,131 @@ class TestTranspileParallel(QiskitTestCase):
                     )
                 )
 
+    def test_atranspile(self):
+        """Test that atranspile gives the same outputs as transpile, in input order."""
+        backend = GenericBackendV2(num_qubits=5, seed=42)
+        circuits = []
+        for num_qubits in range(2, 6):
+            qc = QuantumCircuit(num_qubits, name=f"ghz_{num_qubits}")
+            qc.h(0)
+            for i in range(1, num_qubits):
+                qc.cx(0, i)
+            qc.measure_all()
+            circuits.append(qc)
+        expected = transpile(circuits, backend, seed_transpiler=7)
+
+        async def run():
+            single = await atranspile(circuits[0], backend, seed_transpiler=7)
+            batch = await atranspile(circuits, backend, seed_transpiler=7, max_concurrency=2)
+            return single, batch
+
+        single, batch = asyncio.run(run())
+        self.assertEqual(single, expected[0])
+        self.assertEqual(batch, expected)
+        self.assertEqual([circuit.name for circuit in batch], [qc.name for qc in circuits])
+
+    def test_atranspile_cancel(self):
+        """Test that cancelling an atranspile task raises CancelledError to the awaiter, and that
+        the circuits that had not started compiling are not compiled."""
+        backend = GenericBackendV2(num_qubits=5, seed=42)
+        qc = QuantumCircuit(5)
+        qc.h(0)
+        for i in range(1, 5):
+            qc.cx(0, i)
+        started = []
+
+        def callback(count, **_):
+            if count == 0:
+                started.append(True)
+
+        async def run():
+            task = asyncio.create_task(
+                atranspile([qc] * 50, backend, max_concurrency=1, callback=callback)
+            )
+            await asyncio.sleep(0)
+            task.cancel()
+            await task
+
+        with self.assertRaises(asyncio.CancelledError):
+            asyncio.run(run())
+        # The circuit being compiled at the time of cancellation runs to completion on the helper
+        # thread, which then closes the stream and exits.
+        for thread in threading.enumerate():
+            if thread.name.startswith("qiskit-atranspile"):
+                thread.join()
+        self.assertLessEqual(len(started), 1)
+
+    def test_atranspile_rejects_stream(self):
+        """Test that the streaming arguments of transpile are rejected."""
+        with self.assertRaisesRegex(TranspilerError, "stream"):
+            asyncio.run(atranspile(QuantumCircuit(1), stream=True))
+
+
+class TestTranspileBatch(QiskitTestCase):
+    """Test the native thread-parallel transpile_batch()."""
+
+    def setUp(self):
+        super().setUp()
+        self.target = GenericBackendV2(num_qubits=5, seed=42).target
+
+    def test_outputs_valid(self):
+        """Test that the outputs are in the target ISA and equivalent to the inputs."""
+        circuits = []
+        for num_qubits in range(2, 6):
+            qc = QuantumCircuit(num_qubits, name=f"ghz_{num_qubits}", metadata={"n": num_qubits})
+            qc.h(0)
+            for i in range(1, num_qubits):
+                qc.cx(i - 1, i)
+            qc.cx(num_qubits - 1, 0)
+            circuits.append(qc)
+        for optimization_level in range(4):
+            with self.subTest(optimization_level=optimization_level):
+                out = transpile_batch(
+                    circuits,
+                    self.target,
+                    optimization_level=optimization_level,
+                    seed_transpiler=7,
+                )
+                self.assertEqual(len(out), len(circuits))
+                for circuit, out_circuit in zip(circuits, out):
+                    self.assertEqual(out_circuit.name, circuit.name)
+                    self.assertEqual(out_circuit.metadata, circuit.metadata)
+                    self.assertIsNotNone(out_circuit.layout)
+                    self.assertTrue(Operator.from_circuit(out_circuit).equiv(circuit))
+                    for inst in out_circuit.data:
+                        self.assertTrue(
+                            self.target.instruction_supported(
+                                inst.name, tuple(out_circuit.find_bit(q).index for q in inst.qubits)
+                            )
+                        )
+
+    def test_deterministic_with_seed(self):
+        """Test that compiling the same circuit many times in parallel gives the same output."""
+        qc = QuantumCircuit(5)
+        qc.h(0)
+        for i in range(1, 5):
+            qc.cx(0, i)
+        qc.measure_all()
+        single = transpile_batch(qc, self.target, seed_transpiler=11)
+        self.assertIsInstance(single, QuantumCircuit)
+        for out in transpile_batch([qc] * 8, self.target, seed_transpiler=11):
+            self.assertEqual(out, single)
+
+    def test_rejects_control_flow(self):
+        """Test that circuits with unsupported operations are rejected."""
+        qc = QuantumCircuit(2, 1)
+        qc.h(0)
+        qc.measure(0, 0)
+        with qc.if_test((qc.clbits[0], True)):
+            qc.x(1)
+        with self.assertRaisesRegex(TranspilerError, "Circuit 1 contains 'if_else'"):
+            transpile_batch([QuantumCircuit(2), qc], self.target)
+
+    def test_rejects_too_wide(self):
+        """Test that circuits wider than the target are rejected."""
+        with self.assertRaisesRegex(TranspilerError, "uses 6 qubits"):
+            transpile_batch([QuantumCircuit(6)], self.target)
+
 
 @ddt
 class TestTranspileMultiChipTarget(QiskitTestCase):
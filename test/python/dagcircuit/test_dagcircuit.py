@@ -59,6 +59,7 @@ from qiskit.circuit.library import (
     U1Gate,
     RXGate,
     CSGate,
+    SdgGate,
 )
 from qiskit.converters import circuit_to_dag
 from test import QiskitTestCase  # pylint: disable=wrong-import-order
@@ -3723,5 +3724,173 @@ class TestStructurallyEqual(QiskitTestCase):
         self.assertFalse(left.structurally_equal(right))
 
 
+class TestStructuralHash(QiskitTestCase):
+    """Test the structural hash of DAGs."""
+
+    def test_same_circuit_same_hash(self):
+        """Two DAGs created from the same circuit should have the same hash."""
+        qc = QuantumCircuit(2, 2)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.measure([0, 1], [0, 1])
+        self.assertEqual(circuit_to_dag(qc).structural_hash(), circuit_to_dag(qc).structural_hash())
+
+    def test_hash_sensitive_to_changes(self):
+        """Changes to operations, wires, parameters and phase should change the hash."""
+        base = QuantumCircuit(2)
+        base.rx(0.5, 0)
+        base.cx(0, 1)
+        reference = circuit_to_dag(base).structural_hash()
+        self.assertIsInstance(reference, int)
+
+        different_param = QuantumCircuit(2)
+        different_param.rx(0.25, 0)
+        different_param.cx(0, 1)
+        different_wires = QuantumCircuit(2)
+        different_wires.rx(0.5, 0)
+        different_wires.cx(1, 0)
+        different_phase = base.copy()
+        different_phase.global_phase = 1.0
+        extra_op = base.copy()
+        extra_op.x(1)
+        for other in (different_param, different_wires, different_phase, extra_op):
+            self.assertNotEqual(circuit_to_dag(other).structural_hash(), reference)
+
+    def test_hash_tracks_mutation(self):
+        """Mutating a DAG in place should change its hash."""
+        qc = QuantumCircuit(1)
+        qc.h(0)
+        qc.h(0)
+        dag = circuit_to_dag(qc)
+        before = dag.structural_hash()
+        dag.remove_op_node(dag.op_nodes()[0])
+        self.assertNotEqual(dag.structural_hash(), before)
+
+    def test_control_flow_unhashable(self):
+        """DAGs with control flow fall back to ``None``."""
+        qc = QuantumCircuit(1, 1)
+        with qc.if_test((qc.clbits[0], True)):
+            qc.x(0)
+        self.assertIsNone(circuit_to_dag(qc).structural_hash())
+
+    def test_custom_gate_unhashable(self):
+        """DAGs with Python-space gates fall back to ``None``, since custom gates with the same
+        name and parameters can have different definitions."""
+        qc = QuantumCircuit(1)
+        qc.append(Gate("custom", 1, []), [0])
+        self.assertIsNone(circuit_to_dag(qc).structural_hash())
+
+
+class TestDagCheckpoints(QiskitTestCase):
+    """Test tracking the changes to a DAG since a checkpoint."""
+
+    def test_no_changes(self):
+        """A DAG that isn't modified has no changed nodes."""
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.cx(0, 1)
+        dag = circuit_to_dag(qc)
+        self.assertIsNone(dag.changed_nodes("pass"))
+        dag.checkpoint("pass")
+        self.assertEqual(dag.changed_nodes("pass"), [])
+
+    def test_changes_are_local(self):
+        """Only added and modified nodes, and the neighbours of removed nodes, are changed."""
+        qc = QuantumCircuit(3)
+        qc.h(0)
+        qc.x(0)
+        qc.cx(0, 1)
+        qc.z(2)
+        qc.s(2)
+        dag = circuit_to_dag(qc)
+        dag.checkpoint("pass")
+        h_node, x_node, cx_node, _, s_node = dag.topological_op_nodes()
+
+        dag.remove_op_node(x_node)
+        self.assertEqual(dag.changed_nodes("pass"), [h_node, cx_node])
+
+        dag.checkpoint("pass")
+        dag.substitute_node(s_node, SdgGate())
+        self.assertEqual([node.name for node in dag.changed_nodes("pass")], ["sdg"])
+
+        dag.checkpoint("pass")
+        new_node = dag.apply_operation_back(YGate(), [dag.qubits[1]], [])
+        self.assertEqual(dag.changed_nodes("pass"), [cx_node, new_node])
+
+    def test_replaced_neighbour_reusing_index(self):
+        """A node whose neighbour was replaced by a different node is changed, even if the new
+        node reuses the index of the removed one."""
+        qc = QuantumCircuit(1)
+        qc.h(0)
+        qc.x(0)
+        dag = circuit_to_dag(qc)
+        dag.checkpoint("pass")
+        h_node, x_node = dag.topological_op_nodes()
+        dag.remove_op_node(x_node)
+        y_node = dag.apply_operation_back(YGate(), [dag.qubits[0]], [])
+        self.assertEqual(y_node._node_id, x_node._node_id)
+        self.assertEqual(dag.changed_nodes("pass"), [h_node, y_node])
+
+    def test_named_independently(self):
+        """Checkpoints of different names are independent, and can be discarded."""
+        qc = QuantumCircuit(1)
+        qc.h(0)
+        dag = circuit_to_dag(qc)
+        dag.checkpoint("first")
+        new_node = dag.apply_operation_back(XGate(), [dag.qubits[0]], [])
+        dag.checkpoint("second")
+        self.assertEqual(dag.changed_nodes("first"), [dag.op_nodes()[0], new_node])
+        self.assertEqual(dag.changed_nodes("second"), [])
+        dag.discard_checkpoint("first")
+        self.assertIsNone(dag.changed_nodes("first"))
+
+    def test_older_checkpoint_keeps_changes(self):
+        """Setting and discarding a newer checkpoint doesn't lose the changes since an older one."""
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.h(1)
+        dag = circuit_to_dag(qc)
+        h0_node, h1_node = dag.topological_op_nodes()
+        dag.checkpoint("older")
+        first = dag.apply_operation_back(XGate(), [dag.qubits[0]], [])
+        dag.checkpoint("newer")
+        second = dag.apply_operation_back(XGate(), [dag.qubits[1]], [])
+        self.assertEqual(dag.changed_nodes("newer"), [h1_node, second])
+        dag.discard_checkpoint("newer")
+        self.assertEqual(
+            {node._node_id for node in dag.changed_nodes("older")},
+            {node._node_id for node in (h0_node, h1_node, first, second)},
+        )
+
+    def test_substituted_dag_is_changed(self):
+        """Substituting a node with a DAG changes the new nodes and the ones around them."""
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.z(1)
+        qc.s(0)
+        qc.t(0)
+        dag = circuit_to_dag(qc)
+        dag.checkpoint("pass")
+        cx_node = dag.named_nodes("cx")[0]
+        replacement = QuantumCircuit(2)
+        replacement.h(1)
+        replacement.cz(0, 1)
+        replacement.h(1)
+        dag.substitute_node_with_dag(cx_node, circuit_to_dag(replacement))
+        self.assertEqual(
+            sorted(node.name for node in dag.changed_nodes("pass")), ["cz", "h", "h", "h", "s", "z"]
+        )
+
+    def test_copies_keep_checkpoints(self):
+        """Copies keep the checkpoints of the original, but pickled DAGs do not."""
+        qc = QuantumCircuit(1)
+        qc.h(0)
+        dag = circuit_to_dag(qc)
+        dag.checkpoint("pass")
+        self.assertEqual(copy.deepcopy(dag).changed_nodes("pass"), [])
+        self.assertIsNone(pickle.loads(pickle.dumps(dag)).changed_nodes("pass"))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -13,9 +13,18 @@
 
 """Pass manager test cases."""
 
+import gc
+import os
+
 from test.python.passmanager import PassManagerTestCase
 
-from qiskit.passmanager import GenericPass, BasePassManager
+from qiskit.passmanager import (
+    GenericPass,
+    BasePassManager,
+    PassManagerError,
+    PassManagerPool,
+    PassProfiler,
+)
 from qiskit.passmanager.flow_controllers import DoWhileController, ConditionalController
 
 
@@ -167,3 +176,101 @@ class TestPassManager(PassManagerTestCase):
 
         pm = IntPassManager([ZeroPass()])
         self.assertEqual(pm.run(5), 0)
+
+    def test_pool_matches_serial(self):
+        """Test that running through a persistent pool gives the same result as running serially."""
+        data = [123456789, 45654, 36785554]
+        pm = ToyPassManager([RemoveFive(), AddDigit()])
+        with PassManagerPool(num_processes=2) as pool:
+            self.assertEqual(pm.run(data, pool=pool), [12346780, 4640, 367840])
+            # Re-running reuses the already-loaded pass manager in the workers.
+            self.assertEqual(pm.run(data, pool=pool), [12346780, 4640, 367840])
+
+    def test_pool_invalidate(self):
+        """Test that invalidating a pool picks up in-place changes to a pass manager."""
+        data = [15, 25]
+        pm = ToyPassManager(RemoveFive())
+        with PassManagerPool(num_processes=2) as pool:
+            self.assertEqual(pm.run(data, pool=pool), [1, 2])
+            pm.append(AddDigit())
+            pool.invalidate(pm)
+            self.assertEqual(pm.run(data, pool=pool), [10, 20])
+
+    def test_pool_removes_files_of_dead_pass_managers(self):
+        """Test that a pool deletes a serialized pass manager once no pass manager uses it."""
+        data = [15, 25]
+        with PassManagerPool(num_processes=2) as pool:
+            kept = ToyPassManager(RemoveFive())
+            self.assertEqual(kept.run(data, pool=pool), [1, 2])
+            for _ in range(3):
+                # Each of these serializes identically, so they all share one file.
+                self.assertEqual(ToyPassManager(AddDigit()).run(data, pool=pool), [150, 250])
+                gc.collect()
+            self.assertEqual(len(os.listdir(pool._directory)), 1)
+            # The remaining file still serves the live pass manager.
+            self.assertEqual(kept.run(data, pool=pool), [1, 2])
+            del kept
+            gc.collect()
+            self.assertEqual(os.listdir(pool._directory), [])
+
+    def test_pool_shutdown(self):
+        """Test that a pool that has been shut down cannot be reused."""
+        pm = ToyPassManager(RemoveFive())
+        pool = PassManagerPool(num_processes=2)
+        pool.shutdown()
+        with self.assertRaises(PassManagerError):
+            pm.run([15, 25], pool=pool)
+
+    def test_run_iter_serial(self):
+        """Test that run_iter yields every output with its property set."""
+        pm = ToyPassManager([RemoveFive(), CountDigits()])
+        out = sorted(pm.run_iter(iter([123456789, 45654, 36785554])), key=lambda item: item[0])
+        self.assertEqual([index for index, _, _ in out], [0, 1, 2])
+        self.assertEqual([program for _, program, _ in out], [12346789, 464, 36784])
+        self.assertEqual([ps["ndigits"] for _, _, ps in out], [8, 3, 5])
+
+    def test_run_iter_pool(self):
+        """Test that run_iter through a pool yields every output, bounded by max_in_flight."""
+        data = list(range(50, 60))
+        pm = ToyPassManager([RemoveFive(), AddDigit(), CountDigits()])
+        with PassManagerPool(num_processes=2) as pool:
+            out = list(pm.run_iter((x for x in data), pool=pool, max_in_flight=3))
+        out.sort(key=lambda item: item[0])
+        self.assertEqual([index for index, _, _ in out], list(range(10)))
+        expected = [int(str(x).replace("5", "") + "0") for x in data]
+        self.assertEqual([program for _, program, _ in out], expected)
+        self.assertEqual([ps["ndigits"] for _, _, ps in out], [2] * 10)
+
+    def test_profiler_records_loop_iterations(self):
+        """Test that the profiler records every pass execution, including loop iterations."""
+
+        def _condition(property_set):
+            return property_set["ndigits"] < 7
+
+        controller = DoWhileController([AddDigit(), CountDigits()], do_while=_condition)
+        pm = ToyPassManager([RemoveFive(), controller])
+        profiler = PassProfiler()
+        pm.run([123456, 78], profiler=profiler)
+        records = profiler.records
+        names = [record.name for record in records if record.program_index == 0]
+        self.assertEqual(names, ["RemoveFive"] + ["AddDigit", "CountDigits"] * 2)
+        names = [record.name for record in records if record.program_index == 1]
+        self.assertEqual(names, ["RemoveFive"] + ["AddDigit", "CountDigits"] * 5)
+        self.assertTrue(all(record.memory_delta is not None for record in records))
+        self.assertTrue(all(record.size_before is None for record in records))
+        summary = {group["name"]: group for group in profiler.summary()}
+        self.assertEqual(summary["AddDigit"]["calls"], 7)
+        self.assertIn("AddDigit", profiler.table())
+
+    def test_profiler_pool(self):
+        """Test that profiles recorded in worker processes are merged with the right indices."""
+        data = [5, 15, 25, 35]
+        pm = ToyPassManager([RemoveFive(), AddDigit()])
+        profiler = PassProfiler(track_memory=False)
+        with PassManagerPool(num_processes=2) as pool:
+            out = pm.run(data, pool=pool, profiler=profiler)
+        self.assertEqual(out, [0, 10, 20, 30])
+        records = profiler.records
+        indices = sorted(record.program_index for record in records)
+        self.assertEqual(indices, [0, 0, 1, 1, 2, 2, 3, 3])
+        self.assertTrue(all(record.memory_delta is None for record in records))
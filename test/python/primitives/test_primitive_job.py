@@ -12,6 +12,7 @@
 
 """Tests for PrimitiveJob."""
 
+import asyncio
 import pickle
 from test import QiskitTestCase
 
@@ -49,3 +50,30 @@ class TestPrimitiveJob(QiskitTestCase):
             self.assertEqual(sampler_pub.metadata, sampler_pub.metadata)
             self.assertEqual(sampler_pub.data.keys(), sampler_pub.data.keys())
             np.testing.assert_allclose(sampler_pub.join_data().array, sampler_pub.join_data().array)
+
+    def test_await(self):
+        """Test that a job can be awaited for its result."""
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.measure_all()
+        sampler = StatevectorSampler(seed=42)
+
+        async def run():
+            return await sampler.run([qc], shots=100)
+
+        result = asyncio.run(run())
+        expected = sampler.run([qc], shots=100).result()
+        self.assertEqual(result[0].data.meas.get_counts(), expected[0].data.meas.get_counts())
+
+    def test_await_after_result(self):
+        """Test that a completed job can still be awaited."""
+        qc = QuantumCircuit(1)
+        qc.measure_all()
+        job = StatevectorSampler().run([qc], shots=10)
+        result = job.result()
+
+        async def run():
+            return await job
+
+        self.assertIs(asyncio.run(run()), result)
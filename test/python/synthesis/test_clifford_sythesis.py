@@ -12,8 +12,11 @@
 
 """Tests for Clifford synthesis functions."""
 
+import itertools
+
 from ddt import ddt
-from qiskit.quantum_info import random_clifford
+from qiskit.circuit import QuantumCircuit
+from qiskit.quantum_info import random_clifford, random_pauli
 from qiskit.quantum_info.operators import Clifford
 from qiskit.synthesis.clifford import (
     synth_clifford_full,
@@ -106,3 +109,20 @@ class TestCliffordSynthesis(QiskitTestCase):
             synth_circ = synth_clifford_full(target)
             value = Clifford(synth_circ)
             self.assertEqual(value, target)
+
+    @combine(num_qubits=[2, 3])
+    def test_synth_bm_symmetries(self, num_qubits):
+        """Test B&M synthesis of {num_qubits}-qubit Cliffords that share a lookup-table entry."""
+        for seed in range(10):
+            clifford = random_clifford(num_qubits, seed=seed)
+            num_cx = synth_clifford_bm(clifford).count_ops().get("cx", 0)
+            for pauli_seed, permutation in enumerate(itertools.permutations(range(num_qubits))):
+                # Conjugating by a permutation and multiplying by a Pauli keep the CX cost.
+                pauli = random_pauli(num_qubits, seed=pauli_seed)
+                circuit = QuantumCircuit(num_qubits)
+                circuit.append(pauli.to_instruction(), circuit.qubits)
+                circuit.compose(clifford.to_circuit(), qubits=permutation, inplace=True)
+                target = Clifford(circuit)
+                synth_circ = synth_clifford_bm(target)
+                self.assertEqual(Clifford(synth_circ), target)
+                self.assertEqual(synth_circ.count_ops().get("cx", 0), num_cx)
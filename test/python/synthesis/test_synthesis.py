@@ -1442,6 +1442,96 @@ class TestTwoQubitDecomposeApprox(CheckDecompositions):
         self.check_approx_decomposition(tgt_unitary, decomposer, num_basis_uses=3)
 
 
+class TestTwoQubitDecomposeBatch(CheckDecompositions):
+    """Test the batched two-qubit decomposition interfaces"""
+
+    def setUp(self):
+        super().setUp()
+        self.unitaries = np.stack([random_unitary(4, seed=seed).data for seed in range(70)])
+
+    def test_batch_coordinates(self):
+        """Verify that the batched Weyl coordinates match the individual decompositions"""
+        coordinates, global_phases = TwoQubitWeylDecomposition.batch_coordinates(self.unitaries)
+        self.assertEqual(coordinates.shape, (70, 3))
+        for unitary, abc, global_phase in zip(self.unitaries, coordinates, global_phases):
+            expected = TwoQubitWeylDecomposition(unitary)
+            np.testing.assert_allclose(abc, [expected.a, expected.b, expected.c], atol=1e-13)
+            self.assertAlmostEqual(global_phase, expected.global_phase, places=13)
+
+    def test_decompose_batch(self):
+        """Verify that the batched decompositions match the individual ones"""
+        decomposer = TwoQubitBasisDecomposer(CXGate(), euler_basis="ZSX")
+        batch = decomposer.decompose_batch(self.unitaries)
+        self.assertEqual(len(batch), 70)
+        self.assertEqual(batch.offsets[-1], len(batch.gates))
+        for i, unitary in enumerate(self.unitaries):
+            self.assertEqual(batch[i], decomposer(unitary))
+            self.assertTrue(Operator(batch[i]).equiv(unitary))
+
+    def test_decompose_batch_unitary_basis(self):
+        """Verify batched decomposition over a non-standard basis gate"""
+        decomposer = TwoQubitBasisDecomposer(UnitaryGate(Ud(np.pi / 4, 0, 0)))
+        batch = decomposer.decompose_batch(self.unitaries[:5], approximate=False)
+        for i, unitary in enumerate(self.unitaries[:5]):
+            self.assertTrue(Operator(batch[i]).equiv(unitary))
+
+    def test_bad_shape(self):
+        """Verify that a stack of matrices of the wrong size is rejected"""
+        with self.assertRaises(ValueError):
+            TwoQubitWeylDecomposition.batch_coordinates(np.eye(4, dtype=complex))
+        with self.assertRaises(ValueError):
+            two_qubit_cnot_decompose.decompose_batch(np.zeros((2, 2, 2), dtype=complex))
+
+
+class TestTwoQubitBasisDecomposerCache(CheckDecompositions):
+    """Test the decomposition cache shared by TwoQubitBasisDecomposer instances"""
+
+    def setUp(self):
+        super().setUp()
+        max_size = TwoQubitBasisDecomposer.cache_info().max_size
+        self.addCleanup(TwoQubitBasisDecomposer.set_cache_size, max_size)
+        self.addCleanup(TwoQubitBasisDecomposer.cache_clear)
+        TwoQubitBasisDecomposer.cache_clear()
+
+    def test_repeated_interaction_hits(self):
+        """Verify that targets with the same Weyl coordinates share a skeleton and stay exact"""
+        state = np.random.default_rng(2025)
+        targets = [
+            np.kron(random_unitary(2, seed=state).data, random_unitary(2, seed=state).data)
+            @ Ud(np.pi / 4, np.pi / 4, np.pi / 4)
+            @ np.kron(random_unitary(2, seed=state).data, random_unitary(2, seed=state).data)
+            for _ in range(3)
+        ]
+        for target in targets:
+            decomposer = TwoQubitBasisDecomposer(CXGate(), euler_basis="ZYZ")
+            self.check_exact_decomposition(target, decomposer)
+        info = TwoQubitBasisDecomposer.cache_info()
+        self.assertEqual((info.hits, info.misses, info.current_size), (2, 1, 1))
+
+    def test_basis_is_part_of_key(self):
+        """Verify that decomposers with different bases do not share entries"""
+        target = Ud(np.pi / 4, np.pi / 4, np.pi / 4)
+        self.check_exact_decomposition(target, TwoQubitBasisDecomposer(CXGate(), euler_basis="ZYZ"))
+        self.check_exact_decomposition(target, TwoQubitBasisDecomposer(CZGate(), euler_basis="ZYZ"))
+        self.check_exact_decomposition(target, TwoQubitBasisDecomposer(CXGate(), euler_basis="U"))
+        info = TwoQubitBasisDecomposer.cache_info()
+        self.assertEqual((info.hits, info.misses, info.current_size), (0, 3, 3))
+
+    def test_set_cache_size(self):
+        """Verify that the size bound evicts entries and that zero disables the cache"""
+        decomposer = TwoQubitBasisDecomposer(CXGate(), euler_basis="ZYZ")
+        TwoQubitBasisDecomposer.set_cache_size(1)
+        self.check_exact_decomposition(Ud(np.pi / 4, np.pi / 4, np.pi / 4), decomposer)
+        self.check_exact_decomposition(Ud(np.pi / 4, 0, 0), decomposer)
+        self.assertEqual(TwoQubitBasisDecomposer.cache_info().current_size, 1)
+        TwoQubitBasisDecomposer.set_cache_size(0)
+        self.assertEqual(TwoQubitBasisDecomposer.cache_info().current_size, 0)
+        self.check_exact_decomposition(Ud(np.pi / 4, 0, 0), decomposer)
+        self.assertEqual(TwoQubitBasisDecomposer.cache_info().current_size, 0)
+        with self.assertRaises(ValueError):
+            TwoQubitBasisDecomposer.set_cache_size(-1)
+
+
 @ddt
 class TestTwoQubitControlledUDecompose(CheckDecompositions):
     """Test TwoQubitControlledUDecomposer() for exact decompositions and raised exceptions"""
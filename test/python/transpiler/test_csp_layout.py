@@ -17,21 +17,31 @@ from time import process_time
 
 from qiskit import QuantumRegister, QuantumCircuit
 from qiskit.providers.fake_provider import GenericBackendV2
-from qiskit.transpiler import CouplingMap
+from qiskit.transpiler import CouplingMap, Layout
 from qiskit.transpiler.passes import CSPLayout
+from qiskit.transpiler.passes.layout.vf2_utils import ErrorMap
 from qiskit.converters import circuit_to_dag
-from qiskit.utils import optionals
 from test import QiskitTestCase  # pylint: disable=wrong-import-order
 
 from ..legacy_cmaps import TENERIFE_CMAP, RUESCHLIKON_CMAP, TOKYO_CMAP, YORKTOWN_CMAP
 
 
-@unittest.skipUnless(optionals.HAS_CONSTRAINT, "needs python-constraint")
 class TestCSPLayout(QiskitTestCase):
     """Tests the CSPLayout pass"""
 
     seed = 42
 
+    def assertLayoutSatisfies(self, dag, layout, coupling_map, strict_direction):
+        """Assert that every two-qubit operation in the DAG is on an edge of the coupling map."""
+        edges = set(coupling_map.get_edges())
+        self.assertEqual(len({layout[qubit] for qubit in dag.qubits}), dag.num_qubits())
+        for node in dag.two_qubit_ops():
+            pair = (layout[node.qargs[0]], layout[node.qargs[1]])
+            if strict_direction:
+                self.assertIn(pair, edges)
+            else:
+                self.assertTrue(pair in edges or pair[::-1] in edges, msg=f"{pair} is not an edge")
+
     def test_2q_circuit_2q_coupling(self):
         """A simple example, without considering the direction
           0 - 1
@@ -46,8 +56,7 @@ class TestCSPLayout(QiskitTestCase):
         pass_.run(dag)
         layout = pass_.property_set["layout"]
 
-        self.assertEqual(layout[qr[0]], 1)
-        self.assertEqual(layout[qr[1]], 0)
+        self.assertLayoutSatisfies(dag, layout, CouplingMap([[0, 1]]), strict_direction=False)
         self.assertEqual(pass_.property_set["CSPLayout_stop_reason"], "solution found")
 
     def test_3q_circuit_5q_coupling(self):
@@ -70,9 +79,7 @@ class TestCSPLayout(QiskitTestCase):
         pass_.run(dag)
         layout = pass_.property_set["layout"]
 
-        self.assertEqual(layout[qr[0]], 3)
-        self.assertEqual(layout[qr[1]], 2)
-        self.assertEqual(layout[qr[2]], 4)
+        self.assertLayoutSatisfies(dag, layout, CouplingMap(cmap5), strict_direction=False)
         self.assertEqual(pass_.property_set["CSPLayout_stop_reason"], "solution found")
 
     def test_3q_circuit_5q_coupling_with_target(self):
@@ -99,9 +106,7 @@ class TestCSPLayout(QiskitTestCase):
         pass_.run(dag)
         layout = pass_.property_set["layout"]
 
-        self.assertEqual(layout[qr[0]], 3)
-        self.assertEqual(layout[qr[1]], 2)
-        self.assertEqual(layout[qr[2]], 4)
+        self.assertLayoutSatisfies(dag, layout, target.build_coupling_map(), strict_direction=False)
         self.assertEqual(pass_.property_set["CSPLayout_stop_reason"], "solution found")
 
     def test_9q_circuit_16q_coupling(self):
@@ -124,15 +129,7 @@ class TestCSPLayout(QiskitTestCase):
         pass_.run(dag)
         layout = pass_.property_set["layout"]
 
-        self.assertEqual(layout[qr0[0]], 9)
-        self.assertEqual(layout[qr0[1]], 6)
-        self.assertEqual(layout[qr0[2]], 7)
-        self.assertEqual(layout[qr0[3]], 5)
-        self.assertEqual(layout[qr1[0]], 14)
-        self.assertEqual(layout[qr1[1]], 12)
-        self.assertEqual(layout[qr1[2]], 1)
-        self.assertEqual(layout[qr1[3]], 8)
-        self.assertEqual(layout[qr1[4]], 10)
+        self.assertLayoutSatisfies(dag, layout, CouplingMap(cmap16), strict_direction=False)
         self.assertEqual(pass_.property_set["CSPLayout_stop_reason"], "solution found")
 
     def test_2q_circuit_2q_coupling_sd(self):
@@ -174,9 +171,7 @@ class TestCSPLayout(QiskitTestCase):
         pass_.run(dag)
         layout = pass_.property_set["layout"]
 
-        self.assertEqual(layout[qr[0]], 1)
-        self.assertEqual(layout[qr[1]], 2)
-        self.assertEqual(layout[qr[2]], 0)
+        self.assertLayoutSatisfies(dag, layout, CouplingMap(cmap5), strict_direction=True)
         self.assertEqual(pass_.property_set["CSPLayout_stop_reason"], "solution found")
 
     def test_9q_circuit_16q_coupling_sd(self):
@@ -199,15 +194,7 @@ class TestCSPLayout(QiskitTestCase):
         pass_.run(dag)
         layout = pass_.property_set["layout"]
 
-        self.assertEqual(layout[qr0[0]], 9)
-        self.assertEqual(layout[qr0[1]], 6)
-        self.assertEqual(layout[qr0[2]], 7)
-        self.assertEqual(layout[qr0[3]], 5)
-        self.assertEqual(layout[qr1[0]], 14)
-        self.assertEqual(layout[qr1[1]], 12)
-        self.assertEqual(layout[qr1[2]], 1)
-        self.assertEqual(layout[qr1[3]], 10)
-        self.assertEqual(layout[qr1[4]], 8)
+        self.assertLayoutSatisfies(dag, layout, CouplingMap(cmap16), strict_direction=True)
         self.assertEqual(pass_.property_set["CSPLayout_stop_reason"], "solution found")
 
     def test_5q_circuit_16q_coupling_no_solution(self):
@@ -271,16 +258,17 @@ class TestCSPLayout(QiskitTestCase):
         return circuit_to_dag(circuit)
 
     def test_time_limit(self):
-        """Hard to solve situations hit the time limit"""
+        """The time limit is checked at every step of the search"""
         dag = TestCSPLayout.create_hard_dag()
         coupling_map = CouplingMap(TOKYO_CMAP)
-        pass_ = CSPLayout(coupling_map, call_limit=None, time_limit=1)
+        pass_ = CSPLayout(coupling_map, call_limit=None, time_limit=0)
 
         start = process_time()
         pass_.run(dag)
         runtime = process_time() - start
 
-        self.assertLess(runtime, 3)
+        self.assertLess(runtime, 1)
+        self.assertIsNone(pass_.property_set["layout"])
         self.assertEqual(pass_.property_set["CSPLayout_stop_reason"], "time limit reached")
 
     def test_call_limit(self):
@@ -297,28 +285,90 @@ class TestCSPLayout(QiskitTestCase):
         self.assertEqual(pass_.property_set["CSPLayout_stop_reason"], "call limit reached")
 
     def test_seed(self):
-        """Different seeds yield different results"""
-        seed_1 = 42
-        seed_2 = 43
+        """The same seed yields the same result"""
+        cmap16 = RUESCHLIKON_CMAP
 
-        cmap5 = TENERIFE_CMAP
+        circuit = QuantumCircuit(6)
+        circuit.cx(0, 1)
+        circuit.cx(1, 2)
+        circuit.cx(3, 4)
+        dag = circuit_to_dag(circuit)
 
-        qr = QuantumRegister(3, "qr")
+        layouts = []
+        for seed in (self.seed, self.seed):
+            pass_ = CSPLayout(CouplingMap(cmap16), seed=seed)
+            pass_.run(dag)
+            self.assertLayoutSatisfies(
+                dag, pass_.property_set["layout"], CouplingMap(cmap16), strict_direction=False
+            )
+            layouts.append(pass_.property_set["layout"])
+        self.assertEqual(layouts[0], layouts[1])
+
+    def test_initial_layout(self):
+        """Pre-assigned qubits are kept where they are"""
+        qr = QuantumRegister(4, "qr")
         circuit = QuantumCircuit(qr)
-        circuit.cx(qr[1], qr[0])  # qr1 -> qr0
-        circuit.cx(qr[0], qr[2])  # qr0 -> qr2
-        circuit.cx(qr[1], qr[2])  # qr1 -> qr2
+        circuit.cx(qr[0], qr[1])
+        circuit.cx(qr[1], qr[2])
+        circuit.h(qr[3])
+        dag = circuit_to_dag(circuit)
+        coupling_map = CouplingMap(RUESCHLIKON_CMAP)
+
+        initial_layout = Layout({qr[1]: 12, qr[3]: 0})
+        pass_ = CSPLayout(coupling_map, seed=self.seed, initial_layout=initial_layout)
+        pass_.run(dag)
+        layout = pass_.property_set["layout"]
+
+        self.assertEqual(pass_.property_set["CSPLayout_stop_reason"], "solution found")
+        self.assertEqual(layout[qr[1]], 12)
+        self.assertEqual(layout[qr[3]], 0)
+        self.assertLayoutSatisfies(dag, layout, coupling_map, strict_direction=False)
+
+    def test_initial_layout_no_solution(self):
+        """Pre-assigned qubits that cannot interact leave no solution"""
+        qr = QuantumRegister(2, "qr")
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[1])
+        dag = circuit_to_dag(circuit)
+
+        initial_layout = Layout({qr[0]: 0, qr[1]: 2})
+        pass_ = CSPLayout(CouplingMap.from_line(3), initial_layout=initial_layout)
+        pass_.run(dag)
+
+        self.assertIsNone(pass_.property_set["layout"])
+        self.assertEqual(pass_.property_set["CSPLayout_stop_reason"], "nonexistent solution")
+
+    def test_error_map(self):
+        """With an error map, the layout with the lowest error is found"""
+        qr = QuantumRegister(2, "qr")
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[1])
+        circuit.cx(qr[1], qr[0])
         dag = circuit_to_dag(circuit)
+        error_map = ErrorMap(2)
+        error_map.add_error((0, 1), 0.1)
+        error_map.add_error((1, 2), 0.01)
+
+        pass_ = CSPLayout(CouplingMap.from_line(3, bidirectional=False), seed=self.seed)
+        pass_.property_set["vf2_avg_error_map"] = error_map
+        pass_.run(dag)
+        layout = pass_.property_set["layout"]
 
-        pass_1 = CSPLayout(CouplingMap(cmap5), seed=seed_1)
-        pass_1.run(dag)
-        layout_1 = pass_1.property_set["layout"]
+        self.assertEqual(pass_.property_set["CSPLayout_stop_reason"], "solution found")
+        self.assertEqual({layout[qr[0]], layout[qr[1]]}, {1, 2})
 
-        pass_2 = CSPLayout(CouplingMap(cmap5), seed=seed_2)
-        pass_2.run(dag)
-        layout_2 = pass_2.property_set["layout"]
+    def test_more_than_2q(self):
+        """Operations on more than two qubits are ignored"""
+        circuit = QuantumCircuit(3)
+        circuit.ccx(0, 1, 2)
+        circuit.cx(0, 1)
+        dag = circuit_to_dag(circuit)
+        pass_ = CSPLayout(CouplingMap(TENERIFE_CMAP), seed=self.seed)
+        pass_.run(dag)
+        layout = pass_.property_set["layout"]
 
-        self.assertNotEqual(layout_1, layout_2)
+        self.assertLayoutSatisfies(dag, layout, CouplingMap(TENERIFE_CMAP), strict_direction=False)
+        self.assertEqual(pass_.property_set["CSPLayout_stop_reason"], "solution found")
 
 
 if __name__ == "__main__":
@@ -15,6 +15,7 @@
 import unittest
 from qiskit.transpiler.passes import DAGFixedPoint
 from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.circuit.library import RZGate
 from qiskit.converters import circuit_to_dag
 from test import QiskitTestCase  # pylint: disable=wrong-import-order
 
@@ -48,6 +49,58 @@ class TestFixedPointPass(QiskitTestCase):
         pass_.run(dag)
         self.assertFalse(pass_.property_set["dag_fixed_point"])
 
+    def test_parameter_change_false(self):
+        """Test that changing only a gate parameter is not a fixed point."""
+        circuit = QuantumCircuit(1)
+        circuit.rz(0.5, 0)
+        dag = circuit_to_dag(circuit)
+
+        pass_ = DAGFixedPoint()
+        pass_.run(dag)
+        self.assertIsNone(pass_.property_set["_dag_fixed_point_previous_dag"])
+        pass_.run(dag)
+        self.assertTrue(pass_.property_set["dag_fixed_point"])
+        node = dag.op_nodes()[0]
+        dag.substitute_node(node, RZGate(0.25))
+        pass_.run(dag)
+        self.assertFalse(pass_.property_set["dag_fixed_point"])
+
+    def test_control_flow_fallback(self):
+        """Test the fixed point of a DAG with control flow, which can't be hashed."""
+        circuit = QuantumCircuit(1, 1)
+        circuit.measure(0, 0)
+        with circuit.if_test((circuit.clbits[0], True)):
+            circuit.x(0)
+        dag = circuit_to_dag(circuit)
+
+        pass_ = DAGFixedPoint()
+        pass_.run(dag)
+        self.assertFalse(pass_.property_set["dag_fixed_point"])
+        pass_.run(dag)
+        self.assertTrue(pass_.property_set["dag_fixed_point"])
+        dag.remove_all_ops_named("measure")
+        pass_.run(dag)
+        self.assertFalse(pass_.property_set["dag_fixed_point"])
+
+    def test_custom_gates_same_name(self):
+        """Test replacing a custom gate by a different one with the same name is a change."""
+        first = QuantumCircuit(1, name="custom")
+        first.x(0)
+        second = QuantumCircuit(1, name="custom")
+        second.z(0)
+        circuit = QuantumCircuit(1)
+        circuit.append(first.to_gate(), [0])
+        dag = circuit_to_dag(circuit)
+
+        pass_ = DAGFixedPoint()
+        pass_.run(dag)
+        pass_.run(dag)
+        self.assertTrue(pass_.property_set["dag_fixed_point"])
+        node = dag.op_nodes()[0]
+        dag.substitute_node(node, second.to_gate())
+        pass_.run(dag)
+        self.assertFalse(pass_.property_set["dag_fixed_point"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,130 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for ensembles of pass managers."""
+
+from qiskit import QuantumCircuit
+from qiskit.circuit.library import QFTGate
+from qiskit.compiler import transpile_ensemble
+from qiskit.providers.fake_provider import GenericBackendV2
+from qiskit.quantum_info import Operator
+from qiskit.transpiler import (
+    EnsemblePassManager,
+    OptimizationMetric,
+    TranspilerError,
+    generate_preset_pass_manager,
+)
+from test import QiskitTestCase  # pylint: disable=wrong-import-order
+
+
+def _qft(num_qubits):
+    qc = QuantumCircuit(num_qubits)
+    qc.append(QFTGate(num_qubits), qc.qubits)
+    qc.measure_all()
+    return qc
+
+
+class TestEnsemblePassManager(QiskitTestCase):
+    """Tests for EnsemblePassManager and transpile_ensemble."""
+
+    def setUp(self):
+        super().setUp()
+        self.backend = GenericBackendV2(num_qubits=7, seed=42)
+
+    def test_selects_lowest_cost(self):
+        """Test that the best output matches running its pass manager directly."""
+        seeds = [3, 5, 7, 11]
+        pms = [generate_preset_pass_manager(1, self.backend, seed_transpiler=s) for s in seeds]
+        result = EnsemblePassManager(pms, labels=seeds).run(_qft(5))
+        self.assertEqual([candidate.label for candidate in result.candidates], seeds)
+        costs = [candidate.cost for candidate in result.candidates]
+        self.assertEqual(result.best.cost, min(costs))
+        self.assertEqual(result.best.label, seeds[costs.index(min(costs))])
+        self.assertEqual(result.circuit.num_nonlocal_gates(), result.best.cost)
+        expected = generate_preset_pass_manager(
+            1, self.backend, seed_transpiler=result.best.label
+        ).run(_qft(5))
+        self.assertEqual(result.circuit, expected)
+        self.assertEqual(result.circuit.layout, expected.layout)
+
+    def test_shared_init_with_permutations(self):
+        """Test that sharing the init stage keeps layout selection and the virtual permutation."""
+        qc = QuantumCircuit(4)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.swap(1, 2)
+        qc.cx(2, 3)
+        pms = [generate_preset_pass_manager(3, self.backend, seed_transpiler=s) for s in range(3)]
+        result = EnsemblePassManager(pms).run(qc)
+        for pm, candidate in zip(pms, result.candidates):
+            self.assertEqual(candidate.size, pm.run(qc).size())
+        expected = pms[result.best.label].run(qc)
+        self.assertEqual(result.circuit, expected)
+        self.assertEqual(result.circuit.layout, expected.layout)
+
+    def test_elided_permutations_equivalent(self):
+        """Test that the outputs are equivalent to the input when the init stage elides swaps."""
+        qc = QuantumCircuit(4)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.swap(0, 2)
+        qc.cx(1, 2)
+        qc.swap(1, 3)
+        qc.cx(3, 0)
+        pms = [generate_preset_pass_manager(2, self.backend, seed_transpiler=s) for s in range(3)]
+        result = EnsemblePassManager(pms).run(qc)
+        self.assertTrue(Operator.from_circuit(result.circuit).equiv(qc))
+
+    def test_custom_cost(self):
+        """Test that a callable metric is used, and ties go to the first member."""
+        pms = [generate_preset_pass_manager(1, self.backend, seed_transpiler=s) for s in range(3)]
+        result = EnsemblePassManager(pms, metric=lambda circuit: 0).run([_qft(4), _qft(3)])
+        self.assertEqual(len(result), 2)
+        for item in result:
+            self.assertEqual(item.best.label, 0)
+            self.assertEqual({candidate.cost for candidate in item.candidates}, {0})
+
+    def test_bad_labels(self):
+        """Test that the labels must match the members."""
+        pm = generate_preset_pass_manager(1, self.backend)
+        with self.assertRaisesRegex(TranspilerError, "labels"):
+            EnsemblePassManager([pm], labels=[0, 1])
+        with self.assertRaises(TranspilerError):
+            EnsemblePassManager([])
+
+    def test_transpile_ensemble(self):
+        """Test the transpile wrapper over seeds and optimization levels."""
+        result = transpile_ensemble(
+            [_qft(5)],
+            self.backend,
+            seeds=3,
+            optimization_levels=[1, 2],
+            seed_transpiler=2025,
+            metric=OptimizationMetric.COUNT_2Q,
+        )[0]
+        self.assertEqual(len(result.candidates), 6)
+        self.assertEqual({candidate.label[0] for candidate in result.candidates}, {1, 2})
+        level, seed = result.best.label
+        expected = generate_preset_pass_manager(level, self.backend, seed_transpiler=seed).run(
+            _qft(5)
+        )
+        self.assertEqual(result.circuit, expected)
+
+    def test_transpile_ensemble_reproducible(self):
+        """Test that drawing the seeds is controlled by seed_transpiler."""
+        first = transpile_ensemble(_qft(4), self.backend, seeds=2, seed_transpiler=1)
+        second = transpile_ensemble(_qft(4), self.backend, seeds=2, seed_transpiler=1)
+        self.assertEqual(
+            [candidate.label for candidate in first.candidates],
+            [candidate.label for candidate in second.candidates],
+        )
+        self.assertEqual(first.circuit, second.circuit)
@@ -62,6 +62,7 @@ from qiskit.quantum_info import (
     Statevector,
     SparsePauliOp,
     SparseObservable,
+    random_clifford,
 )
 from qiskit.synthesis.evolution import synth_pauli_network_rustiq, LieTrotter
 from qiskit.synthesis.linear import random_invertible_binary_matrix
@@ -1169,6 +1170,28 @@ class TestTokenSwapperPermutationPlugin(QiskitTestCase):
         # and `HighLevelSynthesis` should not change the original circuit.
         self.assertEqual(qc_transpiled, qc)
 
+    def test_concrete_synthesis_disconnected_coupling_map(self):
+        """Test concrete synthesis on a disconnected coupling map, which is only possible for
+        permutations within its connected components.
+        """
+        coupling_map = CouplingMap([(0, 1), (1, 0), (2, 3), (3, 2)])
+        synthesis_config = HLSConfig(permutation=[("token_swapper", {"trials": 10})])
+        pm = PassManager(
+            HighLevelSynthesis(
+                synthesis_config, coupling_map=coupling_map, target=None, use_qubit_indices=True
+            )
+        )
+
+        qc = QuantumCircuit(4)
+        qc.append(PermutationGate([1, 0, 3, 2]), [0, 1, 2, 3])
+        qc_transpiled = pm.run(qc)
+        self.assertNotIn("permutation", qc_transpiled.count_ops())
+        self.assertEqual(Operator(qc), Operator(qc_transpiled))
+
+        qc = QuantumCircuit(4)
+        qc.append(PermutationGate([2, 1, 0, 3]), [0, 1, 2, 3])
+        self.assertEqual(pm.run(qc), qc)
+
     def test_abstract_synthesis_all_permutations(self):
         """Test abstract synthesis of permutation gates, varying permutation gate patterns."""
 
@@ -3264,5 +3287,77 @@ def count_rotation_gates(qc: QuantumCircuit):
     )
 
 
+class TestHighLevelSynthesisCache(QiskitTestCase):
+    """Tests for the cache of synthesized high-level objects."""
+
+    def test_identical_objects_synthesized_once(self):
+        """Test that identical objects only hit the synthesis plugins once."""
+        cliff = random_clifford(2, seed=1)
+        qc = QuantumCircuit(4)
+        for qubits in [[0, 1], [2, 3], [1, 2], [3, 0]]:
+            qc.append(cliff, qubits)
+
+        hls = HighLevelSynthesis(basis_gates=["cx", "u"], qubits_initially_zero=False)
+        out = hls(qc)
+        cache = hls.data.synthesis_cache
+        self.assertEqual((cache.hits, cache.misses), (3, 1))
+
+        uncached = HighLevelSynthesis(
+            basis_gates=["cx", "u"], qubits_initially_zero=False, cache_size=0
+        )
+        self.assertIsNone(uncached.data.synthesis_cache)
+        self.assertEqual(out, uncached(qc))
+
+        # The cache is kept across the circuits that the pass runs on.
+        hls(qc)
+        self.assertEqual((cache.hits, cache.misses), (7, 1))
+
+    def test_ancillas_are_part_of_key(self):
+        """Test that objects with different auxiliary qubits available do not collide."""
+        qc = QuantumCircuit(8)
+        qc.mcx([0, 1, 2, 3, 4], 5)
+        qc.mcx([0, 1, 2, 3, 4], 5)
+        qc.h(6)
+        qc.mcx([0, 1, 2, 3, 4], 5)
+
+        hls = HighLevelSynthesis(basis_gates=["cx", "u"])
+        out = hls(qc)
+        uncached = HighLevelSynthesis(basis_gates=["cx", "u"], cache_size=0)
+        self.assertEqual(out, uncached(qc))
+
+    def test_eviction(self):
+        """Test that the least-recently used entries are evicted."""
+        qc = QuantumCircuit(2)
+        for seed in range(3):
+            qc.append(random_clifford(2, seed=seed), [0, 1])
+
+        hls = HighLevelSynthesis(basis_gates=["cx", "u"], qubits_initially_zero=False, cache_size=2)
+        hls(qc)
+        self.assertEqual(len(hls.data.synthesis_cache), 2)
+
+    def test_concurrent_synthesis(self):
+        """Test that concurrently synthesizing distinct objects gives the sequential result."""
+        qc = QuantumCircuit(6)
+        for seed in range(6):
+            qc.append(random_clifford(3, seed=seed), [seed % 6, (seed + 2) % 6, (seed + 4) % 6])
+        qc.append(LinearFunction(random_invertible_binary_matrix(4, seed=7)), [0, 2, 3, 5])
+        qc.append(random_clifford(3, seed=0), [1, 3, 5])
+
+        sequential = HighLevelSynthesis(basis_gates=["cx", "u"], qubits_initially_zero=False)
+        concurrent = HighLevelSynthesis(
+            basis_gates=["cx", "u"], qubits_initially_zero=False, num_threads=4
+        )
+        self.assertEqual(concurrent(qc), sequential(qc))
+        # The distinct objects are all synthesized in advance of the pass.
+        self.assertEqual(concurrent.data.synthesis_cache.misses, 0)
+
+    def test_invalid_arguments(self):
+        """Test that invalid cache sizes and thread counts raise."""
+        with self.assertRaises(TranspilerError):
+            HighLevelSynthesis(basis_gates=["cx", "u"], cache_size=-1)
+        with self.assertRaises(TranspilerError):
+            HighLevelSynthesis(basis_gates=["cx", "u"], num_threads=0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -474,7 +474,7 @@ class LayoutTest(QiskitTestCase):
 
 
 class TestNLayout(QiskitTestCase):
-    """This is a private class, so mostly doesn't need direct tests."""
+    """Tests for NLayout."""
 
     def test_pickle(self):
         """Test that the layout roundtrips through pickle."""
@@ -521,6 +521,61 @@ class TestNLayout(QiskitTestCase):
         self.assertEqual([layout.virtual_to_physical(x) for x in range(size)], v2p)
         self.assertEqual([roundtripped.virtual_to_physical(x) for x in range(size)], expected)
 
+    def test_arrays(self):
+        """Test the layout can be read out as arrays."""
+        v2p = [3, 5, 1, 2, 0, 4]
+        layout = NLayout.from_virtual_to_physical(v2p)
+        numpy.testing.assert_array_equal(layout.virtual_to_physical_array(), v2p)
+        numpy.testing.assert_array_equal(layout.physical_to_virtual_array(), [4, 2, 3, 0, 5, 1])
+        self.assertEqual(len(layout), 6)
+        self.assertEqual(layout.num_physical_qubits, 6)
+
+    def test_apply(self):
+        """Test mapping arrays of virtual qubits."""
+        layout = NLayout.from_array(numpy.array([3, 5, 1, 2, 0, 4]))
+        numpy.testing.assert_array_equal(layout.apply([0, 0, 5, 2]), [3, 3, 4, 1])
+        numpy.testing.assert_array_equal(layout.apply(numpy.array([[1, 2]])[0]), [5, 1])
+        self.assertEqual(layout.apply([]).shape, (0,))
+        with self.assertRaises(IndexError):
+            layout.apply([6])
+        with self.assertRaises(IndexError):
+            layout.apply([-1])
+
+    def test_apply_unmapped(self):
+        """Test mapping a virtual qubit that is not in the layout."""
+        layout = NLayout({0: 2}, 2, 3)
+        with self.assertRaisesRegex(ValueError, "not in the layout"):
+            layout.apply([1])
+
+    def test_inverse(self):
+        """Test the inverse undoes the layout."""
+        layout = NLayout.from_array([3, 0, 4], 5)
+        inverse = layout.inverse()
+        self.assertEqual(len(inverse), 5)
+        self.assertEqual(inverse.num_physical_qubits, 3)
+        numpy.testing.assert_array_equal(inverse.apply(layout.apply([0, 1, 2])), [0, 1, 2])
+        self.assertEqual(inverse.inverse(), layout)
+
+    def test_compose(self):
+        """Test composing two layouts."""
+        first = NLayout.from_array([2, 0, 1])
+        second = NLayout.from_array([1, 4, 0], 5)
+        composed = first.compose(second)
+        numpy.testing.assert_array_equal(composed.virtual_to_physical_array(), [0, 1, 4])
+        self.assertEqual(composed.num_physical_qubits, 5)
+        numpy.testing.assert_array_equal(
+            composed.apply([0, 1, 2]), second.apply(first.apply([0, 1, 2]))
+        )
+        with self.assertRaises(ValueError):
+            second.compose(first)
+
+    def test_from_array_invalid(self):
+        """Test invalid arrays are rejected."""
+        with self.assertRaisesRegex(ValueError, "more than once"):
+            NLayout.from_array([0, 0])
+        with self.assertRaisesRegex(ValueError, "out of range"):
+            NLayout.from_array([0, 3], 3)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -16,11 +16,13 @@ import unittest
 from numpy import pi
 
 from qiskit.dagcircuit import DAGCircuit
-from qiskit.transpiler.passes import LookaheadSwap
-from qiskit.transpiler import CouplingMap, Target
+from qiskit.transpiler.passes import CheckMap, LookaheadSwap
+from qiskit.transpiler import CouplingMap, PassManager, Target
 from qiskit.converters import circuit_to_dag
-from qiskit.circuit.library import CXGate
+from qiskit.circuit.library import CXGate, PermutationGate
+from qiskit.circuit.random import random_circuit
 from qiskit import ClassicalRegister, QuantumRegister, QuantumCircuit
+from qiskit.quantum_info import Operator
 from test import QiskitTestCase  # pylint: disable=wrong-import-order
 
 from ..legacy_cmaps import MELBOURNE_CMAP
@@ -315,6 +317,48 @@ class TestLookaheadSwap(QiskitTestCase):
             mapped_dag.count_ops().get("swap", 0), dag_circuit.count_ops().get("swap", 0) + 1
         )
 
+    def test_equivalent_on_larger_device(self):
+        """Test that the routed circuit is valid and equivalent to the input, and reproducible."""
+        num_qubits = 8
+        qc = random_circuit(num_qubits, 6, max_operands=2, seed=7)
+        coupling_map = CouplingMap.from_line(num_qubits)
+        pm = PassManager(
+            [LookaheadSwap(coupling_map, search_depth=3, search_width=3), CheckMap(coupling_map)]
+        )
+        routed = pm.run(qc)
+        self.assertTrue(pm.property_set["is_swap_mapped"])
+
+        # Each virtual qubit finishes on the physical qubit given by the final layout.
+        final_layout = pm.property_set["final_layout"]
+        permutation = [None] * num_qubits
+        for virtual, qubit in enumerate(routed.qubits):
+            permutation[final_layout[qubit]] = virtual
+        expected = qc.copy()
+        expected.append(PermutationGate(permutation), expected.qubits)
+        self.assertEqual(Operator(routed), Operator(expected))
+        self.assertEqual(pm.run(qc), routed)
+
+    def test_fake_run(self):
+        """Test that a fake run sets the same final layout, but leaves the circuit unchanged."""
+        qc = random_circuit(6, 5, max_operands=2, seed=3)
+        dag = circuit_to_dag(qc)
+        coupling_map = CouplingMap.from_ring(6)
+        real = LookaheadSwap(coupling_map)
+        real.run(dag)
+        fake = LookaheadSwap(coupling_map, fake_run=True)
+        self.assertEqual(fake.run(dag), dag)
+        self.assertEqual(fake.property_set["final_layout"], real.property_set["final_layout"])
+
+    def test_narrow_circuit_is_padded(self):
+        """Test that a circuit narrower than the coupling map is routed on idle ancillas."""
+        qc = QuantumCircuit(QuantumRegister(3, "q"))
+        qc.cx(0, 2)
+        coupling_map = CouplingMap.from_line(4)
+        pm = PassManager([LookaheadSwap(coupling_map), CheckMap(coupling_map)])
+        routed = pm.run(qc)
+        self.assertTrue(pm.property_set["is_swap_mapped"])
+        self.assertEqual(routed.num_qubits, 4)
+        self.assertEqual(routed.count_ops(), {"swap": 1, "cx": 1})
 
 if __name__ == "__main__":
     unittest.main()
@@ -31,9 +31,11 @@ from qiskit.circuit.library.standard_gates import (
     RYGate,
     HGate,
     SGate,
+    XGate,
 )
 from qiskit.circuit.random import random_circuit
 from qiskit.compiler import transpile
+from qiskit.converters import circuit_to_dag
 from qiskit.transpiler import PassManager, Target, InstructionProperties
 from qiskit.transpiler.passes import Optimize1qGatesDecomposition
 from qiskit.transpiler.passes import BasisTranslator
@@ -797,6 +799,26 @@ class TestOptimize1qGatesDecomposition(QiskitTestCase):
         self.assertIn("rz", res.count_ops())
         self.assertIn("sx", res.count_ops())
 
+    def test_track_changes(self):
+        """Test that tracking changes gives the same results over repeated runs on one DAG."""
+        qc = QuantumCircuit(3)
+        qc.h(0)
+        qc.t(0)
+        qc.cx(0, 1)
+        qc.s(2)
+        qc.h(2)
+        tracked_dag = circuit_to_dag(qc)
+        plain_dag = circuit_to_dag(qc)
+        tracked = Optimize1qGatesDecomposition(["rz", "sx", "cx"], track_changes=True)
+        plain = Optimize1qGatesDecomposition(["rz", "sx", "cx"])
+        for gate, qubit in [(None, None), (HGate(), 1), (XGate(), 2), (None, None)]:
+            for dag in (tracked_dag, plain_dag):
+                if gate is not None:
+                    dag.apply_operation_back(gate, [dag.qubits[qubit]], [])
+            tracked_dag = tracked.run(tracked_dag)
+            plain_dag = plain.run(plain_dag)
+            self.assertEqual(tracked_dag, plain_dag)
+
 
 if __name__ == "__main__":
     unittest.main()
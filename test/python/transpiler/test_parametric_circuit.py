@@ -0,0 +1,127 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for binding transpiled parametric circuits."""
+
+import math
+
+import numpy as np
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter, ParameterVector
+from qiskit.circuit.library import real_amplitudes
+from qiskit.primitives.containers import BindingsArray
+from qiskit.providers.fake_provider import GenericBackendV2
+from qiskit.quantum_info import Operator
+from qiskit.transpiler import CompiledParametricCircuit, TranspilerError
+from test import QiskitTestCase  # pylint: disable=wrong-import-order
+
+
+class TestCompiledParametricCircuit(QiskitTestCase):
+    """Tests for CompiledParametricCircuit."""
+
+    def setUp(self):
+        super().setUp()
+        self.backend = GenericBackendV2(num_qubits=4, seed=42)
+
+    def test_matches_assign_parameters(self):
+        """Test that binding gives the same circuits as binding the transpiled circuit directly."""
+        ansatz = real_amplitudes(3, reps=2)
+        compiled = CompiledParametricCircuit.from_transpile(
+            ansatz, self.backend, optimization_level=2, seed_transpiler=0
+        )
+        rng = np.random.default_rng(0)
+        values = rng.uniform(-np.pi, np.pi, size=(2, 3, ansatz.num_parameters))
+        bound = compiled.bind(values)
+        self.assertEqual(bound.shape, (2, 3))
+        for index in np.ndindex(2, 3):
+            expected = compiled.circuit.assign_parameters(
+                dict(zip(ansatz.parameters, values[index]))
+            )
+            self.assertEqual(bound[index].parameters, set())
+            self.assertEqual(bound[index].layout, compiled.circuit.layout)
+            self.assertEqual(Operator(bound[index]), Operator(expected))
+
+    def test_expressions_and_global_phase(self):
+        """Test that slots hold fused expressions, including in the global phase."""
+        theta = Parameter("θ")
+        phi = Parameter("φ")
+        qc = QuantumCircuit(1, global_phase=theta / 2)
+        qc.rz(2 * theta + 1, 0)
+        qc.rx(phi.sin() - theta, 0)
+        qc.ry(2 * theta + 1, 0)
+        compiled = CompiledParametricCircuit(qc)
+        self.assertEqual(compiled.num_slots, 3)
+        self.assertEqual(compiled.parameters, (theta, phi))
+        values = compiled.parameter_values(np.array([[0.5, 0.25], [1.0, -0.5]]))
+        self.assertEqual(values.shape, (2, 3))
+        for row, (theta_value, phi_value) in zip(values, [(0.5, 0.25), (1.0, -0.5)]):
+            np.testing.assert_allclose(
+                sorted(row),
+                sorted([2 * theta_value + 1, math.sin(phi_value) - theta_value, theta_value / 2]),
+            )
+
+    def test_bindings_array(self):
+        """Test that values can be given as a BindingsArray, in any parameter order."""
+        vec = ParameterVector("x", 2)
+        qc = QuantumCircuit(2)
+        qc.rx(vec[0], 0)
+        qc.ry(vec[1] + vec[0], 1)
+        compiled = CompiledParametricCircuit(qc)
+        bindings = BindingsArray({(vec[1], vec[0]): [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]})
+        bound = compiled.bind(bindings)
+        self.assertEqual(bound.shape, (3,))
+        expected = [qc.assign_parameters([2.0, 1.0]), qc.assign_parameters([4.0, 3.0])]
+        self.assertEqual(Operator(bound[0]), Operator(expected[0]))
+        self.assertEqual(Operator(bound[1]), Operator(expected[1]))
+
+    def test_missing_values(self):
+        """Test that bindings must cover every input parameter."""
+        qc = QuantumCircuit(1)
+        qc.rx(Parameter("a"), 0)
+        qc.rz(Parameter("b"), 0)
+        compiled = CompiledParametricCircuit(qc)
+        with self.assertRaisesRegex(TranspilerError, "'b'"):
+            compiled.parameter_values({"a": [[0.1], [0.2]]})
+        with self.assertRaises(TranspilerError):
+            compiled.parameter_values(np.zeros((4, 3)))
+
+    def test_removed_parameter_is_input(self):
+        """Test that input parameters the transpiler removed are still accepted."""
+        theta = Parameter("θ")
+        phi = Parameter("φ")
+        qc = QuantumCircuit(1)
+        qc.rz(theta, 0)
+        compiled = CompiledParametricCircuit(qc, parameters=[theta, phi])
+        self.assertEqual(compiled.parameters, (theta, phi))
+        np.testing.assert_allclose(compiled.parameter_values(np.array([0.5, 0.25])), [0.5])
+        np.testing.assert_allclose(
+            compiled.parameter_values({("θ", "φ"): [[0.5, 0.25], [1.5, 0.25]]}), [[0.5], [1.5]]
+        )
+        with self.assertRaisesRegex(TranspilerError, "not inputs"):
+            CompiledParametricCircuit(qc, parameters=[phi])
+
+    def test_optimize(self):
+        """Test that optimizing removes gates that become identities with the bound values."""
+        theta = Parameter("θ")
+        qc = QuantumCircuit(2)
+        qc.rx(theta, 0)
+        qc.cx(0, 1)
+        compiled = CompiledParametricCircuit.from_transpile(
+            qc, self.backend, optimization_level=1, seed_transpiler=0
+        )
+        plain = compiled.bind(np.array([0.0]))
+        optimized = compiled.bind(np.array([0.0]), optimize=True)
+        self.assertLess(optimized.item().size(), plain.item().size())
+        self.assertEqual(optimized.item().layout, compiled.circuit.layout)
+        with self.assertRaisesRegex(TranspilerError, "target"):
+            CompiledParametricCircuit(compiled.circuit).bind(np.array([0.0]), optimize=True)
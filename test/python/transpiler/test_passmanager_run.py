@@ -14,9 +14,10 @@
 
 from qiskit import QuantumRegister, QuantumCircuit
 from qiskit.circuit.library import CXGate
+from qiskit.passmanager import PassProfiler
 from qiskit.transpiler.preset_passmanagers import level_1_pass_manager
 from qiskit.providers.fake_provider import GenericBackendV2
-from qiskit.transpiler import Layout, PassManager
+from qiskit.transpiler import Layout, PassManager, generate_preset_pass_manager
 from qiskit.transpiler.passmanager_config import PassManagerConfig
 from ..legacy_cmaps import ALMADEN_CMAP
 from test import QiskitTestCase  # pylint: disable=wrong-import-order
@@ -214,3 +215,52 @@ class TestPassManagerRun(QiskitTestCase):
             for instruction in new_circuit.data:
                 if isinstance(instruction.operation, CXGate):
                     self.assertIn([bit_indices[x] for x in instruction.qubits], coupling_map)
+
+    def test_run_iter_streams_generator(self):
+        """Test that run_iter accepts a generator and yields every circuit with its layout."""
+        backend = GenericBackendV2(num_qubits=5, seed=42)
+        pm = generate_preset_pass_manager(1, backend, seed_transpiler=42)
+
+        def circuits():
+            for num_qubits in range(2, 5):
+                qc = QuantumCircuit(num_qubits, name=f"ghz_{num_qubits}")
+                qc.h(0)
+                for i in range(1, num_qubits):
+                    qc.cx(0, i)
+                yield qc
+
+        out = sorted(pm.run_iter(circuits(), max_in_flight=2), key=lambda item: item[0])
+        self.assertEqual([index for index, _, _ in out], [0, 1, 2])
+        for (_, circuit, property_set), num_qubits in zip(out, range(2, 5)):
+            self.assertEqual(circuit.name, f"ghz_{num_qubits}")
+            self.assertEqual(circuit, pm.run(list(circuits())[num_qubits - 2]))
+            self.assertIsNotNone(property_set["layout"])
+
+    def test_profiler_stages_and_sizes(self):
+        """Test that profiling a staged pass manager records stages and circuit sizes."""
+        backend = GenericBackendV2(num_qubits=5, seed=42)
+        pm = generate_preset_pass_manager(2, backend, seed_transpiler=42)
+        qc = QuantumCircuit(3)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.cx(1, 2)
+        qc.cx(0, 2)
+        profiler = PassProfiler()
+        pm.run([qc, qc], profiler=profiler)
+
+        records = profiler.records
+        self.assertEqual({record.program_index for record in records}, {0, 1})
+        self.assertTrue({"layout", "translation", "optimization"} <= {r.stage for r in records})
+        first = [record for record in records if record.program_index == 0]
+        self.assertEqual(first[0].size_before, 4)
+        self.assertEqual(first[0].num_2q_before, 3)
+        for before, after in zip(first, first[1:]):
+            self.assertEqual(after.size_before, before.size_after)
+            self.assertGreaterEqual(after.start, before.start)
+        self.assertEqual(first[-1].num_2q_after, pm.run(qc).num_nonlocal_gates())
+
+        stages = profiler.summary(by="stage")
+        self.assertEqual(sum(stage["calls"] for stage in stages), len(records))
+        trace = profiler.chrome_trace()
+        self.assertEqual(len(trace["traceEvents"]), len(records))
+        self.assertEqual({event["ph"] for event in trace["traceEvents"]}, {"X"})
@@ -0,0 +1,116 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for persisted routing tables."""
+
+import os
+import tempfile
+
+import numpy as np
+
+from qiskit import QuantumCircuit
+from qiskit.providers.fake_provider import GenericBackendV2
+from qiskit.transpiler import CouplingMap, PassManager, RoutingTable, TranspilerError
+from qiskit.transpiler.passes import SabreLayout, SabreSwap
+from test import QiskitTestCase  # pylint: disable=wrong-import-order
+
+
+class TestRoutingTable(QiskitTestCase):
+    """Tests for RoutingTable."""
+
+    def setUp(self):
+        super().setUp()
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        # Cleanups run in reverse order, so the tables are cleared before their files are removed.
+        self.addCleanup(RoutingTable.clear)
+        self.path = os.path.join(tmpdir.name, "table.routing")
+
+    def test_distance_matrix_matches_coupling_map(self):
+        """Test the mapped distance matrix is the same as the calculated one."""
+        coupling = CouplingMap.from_heavy_hex(5)
+        expected = coupling.distance_matrix
+        table = RoutingTable.build(coupling, self.path)
+        self.assertNotIsInstance(expected, np.memmap)
+        self.assertEqual(table.num_qubits, coupling.size())
+        np.testing.assert_array_equal(table.distance_matrix, expected)
+        self.assertFalse(table.distance_matrix.flags.writeable)
+
+    def test_coupling_map_uses_loaded_table(self):
+        """Test a new coupling map of the same graph uses the loaded table."""
+        RoutingTable.build(CouplingMap.from_grid(4, 5), self.path)
+        coupling = CouplingMap.from_grid(4, 5)
+        self.assertIsInstance(coupling.distance_matrix, np.memmap)
+        RoutingTable.clear()
+        self.assertNotIsInstance(CouplingMap.from_grid(4, 5).distance_matrix, np.memmap)
+
+    def test_disconnected_coupling_map_is_not_used(self):
+        """Test a table with unconnected pairs is not used for the distance of a coupling map."""
+        coupling = CouplingMap([[0, 1], [2, 3]])
+        table = RoutingTable.build(coupling, self.path)
+        self.assertTrue(np.isnan(table.distance_matrix[0, 2]))
+        self.assertEqual(CouplingMap([[0, 1], [2, 3]]).distance_matrix[0, 2], np.inf)
+
+    def test_build_from_target(self):
+        """Test a table can be built from a target."""
+        backend = GenericBackendV2(num_qubits=7, seed=42)
+        expected = backend.coupling_map.distance_matrix
+        table = RoutingTable.build(backend.target, self.path)
+        np.testing.assert_array_equal(table.distance_matrix, expected)
+
+    def test_routing_with_loaded_table(self):
+        """Test routing with a loaded table gives the same result as without."""
+        coupling = CouplingMap.from_line(6)
+        qc = QuantumCircuit(6)
+        qc.h(0)
+        for i in range(1, 6):
+            qc.cx(0, i)
+        qc.cx(5, 1)
+        expected = PassManager([SabreLayout(coupling, seed=7)]).run(qc)
+        RoutingTable.build(coupling, self.path)
+        self.assertEqual(PassManager([SabreLayout(coupling, seed=7)]).run(qc), expected)
+        expected_swap = PassManager([SabreSwap(coupling, seed=7)]).run(qc)
+        self.assertEqual(PassManager([SabreSwap(coupling, seed=7)]).run(qc), expected_swap)
+
+    def test_table_shared_between_loads(self):
+        """Test loading the same file again replaces the registered table."""
+        coupling = CouplingMap.from_ring(8)
+        expected = coupling.distance_matrix
+        RoutingTable.build(coupling, self.path)
+        table = RoutingTable(self.path)
+        self.assertEqual(table.path, self.path)
+        np.testing.assert_array_equal(table.distance_matrix, expected)
+
+    def test_invalid_file(self):
+        """Test loading a file that is not a routing table raises."""
+        with open(self.path, "wb") as file:
+            file.write(b"not a routing table, but long enough to hold a header")
+        with self.assertRaisesRegex(TranspilerError, "not a routing table"):
+            RoutingTable(self.path)
+
+    def test_truncated_file(self):
+        """Test loading a truncated file raises."""
+        with open(self.path, "wb") as file:
+            file.write(b"QKRTBL01")
+        with self.assertRaisesRegex(TranspilerError, "too short"):
+            RoutingTable(self.path)
+
+    def test_truncated_body(self):
+        """Test loading a file whose body is shorter than its header describes raises."""
+        RoutingTable.build(CouplingMap.from_line(5), self.path)
+        with open(self.path, "rb") as file:
+            contents = file.read()
+        truncated = self.path + ".truncated"
+        with open(truncated, "wb") as file:
+            file.write(contents[:-1])
+        with self.assertRaisesRegex(TranspilerError, "not a valid routing table"):
+            RoutingTable(truncated)
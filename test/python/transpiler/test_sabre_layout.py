@@ -12,7 +12,9 @@
 
 """Test the SabreLayout pass"""
 
+import os
 import unittest
+from unittest import mock
 
 import math
 
@@ -21,7 +23,7 @@ from qiskit.circuit import library as lib, Parameter
 from qiskit.circuit.classical import expr, types
 from qiskit.circuit.library import efficient_su2, quantum_volume
 from qiskit.transpiler import CouplingMap, AnalysisPass, PassManager, Target, Layout
-from qiskit.transpiler.passes import SabreLayout, DenseLayout, Unroll3qOrMore, BasicSwap
+from qiskit.transpiler.passes import SabreLayout, DenseLayout, Unroll3qOrMore, BasicSwap, CheckMap
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.converters import circuit_to_dag
 from qiskit.compiler.transpiler import transpile
@@ -372,6 +374,37 @@ barrier q18585[5],q18585[2],q18585[8],q18585[3],q18585[6];
             expected.cx(0, target)
         self.assertEqual(out, expected)
 
+    def test_time_limit(self):
+        """Test that trials are skipped once the time limit is reached."""
+        qc = efficient_su2(8, entanglement="circular", reps=2)
+        cmap = CouplingMap.from_heavy_hex(3)
+
+        pm = PassManager([SabreLayout(cmap, seed=0, swap_trials=2, layout_trials=4)])
+        unlimited = pm.run(qc)
+        # The random trials, and the dense, trivial and reversed heuristic layouts.
+        self.assertEqual(pm.property_set["sabre_layout_trials_completed"], 7)
+
+        pm = PassManager(
+            [SabreLayout(cmap, seed=0, swap_trials=2, layout_trials=4, time_limit=600.0)]
+        )
+        self.assertEqual(pm.run(qc), unlimited)
+        self.assertEqual(pm.property_set["sabre_layout_trials_completed"], 7)
+
+        pm = PassManager(
+            [
+                SabreLayout(cmap, seed=0, swap_trials=2, layout_trials=4, time_limit=0),
+                CheckMap(cmap),
+            ]
+        )
+        pm.run(qc)
+        self.assertEqual(pm.property_set["sabre_layout_trials_completed"], 1)
+        self.assertTrue(pm.property_set["is_swap_mapped"])
+
+    def test_negative_time_limit(self):
+        """Test that a negative time limit is rejected."""
+        with self.assertRaisesRegex(ValueError, "time limit"):
+            SabreLayout(CouplingMap.from_line(3), time_limit=-1.0)(QuantumCircuit(3))
+
 
 class DensePartialSabreTrial(AnalysisPass):
     """Pass to run dense layout as a sabre trial."""
@@ -508,6 +541,41 @@ class TestDisjointDeviceSabreLayout(QiskitTestCase):
         layout = pm.property_set["layout"]
         self.assertEqual([layout[q] for q in qc.qubits], [3, 2, 1, 5, 4, 7, 6, 8])
 
+    def test_parallel_components_deterministic(self):
+        """Test that laying out many components in parallel gives the same result as serially."""
+        num_islands = 6
+        edges = []
+        for island in range(num_islands):
+            base = 5 * island
+            edges.extend([base + i, base + i + 1] for i in range(4))
+        cmap = CouplingMap(edges)
+        qc = QuantumCircuit(5 * num_islands)
+        for island in range(num_islands):
+            base = 5 * island
+            qc.h(base)
+            for i in range(1, 5):
+                qc.cx(base, base + i)
+            qc.cx(base + 4, base + 1)
+        qc.measure_all()
+
+        def run():
+            layout_routing_pass = SabreLayout(cmap, seed=2025, swap_trials=4, layout_trials=4)
+            out = layout_routing_pass(qc)
+            return out, out.layout.initial_index_layout()
+
+        with mock.patch.dict(os.environ, {"QISKIT_IN_PARALLEL": "TRUE"}):
+            serial = run()
+        with mock.patch.dict(
+            os.environ, {"QISKIT_IN_PARALLEL": "FALSE", "QISKIT_FORCE_THREADS": "TRUE"}
+        ):
+            parallel = run()
+        self.assertEqual(serial[1], parallel[1])
+        self.assertEqual(serial[0], parallel[0])
+        for island in range(num_islands):
+            island_qubits = set(range(5 * island, 5 * island + 5))
+            physical = {serial[1][q] for q in island_qubits}
+            self.assertEqual(len({p // 5 for p in physical}), 1)
+
     def test_dag_fits_in_one_component(self):
         """Test that the output is valid if the DAG all fits in a single component of a disjoint
         coupling map.."""
@@ -12,11 +12,13 @@
 
 """Test the Sabre Swap pass"""
 
+import os
 import unittest
 import itertools
 import pickle
 from copy import deepcopy
 import io
+from unittest import mock
 
 import ddt
 import numpy.random
@@ -384,6 +386,24 @@ class TestSabreSwap(QiskitTestCase):
         # Check that a re-run with the same seed produces the same circuit in the exact same order.
         self.assertEqual(normalize_nodes(dag_0), normalize_nodes(pass_0.run(dag)))
 
+    def test_time_limit(self):
+        """Test that trials are skipped once the time limit is reached."""
+        qc = random_circuit(10, 10, max_operands=2, seed=3)
+        coupling = CouplingMap.from_line(10)
+        pm = PassManager([SabreSwap(coupling, "decay", seed=0, trials=4), CheckMap(coupling)])
+        unlimited = pm.run(qc)
+        self.assertEqual(pm.property_set["sabre_swap_trials_completed"], 4)
+
+        pm = PassManager(
+            [SabreSwap(coupling, "decay", seed=0, trials=4, time_limit=0.0), CheckMap(coupling)]
+        )
+        limited = pm.run(qc)
+        self.assertEqual(pm.property_set["sabre_swap_trials_completed"], 1)
+        self.assertTrue(pm.property_set["is_swap_mapped"])
+        self.assertGreaterEqual(
+            limited.count_ops().get("swap", 0), unlimited.count_ops().get("swap", 0)
+        )
+
     def test_rejects_too_many_qubits(self):
         """Test that a sensible Python-space error message is emitted if the DAG has an incorrect
         number of qubits."""
@@ -1026,6 +1046,65 @@ class TestSabreSwapControlFlow(QiskitTestCase):
 
         self.assertEqual(canonicalize_control_flow(test), canonicalize_control_flow(expected))
 
+    def test_sibling_blocks_routed_concurrently_deterministic(self):
+        """Test that routing sibling control-flow blocks in parallel gives the same output as
+        routing them serially."""
+        num_qubits = 8
+        qreg = QuantumRegister(num_qubits, "q")
+        creg = ClassicalRegister(3, "c")
+        rng = numpy.random.default_rng(2025)
+        qc = QuantumCircuit(qreg, creg)
+        for i in range(6):
+            qc.cx(*rng.choice(num_qubits, size=2, replace=False).tolist())
+            qc.measure(i % num_qubits, creg[i % 3])
+            cases = []
+            for _ in range(4):
+                case = QuantumCircuit(qreg, creg[:])
+                for _ in range(5):
+                    case.cx(*rng.choice(num_qubits, size=2, replace=False).tolist())
+                cases.append(case)
+            qc.switch(
+                creg, [(0, cases[0]), (1, cases[1]), (2, cases[2]), (3, cases[3])], qreg, creg
+            )
+        qc.measure_all(add_bits=True)
+
+        coupling = CouplingMap.from_line(num_qubits)
+
+        def run():
+            return SabreSwap(coupling, "decay", seed=2025, trials=2)(qc)
+
+        with mock.patch.dict(os.environ, {"QISKIT_IN_PARALLEL": "TRUE"}):
+            serial = run()
+        with mock.patch.dict(
+            os.environ, {"QISKIT_IN_PARALLEL": "FALSE", "QISKIT_FORCE_THREADS": "TRUE"}
+        ):
+            parallel = run()
+
+        check = CheckMap(coupling)
+        check(parallel)
+        self.assertTrue(check.property_set["is_swap_mapped"])
+        self.assertEqual(canonicalize_control_flow(serial), canonicalize_control_flow(parallel))
+
+    def test_routed_block_keeps_circuit_attributes(self):
+        """Test that routed control-flow blocks keep the name, metadata and duration of the input
+        blocks, like ``dag_to_circuit``."""
+        qreg = QuantumRegister(3, "q")
+        creg = ClassicalRegister(1, "c")
+        body = QuantumCircuit(qreg, name="body", metadata={"key": "value"})
+        body.cx(0, 2)
+        body._duration = 100
+        body._unit = "ns"
+        qc = QuantumCircuit(qreg, creg)
+        qc.measure(0, 0)
+        qc.if_test((creg, 0), body, qreg, [])
+
+        routed = SabreSwap(CouplingMap.from_line(3), "basic", seed=0, trials=1)(qc)
+        block = routed.data[-1].operation.blocks[0]
+        self.assertEqual(block.name, "body")
+        self.assertEqual(block.metadata, {"key": "value"})
+        self.assertEqual(block._duration, 100)
+        self.assertEqual(block._unit, "ns")
+
     def test_switch_expr_single_case(self):
         """Test routing of 'switch' with an `Expr` target and just a single case."""
         qreg = QuantumRegister(5, "q")
@@ -245,6 +245,37 @@ class TestSolovayKitaev(QiskitTestCase):
         # Check that both flows produce the same result
         self.assertEqual(discretized, reference)
 
+    def test_load_from_table(self):
+        """Test loading basic approximations from a memory-mapped table works."""
+        gate_approx_library = generate_basic_approximations(basis_gates=["h", "s", "sdg"], depth=3)
+        sk = SolovayKitaevDecomposition(gate_approx_library)
+
+        circuit = QuantumCircuit(1)
+        circuit.rx(0.8, 0)
+        reference = SolovayKitaev(basic_approximations=gate_approx_library)(circuit)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            fullpath = os.path.join(tmp_dir, "approximations.table")
+            sk.save_basic_approximation_table(fullpath)
+
+            from_table = SolovayKitaevDecomposition(fullpath)
+            self.assertEqual(
+                len(SolovayKitaevDecomposition.load_basic_approximations(fullpath)),
+                len(gate_approx_library),
+            )
+            for angle in np.linspace(0.1, 3.0, 7):
+                matrix = RXGate(angle).to_matrix()
+                self.assertEqual(
+                    from_table.query_basic_approximation(matrix),
+                    sk.query_basic_approximation(matrix),
+                )
+
+            discretized = SolovayKitaev(basic_approximations=fullpath)(circuit)
+            # Release the mapped file before the directory is removed.
+            del from_table
+
+        self.assertEqual(discretized, reference)
+
     def test_load_legacy_format(self):
         """Test loading basic approximations from a legacy npy format."""
         filename = "approximations.npy"
@@ -12,6 +12,7 @@
 
 """Tests for swap strategies."""
 
+import pickle
 from typing import List
 from ddt import data, ddt, unpack
 import numpy as np
@@ -259,3 +260,29 @@ class TestLineSwapStrategy(QiskitTestCase):
             "[[0, 1], [1, 0], [1, 2], [2, 1]] coupling map."
         )
         self.assertEqual(repr(SwapStrategy.from_line([0, 1, 2])), expected)
+
+    def test_tables_are_shared(self):
+        """Test that identical strategies share their precomputed tables."""
+        first = SwapStrategy.from_line(list(range(20)))
+        second = SwapStrategy.from_line(list(range(20)))
+        self.assertIs(first._tables, second._tables)
+        np.testing.assert_array_equal(first.distance_matrix, second.distance_matrix)
+
+        other = SwapStrategy.from_line(list(range(20)), num_swap_layers=3)
+        self.assertIsNot(first._tables, other._tables)
+
+    def test_pickle(self):
+        """Test that a swap strategy and its tables round-trip through pickle."""
+        strategy = SwapStrategy.from_line([0, 2, 3, 4])
+        tables = pickle.loads(pickle.dumps(strategy._tables))
+        np.testing.assert_array_equal(tables.distance_matrix(), strategy.distance_matrix)
+        self.assertEqual(tables.possible_edges(), strategy.possible_edges)
+        for idx in range(len(strategy) + 1):
+            self.assertEqual(
+                tables.inverse_composed_permutation(idx),
+                strategy.inverse_composed_permutation(idx),
+            )
+
+        restored = pickle.loads(pickle.dumps(strategy))
+        np.testing.assert_array_equal(restored.distance_matrix, strategy.distance_matrix)
+        self.assertEqual(restored.new_connections(1), strategy.new_connections(1))
@@ -340,6 +340,25 @@ class TestPauliEvolutionSwapStrategies(QiskitTestCase):
 
         self.assertEqual(embedded, expected)
 
+    def test_large_line_all_to_all(self):
+        """Test routing a fully connected block on a long line in a single pass."""
+        num_qubits = 40
+        terms = [("ZZ", [i, j], 1.0) for i in range(num_qubits) for j in range(i + 1, num_qubits)]
+        op = SparsePauliOp.from_sparse_list(terms, num_qubits=num_qubits)
+        circ = QuantumCircuit(num_qubits)
+        circ.append(PauliEvolutionGate(op, 1), range(num_qubits))
+
+        swap_strat = SwapStrategy.from_line(list(range(num_qubits)))
+        pm_ = PassManager([FindCommutingPauliEvolutions(), Commuting2qGateRouter(swap_strat)])
+        routed = pm_.run(circ)
+
+        num_evolutions = 0
+        for instruction in routed.data:
+            q0, q1 = (routed.find_bit(qubit).index for qubit in instruction.qubits)
+            self.assertEqual(abs(q0 - q1), 1)
+            num_evolutions += instruction.operation.name == "PauliEvolution"
+        self.assertEqual(num_evolutions, len(terms))
+
     def test_ccx(self):
         """Test that extra multi-qubit operations are properly adjusted.
 
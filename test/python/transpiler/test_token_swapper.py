@@ -122,3 +122,49 @@ class TestGeneral(QiskitTestCase):
         out = list(swapper.map(mapping, trials=40))
         util.swap_permutation([out], mapping, allow_missing_keys=True)
         self.assertEqual({i: i for i in mapping.values()}, mapping)
+
+    def test_map_batch(self) -> None:
+        """Test that a batch of mappings is routed the same as each mapping on its own."""
+        graph = rx.generators.grid_graph(4, 4)
+        rng = random.default_rng(2025)
+        mappings = []
+        for _ in range(8):
+            sources = rng.permutation(16)[:10]
+            destinations = rng.permutation(16)[:10]
+            mappings.append(dict(zip(sources.tolist(), destinations.tolist())))
+        swapper = ApproximateTokenSwapper(graph, seed=1)
+        batch = swapper.map_batch(mappings, trials=4)
+        self.assertEqual(len(batch), len(mappings))
+        for swaps, mapping in zip(batch, mappings):
+            expected = {destination: destination for destination in mapping.values()}
+            util.swap_permutation([list(swaps)], mapping, allow_missing_keys=True)
+            self.assertEqual(expected, mapping)
+
+    def test_map_batch_is_seeded(self) -> None:
+        """Test that the batch output only depends on the seed."""
+        graph = rx.generators.heavy_hex_graph(5)
+        num_nodes = len(graph)
+        rng = random.default_rng(0)
+        mappings = [dict(enumerate(rng.permutation(num_nodes).tolist())) for _ in range(4)]
+        first = ApproximateTokenSwapper(graph, seed=7).map_batch(mappings)
+        second = ApproximateTokenSwapper(graph, seed=7).map_batch(mappings)
+        self.assertEqual(first, second)
+
+    def test_distance(self) -> None:
+        """Test the distances reported by the swapper."""
+        graph = rx.generators.path_graph(4)
+        graph.add_node(None)
+        swapper = ApproximateTokenSwapper(graph)
+        self.assertEqual(swapper.distance(0, 3), 3)
+        self.assertEqual(swapper.distance(1, 1), 0)
+        self.assertEqual(swapper.distance(0, 4), 0)
+        self.assertEqual(swapper.shortest_paths.shape, (5, 5))
+        self.assertEqual(swapper.shortest_paths[3, 0], 3.0)
+
+    def test_disconnected_mapping_raises(self) -> None:
+        """Test that a token with no path to its destination is an error."""
+        graph = rx.PyGraph()
+        graph.extend_from_edge_list([(0, 1), (2, 3)])
+        swapper = ApproximateTokenSwapper(graph)
+        with self.assertRaisesRegex(rx.InvalidMapping, "no path"):
+            swapper.map({0: 3, 3: 0})
@@ -0,0 +1,141 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2025.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the transpilation cache."""
+
+import os
+import tempfile
+
+from qiskit import QuantumCircuit, transpile
+from qiskit.circuit import Parameter
+from qiskit.providers.fake_provider import GenericBackendV2
+from qiskit.transpiler import TranspileCache, generate_preset_pass_manager
+from test import QiskitTestCase  # pylint: disable=wrong-import-order
+
+
+def _ghz(num_qubits):
+    qc = QuantumCircuit(num_qubits)
+    qc.h(0)
+    for i in range(1, num_qubits):
+        qc.cx(0, i)
+    qc.measure_all()
+    return qc
+
+
+class TestTranspileCache(QiskitTestCase):
+    """Tests for TranspileCache."""
+
+    def setUp(self):
+        super().setUp()
+        self.backend = GenericBackendV2(num_qubits=5, seed=42)
+
+    def test_hit_returns_equal_circuit(self):
+        """Test that a repeated compilation is served from the cache."""
+        cache = TranspileCache()
+        first = transpile(_ghz(4), self.backend, seed_transpiler=1, cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+        second = transpile(_ghz(4), self.backend, seed_transpiler=1, cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(first, second)
+        self.assertEqual(first.layout, second.layout)
+        self.assertIsNot(first, second)
+
+    def test_seed_is_part_of_key(self):
+        """Test that a different seed does not hit the cache."""
+        cache = TranspileCache()
+        transpile(_ghz(4), self.backend, seed_transpiler=1, cache=cache)
+        transpile(_ghz(4), self.backend, seed_transpiler=2, cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+
+    def test_bound_parameters_are_part_of_key(self):
+        """Test that circuits differing only in bound parameter values do not collide."""
+        theta = Parameter("θ")
+        qc = QuantumCircuit(2)
+        qc.rx(theta, 0)
+        qc.cx(0, 1)
+        pm = generate_preset_pass_manager(2, self.backend, seed_transpiler=0)
+        cache = TranspileCache()
+        out_a = pm.run(qc.assign_parameters([0.25]), cache=cache)
+        out_b = pm.run(qc.assign_parameters([0.5]), cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+        self.assertNotEqual(out_a, out_b)
+
+    def test_unbound_parameters_hit(self):
+        """Test that the same parameterized circuit hits the cache and keeps its parameters."""
+        theta = Parameter("θ")
+        qc = QuantumCircuit(2)
+        qc.rx(theta, 0)
+        qc.cx(0, 1)
+        pm = generate_preset_pass_manager(2, self.backend, seed_transpiler=0)
+        cache = TranspileCache()
+        pm.run(qc, cache=cache)
+        out = pm.run(qc, cache=cache)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(set(out.parameters), {theta})
+
+    def test_mutating_output_does_not_poison_cache(self):
+        """Test that the caller can modify the returned circuit freely."""
+        cache = TranspileCache()
+        first = transpile(_ghz(3), self.backend, seed_transpiler=3, cache=cache)
+        expected = first.copy()
+        first.x(0)
+        second = transpile(_ghz(3), self.backend, seed_transpiler=3, cache=cache)
+        self.assertEqual(second, expected)
+
+    def test_output_name(self):
+        """Test that cache hits respect the requested output name."""
+        cache = TranspileCache()
+        transpile(_ghz(3), self.backend, seed_transpiler=3, cache=cache, output_name="first")
+        out = transpile(_ghz(3), self.backend, seed_transpiler=3, cache=cache, output_name="second")
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(out.name, "second")
+
+    def test_size_eviction(self):
+        """Test that entries are evicted when the size bound is exceeded."""
+        pm = generate_preset_pass_manager(1, self.backend, seed_transpiler=0)
+        first = pm.run(_ghz(3))
+        cache = TranspileCache(max_size=len(first.data) + 1)
+        pm.run(_ghz(3), cache=cache)
+        self.assertEqual(len(cache), 1)
+        # The larger circuit on its own exceeds the bound, so everything is evicted.
+        pm.run(_ghz(4), cache=cache)
+        self.assertEqual(len(cache), 0)
+        pm.run(_ghz(3), cache=cache)
+        self.assertEqual(cache.hits, 0)
+
+    def test_disk_store(self):
+        """Test that entries persist through the on-disk store."""
+        with tempfile.TemporaryDirectory() as directory:
+            cache = TranspileCache(directory=directory)
+            first = transpile(_ghz(4), self.backend, seed_transpiler=5, cache=cache)
+            self.assertEqual(len(os.listdir(directory)), 1)
+
+            fresh = TranspileCache(directory=directory)
+            second = transpile(_ghz(4), self.backend, seed_transpiler=5, cache=fresh)
+            self.assertEqual((fresh.hits, fresh.misses), (1, 0))
+            self.assertEqual(first, second)
+            self.assertEqual(first.layout, second.layout)
+
+    def test_callback_bypasses_cache(self):
+        """Test that using a callback skips the cache entirely."""
+        cache = TranspileCache()
+        calls = []
+        transpile(_ghz(3), self.backend, seed_transpiler=3, cache=cache)
+        transpile(
+            _ghz(3),
+            self.backend,
+            seed_transpiler=3,
+            cache=cache,
+            callback=lambda **kwargs: calls.append(kwargs),
+        )
+        self.assertEqual(cache.hits, 0)
+        self.assertGreater(len(calls), 0)
@@ -236,3 +236,26 @@ class TranspileLayoutTest(QiskitTestCase):
         tqc_1 = transpile(qc, coupling_map=cmap, initial_layout=range(3), seed_transpiler=42)
         tqc_2 = transpile(qc, coupling_map=cmap, initial_layout=list(range(3)), seed_transpiler=42)
         self.assertEqual(tqc_1.layout.initial_index_layout(), tqc_2.layout.initial_index_layout())
+
+    def test_nlayouts_match_index_layouts(self):
+        qc = QuantumCircuit(3)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.cx(0, 2)
+        cmap = CouplingMap.from_line(10, bidirectional=False)
+        tqc = transpile(qc, coupling_map=cmap, initial_layout=[9, 4, 0], seed_transpiler=42)
+        layout = tqc.layout
+        initial = layout.initial_nlayout(filter_ancillas=True)
+        self.assertEqual(initial.virtual_to_physical_array().tolist(), [9, 4, 0])
+        self.assertEqual(initial.num_physical_qubits, 10)
+        routing = layout.routing_nlayout()
+        self.assertEqual(routing.virtual_to_physical_array().tolist(), layout.routing_permutation())
+        final = layout.final_nlayout()
+        self.assertEqual(final.virtual_to_physical_array().tolist(), [3, 5, 2])
+        self.assertEqual(
+            layout.final_nlayout(filter_ancillas=False).virtual_to_physical_array().tolist(),
+            layout.final_index_layout(filter_ancillas=False),
+        )
+        # The final layout is the initial layout followed by the routing permutation.
+        self.assertEqual(initial.compose(routing), final)
+        self.assertEqual(final.inverse().apply([3, 5, 2]).tolist(), [0, 1, 2])
@@ -13,7 +13,9 @@
 """Test the VF2Layout pass"""
 
 import io
+import os
 import pickle
+import tempfile
 import unittest
 from math import pi
 
@@ -24,7 +26,11 @@ import rustworkx
 from qiskit import QuantumRegister, QuantumCircuit, ClassicalRegister
 from qiskit.circuit import ControlFlowOp, Qubit
 from qiskit.transpiler import CouplingMap, Target, TranspilerError
-from qiskit.transpiler.passes.layout.vf2_layout import VF2Layout, VF2LayoutStopReason
+from qiskit.transpiler.passes.layout.vf2_layout import (
+    VF2Layout,
+    VF2LayoutCache,
+    VF2LayoutStopReason,
+)
 from qiskit._accelerate.error_map import ErrorMap
 from qiskit.converters import circuit_to_dag
 from qiskit.providers.fake_provider import GenericBackendV2
@@ -808,5 +814,112 @@ class TestMultipleTrials(QiskitTestCase):
         self.assertEqual(res.num_qubits, 16)
 
 
+class TestVF2LayoutCache(QiskitTestCase):
+    """Test the cache of VF2Layout results."""
+
+    def setUp(self):
+        super().setUp()
+        self.target = GenericBackendV2(num_qubits=7, seed=42).target
+
+    @staticmethod
+    def _circuit(num_qubits):
+        qc = QuantumCircuit(num_qubits)
+        qc.h(0)
+        for qubit in range(num_qubits - 1):
+            qc.cx(qubit, qubit + 1)
+        return qc
+
+    def _run(self, circuit, cache, **kwargs):
+        vf2_pass = VF2Layout(target=self.target, seed=2025, cache=cache, **kwargs)
+        vf2_pass(circuit)
+        return vf2_pass.property_set["layout"]
+
+    def test_hit_skips_search(self):
+        """Test that a second run of the same problem is served from the cache."""
+        cache = VF2LayoutCache()
+        uncached = self._run(self._circuit(4), None)
+        first = self._run(self._circuit(4), cache)
+        second = self._run(self._circuit(4), cache)
+        self.assertEqual(first, uncached)
+        self.assertEqual(second, first)
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (1, 1, 1))
+
+    def test_key_includes_problem(self):
+        """Test that different circuits and search arguments get different entries."""
+        cache = VF2LayoutCache()
+        self._run(self._circuit(3), cache)
+        self._run(self._circuit(4), cache)
+        self._run(self._circuit(4), cache, strict_direction=True)
+        self._run(self._circuit(4), cache, call_limit=10)
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 4, 4))
+
+    def test_time_limited_search_not_cached(self):
+        """Test that the result of a search cut short by its time limit is not cached."""
+        cache = VF2LayoutCache()
+        layout = self._run(self._circuit(4), cache, time_limit=0.0)
+        self.assertIsNotNone(layout)
+        self._run(self._circuit(4), cache, time_limit=0.0)
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 2, 0))
+
+    def test_size_bound(self):
+        """Test that the least-recently used entry is evicted."""
+        cache = VF2LayoutCache(max_size=2)
+        self._run(self._circuit(2), cache)
+        self._run(self._circuit(3), cache)
+        self._run(self._circuit(2), cache)
+        self._run(self._circuit(4), cache)
+        self.assertEqual(len(cache), 2)
+        self._run(self._circuit(2), cache)
+        self.assertEqual(cache.hits, 2)
+        self._run(self._circuit(3), cache)
+        self.assertEqual(cache.hits, 2)
+        with self.assertRaises(ValueError):
+            VF2LayoutCache(max_size=0)
+
+    def test_file_backed(self):
+        """Test that caches backed by the same file share their entries."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "vf2.cache")
+            first = VF2LayoutCache(path=path)
+            layout = self._run(self._circuit(5), first)
+
+            second = VF2LayoutCache(path=path)
+            self.assertEqual(len(second), 1)
+            self.assertEqual(self._run(self._circuit(5), second), layout)
+            self.assertEqual((second.hits, second.misses), (1, 0))
+
+            # A copy sent to another process reads the same file.
+            copied = pickle.loads(pickle.dumps(first))
+            self.assertEqual(copied.max_size, first.max_size)
+            self.assertEqual(self._run(self._circuit(5), copied), layout)
+            self.assertEqual(copied.hits, 1)
+
+            first.clear()
+            self.assertEqual(len(first), 0)
+            self.assertEqual(len(VF2LayoutCache(path=path)), 0)
+
+    def test_file_corrupt_records_skipped(self):
+        """Test that the records after a corrupt record of a cache file are still read, and that
+        corrupt records count towards the compaction of the file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "vf2.cache")
+            first = VF2LayoutCache(max_size=2, path=path)
+            self._run(self._circuit(3), first)
+            # A record with a valid length prefix, but a payload that doesn't match its checksum.
+            corrupt = (20).to_bytes(4, "little") + bytes(20) + bytes(8)
+            with open(path, "ab") as file:
+                file.write(corrupt)
+            self._run(self._circuit(4), first)
+            self.assertEqual(len(VF2LayoutCache(max_size=2, path=path)), 2)
+
+            with open(path, "ab") as file:
+                file.write(corrupt * 4)
+            size = os.path.getsize(path)
+            self._run(self._circuit(5), first)
+            # The file was compacted to the two entries of the cache.
+            self.assertLess(os.path.getsize(path), size)
+            self.assertEqual(len(VF2LayoutCache(max_size=2, path=path)), 2)
+
+
 if __name__ == "__main__":
     unittest.main()